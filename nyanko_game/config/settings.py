@@ -17,6 +17,13 @@ FPS = 60
 FULLSCREEN_MODE = False  # 預設視窗模式
 
 
+# 閒置節流設定（畫面靜止時停止重繪並降低主循環的喚醒頻率）
+class RenderSettings:
+    IDLE_THROTTLING = True  # 是否啟用閒置節流
+    IDLE_WAKE_INTERVAL = 0.25  # 閒置時最長等待事件的時間（秒）
+    IDLE_REFRESH_INTERVAL = 1.0  # 閒置時仍定期重繪一次，避免遺漏沒有標記的畫面變化（秒）
+
+
 # 顯示模式設定
 class DisplayModes:
     # 支援的解析度 (寬度, 高度, 名稱)
@@ -91,7 +98,7 @@ class FontSettings:
     @staticmethod
     def get_font(size, bold=False):
         """
-        獲取字體的輔助函數
+        獲取字體的輔助函數（由字體管理器快取）
 
         Args:
             size (int): 字體大小
@@ -100,16 +107,9 @@ class FontSettings:
         Returns:
             pygame.font.Font: 字體物件
         """
-        import pygame
+        from systems.font_manager import font_manager
 
-        try:
-            font_path = (
-                FontSettings.FALLBACK_FONT if bold else FontSettings.DEFAULT_FONT
-            )
-            return pygame.font.Font(font_path, size)
-        except (FileNotFoundError, OSError):
-            print(f"警告: 無法載入指定字體，使用系統預設字體 (size: {size})")
-            return pygame.font.Font(None, size)
+        return font_manager.get_font(size, bold)
 
 
 # UI設定
@@ -164,6 +164,13 @@ class ImageScaling:
     USE_PIXEL_PERFECT_SCALING = True  # 是否使用像素完整縮放
     PIXEL_PERFECT_FILTER = True  # 是否在像素完整縮放時使用最近鄰過濾
 
+    # 縮放圖片快取設定
+    SCALED_CACHE_MAX_MB = 192  # ImageManager 縮放結果快取的記憶體上限（MB）
+    SURFACE_MEMORY_MAX_MB = 384  # 圖片 Surface 總記憶體上限（原始圖片 + 縮放快取，MB）
+
+    # 背景載入設定
+    ASSET_PUMP_PER_FRAME = 1  # 每幀最多接手的背景載入資源數（轉換顯示格式較耗時，分散到多幀）
+
     # 多解析度支援設定
     ENABLE_MULTI_RESOLUTION = True  # 啟用多解析度支援
     AUTO_DETECT_RESOLUTION = True  # 自動偵測最佳解析度
@@ -218,10 +225,83 @@ class ImageScaling:
 
         return (x, y)
 
+    @staticmethod
+    def is_opaque(surface):
+        """
+        檢查圖片是否完全不透明（沒有任何 alpha 小於 255 的像素）
+
+        Args:
+            surface (pygame.Surface): 要檢查的表面
+
+        Returns:
+            bool: 是否完全不透明
+        """
+        if not surface.get_flags() & pygame.SRCALPHA:
+            return surface.get_colorkey() is None
+        alpha = pygame.image.tobytes(surface, "RGBA")[3::4]
+        return not alpha.strip(b"\xff")
+
+    @staticmethod
+    def to_display_format(surface, opaque=None):
+        """
+        轉換為顯示器的像素格式 - 不透明圖片使用 convert()（blit 時不需要逐像素混合），
+        透明圖片使用 convert_alpha()；已經是顯示器格式時直接返回
+
+        Args:
+            surface (pygame.Surface): 要轉換的表面
+            opaque (bool): 是否不透明，None 時自動判斷
+
+        Returns:
+            pygame.Surface: 轉換後的表面（尚未建立顯示器時返回原表面）
+        """
+        display = pygame.display.get_surface()
+        if display is None:
+            return surface
+        if opaque is None:
+            opaque = ImageScaling.is_opaque(surface)
+
+        has_alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        same_layout = (
+            surface.get_bitsize() == 32
+            and surface.get_masks()[:3] == display.get_masks()[:3]
+        )
+        if opaque:
+            if not has_alpha and same_layout and display.get_bitsize() == 32:
+                return surface
+            return surface.convert()
+        if has_alpha and same_layout:
+            return surface
+        return surface.convert_alpha()
+
+    @staticmethod
+    def remove_alpha(surface):
+        """
+        建立不含 alpha 通道的副本（用於不透明的圖片，不需要顯示器，可在背景執行緒使用）
+
+        Args:
+            surface (pygame.Surface): 不透明的表面
+
+        Returns:
+            pygame.Surface: 不含 alpha 的 32 位元表面
+        """
+        red, green, blue, _ = surface.get_masks()
+        result = pygame.Surface(
+            surface.get_size(), 0, 32, masks=(red, green, blue, 0)
+        )
+        result.blit(surface, (0, 0))
+        return result
+
+    @staticmethod
+    def _create_surface_like(surface, size):
+        """建立與原表面相同像素格式的空白表面（透明圖片保留 alpha）"""
+        flags = surface.get_flags() & pygame.SRCALPHA
+        return pygame.Surface(size, flags, surface)
+
     @staticmethod
     def pixel_perfect_scale(surface, target_size):
         """
         像素完整縮放函數 - 保持圖片的銳利度和像素完整性
+        結果與原表面使用相同的像素格式（不透明的背景縮放後仍然不透明）
 
         Args:
             surface (pygame.Surface): 要縮放的表面
@@ -258,26 +338,24 @@ class ImageScaling:
                     return surface.copy()
                 else:
                     # 需要裁剪或填充
-                    result = pygame.Surface(target_size, pygame.SRCALPHA)
+                    result = ImageScaling._create_surface_like(surface, target_size)
                     x_offset = (target_width - original_width) // 2
                     y_offset = (target_height - original_height) // 2
                     result.blit(surface, (x_offset, y_offset))
                     return result
 
-            # 對於整數倍縮放，使用快速的重複blit方法
+            # 對於整數倍縮放，transform.scale 即為最近鄰放大，結果保持原表面的像素格式
             scaled_size = (
                 original_width * scale_factor,
                 original_height * scale_factor,
             )
-            scaled_surface = pygame.Surface(scaled_size, pygame.SRCALPHA)
-
-            # 使用pygame的transform.scale進行整數倍縮放，然後手動確保像素完整性
-            temp_scaled = pygame.transform.scale(surface, scaled_size)
-            scaled_surface.blit(temp_scaled, (0, 0))
+            scaled_surface = pygame.transform.scale(surface, scaled_size)
 
             # 如果目標尺寸與縮放尺寸不同，居中顯示
             if scaled_size != target_size:
-                final_surface = pygame.Surface(target_size, pygame.SRCALPHA)
+                final_surface = ImageScaling._create_surface_like(
+                    surface, target_size
+                )
                 x_offset = (target_width - scaled_size[0]) // 2
                 y_offset = (target_height - scaled_size[1]) // 2
                 final_surface.blit(scaled_surface, (x_offset, y_offset))
@@ -337,7 +415,10 @@ class Paths:
     # 資料檔案
     DATA_DIR = "data"
     SAVES_DIR = f"{DATA_DIR}/saves"
+    ASSET_CACHE_DIR = f"{DATA_DIR}/asset_cache"  # 預先烘焙的圖片快取（自動產生）
     DIALOGUE_DATA = f"{DATA_DIR}/dialogue.json"
+    DIALOGUE_SOURCE = f"{ASSETS_DIR}/dialogue_data.json"  # 對話資料（編輯用）
+    DIALOGUE_PACK = f"{ASSET_CACHE_DIR}/dialogue_data.pack"  # 編譯後的對話資料包（自動產生）
     CHARACTER_DATA = f"{DATA_DIR}/characters.json"
 
 
@@ -9,8 +9,12 @@ import sys
 from typing import Optional
 from config.settings import *
 from core.scene_manager import SceneManager
+from core.render_scheduler import RenderScheduler
 from systems import DialogueSystem, AffectionSystem, EventSystem
 from systems.image_manager import image_manager
+from systems.font_manager import font_manager
+from systems.asset_loader import AssetLoader
+from systems.asset_cache import AssetCache
 from systems.daily_event_system import DailyEventSystem
 from systems.progress_tracker import ProgressTracker
 from systems.modern_display_manager import ModernDisplayManager
@@ -48,6 +52,16 @@ class GameEngine:
         self.progress_tracker = None
         self.audio_manager = None
 
+        # 非同步資源載入器（圖片與音效在背景執行緒解碼）
+        self.asset_loader = AssetLoader()
+
+        # 渲染排程器（畫面靜止時跳過渲染並降低喚醒頻率）
+        self.render_scheduler = RenderScheduler()
+        self._last_scene = None
+        self._last_rendered_dialogue = None
+        self._scene_was_animating = True
+        self._debug_info_rect = None
+
         # 遊戲狀態資料
         self.game_state = {
             "nyanko_affection": 0,
@@ -78,6 +92,12 @@ class GameEngine:
             # 建立時鐘物件
             self.clock = pygame.time.Clock()
 
+            # 啟動背景資源載入（場景建立前啟動，主選單不需要等待所有圖片解碼）
+            # 圖片優先從預先烘焙的快取讀取，需要在顯示模式設定後建立（快取使用顯示器的像素格式）
+            image_manager.enable_asset_cache(AssetCache())
+            self.asset_loader.start()
+            image_manager.start_streaming(self.asset_loader)
+
             # 初始化場景管理器
             self.scene_manager = SceneManager(self)
 
@@ -155,9 +175,6 @@ class GameEngine:
     def _initialize_systems(self):
         """初始化核心系統"""
         try:
-            # 初始化圖片管理器
-            image_manager.load_all_images()
-
             # 初始化統一選擇系統
             from systems.unified_choice_system import UnifiedChoiceSystem
 
@@ -165,8 +182,7 @@ class GameEngine:
 
             # 初始化對話系統
             self.dialogue_system = DialogueSystem(self)
-            dialogue_data_path = "assets/dialogue_data.json"
-            self.dialogue_system.load_dialogue_data(dialogue_data_path)
+            self.dialogue_system.load_dialogue_data(Paths.DIALOGUE_SOURCE)
 
             # 將統一選擇系統設置到對話系統
             self.dialogue_system.set_unified_choice_system(self.unified_choice_system)
@@ -191,7 +207,7 @@ class GameEngine:
             # 初始化音效系統
             from systems.audio_system import AudioManager
 
-            self.audio_manager = AudioManager()
+            self.audio_manager = AudioManager(self.asset_loader)
 
             # 初始化事件驅動時間系統
             from systems.event_driven_time_system import EventDrivenTimeSystem
@@ -296,8 +312,12 @@ class GameEngine:
         print("開始遊戲主循環...")
 
         while self.running:
-            # 計算時間差
-            self.dt = self.clock.tick(FPS) / 1000.0
+            # 計算時間差（閒置時在這裡等待輸入，最長 IDLE_WAKE_INTERVAL 秒）
+            self.dt = self.render_scheduler.tick(self.clock)
+
+            # 接手背景載入完成的資源（替換佔位圖片、播放等待中的BGM）
+            if self.asset_loader.pump(ImageScaling.ASSET_PUMP_PER_FRAME):
+                self.render_scheduler.request_redraw()
 
             # 處理事件
             self.handle_events()
@@ -306,12 +326,54 @@ class GameEngine:
             if not self.paused:
                 self.update()
 
-            # 渲染畫面
-            self.render()
+            # 場景切換後重繪整個畫面
+            current_scene = (
+                self.scene_manager.current_scene if self.scene_manager else None
+            )
+            if current_scene is not self._last_scene:
+                self._last_scene = current_scene
+                self.render_scheduler.request_redraw()
+
+            # 渲染畫面（畫面沒有變化時跳過）
+            if self.render_scheduler.should_render(self._is_animating()):
+                self.render()
 
         # 清理資源
         self.cleanup()
 
+    def _is_animating(self) -> bool:
+        """
+        檢查畫面是否有持續的變化（打字機文字、場景切換、活動結果顯示、資源載入中等）
+
+        Returns:
+            bool: 是否需要以固定 FPS 持續重繪
+        """
+        if self._is_scene_animating():
+            return True
+        return bool(self.dialogue_system and self.dialogue_system.is_animating())
+
+    def _is_scene_animating(self) -> bool:
+        """
+        檢查對話框以外的畫面是否有持續的變化
+
+        Returns:
+            bool: 是否有對話框以外的動畫
+        """
+        # 資源仍在載入時持續運行，佔位圖片會被陸續替換
+        if self.asset_loader.pending_count():
+            return True
+
+        current_scene = self.scene_manager.current_scene if self.scene_manager else None
+        if self.scene_manager and self.scene_manager.next_scene:
+            return True
+        if current_scene and current_scene.is_animating():
+            return True
+
+        # 即時時間系統（沒有事件驅動時間系統時）會持續改變畫面上的時間
+        if not getattr(self, "event_driven_time_system", None) and self.time_system:
+            return True
+        return False
+
     def transform_mouse_pos(self, mouse_pos: tuple) -> tuple:
         """
         轉換滑鼠座標從實際螢幕座標到遊戲虛擬座標 - 使用顯示管理器
@@ -339,6 +401,9 @@ class GameEngine:
     def handle_events(self):
         """處理輸入事件"""
         for event in pygame.event.get():
+            # 任何事件都可能改變畫面，下一次渲染不可跳過
+            self.render_scheduler.request_redraw()
+
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -412,6 +477,8 @@ class GameEngine:
                     ImageScaling.USE_PIXEL_PERFECT_SCALING = (
                         not ImageScaling.USE_PIXEL_PERFECT_SCALING
                     )
+                    # 縮放模式改變，舊的縮放結果不再使用
+                    image_manager.clear_scaled_cache()
                     mode_text = (
                         "開啟" if ImageScaling.USE_PIXEL_PERFECT_SCALING else "關閉"
                     )
@@ -515,19 +582,51 @@ class GameEngine:
                 self._render_debug_info_on_surface(surface)
 
         # 使用顯示管理器渲染
-        self.display_manager.render_frame(self.screen, render_game_content)
+        updated_rects = self.display_manager.render_frame(
+            self.screen, render_game_content, self._get_dirty_rects()
+        )
 
-        # 更新顯示
-        pygame.display.flip()
+        # 更新顯示（只有部分區域變更時只更新這些區域）
+        if updated_rects is None:
+            pygame.display.flip()
+        elif updated_rects:
+            pygame.display.update(updated_rects)
+
+    def _get_dirty_rects(self):
+        """
+        這一幀有變更的區域：只有打字機文字在變化時只重繪對話框
+
+        Returns:
+            list: 變更的區域（遊戲座標），None 表示重繪整個畫面
+        """
+        # 對話框以外的動畫剛結束或換了對話時，最後一幀仍需重繪整個畫面
+        scene_animating = self._is_scene_animating()
+        scene_was_animating = self._scene_was_animating
+        self._scene_was_animating = scene_animating
+        dialogue = self.dialogue_system.current_dialogue if self.dialogue_system else None
+        dialogue_changed = dialogue is not self._last_rendered_dialogue
+        self._last_rendered_dialogue = dialogue
+
+        if self.render_scheduler.full_redraw:
+            return None
+        if scene_animating or scene_was_animating or dialogue_changed:
+            return None
+        if dialogue is None or not self.dialogue_system.is_active:
+            return None
+
+        dirty_rects = [self.dialogue_system.get_render_rect()]
+        if self.debug_mode and DebugSettings.SHOW_FPS:
+            # 除錯資訊（FPS 等）每幀都會改變
+            if self._debug_info_rect is None:
+                return None
+            dirty_rects.append(self._debug_info_rect)
+        return dirty_rects
 
     def _render_debug_info_on_surface(self, surface):
         """在指定表面上渲染除錯資訊 - 現代版本"""
         if DebugSettings.SHOW_FPS:
             fps = self.clock.get_fps()
-            try:
-                font = pygame.font.Font(FontSettings.DEFAULT_FONT, 20)
-            except (FileNotFoundError, OSError):
-                font = pygame.font.Font(None, 24)
+            font = font_manager.get_font(20, fallback_size=24)
 
             y_offset = 10
             line_height = 25
@@ -602,6 +701,46 @@ class GameEngine:
             surface.blit(pixel_text, (10, y_offset))
             y_offset += line_height
 
+            # 圖片記憶體
+            memory = image_manager.get_memory_report()
+            categories = memory["categories"]
+            mb = 1024 * 1024
+            memory_color = (
+                Colors.RED
+                if memory["total_bytes"] > memory["budget_bytes"]
+                else Colors.BLACK
+            )
+            memory_text = font.render(
+                f"Images: {memory['total_bytes'] / mb:.1f} / "
+                f"{memory['budget_bytes'] / mb:.0f} MB",
+                True,
+                memory_color,
+            )
+            surface.blit(memory_text, (10, y_offset))
+            y_offset += line_height
+
+            category_text = font.render(
+                f"BG {categories.get('backgrounds', 0) / mb:.1f} | "
+                f"Char {categories.get('characters', 0) / mb:.1f} | "
+                f"Scaled {categories['scaled_cache'] / mb:.1f} MB "
+                f"(hit {memory['scaled_cache']['hit_rate'] * 100:.0f}%)",
+                True,
+                Colors.BLACK,
+            )
+            surface.blit(category_text, (10, y_offset))
+            y_offset += line_height
+
+            # 渲染排程（閒置時 FPS 會降到喚醒頻率）
+            schedule = self.render_scheduler.get_info()
+            schedule_text = font.render(
+                f"Render: {'idle' if schedule['idle'] else 'active'} "
+                f"(skipped {schedule['skipped']})",
+                True,
+                Colors.BLACK,
+            )
+            surface.blit(schedule_text, (10, y_offset))
+            y_offset += line_height
+
             # 滑鼠座標
             raw_mouse = pygame.mouse.get_pos()
             game_mouse = self.get_mouse_pos()
@@ -622,15 +761,17 @@ class GameEngine:
             )
             surface.blit(controls_text, (10, y_offset))
 
+            # 除錯資訊佔用的區域（文字長度每幀不同，保留半個畫面寬度與多一行高度）
+            self._debug_info_rect = pygame.Rect(
+                0, 0, SCREEN_WIDTH // 2, y_offset + line_height * 2
+            )
+
     def render_debug_info(self):
         """簡化的除錯資訊渲染"""
         if DebugSettings.SHOW_FPS:
             # 顯示FPS
             fps = self.clock.get_fps()
-            try:
-                font = pygame.font.Font(FontSettings.DEFAULT_FONT, 20)
-            except (FileNotFoundError, OSError):
-                font = pygame.font.Font(None, 24)
+            font = font_manager.get_font(20, fallback_size=24)
 
             # FPS資訊
             fps_text = font.render(f"FPS: {fps:.1f}", True, Colors.BLACK)
@@ -745,6 +886,7 @@ class GameEngine:
         """切換全螢幕模式 - 使用現代顯示管理器"""
         self.fullscreen_mode = not self.fullscreen_mode
         self.screen = self.display_manager.toggle_fullscreen(self.screen)
+        image_manager.clear_scaled_cache()
 
         if self.debug_mode:
             display_info = self.display_manager.get_display_info()
@@ -791,6 +933,16 @@ class GameEngine:
             print(f"  {i+1}. {res[0]}x{res[1]}")
         print("===================\n")
 
+        # 圖片記憶體使用狀況
+        image_manager.print_memory_report()
+
+        # 字體快取狀況
+        font_info = font_manager.get_info()
+        print(
+            f"字體: {font_info['font_path'] or '系統預設字體'} "
+            f"(快取 {font_info['fonts']} 個, 命中 {font_info['hits']} 次)"
+        )
+
     def _auto_adjust_resolution(self):
         """自動調整到最佳解析度"""
         if self.fullscreen_mode:
@@ -800,6 +952,7 @@ class GameEngine:
         try:
             recommended = self.display_manager.auto_adjust_resolution()
             self.screen = self.display_manager.initialize_display(False)
+            image_manager.clear_scaled_cache()
             print(f"解析度已自動調整為: {recommended[0]}x{recommended[1]}")
         except Exception as e:
             print(f"自動調整解析度失敗: {e}")
@@ -879,6 +1032,9 @@ class GameEngine:
             save_path = "data/progress.json"
             self.progress_tracker.save_progress(save_path)
 
+        # 停止背景資源載入
+        self.asset_loader.stop()
+
         # 清理音效系統
         if self.audio_manager:
             self.audio_manager.cleanup()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+渲染排程器
+決定每一幀是否需要重繪：有動畫進行中（打字機文字、場景切換、活動結果等）時以固定 FPS 運行；
+畫面靜止且等待玩家輸入時跳過渲染，主循環改以 pygame.event.wait 低頻喚醒，有輸入時立即恢復
+"""
+
+import time
+
+import pygame
+
+from config.settings import FPS, RenderSettings
+
+
+class RenderScheduler:
+    """渲染排程器"""
+
+    def __init__(self):
+        """初始化渲染排程器"""
+        self.enabled = RenderSettings.IDLE_THROTTLING
+        self.idle = False  # 上一幀判斷為閒置（下一次 tick 改為等待事件）
+        self.redraw_requested = True
+        self.full_redraw = True  # 這一幀需要重繪整個畫面（False 表示只有動畫在變化）
+        self.was_animating = False
+        self.last_render_time = 0.0
+
+        # 統計
+        self.rendered_frames = 0
+        self.skipped_frames = 0
+
+    def request_redraw(self):
+        """要求下一幀重繪（畫面內容改變時呼叫）"""
+        self.redraw_requested = True
+
+    def tick(self, clock: pygame.time.Clock) -> float:
+        """
+        等待下一幀
+
+        活動中以 clock.tick(FPS) 固定幀率；閒置時阻塞等待事件，最長 IDLE_WAKE_INTERVAL 秒，
+        收到的事件放回佇列交給主循環處理（主循環處理事件時呼叫 request_redraw）
+
+        Args:
+            clock: 遊戲時鐘
+
+        Returns:
+            float: 與上一幀的時間差（秒）
+        """
+        if not self.idle:
+            return clock.tick(FPS) / 1000.0
+
+        timeout = int(RenderSettings.IDLE_WAKE_INTERVAL * 1000)
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            # 放回佇列交給主循環的事件處理（處理事件時會要求重繪）
+            pygame.event.post(event)
+        return clock.tick() / 1000.0
+
+    def should_render(self, animating: bool) -> bool:
+        """
+        判斷這一幀是否需要渲染
+
+        Args:
+            animating (bool): 是否有動畫進行中
+
+        Returns:
+            bool: 是否需要渲染
+        """
+        now = time.perf_counter()
+        refresh_due = now - self.last_render_time >= RenderSettings.IDLE_REFRESH_INTERVAL
+        # 動畫結束的那一幀仍需重繪最後的狀態
+        changed = animating or self.was_animating or self.redraw_requested
+        self.was_animating = animating
+        self.idle = self.enabled and not animating
+
+        if not self.enabled or changed or refresh_due:
+            # 有輸入、資源更新或定期重繪時整個畫面重繪，否則只有動畫的區域需要重繪
+            self.full_redraw = self.redraw_requested or refresh_due
+            self.redraw_requested = False
+            self.last_render_time = now
+            self.rendered_frames += 1
+            return True
+
+        self.skipped_frames += 1
+        return False
+
+    def get_info(self) -> dict:
+        """
+        獲取排程狀況（除錯資訊用）
+
+        Returns:
+            dict: 是否閒置、渲染與跳過的幀數
+        """
+        return {
+            "idle": self.idle,
+            "rendered": self.rendered_frames,
+            "skipped": self.skipped_frames,
+        }
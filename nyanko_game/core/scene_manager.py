@@ -75,6 +75,9 @@ class SceneManager:
         self.next_scene = scene_name
         self.transition_data = transition_data or {}
 
+        # 優先載入目標場景宣告的資源
+        self.scenes[scene_name].request_assets()
+
         # 如果當前有場景，呼叫其退出方法
         if self.current_scene:
             self.current_scene.on_exit()
@@ -7,6 +7,7 @@
 import pygame
 from typing import Dict, Any
 from config.settings import Colors
+from systems.font_manager import font_manager
 
 
 class ActivityResultMixin:
@@ -114,7 +115,9 @@ class ActivityResultMixin:
         )
 
         # 獲取字體（假設場景有 ui_font 屬性）
-        ui_font = getattr(self, "ui_font", pygame.font.Font(None, 24))
+        ui_font = getattr(self, "ui_font", None)
+        if ui_font is None:
+            ui_font = font_manager.get_default_font(24)
 
         # 標題
         title_text = ui_font.render("活動完成", True, Colors.PRIMARY_COLOR)
@@ -12,6 +12,10 @@ from typing import Any, Dict, Optional
 class BaseScene(ABC):
     """場景基礎抽象類別"""
 
+    # 場景需要的資源（子類別宣告）- 進入場景時優先載入，載入完成前顯示佔位圖片
+    IMAGE_ASSETS = ()  # 圖片識別鍵
+    SOUND_ASSETS = ()  # 音效名稱
+
     def __init__(self, game_engine, scene_manager):
         """
         初始化場景
@@ -48,6 +52,16 @@ class BaseScene(ABC):
         """設置UI元素（子類別必須實作）"""
         pass
 
+    def request_assets(self):
+        """提高場景宣告資源的載入優先順序（場景切換前呼叫）"""
+        from systems.image_manager import image_manager
+
+        image_manager.request_images(self.IMAGE_ASSETS)
+
+        audio_manager = getattr(self.game_engine, "audio_manager", None)
+        if audio_manager:
+            audio_manager.request_sounds(self.SOUND_ASSETS)
+
     def on_enter(self, transition_data: Dict[str, Any] = None):
         """
         場景進入時的回調函數
@@ -102,6 +116,17 @@ class BaseScene(ABC):
         """
         pass
 
+    def is_animating(self) -> bool:
+        """
+        場景是否有持續變化的畫面（子類別可覆寫）
+
+        回傳 False 時渲染排程器可以在等待輸入期間跳過重繪
+
+        Returns:
+            bool: 是否需要每幀重繪
+        """
+        return False
+
     def pause(self):
         """暫停場景"""
         self.paused = True
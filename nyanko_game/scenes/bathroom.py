@@ -7,6 +7,7 @@
 import pygame
 from scenes.base_scene import BaseScene
 from config.settings import *
+from systems.font_manager import font_manager
 
 
 class BathroomScene(BaseScene):
@@ -29,14 +30,8 @@ class BathroomScene(BaseScene):
 
     def load_resources(self):
         """載入場景資源"""
-        # 建立字體（使用中文字體）
-        try:
-            self.ui_font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.FONT_SIZE_MEDIUM
-            )
-        except (FileNotFoundError, OSError):
-            print("警告: 無法載入指定字體，使用系統預設字體")
-            self.ui_font = pygame.font.Font(None, FontSettings.FONT_SIZE_MEDIUM)
+        # 建立字體（使用中文字體，由字體管理器快取）
+        self.ui_font = font_manager.get_font(FontSettings.FONT_SIZE_MEDIUM)
 
         # 建立背景
         screen_width, screen_height = self.get_screen_size()
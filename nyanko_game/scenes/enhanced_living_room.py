@@ -10,12 +10,23 @@ from scenes.base_scene import BaseScene
 from scenes.activity_result_mixin import ActivityResultMixin
 from config.settings import *
 from systems.image_manager import image_manager
+from systems.font_manager import font_manager
 from systems.game_ui import GameStatusUI
 
 
 class EnhancedLivingRoomScene(BaseScene, ActivityResultMixin):
     """客廳場景類別 - 事件驅動版本"""
 
+    IMAGE_ASSETS = (
+        "bg_livingroom_early_morning",
+        "bg_livingroom_morning",
+        "bg_livingroom_noon",
+        "bg_livingroom_evening",
+        "nyanko_normal",
+        "nyanko_happy",
+    )
+    SOUND_ASSETS = ("nyanko_interact",)
+
     def __init__(self, game_engine, scene_manager):
         """初始化客廳場景"""
         # 初始化混入類別
@@ -24,6 +35,8 @@ class EnhancedLivingRoomScene(BaseScene, ActivityResultMixin):
         self.background = None
         self.ui_font = None
         self.dialogue_font = None
+        self.desc_font = None  # 活動選單的描述與操作提示
+        self.effects_font = None  # 活動選單的效果資訊
 
         # にゃんこ狀態
         self.nyanko_present = True
@@ -54,33 +67,27 @@ class EnhancedLivingRoomScene(BaseScene, ActivityResultMixin):
 
     def load_resources(self):
         """載入場景資源"""
-        image_manager.load_all_images()
-
-        try:
-            self.ui_font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.FONT_SIZE_MEDIUM
-            )
-            self.dialogue_font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.DIALOGUE_FONT_SIZE
-            )
-        except (FileNotFoundError, OSError):
-            print("警告: 無法載入指定字體，使用系統預設字體")
-            self.ui_font = pygame.font.Font(None, FontSettings.FONT_SIZE_MEDIUM)
-            self.dialogue_font = pygame.font.Font(None, FontSettings.DIALOGUE_FONT_SIZE)
-
-        # 載入所有時間段的背景圖片
-        self.backgrounds = {
-            "early_morning": image_manager.get_image("bg_livingroom_early_morning"),
-            "morning": image_manager.get_image("bg_livingroom_morning"),
-            "afternoon": image_manager.get_image("bg_livingroom_noon"),
-            "evening": image_manager.get_image("bg_livingroom_evening"),
-            "night": image_manager.get_image("bg_livingroom_evening"),
-            "late_night": image_manager.get_image("bg_livingroom_evening"),
+        # 圖片由 image_manager 載入（非同步載入時先顯示佔位圖片，見 IMAGE_ASSETS）
+        self.ui_font = font_manager.get_font(FontSettings.FONT_SIZE_MEDIUM)
+        self.dialogue_font = font_manager.get_font(FontSettings.DIALOGUE_FONT_SIZE)
+        self.desc_font = font_manager.get_font(20)
+        self.effects_font = font_manager.get_font(18)
+
+        # 所有時間段對應的背景圖片識別鍵（縮放結果由 image_manager 快取）
+        self.background_keys = {
+            "early_morning": "bg_livingroom_early_morning",
+            "morning": "bg_livingroom_morning",
+            "afternoon": "bg_livingroom_noon",
+            "evening": "bg_livingroom_evening",
+            "night": "bg_livingroom_evening",
+            "late_night": "bg_livingroom_evening",
         }
 
         # 檢查是否需要創建備用背景
         missing_backgrounds = [
-            key for key, bg in self.backgrounds.items() if bg is None
+            period
+            for period, key in self.background_keys.items()
+            if image_manager.get_image(key) is None
         ]
         if missing_backgrounds:
             self._create_fallback_backgrounds(missing_backgrounds)
@@ -107,7 +114,10 @@ class EnhancedLivingRoomScene(BaseScene, ActivityResultMixin):
                 surface.fill((100, 100, 200))  # 深藍色
                 self._create_background_layout(surface, "evening")
 
-            self.backgrounds[time_key] = surface
+            # 註冊到圖片管理器，與一般背景共用縮放快取
+            fallback_key = f"bg_livingroom_fallback_{time_key}"
+            image_manager.add_image(fallback_key, surface)
+            self.background_keys[time_key] = fallback_key
 
     def _create_background_layout(self, surface, time_of_day):
         """建立背景佈局"""
@@ -181,6 +191,10 @@ class EnhancedLivingRoomScene(BaseScene, ActivityResultMixin):
         ):
             self.game_engine.dialogue_system.update(dt, self.current_game_state)
 
+    def is_animating(self) -> bool:
+        """活動結果顯示中（需要計時自動關閉）或狀態UI有動畫時需要持續重繪"""
+        return self.activity_result_display or self.status_ui.is_animating()
+
     def render(self, screen: pygame.Surface):
         """渲染場景"""
         # 獲取當前時間資訊來選擇背景
@@ -191,24 +205,24 @@ class EnhancedLivingRoomScene(BaseScene, ActivityResultMixin):
         # 統一小寫
         period = str(period).lower()
 
-        # 使用新的背景系統 - 直接從backgrounds字典獲取
-        current_bg = self.backgrounds.get(period)
+        # 使用新的背景系統 - 從background_keys字典獲取背景圖片識別鍵
+        bg_key = self.background_keys.get(period)
 
         # 如果找不到對應時間段的背景，使用備用邏輯
-        if current_bg is None:
+        if bg_key is None:
             if period in ["early_morning", "morning", "afternoon"]:
-                current_bg = self.backgrounds.get("morning") or self.backgrounds.get(
-                    "early_morning"
-                )
+                bg_key = self.background_keys.get("morning")
+                if bg_key is None:
+                    bg_key = self.background_keys.get("early_morning")
             else:
-                current_bg = self.backgrounds.get("evening")
+                bg_key = self.background_keys.get("evening")
 
-        # 縮放背景到螢幕大小 - 使用像素完整縮放
+        # 縮放背景到螢幕大小 - 使用像素完整縮放（同一尺寸只縮放一次）
         screen_size = self.get_screen_size()
-        if current_bg:
-            from config.settings import ImageScaling
-
-            scaled_bg = ImageScaling.pixel_perfect_scale(current_bg, screen_size)
+        scaled_bg = None
+        if bg_key:
+            scaled_bg = image_manager.get_scaled_image(bg_key, screen_size)
+        if scaled_bg:
             screen.blit(scaled_bg, (0, 0))
         else:
             screen.fill(Colors.LIGHT_PINK)
@@ -517,30 +531,20 @@ class EnhancedLivingRoomScene(BaseScene, ActivityResultMixin):
 
             # 活動描述
             desc_color = (100, 100, 100)
-            try:
-                desc_font = pygame.font.Font(FontSettings.DEFAULT_FONT, 20)
-            except (FileNotFoundError, OSError):
-                desc_font = self.ui_font
-            desc_text = desc_font.render(activity.description, True, desc_color)
+            desc_text = self.desc_font.render(activity.description, True, desc_color)
             menu_surface.blit(desc_text, (20, y_offset + 25))
 
             # 效果資訊
             effects_text = f"消耗{activity.time_cost}點 | 體力{activity.energy_change:+d} 好感{activity.affection_change:+d} 心情{activity.mood_change:+d}"
-            try:
-                effects_font = pygame.font.Font(FontSettings.DEFAULT_FONT, 18)
-            except (FileNotFoundError, OSError):
-                effects_font = self.ui_font
-            effects_surface = effects_font.render(effects_text, True, (80, 80, 80))
+            effects_surface = self.effects_font.render(
+                effects_text, True, (80, 80, 80)
+            )
             menu_surface.blit(effects_surface, (20, y_offset + 45))
 
             y_offset += 80
 
         # 操作提示
-        try:
-            hint_font = pygame.font.Font(FontSettings.DEFAULT_FONT, 20)
-        except (FileNotFoundError, OSError):
-            hint_font = self.ui_font
-        hint_text = hint_font.render(
+        hint_text = self.desc_font.render(
             "↑↓ 選擇  Enter 確認  ESC 取消", True, (100, 100, 100)
         )
         hint_rect = hint_text.get_rect()
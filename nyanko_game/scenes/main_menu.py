@@ -7,16 +7,20 @@
 import pygame
 from scenes.base_scene import BaseScene
 from config.settings import *
+from systems.font_manager import font_manager
 
 
 class MainMenuScene(BaseScene):
     """主選單場景類別"""
 
+    SOUND_ASSETS = ("main_menu",)
+
     def __init__(self, game_engine, scene_manager):
         """初始化主選單場景"""
         self.background = None
         self.title_font = None
         self.menu_font = None
+        self.version_font = None
         self.menu_items = []
         self.selected_index = 0
         self.button_hover_color = Colors.LIGHT_PINK
@@ -26,19 +30,12 @@ class MainMenuScene(BaseScene):
 
     def load_resources(self):
         """載入場景資源"""
-        # 建立字體（使用中文字體）
-        try:
-            self.title_font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.FONT_SIZE_TITLE * 2
-            )
-            self.menu_font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.FONT_SIZE_LARGE
-            )
-        except (FileNotFoundError, OSError):
-            # 如果找不到指定字體，使用系統預設字體
-            print("警告: 無法載入指定字體，使用系統預設字體")
-            self.title_font = pygame.font.Font(None, FontSettings.FONT_SIZE_TITLE * 2)
-            self.menu_font = pygame.font.Font(None, FontSettings.FONT_SIZE_LARGE)
+        # 建立字體（使用中文字體，由字體管理器快取）
+        self.title_font = font_manager.get_font(FontSettings.FONT_SIZE_TITLE * 2)
+        self.menu_font = font_manager.get_font(FontSettings.FONT_SIZE_LARGE)
+        self.version_font = font_manager.get_default_font(
+            FontSettings.FONT_SIZE_SMALL
+        )
 
         # 建立背景
         screen_width, screen_height = self.get_screen_size()
@@ -192,8 +189,9 @@ class MainMenuScene(BaseScene):
         """繪製版本資訊"""
         screen_width, screen_height = self.get_screen_size()
 
-        version_font = pygame.font.Font(None, FontSettings.FONT_SIZE_SMALL)
-        version_text = version_font.render(f"版本 {GAME_VERSION}", True, Colors.GRAY)
+        version_text = self.version_font.render(
+            f"版本 {GAME_VERSION}", True, Colors.GRAY
+        )
         screen.blit(version_text, (10, screen_height - 30))
 
     def handle_event(self, event: pygame.event.Event) -> bool:
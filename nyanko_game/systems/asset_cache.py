@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+"""
+預先烘焙的圖片快取系統
+將 assets/images 下的 PNG 轉換為顯示器格式的原始像素檔（含常用解析度的縮放版本），
+執行時以 mmap + pygame.image.frombuffer 直接讀取，省去 PNG 解碼與縮放
+
+快取目錄結構：
+    data/asset_cache/manifest.json   各項目的來源檔案、內容雜湊、尺寸、像素格式與是否不透明
+    data/asset_cache/*.raw           原始像素資料（寬 x 高 x 4 位元組）
+
+來源檔案的內容雜湊改變時（或快取不存在時）會自動重新產生該項目；
+先以檔案修改時間與大小快速比對，只有不一致時才重新計算雜湊
+
+建立快取（也會在執行時依需要自動建立）：
+    python -m systems.asset_cache
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from typing import Iterable, Optional, Tuple
+
+import pygame
+
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    DisplayModes,
+    ImageScaling,
+    Paths,
+)
+
+MANIFEST_VERSION = 2
+
+
+class AssetCache:
+    """預先烘焙的圖片快取"""
+
+    def __init__(self, cache_dir: str = Paths.ASSET_CACHE_DIR):
+        """
+        初始化圖片快取
+
+        Args:
+            cache_dir (str): 快取目錄
+        """
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, "manifest.json")
+        self.lock = threading.RLock()  # 保護清單（解碼、縮放與寫檔時不持有，避免阻塞主執行緒）
+        self.source_hashes = {}  # 來源路徑 -> (修改時間, 大小, 雜湊)，本次執行已驗證
+        self.hits = 0
+        self.rebuilds = 0
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self) -> dict:
+        """讀取快取清單（版本不符或損毀時視為空清單）"""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _write_manifest(self):
+        """寫入快取清單（先寫入暫存檔再替換，避免中途中斷留下損毀的檔案）"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.manifest_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "entries": self.manifest},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        os.replace(temp_path, self.manifest_path)
+
+    @staticmethod
+    def entry_key(key: str, size: Optional[Tuple[int, int]] = None) -> str:
+        """
+        快取項目的識別鍵
+
+        Args:
+            key (str): 圖片識別鍵
+            size (tuple): 縮放尺寸，None 表示原始尺寸
+
+        Returns:
+            str: 例如 "bg_livingroom_noon@native"、"nyanko_normal@648x1080@pp-nearest"
+        """
+        if size is None:
+            return f"{key}@native"
+        return f"{key}@{size[0]}x{size[1]}@{AssetCache._scaling_tag()}"
+
+    @staticmethod
+    def _scaling_tag() -> str:
+        """縮放模式標記（不同縮放模式的結果分開快取）"""
+        if not ImageScaling.USE_PIXEL_PERFECT_SCALING:
+            return "scale"
+        if ImageScaling.PIXEL_PERFECT_FILTER:
+            return "pp-nearest"
+        return "pp-smooth"
+
+    @staticmethod
+    def pixel_format() -> str:
+        """
+        與顯示器相同的像素位元組順序（讀取後的 convert_alpha() 只需要複製記憶體）
+
+        Returns:
+            str: "BGRA" 或 "RGBA"
+        """
+        display = pygame.display.get_surface()
+        if display is not None and display.get_masks()[0] == 0xFF0000:
+            return "BGRA"
+        return "RGBA"
+
+    def _source_hash(self, path: str) -> Optional[str]:
+        """
+        取得來源檔案的內容雜湊（修改時間與大小和上次相同時沿用清單中的雜湊）
+
+        Returns:
+            str: SHA-1 雜湊，檔案不存在時返回None
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self.lock:
+            cached = self.source_hashes.get(path)
+            if cached and cached[:2] == signature:
+                return cached[2]
+
+            for entry in self.manifest.values():
+                if entry["source"] == path and tuple(entry["source_stat"]) == signature:
+                    self.source_hashes[path] = (*signature, entry["hash"])
+                    return entry["hash"]
+
+        # 計算雜湊時不持有鎖
+        sha1 = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha1.update(chunk)
+        digest = sha1.hexdigest()
+
+        with self.lock:
+            # 內容沒有改變（例如只是修改時間改變）時更新清單，下次啟動不必重新計算
+            touched = False
+            for entry in self.manifest.values():
+                if entry["source"] == path and entry["hash"] == digest:
+                    entry["source_stat"] = list(signature)
+                    touched = True
+            if touched:
+                self._write_manifest()
+            self.source_hashes[path] = (*signature, digest)
+        return digest
+
+    def _valid_entry(self, name: str, digest: str) -> Optional[dict]:
+        """
+        取得仍然有效的清單項目
+
+        Returns:
+            dict: 清單項目，不存在或來源已改變時返回None
+        """
+        with self.lock:
+            entry = self.manifest.get(name)
+        if (
+            entry is None
+            or entry["hash"] != digest
+            or entry["format"] != self.pixel_format()
+            or not os.path.exists(os.path.join(self.cache_dir, entry["file"]))
+        ):
+            return None
+        return entry
+
+    def load(
+        self,
+        key: str,
+        path: str,
+        size: Optional[Tuple[int, int]] = None,
+        convert: bool = True,
+        build: bool = True,
+    ) -> Optional[pygame.Surface]:
+        """
+        從快取讀取圖片，快取不存在或來源已改變時先重新產生
+
+        Args:
+            key (str): 圖片識別鍵
+            path (str): 來源 PNG 路徑
+            size (tuple): 縮放尺寸，None 表示原始尺寸
+            convert (bool): 是否轉換為顯示器格式（只能在主執行緒；背景執行緒請傳 False）
+            build (bool): 快取不存在時是否重新產生（False 時直接返回None，
+                主執行緒使用，產生交給背景執行緒的 bake()）
+
+        Returns:
+            pygame.Surface: 圖片，來源不存在、沒有快取或讀取失敗時返回None
+        """
+        entry = self._get_entry(key, path, size, build)
+        if entry is None:
+            return None
+
+        try:
+            surface = self._read_blob(entry)
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"錯誤: 無法讀取圖片快取 {self.entry_key(key, size)}: {e}")
+            return None
+
+        if convert and pygame.display.get_surface() is not None:
+            # 不透明的圖片轉換為不含 alpha 的顯示器格式（blit 時不需要混合）
+            return surface.convert() if entry["opaque"] else surface.convert_alpha()
+        return surface.copy()
+
+    def bake(self, key: str, path: str, size: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        確保快取項目存在（不存在或來源已改變時重新產生，不讀取結果；背景執行緒使用）
+
+        Args:
+            key (str): 圖片識別鍵
+            path (str): 來源 PNG 路徑
+            size (tuple): 縮放尺寸，None 表示原始尺寸
+
+        Returns:
+            bool: 快取項目是否可用
+        """
+        return self._get_entry(key, path, size, build=True) is not None
+
+    def _get_entry(
+        self,
+        key: str,
+        path: str,
+        size: Optional[Tuple[int, int]],
+        build: bool,
+    ) -> Optional[dict]:
+        """
+        取得有效的清單項目，需要時重新產生
+
+        Returns:
+            dict: 清單項目，來源不存在、不重新產生或產生失敗時返回None
+        """
+        digest = self._source_hash(path)
+        if digest is None:
+            return None
+        name = self.entry_key(key, size)
+        entry = self._valid_entry(name, digest)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        if not build:
+            return None
+        return self._build_entry(key, name, path, digest, size)
+
+    def is_opaque(
+        self, key: str, size: Optional[Tuple[int, int]] = None
+    ) -> Optional[bool]:
+        """
+        查詢快取項目是否不透明（烘焙時記錄，不需要重新檢查像素）
+
+        Returns:
+            bool: 是否不透明，快取中沒有此項目時返回None
+        """
+        with self.lock:
+            entry = self.manifest.get(self.entry_key(key, size))
+        return entry["opaque"] if entry else None
+
+    def _read_blob(self, entry: dict) -> pygame.Surface:
+        """
+        以 mmap 讀取原始像素資料
+
+        注意：返回的 Surface 直接參照 mmap 的記憶體，必須在關閉前複製或轉換
+        （呼叫者負責，mmap 在 Surface 被釋放後關閉）
+        """
+        blob_path = os.path.join(self.cache_dir, entry["file"])
+        with open(blob_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return pygame.image.frombuffer(mapped, tuple(entry["size"]), entry["format"])
+
+    def _build_entry(
+        self,
+        key: str,
+        name: str,
+        path: str,
+        digest: str,
+        size: Optional[Tuple[int, int]],
+    ) -> Optional[dict]:
+        """
+        解碼來源 PNG、縮放並寫入原始像素檔（只有更新清單時持有 self.lock）
+
+        Returns:
+            dict: 新的清單項目，失敗時返回None
+        """
+        try:
+            if size is None:
+                surface = pygame.image.load(path)
+            else:
+                # 縮放版本由原始尺寸的快取產生，同一張 PNG 只需要解碼一次
+                surface = self.load(key, path, convert=False)
+                if surface is None:
+                    return None
+                surface = ImageScaling.pixel_perfect_scale(surface, size)
+            pixel_format = self.pixel_format()
+            data = pygame.image.tobytes(surface, pixel_format)
+            # 兩種像素格式的 alpha 都是每個像素的第 4 個位元組
+            opaque = not data[3::4].strip(b"\xff")
+        except pygame.error as e:
+            print(f"錯誤: 無法建立圖片快取 {path}: {e}")
+            return None
+
+        file_name = hashlib.sha1(name.encode("utf-8")).hexdigest()[:16] + ".raw"
+        blob_path = os.path.join(self.cache_dir, file_name)
+        stat = os.stat(path)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 兩個執行緒同時產生同一個項目時各自寫入暫存檔，替換後內容相同
+            temp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, blob_path)
+
+            entry = {
+                "source": path,
+                "source_stat": [stat.st_mtime_ns, stat.st_size],
+                "hash": digest,
+                "size": list(surface.get_size()),
+                "format": pixel_format,
+                "opaque": opaque,
+                "file": file_name,
+            }
+            with self.lock:
+                self.manifest[name] = entry
+                self._write_manifest()
+        except OSError as e:
+            print(f"錯誤: 無法寫入圖片快取 {blob_path}: {e}")
+            return None
+
+        self.rebuilds += 1
+        print(f"已更新圖片快取: {name}")
+        return entry
+
+    def prune(self, valid_names: Iterable[str]) -> int:
+        """
+        移除不在清單中的快取項目與檔案
+
+        Args:
+            valid_names: 要保留的快取項目識別鍵
+
+        Returns:
+            int: 移除的項目數量
+        """
+        valid_names = set(valid_names)
+        with self.lock:
+            removed = [name for name in self.manifest if name not in valid_names]
+            for name in removed:
+                entry = self.manifest.pop(name)
+                try:
+                    os.remove(os.path.join(self.cache_dir, entry["file"]))
+                except OSError:
+                    pass
+            if removed:
+                self._write_manifest()
+        return len(removed)
+
+    def get_info(self) -> dict:
+        """
+        獲取快取使用狀況
+
+        Returns:
+            dict: 項目數、命中次數與重新產生次數
+        """
+        return {
+            "entries": len(self.manifest),
+            "hits": self.hits,
+            "rebuilds": self.rebuilds,
+        }
+
+
+def target_resolutions(supported_resolutions=None):
+    """
+    要預先烘焙的畫面解析度：遊戲虛擬解析度加上顯示管理器偵測到的解析度
+
+    Args:
+        supported_resolutions: ModernDisplayManager.supported_resolutions，
+            None 時使用 DisplayModes 的預設列表
+
+    Returns:
+        list: [(width, height), ...]
+    """
+    if supported_resolutions is None:
+        supported_resolutions = DisplayModes.SUPPORTED_RESOLUTIONS
+    resolutions = [(SCREEN_WIDTH, SCREEN_HEIGHT)]
+    for resolution in list(supported_resolutions) + DisplayModes.PREFERRED_RESOLUTIONS:
+        size = (int(resolution[0]), int(resolution[1]))  # 預設列表的項目含名稱
+        if size not in resolutions:
+            resolutions.append(size)
+    return resolutions
+
+
+def build_cache(cache, image_manager, resolutions) -> int:
+    """
+    烘焙所有圖片：原始尺寸，以及背景與角色立繪在各解析度下的縮放版本
+
+    Args:
+        cache (AssetCache): 圖片快取
+        image_manager (ImageManager): 提供圖片識別鍵與來源路徑
+        resolutions: 目標解析度列表
+
+    Returns:
+        int: 快取項目數量
+    """
+    names = []
+    for key, path in sorted(image_manager.image_sources.items()):
+        if not os.path.exists(path):
+            continue
+        cache.load(key, path, convert=False)
+        names.append(cache.entry_key(key))
+
+        for width, height in resolutions:
+            if key.startswith("bg_"):
+                size = (width, height)
+            elif key.startswith("nyanko_"):
+                size = ImageScaling.calculate_character_size(width, height)
+            else:
+                continue
+            cache.load(key, path, size, convert=False)
+            names.append(cache.entry_key(key, size))
+
+    cache.prune(names)
+    return len(names)
+
+
+def main():
+    """建立或更新圖片快取"""
+    from systems.image_manager import ImageManager
+    from systems.modern_display_manager import ModernDisplayManager
+
+    pygame.init()
+    display_manager = ModernDisplayManager()
+    # 建立隱藏視窗以取得顯示器的像素格式
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    cache = AssetCache()
+    manager = ImageManager()
+    manager.enable_asset_cache(cache)
+    manager.load_all_images()
+
+    resolutions = target_resolutions(display_manager.supported_resolutions)
+    count = build_cache(cache, manager, resolutions)
+    info = cache.get_info()
+    print(f"圖片快取完成: {count} 個項目（重新產生 {info['rebuilds']} 個）")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+非同步資源載入系統
+在背景執行緒解碼圖片與音效檔案，主執行緒每幀接手完成的資源
+
+流程：
+1. 各管理器以 request() 提出載入需求（同一個資源只會載入一次，重複需求只會合併回調）
+2. 背景執行緒依優先順序解碼：圖片為 pygame.image.load 的 Surface，音效為 pygame.mixer.Sound，
+   其他檔案為原始 bytes
+3. 主執行緒每幀呼叫 pump()，對圖片執行 convert()/convert_alpha()（需要顯示器，只能在主執行緒進行；
+   解碼結果不含 alpha 的圖片一律使用 convert()）
+   後呼叫回調，由管理器替換掉佔位資源
+"""
+
+import itertools
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+import pygame
+
+
+class AssetPriority:
+    """載入優先順序（數字越小越優先）"""
+
+    SCENE = 0  # 目前或即將進入的場景需要的資源
+    PREFETCH = 10  # 背景預先載入
+
+
+class AssetLoader:
+    """非同步資源載入器"""
+
+    def __init__(self):
+        """初始化資源載入器"""
+        self.requests = queue.PriorityQueue()  # (優先順序, 序號, 資源鍵)
+        self.completed = queue.Queue()  # (資源鍵, 結果, 錯誤)
+        self.jobs = {}  # 資源鍵 -> 載入工作
+        self.lock = threading.Lock()
+        self._sequence = itertools.count()
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+        self.loaded_count = 0
+
+    def start(self):
+        """啟動背景載入執行緒"""
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(
+            target=self._worker, name="AssetLoader", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        """停止背景載入執行緒（尚未載入的資源會被捨棄）"""
+        if not self.running:
+            return
+        self.running = False
+        self.requests.put((-1, next(self._sequence), None))
+        if self.thread:
+            self.thread.join(timeout=2.0)
+        self.thread = None
+
+    def request(
+        self,
+        key: str,
+        path: str,
+        kind: str = "image",
+        callback: Optional[Callable] = None,
+        priority: int = AssetPriority.PREFETCH,
+        alpha: bool = True,
+        decoder: Optional[Callable] = None,
+    ):
+        """
+        提出資源載入需求
+
+        Args:
+            key (str): 資源鍵（同一鍵只會載入一次）
+            path (str): 檔案路徑
+            kind (str): "image"、"sound"、"bytes"，或搭配 decoder 的其他種類（結果原樣交給回調）
+            callback (callable): 完成時在主執行緒呼叫 callback(key, result)，失敗時 result 為 None
+            priority (int): 優先順序（見 AssetPriority）
+            alpha (bool): 圖片含 alpha 時是否使用 convert_alpha()
+            decoder (callable): 自訂解碼函數 decoder(path)，在背景執行緒呼叫（例如從圖片快取讀取）
+        """
+        with self.lock:
+            job = self.jobs.get(key)
+            if job is None:
+                job = {
+                    "path": path,
+                    "kind": kind,
+                    "alpha": alpha,
+                    "decoder": decoder,
+                    "callbacks": [],
+                    "priority": priority,
+                    "started": False,
+                }
+                self.jobs[key] = job
+            elif priority >= job["priority"] or job["started"]:
+                # 已經在佇列中且優先順序沒有提高，只需合併回調
+                if callback:
+                    job["callbacks"].append(callback)
+                return
+            job["priority"] = priority
+            if callback:
+                job["callbacks"].append(callback)
+        # 優先順序提高時重新排入佇列（背景執行緒會略過已經開始的工作）
+        self.requests.put((priority, next(self._sequence), key))
+
+    def is_pending(self, key: str) -> bool:
+        """檢查資源是否仍在載入中"""
+        with self.lock:
+            return key in self.jobs
+
+    def pending_count(self) -> int:
+        """尚未交給主執行緒的資源數量"""
+        with self.lock:
+            return len(self.jobs)
+
+    def _worker(self):
+        """背景執行緒：依優先順序解碼資源"""
+        while self.running:
+            _, _, key = self.requests.get()
+            if key is None:
+                break
+            with self.lock:
+                job = self.jobs.get(key)
+                if job is None or job["started"]:
+                    continue
+                job["started"] = True
+
+            try:
+                if job["decoder"]:
+                    result = job["decoder"](job["path"])
+                else:
+                    result = self._decode(job["kind"], job["path"])
+                error = None
+            except Exception as e:
+                result = None
+                error = e
+            self.completed.put((key, result, error))
+
+    @staticmethod
+    def _decode(kind: str, path: str):
+        """
+        在背景執行緒解碼檔案
+
+        Args:
+            kind (str): 資源類型
+            path (str): 檔案路徑
+
+        Returns:
+            解碼後的 Surface、Sound 或 bytes
+        """
+        if kind == "image":
+            return pygame.image.load(path)
+        if kind == "sound":
+            return pygame.mixer.Sound(path)
+        with open(path, "rb") as f:
+            return f.read()
+
+    def pump(self, max_items: Optional[int] = None) -> int:
+        """
+        在主執行緒接手已完成的資源（每幀呼叫一次）
+
+        Args:
+            max_items (int): 這一幀最多處理的資源數量，None 表示全部
+
+        Returns:
+            int: 處理的資源數量
+        """
+        handled = 0
+        while max_items is None or handled < max_items:
+            try:
+                key, result, error = self.completed.get_nowait()
+            except queue.Empty:
+                break
+
+            with self.lock:
+                job = self.jobs.pop(key, None)
+            if job is None:
+                continue
+
+            if error is not None:
+                print(f"錯誤: 無法載入資源 {job['path']}: {error}")
+            elif job["kind"] == "image":
+                result = self._prepare_surface(result, job["alpha"])
+            self.loaded_count += 1
+
+            for callback in job["callbacks"]:
+                callback(key, result)
+            handled += 1
+        return handled
+
+    @staticmethod
+    def _prepare_surface(surface: pygame.Surface, alpha: bool) -> pygame.Surface:
+        """轉換為顯示器格式（尚未建立顯示器時保持原樣）"""
+        if pygame.display.get_surface() is None:
+            return surface
+        if alpha and surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def wait(self, keys: Optional[Iterable[str]] = None, timeout: float = 10.0) -> bool:
+        """
+        阻塞等待資源載入完成（同時在目前執行緒接手完成的資源）
+
+        Args:
+            keys: 要等待的資源鍵，None 表示全部
+            timeout (float): 最長等待秒數
+
+        Returns:
+            bool: 是否全部完成
+        """
+        keys = list(keys) if keys is not None else None
+        deadline = time.perf_counter() + timeout
+        while True:
+            self.pump()
+            with self.lock:
+                if keys is None:
+                    remaining = bool(self.jobs)
+                else:
+                    remaining = any(key in self.jobs for key in keys)
+            if not remaining:
+                return True
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.005)
@@ -25,8 +25,16 @@ class AudioType(Enum):
 class AudioManager:
     """音效管理器"""
 
-    def __init__(self):
+    def __init__(self, asset_loader=None):
+        """
+        初始化音效管理器
+
+        Args:
+            asset_loader (AssetLoader): 資源載入器；設定時音效在背景執行緒載入，
+                未設定時在第一次播放時才載入
+        """
         self.is_initialized = False
+        self.asset_loader = asset_loader
 
         # 音量設定
         self.master_volume = 1.0
@@ -41,6 +49,11 @@ class AudioManager:
         self.voice_clips: Dict[str, pygame.mixer.Sound] = {}
         self.ambient_sounds: Dict[str, pygame.mixer.Sound] = {}
 
+        # 音效來源 - (類型, 名稱) -> 檔案路徑；啟動時只掃描資料夾，不解碼
+        self.audio_sources: Dict[tuple, str] = {}
+        self.pending_audio = set()  # 背景載入中的 (類型, 名稱)
+        self.pending_bgm = None  # 載入完成後要播放的BGM (名稱, 循環, 淡入)
+
         # 播放狀態
         self.current_bgm = None
         self.current_bgm_name = None
@@ -102,7 +115,7 @@ class AudioManager:
             self.is_initialized = False
 
     def _load_audio_resources(self):
-        """載入音效資源"""
+        """登記音效資源（解碼延後到背景執行緒或第一次播放時）"""
         if not self.is_initialized:
             return
 
@@ -123,12 +136,12 @@ class AudioManager:
         )
 
     def _load_audio_folder(self, folder_path: str, audio_dict: Dict, audio_type: str):
-        """載入指定資料夾中的音效"""
+        """登記指定資料夾中的音效（設定載入器時排入背景載入）"""
         if not os.path.exists(folder_path):
             print(f"{audio_type} 資料夾不存在: {folder_path}")
             return
 
-        loaded_count = 0
+        found_count = 0
 
         try:
             for filename in os.listdir(folder_path):
@@ -139,23 +152,107 @@ class AudioManager:
                     filename.lower().endswith(fmt)
                     for fmt in self.audio_config["supported_formats"]
                 ):
-                    try:
-                        # 載入音效
-                        sound = pygame.mixer.Sound(file_path)
+                    # 使用檔名（不含副檔名）作為鍵值
+                    audio_name = os.path.splitext(filename)[0]
+                    self.audio_sources[(audio_type, audio_name)] = file_path
+                    found_count += 1
+
+                    if self.asset_loader:
+                        self._request_audio(audio_type, audio_name, audio_dict)
+
+            print(f"找到 {found_count} 個 {audio_type} 檔案")
+
+        except Exception as e:
+            print(f"讀取 {audio_type} 資料夾失敗: {e}")
+
+    def _audio_dicts(self):
+        """音效類型 -> 資源字典"""
+        return {
+            "BGM": self.bgm_tracks,
+            "SFX": self.sfx_sounds,
+            "Voice": self.voice_clips,
+            "Ambient": self.ambient_sounds,
+        }
 
-                        # 使用檔名（不含副檔名）作為鍵值
-                        audio_name = os.path.splitext(filename)[0]
-                        audio_dict[audio_name] = sound
+    def _request_audio(
+        self, audio_type: str, audio_name: str, audio_dict: Dict, priority=None
+    ):
+        """排入背景載入佇列（已在佇列中時只調整優先順序）"""
+        from systems.asset_loader import AssetPriority
+
+        callback = None
+        if (audio_type, audio_name) not in self.pending_audio:
+            self.pending_audio.add((audio_type, audio_name))
+            callback = lambda _, sound: self._on_audio_loaded(
+                audio_type, audio_name, audio_dict, sound
+            )
+        self.asset_loader.request(
+            f"sound:{audio_type}:{audio_name}",
+            self.audio_sources[(audio_type, audio_name)],
+            "sound",
+            callback,
+            AssetPriority.PREFETCH if priority is None else priority,
+        )
 
-                        loaded_count += 1
+    def _on_audio_loaded(self, audio_type: str, audio_name: str, audio_dict, sound):
+        """背景載入完成的回調（主執行緒）"""
+        self.pending_audio.discard((audio_type, audio_name))
+        if sound is None:
+            return
+        audio_dict[audio_name] = sound
+
+        # 播放等待中的BGM
+        if self.pending_bgm and audio_type == "BGM" and self.pending_bgm[0] == audio_name:
+            bgm_name, loop, fade_in = self.pending_bgm
+            self.pending_bgm = None
+            self.play_bgm(bgm_name, loop, fade_in)
+
+    def _ensure_loaded(self, audio_name: str, audio_dict: Dict, audio_type: str) -> bool:
+        """
+        確認音效已載入（未使用載入器時在這裡同步載入）
+
+        Returns:
+            bool: 是否可以立即播放
+        """
+        if audio_name in audio_dict:
+            return True
 
-                    except Exception as e:
-                        print(f"載入 {audio_type} 失敗 - {filename}: {e}")
+        file_path = self.audio_sources.get((audio_type, audio_name))
+        if file_path is None:
+            return False
 
-            print(f"載入 {loaded_count} 個 {audio_type} 檔案")
+        if self.asset_loader:
+            # 背景載入中 - 提高優先順序，這次不播放
+            from systems.asset_loader import AssetPriority
 
+            self._request_audio(audio_type, audio_name, audio_dict, AssetPriority.SCENE)
+            return False
+
+        try:
+            audio_dict[audio_name] = pygame.mixer.Sound(file_path)
+            return True
         except Exception as e:
-            print(f"讀取 {audio_type} 資料夾失敗: {e}")
+            print(f"載入 {audio_type} 失敗 - {os.path.basename(file_path)}: {e}")
+            self.audio_sources.pop((audio_type, audio_name), None)
+            return False
+
+    def request_sounds(self, names):
+        """
+        提高指定音效的載入優先順序（場景宣告的資源在進入場景時呼叫）
+
+        Args:
+            names (iterable): 音效名稱（任何類型）
+        """
+        if not self.asset_loader:
+            return
+        from systems.asset_loader import AssetPriority
+
+        audio_dicts = self._audio_dicts()
+        for audio_type, audio_name in list(self.pending_audio):
+            if audio_name in names:
+                self._request_audio(
+                    audio_type, audio_name, audio_dicts[audio_type], AssetPriority.SCENE
+                )
 
     def play_bgm(self, bgm_name: str, loop: bool = True, fade_in: float = 0.0):
         """播放背景音樂"""
@@ -163,7 +260,11 @@ class AudioManager:
             print("音效系統未初始化，無法播放BGM")
             return False
 
-        if bgm_name not in self.bgm_tracks:
+        if not self._ensure_loaded(bgm_name, self.bgm_tracks, "BGM"):
+            if ("BGM", bgm_name) in self.pending_audio:
+                # 背景載入中，完成後自動播放
+                self.pending_bgm = (bgm_name, loop, fade_in)
+                return True
             print(f"BGM不存在: {bgm_name}")
             return False
 
@@ -201,6 +302,7 @@ class AudioManager:
 
     def stop_bgm(self, fade_out: float = 0.0):
         """停止背景音樂"""
+        self.pending_bgm = None
         if not self.bgm_channel or not self.bgm_channel.get_busy():
             return
 
@@ -241,8 +343,9 @@ class AudioManager:
         if not self.is_initialized:
             return False
 
-        if sfx_name not in self.sfx_sounds:
-            print(f"音效不存在: {sfx_name}")
+        if not self._ensure_loaded(sfx_name, self.sfx_sounds, "SFX"):
+            if ("SFX", sfx_name) not in self.pending_audio:
+                print(f"音效不存在: {sfx_name}")
             return False
 
         try:
@@ -274,8 +377,9 @@ class AudioManager:
         if not self.is_initialized:
             return False
 
-        if voice_name not in self.voice_clips:
-            print(f"語音不存在: {voice_name}")
+        if not self._ensure_loaded(voice_name, self.voice_clips, "Voice"):
+            if ("Voice", voice_name) not in self.pending_audio:
+                print(f"語音不存在: {voice_name}")
             return False
 
         try:
@@ -303,8 +407,9 @@ class AudioManager:
         if not self.is_initialized:
             return False
 
-        if ambient_name not in self.ambient_sounds:
-            print(f"環境音不存在: {ambient_name}")
+        if not self._ensure_loaded(ambient_name, self.ambient_sounds, "Ambient"):
+            if ("Ambient", ambient_name) not in self.pending_audio:
+                print(f"環境音不存在: {ambient_name}")
             return False
 
         try:
@@ -404,13 +509,11 @@ class AudioManager:
         return self.current_bgm_name if self.is_bgm_playing() else None
 
     def get_available_audio(self) -> Dict[str, List[str]]:
-        """獲取可用的音效列表"""
-        return {
-            "bgm": list(self.bgm_tracks.keys()),
-            "sfx": list(self.sfx_sounds.keys()),
-            "voice": list(self.voice_clips.keys()),
-            "ambient": list(self.ambient_sounds.keys()),
-        }
+        """獲取可用的音效列表（包含尚未載入的音效）"""
+        available = {"bgm": [], "sfx": [], "voice": [], "ambient": []}
+        for audio_type, audio_name in self.audio_sources:
+            available[audio_type.lower()].append(audio_name)
+        return available
 
     def stop_all_audio(self):
         """停止所有音效"""
@@ -430,6 +533,7 @@ class AudioManager:
         self.sfx_sounds.clear()
         self.voice_clips.clear()
         self.ambient_sounds.clear()
+        self.pending_bgm = None
 
         if self.is_initialized:
             try:
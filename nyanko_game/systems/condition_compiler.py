@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+條件編譯系統
+對話選項、統一選擇、事件、日常事件、成就與活動前置條件共用同一種條件格式，
+條件字典只在第一次使用時編譯為判斷函數（每個條件項目一個閉包，條件值在編譯時綁定），
+之後每次檢查直接呼叫 condition.check(state)，不再逐項解析字典
+
+條件格式（所有項目都需成立）：
+    "affection_min" / "affection_max"    好感度（nyanko_affection）下限 / 上限
+    "<鍵>_min" / "<鍵>_max"              任意數值狀態的下限 / 上限，例如 "day_count_min"
+    "time_period"                        時間段（current_time_period），可為字串或列表
+    "weekday"                            星期（current_weekday），可為字串或列表
+    "flags" / "flags_required"           旗標需等於指定值
+    "flags_forbidden"                    旗標不可等於指定值
+    "special_events"                     需已完成的特殊事件（completed_special_events）
+    "unlocked_activities"                需已解鎖的活動（可為字串或列表）
+    其他鍵                               狀態值需等於指定值；條件值為列表時，
+                                         狀態值為列表或集合表示需包含全部項目，
+                                         否則表示需為其中之一
+
+值為 None、空字串或空列表的項目表示不限制
+
+每個編譯後的條件都列出會讀取的狀態鍵（reads），狀態改變時只需重新檢查受影響的條件
+"""
+
+import json
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+# 條件鍵對應的遊戲狀態鍵
+STATE_KEY_ALIASES = {
+    "affection": "nyanko_affection",
+    "time_period": "current_time_period",
+    "weekday": "current_weekday",
+    "special_events": "completed_special_events",
+    "flags_required": "flags",
+    "flags_forbidden": "flags",
+}
+
+
+class CompiledCondition:
+    """編譯後的條件"""
+
+    __slots__ = ("source", "reads", "check")
+
+    def __init__(
+        self,
+        source: Dict[str, Any],
+        check: Callable[[Dict[str, Any]], bool],
+        reads: FrozenSet[str],
+    ):
+        """
+        初始化編譯後的條件
+
+        Args:
+            source: 原始條件字典
+            check: 判斷函數（頻繁檢查時直接呼叫 condition.check(state)）
+            reads: 會讀取的遊戲狀態鍵
+        """
+        self.source = source
+        self.reads = reads
+        self.check = check
+
+    def __call__(self, state: Dict[str, Any]) -> bool:
+        """
+        檢查條件是否成立
+
+        Args:
+            state: 遊戲狀態
+
+        Returns:
+            bool: 是否成立
+        """
+        return self.check(state)
+
+    def depends_on(self, changed_keys) -> bool:
+        """
+        檢查條件是否受狀態改變影響（用於只重新檢查受影響的條件）
+
+        Args:
+            changed_keys: 改變的遊戲狀態鍵
+
+        Returns:
+            bool: 是否需要重新檢查
+        """
+        return not self.reads.isdisjoint(changed_keys)
+
+    def __repr__(self) -> str:
+        return f"CompiledCondition({self.source!r}, reads={sorted(self.reads)})"
+
+
+# 狀態中沒有旗標時使用的空字典（不會被修改）
+_EMPTY = {}
+
+
+def _always_true(state: Dict[str, Any]) -> bool:
+    return True
+
+
+ALWAYS_TRUE = CompiledCondition({}, _always_true, frozenset())
+
+
+def _match_list(actual: Any, expected: tuple) -> bool:
+    """
+    比對列表條件：狀態值為列表或集合時需包含全部項目，否則需為其中之一
+
+    Args:
+        actual: 遊戲狀態值
+        expected: 條件值
+
+    Returns:
+        bool: 是否成立
+    """
+    if isinstance(actual, (list, tuple, set, frozenset)):
+        return all(item in actual for item in expected)
+    return actual in expected
+
+
+class ConditionCompiler:
+    """條件編譯器（相同內容的條件只編譯一次）"""
+
+    def __init__(self):
+        """初始化條件編譯器"""
+        self.cache = {}  # 條件字典的正規化 JSON -> CompiledCondition
+        self.compiled_count = 0
+
+    def compile(self, conditions: Optional[Dict[str, Any]]) -> CompiledCondition:
+        """
+        將條件字典編譯為判斷函數
+
+        Args:
+            conditions: 條件字典（None 或空字典表示永遠成立）
+
+        Returns:
+            CompiledCondition: 編譯後的條件
+        """
+        if not conditions:
+            return ALWAYS_TRUE
+
+        try:
+            cache_key = json.dumps(conditions, sort_keys=True, ensure_ascii=False)
+        except TypeError:
+            cache_key = None  # 含有無法序列化的值時不快取
+        if cache_key is not None:
+            compiled = self.cache.get(cache_key)
+            if compiled is not None:
+                return compiled
+
+        checks = []
+        reads = set()
+        for key, value in conditions.items():
+            if value is None or value == "" or value == []:
+                continue  # 空值表示不限制
+            check, state_key = self._compile_clause(key, value)
+            checks.append(check)
+            reads.add(state_key)
+
+        if not checks:
+            check = _always_true
+        elif len(checks) == 1:
+            check = checks[0]
+        else:
+            checks = tuple(checks)
+
+            def check(state: Dict[str, Any]) -> bool:
+                return all(clause(state) for clause in checks)
+
+        compiled = CompiledCondition(dict(conditions), check, frozenset(reads))
+        self.compiled_count += 1
+        if cache_key is not None:
+            self.cache[cache_key] = compiled
+        return compiled
+
+    def _compile_clause(self, key: str, value: Any) -> Tuple[Callable, str]:
+        """
+        將單一條件項目轉換為判斷函數（條件值在這裡綁定，檢查時不再解析）
+
+        Args:
+            key: 條件鍵
+            value: 條件值
+
+        Returns:
+            tuple: (判斷函數, 讀取的遊戲狀態鍵)
+        """
+        # 旗標
+        if key in ("flags", "flags_required", "flags_forbidden"):
+            expected_flags = tuple(value.items())
+            if key == "flags_forbidden":
+
+                def check(state):
+                    flags = state.get("flags") or _EMPTY
+                    return all(flags.get(f) != v for f, v in expected_flags)
+
+            else:
+
+                def check(state):
+                    flags = state.get("flags") or _EMPTY
+                    return all(flags.get(f) == v for f, v in expected_flags)
+
+            return check, "flags"
+
+        # 需包含的項目（狀態值為 None 時視為空列表）
+        if key in ("special_events", "unlocked_activities"):
+            state_key = STATE_KEY_ALIASES.get(key, key)
+            required_items = (value,) if isinstance(value, str) else tuple(value)
+
+            def check(state):
+                items = state.get(state_key) or ()
+                return all(item in items for item in required_items)
+
+            return check, state_key
+
+        # 數值下限 / 上限（狀態值為 None 時視為 0）
+        if key.endswith("_min") or key.endswith("_max"):
+            base = key[:-4]
+            state_key = STATE_KEY_ALIASES.get(base, base)
+            if key.endswith("_min"):
+                return lambda state: (state.get(state_key) or 0) >= value, state_key
+            return lambda state: (state.get(state_key) or 0) <= value, state_key
+
+        # 等於指定值（列表表示需包含全部項目或為其中之一，依狀態值型別而定）
+        state_key = STATE_KEY_ALIASES.get(key, key)
+        if isinstance(value, (list, tuple, set)):
+            expected = tuple(value)
+            return lambda state: _match_list(state.get(state_key), expected), state_key
+        return lambda state: state.get(state_key) == value, state_key
+
+    def get_info(self) -> dict:
+        """
+        獲取編譯狀況（除錯資訊用）
+
+        Returns:
+            dict: 快取的條件數量、編譯次數
+        """
+        return {"cached": len(self.cache), "compiled": self.compiled_count}
+
+
+# 全域條件編譯器實例
+condition_compiler = ConditionCompiler()
+
+
+def compile_condition(conditions: Optional[Dict[str, Any]]) -> CompiledCondition:
+    """
+    編譯條件字典（使用全域條件編譯器）
+
+    Args:
+        conditions: 條件字典
+
+    Returns:
+        CompiledCondition: 編譯後的條件
+    """
+    return condition_compiler.compile(conditions)
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
+from systems.condition_compiler import compile_condition
+
 
 class EventType(Enum):
     """事件類型"""
@@ -53,6 +55,7 @@ class DailyEvent:
         self.required_day = 0
         self.weather_condition = None
         self.location_condition = None
+        self.compiled_condition = None
 
         # 事件結果
         self.dialogue_id = None
@@ -71,37 +74,26 @@ class DailyEvent:
         if self.max_executions > 0 and self.execution_count >= self.max_executions:
             return False
 
-        # 檢查好感度要求
-        if self.required_affection > 0:
-            if game_state.get("nyanko_affection", 0) < self.required_affection:
-                return False
-
-        # 檢查日期要求
-        if self.required_day > 0:
-            if game_state.get("day_count", 0) < self.required_day:
-                return False
-
-        # 檢查時間段
-        if self.time_period:
-            if game_state.get("current_time_period") != self.time_period:
-                return False
-
-        # 檢查天氣條件
-        if self.weather_condition:
-            if game_state.get("weather") != self.weather_condition:
-                return False
-
-        # 檢查位置條件
-        if self.location_condition:
-            if game_state.get("current_location") != self.location_condition:
-                return False
-
-        # 檢查其他自定義條件
-        for condition_key, condition_value in self.conditions.items():
-            if game_state.get(condition_key) != condition_value:
-                return False
-
-        return True
+        return self.get_condition().check(game_state)
+
+    def get_condition(self):
+        """
+        獲取編譯後的觸發條件（第一次檢查時編譯，條件屬性需在加入事件系統前設定好）
+
+        Returns:
+            CompiledCondition: 觸發條件
+        """
+        if self.compiled_condition is None:
+            condition = {
+                "affection_min": self.required_affection or None,
+                "day_count_min": self.required_day or None,
+                "time_period": self.time_period,
+                "weather": self.weather_condition,
+                "current_location": self.location_condition,
+            }
+            condition.update(self.conditions)
+            self.compiled_condition = compile_condition(condition)
+        return self.compiled_condition
 
     def execute(self, game_state: dict) -> dict:
         """執行事件"""
@@ -0,0 +1,494 @@
+# -*- coding: utf-8 -*-
+"""
+編譯後的對話資料包
+將 assets/dialogue_data.json 編譯為有索引的二進位檔（節點表 + 字串池 + 分類索引），
+執行時以 mmap 讀取，對話節點在第一次使用時才建立，啟動時間與記憶體不隨對話數量增加
+
+檔案結構（little-endian）：
+    標頭       魔術字、版本、來源檔案的修改時間 / 大小 / SHA-1、各區段位置
+    節點表     每個節點固定長度，依對話 ID 排序（以二分搜尋查找）
+    分類順序表 依分類排列的節點索引
+    分類表     每個分類的名稱與在分類順序表中的起點、數量
+    字串池     所有字串的 UTF-8 資料（重複字串只存一次）
+
+來源檔案的修改時間與大小相同時直接使用；不同時比對 SHA-1，內容改變才重新編譯
+
+編譯對話資料包（也會在執行時依需要自動編譯）：
+    python -m systems.dialogue_pack
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterator, List, Optional
+
+from config.settings import Paths
+
+PACK_MAGIC = b"NDLG"
+PACK_VERSION = 1
+
+# 魔術字、版本、保留、來源修改時間、來源大小、來源 SHA-1、節點數、分類數、各區段位置
+HEADER = struct.Struct("<4sHHqq20sIIIIII")
+# id、speaker、text、其他欄位 JSON 的 (位置, 長度)，分類索引、保留
+NODE_RECORD = struct.Struct("<8IHH")
+# 分類名稱 (位置, 長度)、分類順序表起點、節點數
+CATEGORY_RECORD = struct.Struct("<4I")
+ORDER_ENTRY = struct.Struct("<I")
+
+# 節點表中直接存放的欄位，其餘欄位（choices、conditions 等）以 JSON 存放，建立節點時才解析
+FIXED_FIELDS = ("id", "speaker", "text")
+
+SOURCE_ENCODINGS = ("utf-8-sig", "utf-8", "utf-16")
+
+
+class DialoguePackError(Exception):
+    """對話資料包格式錯誤"""
+
+
+def read_dialogue_source(source_path: str):
+    """
+    讀取對話資料 JSON（嘗試多種編碼方式）
+
+    Args:
+        source_path (str): 對話資料檔案路徑
+
+    Returns:
+        tuple: (原始位元組, 解析後的資料)
+    """
+    with open(source_path, "rb") as f:
+        raw = f.read()
+
+    for encoding in SOURCE_ENCODINGS:
+        try:
+            return raw, json.loads(raw.decode(encoding))
+        except (UnicodeDecodeError, ValueError):
+            continue
+
+    raise DialoguePackError(f"無法解析對話檔案: {source_path}")
+
+
+def compile_dialogue_pack(source_path: str, pack_path: str) -> int:
+    """
+    將對話資料 JSON 編譯為對話資料包
+
+    Args:
+        source_path (str): 對話資料檔案路徑
+        pack_path (str): 輸出的對話資料包路徑
+
+    Returns:
+        int: 節點數量
+    """
+    stat = os.stat(source_path)
+    raw, data = read_dialogue_source(source_path)
+
+    # 收集節點（ID 重複時後出現的覆蓋先出現的，與直接載入 JSON 相同）
+    categories = []
+    nodes = {}
+    for category, dialogues in data.get("dialogue_database", {}).items():
+        categories.append(category)
+        for dialogue_list in dialogues.values():
+            for node_data in dialogue_list:
+                node_id = node_data.get("id", "")
+                nodes.pop(node_id, None)
+                nodes[node_id] = (len(categories) - 1, node_data)
+
+    # 字串池
+    pool = bytearray()
+    pool_index = {}
+
+    def add_string(value: str):
+        encoded = value.encode("utf-8")
+        offset = pool_index.get(encoded)
+        if offset is None:
+            offset = len(pool)
+            pool_index[encoded] = offset
+            pool.extend(encoded)
+        return offset, len(encoded)
+
+    # 節點表依 ID 的 UTF-8 位元組排序，載入時以二分搜尋查找
+    sorted_ids = sorted(nodes, key=lambda node_id: node_id.encode("utf-8"))
+    node_table = bytearray()
+    for node_id in sorted_ids:
+        category_index, node_data = nodes[node_id]
+        extra = {
+            key: value for key, value in node_data.items() if key not in FIXED_FIELDS
+        }
+        fields = [node_id, node_data.get("speaker", ""), node_data.get("text", "")]
+        fields.append(
+            json.dumps(extra, ensure_ascii=False, separators=(",", ":"))
+            if extra
+            else ""
+        )
+        refs = []
+        for value in fields:
+            refs.extend(add_string(value))
+        node_table.extend(NODE_RECORD.pack(*refs, category_index, 0))
+
+    # 分類順序表與分類表
+    node_positions = {node_id: index for index, node_id in enumerate(sorted_ids)}
+    order_table = bytearray()
+    category_table = bytearray()
+    for category_index, category in enumerate(categories):
+        first = len(order_table) // ORDER_ENTRY.size
+        members = [
+            node_positions[node_id]
+            for node_id, (index, _) in nodes.items()
+            if index == category_index
+        ]
+        for position in members:
+            order_table.extend(ORDER_ENTRY.pack(position))
+        category_table.extend(
+            CATEGORY_RECORD.pack(*add_string(category), first, len(members))
+        )
+
+    node_offset = HEADER.size
+    order_offset = node_offset + len(node_table)
+    category_offset = order_offset + len(order_table)
+    pool_offset = category_offset + len(category_table)
+    header = HEADER.pack(
+        PACK_MAGIC,
+        PACK_VERSION,
+        0,
+        stat.st_mtime_ns,
+        stat.st_size,
+        hashlib.sha1(raw).digest(),
+        len(sorted_ids),
+        len(categories),
+        node_offset,
+        order_offset,
+        category_offset,
+        pool_offset,
+    )
+
+    # 先寫入暫存檔再替換，避免中途中斷留下損毀的檔案
+    os.makedirs(os.path.dirname(pack_path) or ".", exist_ok=True)
+    temp_path = pack_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        for block in (header, node_table, order_table, category_table, pool):
+            f.write(block)
+    os.replace(temp_path, pack_path)
+    return len(sorted_ids)
+
+
+def read_pack_header(pack_path: str) -> Optional[tuple]:
+    """
+    讀取對話資料包標頭（檔案不存在、格式或版本不符時返回 None）
+
+    Args:
+        pack_path (str): 對話資料包路徑
+
+    Returns:
+        tuple: 解析後的標頭欄位
+    """
+    try:
+        with open(pack_path, "rb") as f:
+            header = HEADER.unpack(f.read(HEADER.size))
+    except (OSError, struct.error):
+        return None
+    if header[0] != PACK_MAGIC or header[1] != PACK_VERSION:
+        return None
+    return header
+
+
+def _pack_is_current(pack_path: str, source_path: str, header: tuple) -> bool:
+    """
+    確認對話資料包是否與來源檔案一致
+
+    修改時間與大小相同時直接視為一致；不同時比對內容雜湊，
+    內容沒有改變則更新標頭中的修改時間，下次啟動不必重新計算
+
+    Args:
+        pack_path (str): 對話資料包路徑
+        source_path (str): 對話資料檔案路徑
+        header (tuple): 對話資料包標頭
+
+    Returns:
+        bool: 是否一致
+    """
+    stat = os.stat(source_path)
+    if (header[3], header[4]) == (stat.st_mtime_ns, stat.st_size):
+        return True
+
+    with open(source_path, "rb") as f:
+        digest = hashlib.sha1(f.read()).digest()
+    if digest != header[5]:
+        return False
+
+    updated = HEADER.pack(
+        *header[:3], stat.st_mtime_ns, stat.st_size, *header[5:]
+    )
+    with open(pack_path, "r+b") as f:
+        f.write(updated)
+    return True
+
+
+def load_dialogue_pack(
+    source_path: str, pack_path: str = Paths.DIALOGUE_PACK
+) -> Optional["DialoguePack"]:
+    """
+    開啟對話資料包，不存在或來源已改變時先重新編譯
+
+    只有對話資料包而沒有來源檔案時直接使用對話資料包
+
+    Args:
+        source_path (str): 對話資料檔案路徑
+        pack_path (str): 對話資料包路徑
+
+    Returns:
+        DialoguePack: 對話資料包，無法編譯或開啟時返回 None
+    """
+    try:
+        header = read_pack_header(pack_path)
+        if os.path.exists(source_path):
+            if header is None or not _pack_is_current(pack_path, source_path, header):
+                count = compile_dialogue_pack(source_path, pack_path)
+                print(f"已重新編譯對話資料包: {count} 個對話節點")
+        elif header is None:
+            print(f"警告: 對話資料檔案不存在: {source_path}")
+            return None
+
+        return DialoguePack(pack_path)
+    except (OSError, DialoguePackError) as e:
+        print(f"無法使用對話資料包: {e}")
+        return None
+
+
+class DialoguePack:
+    """
+    以 mmap 讀取的對話資料包
+
+    提供與 Dict[str, DialogueNode] 相同的查詢介面（in、[]、get、len），
+    對話節點在第一次存取時才建立並快取
+    """
+
+    def __init__(self, pack_path: str):
+        """
+        開啟對話資料包
+
+        Args:
+            pack_path (str): 對話資料包路徑
+        """
+        self.pack_path = pack_path
+        with open(pack_path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            header = HEADER.unpack_from(self.data, 0)
+        except struct.error:
+            self.data.close()
+            raise DialoguePackError(f"對話資料包已損毀: {pack_path}")
+        if header[0] != PACK_MAGIC or header[1] != PACK_VERSION:
+            self.data.close()
+            raise DialoguePackError(f"對話資料包版本不符: {pack_path}")
+
+        (
+            self.node_count,
+            self.category_count,
+            self.node_offset,
+            self.order_offset,
+            self.category_offset,
+            self.pool_offset,
+        ) = header[6:]
+        if self.pool_offset > len(self.data) or (
+            self.node_offset + self.node_count * NODE_RECORD.size > self.order_offset
+        ):
+            self.data.close()
+            raise DialoguePackError(f"對話資料包已損毀: {pack_path}")
+
+        self.nodes = {}  # 已建立的對話節點
+        self.positions = {}  # 對話 ID -> 節點表索引（-1 表示不存在）
+        self.loaded_categories = set()
+
+    def _string(self, offset: int, length: int) -> str:
+        """讀取字串池中的字串"""
+        start = self.pool_offset + offset
+        return self.data[start : start + length].decode("utf-8")
+
+    def _record(self, position: int) -> tuple:
+        """讀取節點表中的一筆記錄"""
+        return NODE_RECORD.unpack_from(
+            self.data, self.node_offset + position * NODE_RECORD.size
+        )
+
+    def _record_id(self, position: int) -> bytes:
+        """讀取節點記錄的 ID（UTF-8 位元組，二分搜尋用）"""
+        offset, length = self._record(position)[:2]
+        start = self.pool_offset + offset
+        return self.data[start : start + length]
+
+    def _find(self, dialogue_id: str) -> int:
+        """
+        以二分搜尋在節點表中查找對話 ID
+
+        Args:
+            dialogue_id (str): 對話 ID
+
+        Returns:
+            int: 節點表索引，不存在時返回 -1
+        """
+        position = self.positions.get(dialogue_id)
+        if position is not None:
+            return position
+
+        target = dialogue_id.encode("utf-8")
+        low, high = 0, self.node_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record_id(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+
+        position = -1
+        if low < self.node_count and self._record_id(low) == target:
+            position = low
+        self.positions[dialogue_id] = position
+        return position
+
+    def _materialize(self, position: int):
+        """
+        建立節點表中的對話節點
+
+        Args:
+            position (int): 節點表索引
+
+        Returns:
+            DialogueNode: 對話節點
+        """
+        from systems.dialogue_system import DialogueNode
+
+        record = self._record(position)
+        node_data = {
+            field: self._string(record[index * 2], record[index * 2 + 1])
+            for index, field in enumerate(FIXED_FIELDS)
+        }
+        if record[7]:
+            node_data.update(json.loads(self._string(record[6], record[7])))
+
+        node = DialogueNode(node_data)
+        self.nodes[node.id] = node
+        return node
+
+    def get(self, dialogue_id: str, default=None):
+        """
+        獲取對話節點（第一次存取時建立）
+
+        Args:
+            dialogue_id (str): 對話 ID
+            default: 不存在時的返回值
+
+        Returns:
+            DialogueNode: 對話節點
+        """
+        node = self.nodes.get(dialogue_id)
+        if node is not None:
+            return node
+
+        position = self._find(dialogue_id)
+        if position < 0:
+            return default
+        return self._materialize(position)
+
+    def __getitem__(self, dialogue_id: str):
+        node = self.get(dialogue_id)
+        if node is None:
+            raise KeyError(dialogue_id)
+        return node
+
+    def __contains__(self, dialogue_id) -> bool:
+        if dialogue_id in self.nodes:
+            return True
+        return isinstance(dialogue_id, str) and self._find(dialogue_id) >= 0
+
+    def __len__(self) -> int:
+        return self.node_count
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self.node_count):
+            yield self._record_id(position).decode("utf-8")
+
+    def keys(self) -> List[str]:
+        """所有對話 ID（依 ID 排序）"""
+        return list(self)
+
+    def get_categories(self) -> List[str]:
+        """
+        獲取所有分類名稱
+
+        Returns:
+            List[str]: 分類名稱（依來源檔案順序）
+        """
+        names = []
+        for index in range(self.category_count):
+            record = CATEGORY_RECORD.unpack_from(
+                self.data, self.category_offset + index * CATEGORY_RECORD.size
+            )
+            names.append(self._string(record[0], record[1]))
+        return names
+
+    def load_category(self, category: str) -> Dict[str, object]:
+        """
+        建立一個分類中的所有對話節點（例如進入場景前預先載入）
+
+        Args:
+            category (str): 分類名稱，例如 "scene_interactions"
+
+        Returns:
+            Dict[str, DialogueNode]: 對話 ID -> 對話節點，分類不存在時為空
+        """
+        for index in range(self.category_count):
+            record = CATEGORY_RECORD.unpack_from(
+                self.data, self.category_offset + index * CATEGORY_RECORD.size
+            )
+            if self._string(record[0], record[1]) != category:
+                continue
+
+            nodes = {}
+            for order in range(record[2], record[2] + record[3]):
+                (position,) = ORDER_ENTRY.unpack_from(
+                    self.data, self.order_offset + order * ORDER_ENTRY.size
+                )
+                dialogue_id = self._record_id(position).decode("utf-8")
+                node = self.nodes.get(dialogue_id) or self._materialize(position)
+                nodes[dialogue_id] = node
+            self.loaded_categories.add(category)
+            return nodes
+
+        return {}
+
+    def close(self):
+        """關閉對話資料包"""
+        if not self.data.closed:
+            self.data.close()
+
+    def get_info(self) -> dict:
+        """
+        獲取對話資料包狀況（除錯資訊用）
+
+        Returns:
+            dict: 節點數量、已建立的節點數量、檔案大小
+        """
+        return {
+            "path": self.pack_path,
+            "nodes": self.node_count,
+            "materialized": len(self.nodes),
+            "categories": self.category_count,
+            "loaded_categories": sorted(self.loaded_categories),
+            "size_bytes": len(self.data) if not self.data.closed else 0,
+        }
+
+
+def main():
+    """編譯對話資料包"""
+    source_path = sys.argv[1] if len(sys.argv) > 1 else Paths.DIALOGUE_SOURCE
+    pack_path = sys.argv[2] if len(sys.argv) > 2 else Paths.DIALOGUE_PACK
+    count = compile_dialogue_pack(source_path, pack_path)
+    size = os.path.getsize(pack_path)
+    print(f"對話資料包完成: {count} 個對話節點, {size / 1024:.1f} KB -> {pack_path}")
+
+
+if __name__ == "__main__":
+    main()
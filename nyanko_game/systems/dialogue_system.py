@@ -9,6 +9,9 @@ import json
 import os
 from typing import Dict, List, Optional, Any, Callable
 from config.settings import *
+from systems.font_manager import font_manager
+from systems.line_breaker import line_breaker
+from systems.condition_compiler import compile_condition
 
 
 class DialogueNode:
@@ -25,6 +28,7 @@ class DialogueNode:
         self.effects = data.get("effects", {})
         self.next_dialogue = data.get("next_dialogue", None)
         self.flags = data.get("flags", {})
+        self.choice_conditions = None  # 各選項編譯後的條件
 
     def has_choices(self) -> bool:
         """檢查是否有選擇選項"""
@@ -32,39 +36,23 @@ class DialogueNode:
 
     def get_valid_choices(self, game_state: Dict[str, Any]) -> List[Dict[str, Any]]:
         """獲取符合條件的選擇選項"""
-        valid_choices = []
-        for choice in self.choices:
-            if self._check_choice_conditions(choice, game_state):
-                valid_choices.append(choice)
-        return valid_choices
+        if self.choice_conditions is None:
+            # 第一次使用時才編譯（對話資料包中的節點不會全部用到）
+            self.choice_conditions = [
+                compile_condition(choice.get("conditions")) for choice in self.choices
+            ]
+
+        return [
+            choice
+            for choice, condition in zip(self.choices, self.choice_conditions)
+            if condition.check(game_state)
+        ]
 
     def _check_choice_conditions(
         self, choice: Dict[str, Any], game_state: Dict[str, Any]
     ) -> bool:
         """檢查選擇選項的條件"""
-        conditions = choice.get("conditions", {})
-
-        # 檢查好感度條件
-        if "affection_min" in conditions:
-            if game_state.get("nyanko_affection", 0) < conditions["affection_min"]:
-                return False
-
-        if "affection_max" in conditions:
-            if game_state.get("nyanko_affection", 0) > conditions["affection_max"]:
-                return False
-
-        # 檢查時間條件
-        if "time_period" in conditions:
-            if game_state.get("current_time", "") != conditions["time_period"]:
-                return False
-
-        # 檢查旗標條件
-        if "flags" in conditions:
-            for flag, required_value in conditions["flags"].items():
-                if game_state.get("flags", {}).get(flag) != required_value:
-                    return False
-
-        return True
+        return compile_condition(choice.get("conditions")).check(game_state)
 
 
 class DialogueSystem:
@@ -83,6 +71,7 @@ class DialogueSystem:
         self.text_progress = 0
         self.text_speed = UISettings.TEXT_SPEED_NORMAL
         self.text_complete = False
+        self.text_layout = None  # 目前對話文字的排版快取（換行位置、字元位置、已渲染的行）
 
         # UI相關
         self.dialogue_box_rect = None
@@ -169,20 +158,40 @@ class DialogueSystem:
         )
 
         # 載入字體
-        try:
-            self.font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.DIALOGUE_FONT_SIZE
-            )
-            self.speaker_font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.SPEAKER_FONT_SIZE
-            )
-        except (FileNotFoundError, OSError):
-            self.font = pygame.font.Font(None, FontSettings.DIALOGUE_FONT_SIZE)
-            self.speaker_font = pygame.font.Font(None, FontSettings.SPEAKER_FONT_SIZE)
+        self.font = font_manager.get_font(FontSettings.DIALOGUE_FONT_SIZE)
+        self.speaker_font = font_manager.get_font(FontSettings.SPEAKER_FONT_SIZE)
 
     def load_dialogue_data(self, file_path: str) -> bool:
         """
-        載入對話資料
+        載入對話資料（優先使用編譯後的對話資料包，節點在使用時才建立）
+
+        Args:
+            file_path: 對話資料檔案路徑
+
+        Returns:
+            bool: 是否載入成功
+        """
+        from systems.dialogue_pack import load_dialogue_pack
+
+        # 重新編譯時需要替換檔案，先關閉目前映射的對話資料包
+        self._close_dialogue_pack()
+        pack = load_dialogue_pack(file_path)
+        if pack is not None:
+            self.dialogue_data = pack
+            print(f"成功載入對話資料包: {len(pack)} 個對話節點")
+            return True
+
+        return self._load_dialogue_json(file_path)
+
+    def _close_dialogue_pack(self):
+        """關閉目前使用的對話資料包"""
+        if hasattr(self.dialogue_data, "close"):
+            self.dialogue_data.close()
+            self.dialogue_data = {}
+
+    def _load_dialogue_json(self, file_path: str) -> bool:
+        """
+        直接解析對話資料 JSON（無法使用對話資料包時）
 
         Args:
             file_path: 對話資料檔案路徑
@@ -213,7 +222,7 @@ class DialogueSystem:
                 return False
 
             # 解析對話資料
-            self.dialogue_data.clear()
+            self.dialogue_data = {}
 
             for category, dialogues in data.get("dialogue_database", {}).items():
                 for dialogue_type, dialogue_list in dialogues.items():
@@ -642,6 +651,7 @@ class DialogueSystem:
         self.full_text = ""
         self.text_progress = 0.0
         self.text_complete = False
+        self.text_layout = None
         self.waiting_for_input = False
         self.waiting_for_choice = False
         self.choice_buttons = []
@@ -730,7 +740,7 @@ class DialogueSystem:
         screen.blit(speaker_text, text_pos)
 
     def _render_dialogue_text(self, screen: pygame.Surface):
-        """繪製對話文字"""
+        """繪製對話文字（打字機效果只顯示預先渲染好的行的已顯示部分）"""
         if not self.displayed_text:
             return
 
@@ -742,47 +752,122 @@ class DialogueSystem:
             self.dialogue_box_rect.height - 2 * UISettings.DIALOGUE_TEXT_MARGIN,
         )
 
-        # 分行顯示文字
-        lines = self._wrap_text(self.displayed_text, self.font, text_rect.width)
+        layout = self._get_text_layout(self.full_text, text_rect)
+        visible_length = len(self.displayed_text)
+
+        for line in layout["lines"]:
+            if line["start"] >= visible_length:
+                break
+
+            # 每行只在第一次顯示時渲染一次
+            if line["surface"] is None:
+                line["surface"] = self.font.render(
+                    line["text"], True, Colors.TEXT_COLOR
+                )
+
+            position = (text_rect.x, text_rect.y + line["y"])
+            revealed = visible_length - line["start"]
+            if revealed >= len(line["text"]):
+                screen.blit(line["surface"], position)
+            else:
+                # 打字中的行只顯示已出現的字元
+                area = pygame.Rect(
+                    0, 0, line["x"][revealed], line["surface"].get_height()
+                )
+                screen.blit(line["surface"], position, area)
+
+    def _get_text_layout(self, text: str, text_rect: pygame.Rect) -> Dict[str, Any]:
+        """
+        獲取對話文字的排版（文字、字體或區域寬度改變時才重新計算）
+
+        Args:
+            text: 完整對話文字
+            text_rect: 文字區域
+
+        Returns:
+            Dict[str, Any]: 排版資料
+        """
+        key = (text, self.font, text_rect.width, text_rect.height)
+        if self.text_layout is None or self.text_layout["key"] != key:
+            self.text_layout = self._build_text_layout(
+                text, self.font, text_rect.width, text_rect.height
+            )
+            self.text_layout["key"] = key
+        return self.text_layout
+
+    def _build_text_layout(
+        self, text: str, font: pygame.font.Font, max_width: int, max_height: int
+    ) -> Dict[str, Any]:
+        """
+        計算完整對話文字的排版 - 換行位置與每個字元的 x 座標
+
+        Args:
+            text: 完整對話文字
+            font: 字體
+            max_width: 文字區域寬度
+            max_height: 文字區域高度（超出的行不顯示）
 
-        line_height = self.font.get_height()
+        Returns:
+            Dict[str, Any]: {"lines": [{"start", "text", "x", "y", "surface"}]}
+        """
+        line_height = font.get_height()
+        lines = []
         y_offset = 0
 
-        for line in lines:
-            if y_offset + line_height > text_rect.height:
+        for start, end in self._wrap_text_ranges(text, font, max_width):
+            if y_offset + line_height > max_height:
                 break
 
-            text_surface = self.font.render(line, True, Colors.TEXT_COLOR)
-            screen.blit(text_surface, (text_rect.x, text_rect.y + y_offset))
+            line_text = text[start:end]
+            x_positions = [0]
+            for char in line_text:
+                x_positions.append(
+                    x_positions[-1] + font_manager.get_char_width(font, char)
+                )
+
+            # 字元寬度為整數近似值，依整行實際寬度等比例修正
+            line_width = font.size(line_text)[0]
+            if x_positions[-1] and x_positions[-1] != line_width:
+                scale = line_width / x_positions[-1]
+                x_positions = [round(x * scale) for x in x_positions]
+
+            lines.append(
+                {
+                    "start": start,
+                    "text": line_text,
+                    "x": x_positions,
+                    "y": y_offset,
+                    "surface": None,
+                }
+            )
             y_offset += line_height + 2
 
+        return {"lines": lines}
+
     def _wrap_text(
         self, text: str, font: pygame.font.Font, max_width: int
     ) -> List[str]:
         """文字換行處理"""
-        words = text.split(" ")
-        lines = []
-        current_line = ""
+        return [
+            text[start:end]
+            for start, end in self._wrap_text_ranges(text, font, max_width)
+        ]
 
-        for word in words:
-            test_line = current_line + word + " " if current_line else word + " "
-            test_width = font.size(test_line)[0]
-
-            if test_width <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                    current_line = word + " "
-                else:
-                    # 單詞太長，強制分行
-                    lines.append(word)
-                    current_line = ""
+    def _wrap_text_ranges(
+        self, text: str, font: pygame.font.Font, max_width: int
+    ) -> List[tuple]:
+        """
+        文字換行處理（中日文禁則處理，結果由換行處理器快取）
 
-        if current_line:
-            lines.append(current_line.strip())
+        Args:
+            text: 文字
+            font: 字體
+            max_width: 最大寬度
 
-        return lines
+        Returns:
+            List[tuple]: 每行在原文字中的 (開始, 結束) 索引
+        """
+        return list(line_breaker.wrap(text, font, max_width))
 
     def _render_choice_buttons(self, screen: pygame.Surface):
         """繪製選擇按鈕"""
@@ -855,6 +940,24 @@ class DialogueSystem:
         """檢查對話是否活躍"""
         return self.is_active
 
+    def get_render_rect(self) -> pygame.Rect:
+        """
+        對話框與說話者名字框佔用的畫面區域（打字機效果只會改變這個區域）
+
+        Returns:
+            pygame.Rect: 區域（遊戲座標）
+        """
+        box = self.dialogue_box_rect
+        return box.union(pygame.Rect(box.x, box.y - 25, box.width, 25))
+
+    def is_animating(self) -> bool:
+        """打字機效果進行中（文字尚未完全顯示）時需要每幀重繪"""
+        return (
+            self.is_active
+            and self.current_dialogue is not None
+            and not self.text_complete
+        )
+
     def get_current_speaker(self) -> str:
         """獲取當前說話者"""
         return self.current_dialogue.speaker if self.current_dialogue else ""
@@ -18,6 +18,8 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import json
 
+from systems.condition_compiler import compile_condition
+
 
 class TimePeriod(Enum):
     """時間段枚舉"""
@@ -131,17 +133,14 @@ class SpecialEvent(TimeEvent):
     ):
         super().__init__(event_id, name, description)
         self.conditions = conditions
+        self.condition = compile_condition(conditions)
 
     def can_trigger(self, context: Dict[str, Any]) -> bool:
         if self.is_completed:
             return False
 
         # 檢查觸發條件
-        for key, required_value in self.conditions.items():
-            if context.get(key) != required_value:
-                return False
-
-        return True
+        return self.condition.check(context)
 
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         self.is_completed = True
@@ -156,6 +155,7 @@ class EventDrivenTimeSystem:
         self.activities: Dict[str, ActivityChoice] = {}
         self.events: Dict[str, TimeEvent] = {}
         self.activity_history: List[Dict[str, Any]] = []
+        self.activity_conditions = {}  # 活動 ID -> 編譯後的前置條件
         self.game_state = {
             "nyanko_energy": 100,
             "nyanko_affection": 50,
@@ -404,7 +404,7 @@ class EventDrivenTimeSystem:
                 continue
 
             # 檢查前置條件
-            if not self._check_requirements(activity.requirements):
+            if not self._get_activity_condition(activity).check(self.game_state):
                 continue
 
             # 檢查是否有足夠時間點數
@@ -416,15 +416,32 @@ class EventDrivenTimeSystem:
         return available
 
     def _check_requirements(self, requirements: Dict[str, Any]) -> bool:
-        """檢查活動前置條件"""
+        """檢查活動前置條件（數值條件為下限）"""
+        condition = compile_condition(self._requirements_to_condition(requirements))
+        return condition.check(self.game_state)
+
+    def _get_activity_condition(self, activity: ActivityChoice):
+        """獲取活動前置條件編譯後的判斷函數（每個活動只編譯一次）"""
+        condition = self.activity_conditions.get(activity.id)
+        if condition is None:
+            condition = compile_condition(
+                self._requirements_to_condition(activity.requirements)
+            )
+            self.activity_conditions[activity.id] = condition
+        return condition
+
+    @staticmethod
+    def _requirements_to_condition(requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """將活動前置條件轉換為條件格式（未標示上下限的數值條件轉為 "<鍵>_min"）"""
+        condition = {}
         for key, value in requirements.items():
-            if key == "unlocked_activities":
-                if value not in self.game_state.get("unlocked_activities", []):
-                    return False
-            elif key in self.game_state:
-                if self.game_state[key] < value:
-                    return False
-        return True
+            if key.endswith("_min") or key.endswith("_max"):
+                condition[key] = value
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                condition[f"{key}_min"] = value
+            else:
+                condition[key] = value
+        return condition
 
     def execute_activity(self, activity_id: str) -> Dict[str, Any]:
         """執行活動"""
@@ -610,6 +627,7 @@ class EventDrivenTimeSystem:
     def add_custom_activity(self, activity: ActivityChoice):
         """添加自定義活動"""
         self.activities[activity.id] = activity
+        self.activity_conditions.pop(activity.id, None)
 
     def add_custom_event(self, event: TimeEvent):
         """添加自定義事件"""
@@ -9,6 +9,8 @@ import random
 from typing import Dict, List, Optional, Any, Callable
 from enum import Enum
 
+from systems.condition_compiler import compile_condition
+
 
 class EventType(Enum):
     """事件類型枚舉"""
@@ -45,35 +47,20 @@ class EventCondition:
         self.cooldown_hours = data.get("cooldown_hours", 0)
         self.max_triggers = data.get("max_triggers", -1)  # -1 表示無限制
 
+        # 狀態條件（概率、冷卻與次數限制不屬於遊戲狀態，另外檢查）
+        self.condition = compile_condition(
+            {
+                key: value
+                for key, value in data.items()
+                if key not in ("probability", "cooldown_hours", "max_triggers")
+            }
+        )
+
     def check_conditions(self, game_state: Dict[str, Any]) -> bool:
         """檢查條件是否滿足"""
-        # 檢查好感度條件
-        nyanko_affection = game_state.get("nyanko_affection", 0)
-        if not (self.affection_min <= nyanko_affection <= self.affection_max):
-            return False
-
-        # 檢查時間段條件
-        if (
-            self.time_period
-            and game_state.get("current_time_period", "") != self.time_period
-        ):
+        if not self.condition.check(game_state):
             return False
 
-        # 檢查星期條件
-        if self.weekday and game_state.get("current_weekday", "") not in self.weekday:
-            return False
-
-        # 檢查必需旗標
-        game_flags = game_state.get("flags", {})
-        for flag, required_value in self.flags_required.items():
-            if game_flags.get(flag) != required_value:
-                return False
-
-        # 檢查禁止旗標
-        for flag, forbidden_value in self.flags_forbidden.items():
-            if game_flags.get(flag) == forbidden_value:
-                return False
-
         # 檢查概率
         if random.random() > self.probability:
             return False
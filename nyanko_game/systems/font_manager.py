@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+字體管理系統
+統一解析字體檔案路徑（只解析一次）、依 (路徑, 大小, 粗體) 快取字體物件，
+並提供快取的字元寬度表供文字排版使用
+"""
+
+import os
+import warnings
+import weakref
+
+import pygame
+
+from config.settings import FontSettings, Paths
+
+
+class FontManager:
+    """字體管理器"""
+
+    # 找不到指定字體檔案時，依序嘗試的系統中文字體名稱（pygame.font.match_font）
+    SYSTEM_FONT_NAMES = (
+        "microsoftjhenghei",
+        "microsoftjhengheiui",
+        "notosanscjktc",
+        "notosanscjk",
+        "notosanstc",
+        "pingfangtc",
+        "wenquanyizenhei",
+        "droidsansfallback",
+    )
+
+    def __init__(self):
+        """初始化字體管理器"""
+        self.font_paths = {}  # 是否粗體 -> 解析後的字體路徑（None 表示 pygame 預設字體）
+        self.fonts = {}  # (路徑, 大小, 粗體) -> pygame.font.Font
+        self.width_tables = weakref.WeakKeyDictionary()  # 字體 -> {字元: 前進寬度}
+
+        # 統計
+        self.font_hits = 0
+        self.font_misses = 0
+
+    def resolve_font_path(self, bold: bool = False):
+        """
+        解析字體檔案路徑（結果會快取，每種字重只搜尋一次）
+
+        依序嘗試：設定中的字體路徑、assets/fonts 內的字體檔案、系統中文字體
+
+        Args:
+            bold (bool): 是否使用粗體
+
+        Returns:
+            str: 字體檔案路徑，找不到時為 None（使用 pygame 預設字體）
+        """
+        if bold in self.font_paths:
+            return self.font_paths[bold]
+
+        candidates = []
+        if bold:
+            candidates.append(FontSettings.FALLBACK_FONT)
+        candidates.append(FontSettings.DEFAULT_FONT)
+        candidates.extend(self._bundled_fonts())
+
+        font_path = None
+        for path in candidates:
+            if path and os.path.isfile(path):
+                font_path = path
+                break
+
+        if font_path is None:
+            font_path = self._match_system_font(bold)
+
+        if font_path is None:
+            print("警告: 無法載入指定字體，使用系統預設字體")
+        else:
+            print(f"使用字體: {font_path}")
+
+        self.font_paths[bold] = font_path
+        return font_path
+
+    def _bundled_fonts(self) -> list:
+        """
+        列出 assets/fonts 內的字體檔案
+
+        Returns:
+            list: 字體檔案路徑（依檔名排序）
+        """
+        if not os.path.isdir(Paths.FONTS_DIR):
+            return []
+
+        return [
+            os.path.join(Paths.FONTS_DIR, name)
+            for name in sorted(os.listdir(Paths.FONTS_DIR))
+            if name.lower().endswith((".ttf", ".ttc", ".otf"))
+        ]
+
+    def _match_system_font(self, bold: bool):
+        """
+        從系統已安裝的字體中尋找中文字體
+
+        Args:
+            bold (bool): 是否使用粗體
+
+        Returns:
+            str: 字體檔案路徑，找不到時為 None
+        """
+        try:
+            # 沒有 fc-list 的平台會發出警告，找不到字體時本來就會退回預設字體
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                return pygame.font.match_font(self.SYSTEM_FONT_NAMES, bold=bold)
+        except Exception as e:
+            print(f"搜尋系統字體失敗: {e}")
+            return None
+
+    def get_font(self, size: int, bold: bool = False, fallback_size: int = None):
+        """
+        獲取字體（依路徑、大小、粗體快取）
+
+        Args:
+            size (int): 字體大小
+            bold (bool): 是否使用粗體
+            fallback_size (int): 使用 pygame 預設字體時的大小，None 表示與 size 相同
+
+        Returns:
+            pygame.font.Font: 字體物件
+        """
+        font_path = self.resolve_font_path(bold)
+        if font_path is None and fallback_size is not None:
+            size = fallback_size
+
+        key = (font_path, size, bold)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.font_hits += 1
+            return font
+
+        self.font_misses += 1
+        try:
+            font = pygame.font.Font(font_path, size)
+        except (FileNotFoundError, OSError) as e:
+            print(f"警告: 無法載入字體 {font_path} ({e})，使用系統預設字體")
+            font = pygame.font.Font(None, size)
+
+        # 粗體檔案不存在而與一般字重共用同一個檔案時，改用模擬粗體
+        if bold and font_path == self.resolve_font_path(False):
+            font.set_bold(True)
+
+        self.fonts[key] = font
+        return font
+
+    def get_default_font(self, size: int):
+        """
+        獲取 pygame 預設字體（英數字用，不需要中文字體時使用）
+
+        Args:
+            size (int): 字體大小
+
+        Returns:
+            pygame.font.Font: 字體物件
+        """
+        key = (None, size, False)
+        font = self.fonts.get(key)
+        if font is None:
+            self.font_misses += 1
+            font = pygame.font.Font(None, size)
+            self.fonts[key] = font
+        else:
+            self.font_hits += 1
+        return font
+
+    def get_width_table(self, font: pygame.font.Font) -> dict:
+        """
+        獲取字體的字元寬度表
+
+        Args:
+            font (pygame.font.Font): 字體物件
+
+        Returns:
+            dict: 字元 -> 前進寬度（像素）
+        """
+        table = self.width_tables.get(font)
+        if table is None:
+            table = {}
+            self.width_tables[font] = table
+        return table
+
+    def get_char_width(self, font: pygame.font.Font, char: str) -> int:
+        """
+        獲取單一字元的前進寬度（快取）
+
+        Args:
+            font (pygame.font.Font): 字體物件
+            char (str): 字元
+
+        Returns:
+            int: 前進寬度（像素）
+        """
+        table = self.get_width_table(font)
+        width = table.get(char)
+        if width is None:
+            self._measure_chars(font, table, char)
+            width = table[char]
+        return width
+
+    def get_text_width(self, font: pygame.font.Font, text: str) -> int:
+        """
+        以字元寬度表計算文字寬度（不需要實際渲染文字）
+
+        Args:
+            font (pygame.font.Font): 字體物件
+            text (str): 文字
+
+        Returns:
+            int: 文字寬度（像素）
+        """
+        table = self.get_width_table(font)
+        missing = [char for char in set(text) if char not in table]
+        if missing:
+            self._measure_chars(font, table, "".join(missing))
+        return sum(table[char] for char in text)
+
+    def _measure_chars(self, font: pygame.font.Font, table: dict, chars: str):
+        """
+        測量字元寬度並寫入寬度表（一次 metrics 呼叫測量多個字元）
+
+        Args:
+            font (pygame.font.Font): 字體物件
+            table (dict): 字元寬度表
+            chars (str): 要測量的字元
+        """
+        metrics = font.metrics(chars)
+        for char, metric in zip(chars, metrics):
+            if metric is None:
+                # 字體沒有此字元（或為控制字元），退回實際測量
+                table[char] = font.size(char)[0]
+            else:
+                table[char] = metric[4]
+
+    def get_info(self) -> dict:
+        """
+        獲取字體快取狀況（除錯資訊用）
+
+        Returns:
+            dict: 字體路徑、快取的字體數量與命中次數
+        """
+        return {
+            "font_path": self.font_paths.get(False),
+            "bold_font_path": self.font_paths.get(True),
+            "fonts": len(self.fonts),
+            "width_tables": len(self.width_tables),
+            "hits": self.font_hits,
+            "misses": self.font_misses,
+        }
+
+
+# 全域字體管理器實例
+font_manager = FontManager()
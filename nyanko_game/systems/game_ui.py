@@ -6,7 +6,8 @@
 
 import pygame
 from typing import Dict, Any, Optional
-from config.settings import Colors, FontSettings
+from config.settings import Colors
+from systems.font_manager import font_manager
 
 
 class GameStatusUI:
@@ -50,23 +51,14 @@ class GameStatusUI:
 
     def _setup_fonts(self):
         """設置字體"""
-        try:
-            self.fonts = {
-                "title": pygame.font.Font(FontSettings.DEFAULT_FONT, 28),
-                "large": pygame.font.Font(FontSettings.DEFAULT_FONT, 24),
-                "medium": pygame.font.Font(FontSettings.DEFAULT_FONT, 20),
-                "small": pygame.font.Font(FontSettings.DEFAULT_FONT, 16),
-                "tiny": pygame.font.Font(FontSettings.DEFAULT_FONT, 14),
-            }
-        except (FileNotFoundError, OSError):
-            # 使用系統預設字體
-            self.fonts = {
-                "title": pygame.font.Font(None, 32),
-                "large": pygame.font.Font(None, 28),
-                "medium": pygame.font.Font(None, 24),
-                "small": pygame.font.Font(None, 20),
-                "tiny": pygame.font.Font(None, 18),
-            }
+        # 使用系統預設字體時字形較小，大小加 4
+        self.fonts = {
+            "title": font_manager.get_font(28, fallback_size=32),
+            "large": font_manager.get_font(24, fallback_size=28),
+            "medium": font_manager.get_font(20, fallback_size=24),
+            "small": font_manager.get_font(16, fallback_size=20),
+            "tiny": font_manager.get_font(14, fallback_size=18),
+        }
 
     def update(self, dt: float):
         """更新動畫效果"""
@@ -87,6 +79,17 @@ class GameStatusUI:
         if self.animations["affection_sparkle"] > 2 * math.pi:
             self.animations["affection_sparkle"] = 0
 
+    def is_animating(self) -> bool:
+        """
+        狀態面板是否有可見的動畫
+
+        time_glow 等動畫值目前沒有反映在繪製結果上，面板只在狀態改變時需要重繪
+
+        Returns:
+            bool: 是否需要每幀重繪
+        """
+        return False
+
     def draw_main_status_panel(
         self, screen: pygame.Surface, time_info: Dict, game_state: Dict
     ):
@@ -483,10 +486,7 @@ class MinimalStatusUI:
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        try:
-            self.font = pygame.font.Font(FontSettings.DEFAULT_FONT, 18)
-        except (FileNotFoundError, OSError):
-            self.font = pygame.font.Font(None, 22)
+        self.font = font_manager.get_font(18, fallback_size=22)
 
     def draw(self, screen: pygame.Surface, time_info: Dict, game_state: Dict):
         """繪製精簡UI"""
@@ -6,7 +6,9 @@
 
 import pygame
 import os
-from config.settings import Paths
+from collections import OrderedDict
+from config.settings import Paths, ImageScaling
+from systems.asset_loader import AssetPriority
 
 
 class ImageManager:
@@ -15,14 +17,53 @@ class ImageManager:
     def __init__(self):
         """初始化圖片管理器"""
         self.images = {}
+        self.image_info = {}  # 圖片識別鍵 -> {"category": 分類, "opaque": 是否不透明}
         self.loaded = False
 
+        # 非同步載入 - 設定載入器後圖片在背景執行緒解碼，完成前以佔位圖片代替
+        self.loader = None
+        self.image_sources = {}  # 圖片識別鍵 -> 檔案路徑
+        self.pending_images = set()  # 仍在載入中（目前為佔位圖片）的識別鍵
+
+        # 預先烘焙的圖片快取 - 設定後以原始像素檔取代 PNG 解碼與縮放
+        self.asset_cache = None
+
+        # 縮放圖片快取 - 鍵為 (圖片識別鍵, 目標尺寸, 縮放模式)，依最近使用順序排列
+        self.scaled_cache = OrderedDict()
+        self.scaled_cache_bytes = 0
+        self.scaled_cache_budget = ImageScaling.SCALED_CACHE_MAX_MB * 1024 * 1024
+        self.memory_budget = ImageScaling.SURFACE_MEMORY_MAX_MB * 1024 * 1024
+        self.scaled_cache_hits = 0
+        self.scaled_cache_misses = 0
+
+    def start_streaming(self, loader):
+        """
+        改為非同步載入 - 所有圖片先以佔位圖片代替，在背景依序預先載入
+
+        Args:
+            loader (AssetLoader): 已啟動的資源載入器
+        """
+        self.loader = loader
+        self.load_all_images()
+
+    def enable_asset_cache(self, cache):
+        """
+        使用預先烘焙的圖片快取（需在載入圖片前設定）
+
+        Args:
+            cache (AssetCache): 圖片快取
+        """
+        self.asset_cache = cache
+
     def load_all_images(self):
-        """載入所有遊戲圖片"""
+        """載入所有遊戲圖片（設定載入器時只排入背景載入佇列）"""
         if self.loaded:
             return
 
-        print("正在載入圖片資源...")
+        if self.loader:
+            print("正在排入背景圖片載入...")
+        else:
+            print("正在載入圖片資源...")
 
         # 載入背景圖片
         self._load_backgrounds()
@@ -34,7 +75,34 @@ class ImageManager:
         self._load_ui()
 
         self.loaded = True
-        print("圖片資源載入完成!")
+        if not self.loader:
+            print("圖片資源載入完成!")
+
+    def request_images(self, keys, priority=AssetPriority.SCENE):
+        """
+        提高指定圖片的載入優先順序（場景宣告的資源在進入場景時呼叫）
+
+        Args:
+            keys (iterable): 圖片識別鍵
+            priority (int): 載入優先順序
+        """
+        if not self.loader:
+            return
+        for key in keys:
+            if key in self.pending_images:
+                self._request_image(key, priority)
+
+    def is_ready(self, keys):
+        """
+        檢查圖片是否都已載入完成（不再是佔位圖片）
+
+        Args:
+            keys (iterable): 圖片識別鍵
+
+        Returns:
+            bool: 是否全部完成
+        """
+        return not any(key in self.pending_images for key in keys)
 
     def _load_backgrounds(self):
         """載入背景圖片"""
@@ -78,38 +146,137 @@ class ImageManager:
 
     def _load_image(self, key, filepath):
         """
-        載入單張圖片
+        載入單張圖片（設定載入器時先放入佔位圖片，由背景執行緒載入）
 
         Args:
             key (str): 圖片的識別鍵
             filepath (str): 圖片檔案路徑
         """
+        self.image_sources[key] = filepath
+        if self.loader and os.path.exists(filepath):
+            self._store_image(key, self._create_placeholder_image(key), True)
+            self._request_image(key, AssetPriority.PREFETCH)
+            return
+
         try:
             if os.path.exists(filepath):
-                image = pygame.image.load(filepath).convert_alpha()
-                self.images[key] = image
+                image = None
+                opaque = None
+                if self.asset_cache:
+                    image = self.asset_cache.load(key, filepath)
+                    opaque = self.asset_cache.is_opaque(key)
+                if image is None:
+                    image = pygame.image.load(filepath)
+                self._store_image(key, image, opaque)
                 print(f"已載入圖片: {key} ({filepath})")
             else:
                 print(f"警告: 找不到圖片檔案: {filepath}")
                 # 創建佔位圖片
-                self.images[key] = self._create_placeholder_image(key)
+                self._store_image(key, self._create_placeholder_image(key), True)
         except pygame.error as e:
             print(f"錯誤: 無法載入圖片 {filepath}: {e}")
-            self.images[key] = self._create_placeholder_image(key)
+            self._store_image(key, self._create_placeholder_image(key), True)
+
+    def _store_image(self, key, surface, opaque=None):
+        """
+        轉換為顯示器格式並記錄圖片分類（不透明的圖片不帶 alpha，blit 時不需要逐像素混合）
 
-    def _create_placeholder_image(self, key):
+        Args:
+            key (str): 圖片識別鍵
+            surface (pygame.Surface): 圖片
+            opaque (bool): 是否不透明，None 時自動判斷
+        """
+        if opaque is None:
+            opaque = ImageScaling.is_opaque(surface)
+        self.images[key] = ImageScaling.to_display_format(surface, opaque)
+        self.image_info[key] = {
+            "category": self._image_category(key),
+            "opaque": opaque,
+        }
+
+    def _image_category(self, key):
+        """依來源路徑分類圖片（記憶體統計用）"""
+        filepath = self.image_sources.get(key)
+        if filepath is None:
+            return "generated"  # 執行期產生的圖片（例如場景的備用背景）
+        filepath = filepath.replace(os.sep, "/")
+        for category, directory in (
+            ("backgrounds", Paths.BACKGROUNDS_DIR),
+            ("characters", Paths.CHARACTERS_DIR),
+            ("ui", Paths.UI_DIR),
+        ):
+            if filepath.startswith(directory):
+                return category
+        return "other"
+
+    def _request_image(self, key, priority):
+        """排入背景載入佇列（已在佇列中時只調整優先順序）"""
+        callback = None
+        if key not in self.pending_images:
+            self.pending_images.add(key)
+            callback = lambda _, image: self._on_image_loaded(key, image)
+        self.loader.request(
+            f"image:{key}",
+            self.image_sources[key],
+            "image",
+            callback,
+            priority,
+            decoder=lambda path: self._decode_image(key, path),
+        )
+
+    def _decode_image(self, key, filepath):
+        """
+        背景執行緒：解碼圖片（優先從圖片快取讀取）並判斷是否不透明
+
+        不透明的圖片在這裡移除 alpha 通道，主執行緒接手時只需要 convert()
+
+        Returns:
+            pygame.Surface: 解碼後的圖片
+        """
+        image = None
+        opaque = None
+        if self.asset_cache:
+            image = self.asset_cache.load(key, filepath, convert=False)
+            opaque = self.asset_cache.is_opaque(key)
+        if image is None:
+            image = pygame.image.load(filepath)
+        if opaque is None:
+            opaque = ImageScaling.is_opaque(image)
+        if opaque and image.get_flags() & pygame.SRCALPHA:
+            image = ImageScaling.remove_alpha(image)
+        return image
+
+    def _on_image_loaded(self, key, image):
+        """
+        背景載入完成的回調（主執行緒，圖片已轉換為顯示格式）
+
+        Args:
+            key (str): 圖片識別鍵
+            image (pygame.Surface): 載入的圖片，失敗時為None（保留佔位圖片）
+        """
+        self.pending_images.discard(key)
+        if image is None:
+            return
+        # 背景執行緒已移除不透明圖片的 alpha，這裡不需要再檢查像素
+        self._store_image(key, image, not image.get_flags() & pygame.SRCALPHA)
+        # 佔位圖片的縮放結果已失效
+        self._discard_scaled(key)
+        print(f"已載入圖片: {key} ({self.image_sources[key]})")
+
+    def _create_placeholder_image(self, key, size=None):
         """
         創建佔位圖片
 
         Args:
             key (str): 圖片識別鍵
+            size (tuple): 圖片尺寸，None 時使用預設尺寸
 
         Returns:
             pygame.Surface: 佔位圖片
         """
         if "bg_" in key:
             # 背景佔位圖片
-            surface = pygame.Surface((1280, 720))
+            surface = pygame.Surface(size or (1280, 720))
             if "early_morning" in key:
                 surface.fill((255, 240, 220))  # 淡橙色代表清晨
             elif "morning" in key:
@@ -122,7 +289,7 @@ class ImageManager:
                 surface.fill((100, 100, 200))  # 深藍色代表夜晚
         else:
             # 角色佔位圖片
-            surface = pygame.Surface((300, 400))
+            surface = pygame.Surface(size or (300, 400))
             surface.fill((255, 182, 193))  # 粉色
 
         return surface
@@ -135,30 +302,208 @@ class ImageManager:
             key (str): 圖片識別鍵
 
         Returns:
-            pygame.Surface: 圖片物件，如果不存在則返回None
+            pygame.Surface: 圖片物件（背景載入中時為佔位圖片），如果不存在則返回None
         """
         if not self.loaded:
             self.load_all_images()
 
         return self.images.get(key)
 
+    def add_image(self, key, surface):
+        """
+        註冊執行期產生的圖片（例如場景的備用背景）
+
+        Args:
+            key (str): 圖片識別鍵
+            surface (pygame.Surface): 圖片物件
+        """
+        self._store_image(key, surface)
+        self._discard_scaled(key)
+
     def get_scaled_image(self, key, size):
         """
-        獲取縮放後的圖片 - 使用像素完整縮放
+        獲取縮放後的圖片 - 使用像素完整縮放，結果會被快取
+
+        同一張圖片在相同尺寸與縮放模式下只會縮放一次，之後每幀直接返回快取的結果。
+        快取超過記憶體預算時淘汰最久未使用的縮放結果。
+        背景載入中的圖片返回目標尺寸的佔位圖片（載入完成時清除），不在主執行緒讀取或產生圖片快取。
 
         Args:
             key (str): 圖片識別鍵
             size (tuple): 目標尺寸 (width, height)
 
         Returns:
-            pygame.Surface: 縮放後的圖片
+            pygame.Surface: 縮放後的圖片（與快取共用，請勿直接修改）
+        """
+        size = (int(size[0]), int(size[1]))
+        cache_key = (key, size, self._scaling_mode())
+        scaled = self.scaled_cache.get(cache_key)
+        if scaled is not None:
+            self.scaled_cache.move_to_end(cache_key)
+            self.scaled_cache_hits += 1
+            return scaled
+
+        self.scaled_cache_misses += 1
+        if key in self.pending_images:
+            # 佔位圖片是單色的，直接以目標尺寸產生，不需要縮放
+            scaled = self._create_placeholder_image(key, size)
+        else:
+            scaled = self._load_scaled_from_cache(key, size)
+        if scaled is None:
+            image = self.get_image(key)
+            if not image:
+                return None
+            scaled = ImageScaling.pixel_perfect_scale(image, size)
+        self.scaled_cache[cache_key] = scaled
+        self.scaled_cache_bytes += self._surface_bytes(scaled)
+        self._evict_scaled()
+        return scaled
+
+    def _load_scaled_from_cache(self, key, size):
         """
-        image = self.get_image(key)
-        if image:
-            from config.settings import ImageScaling
+        從預先烘焙的圖片快取讀取縮放結果
 
-            return ImageScaling.pixel_perfect_scale(image, size)
-        return None
+        沒有快取時：設定載入器時交給背景執行緒產生（這次由呼叫者在記憶體中縮放），
+        否則在此產生並寫入
+
+        Returns:
+            pygame.Surface: 縮放後的圖片，無法使用快取時返回None
+        """
+        filepath = self.image_sources.get(key)
+        if not self.asset_cache or filepath is None:
+            return None
+        if not self.loader:
+            return self.asset_cache.load(key, filepath, size)
+
+        scaled = self.asset_cache.load(key, filepath, size, build=False)
+        if scaled is None:
+            self.loader.request(
+                f"bake:{self.asset_cache.entry_key(key, size)}",
+                filepath,
+                "bake",
+                priority=AssetPriority.PREFETCH,
+                decoder=lambda path: self.asset_cache.bake(key, path, size),
+            )
+        return scaled
+
+    def clear_scaled_cache(self):
+        """清除所有縮放圖片快取（解析度或縮放模式改變時呼叫）"""
+        self.scaled_cache.clear()
+        self.scaled_cache_bytes = 0
+
+    def get_scaled_cache_info(self):
+        """
+        獲取縮放圖片快取的使用狀況
+
+        Returns:
+            dict: 項目數、使用記憶體、預算與命中次數
+        """
+        total = self.scaled_cache_hits + self.scaled_cache_misses
+        return {
+            "entries": len(self.scaled_cache),
+            "bytes": self.scaled_cache_bytes,
+            "budget": self._scaled_budget(),
+            "hits": self.scaled_cache_hits,
+            "misses": self.scaled_cache_misses,
+            "hit_rate": self.scaled_cache_hits / total if total else 0.0,
+        }
+
+    def get_memory_report(self):
+        """
+        獲取圖片 Surface 的記憶體使用報告
+
+        Returns:
+            dict: {
+                "images": {識別鍵: {"bytes", "size", "category", "opaque", "pending"}},
+                "categories": {分類: 位元組數}（縮放快取列為 "scaled_cache"）,
+                "total_bytes": 總位元組數,
+                "budget_bytes": 記憶體上限,
+                "scaled_cache": 縮放快取狀況（含命中率）,
+                "asset_cache": 預先烘焙快取狀況（未啟用時為None）,
+            }
+        """
+        images = {}
+        categories = {}
+        for key, surface in self.images.items():
+            info = self.image_info.get(key, {})
+            category = info.get("category", self._image_category(key))
+            size = self._surface_bytes(surface)
+            images[key] = {
+                "bytes": size,
+                "size": surface.get_size(),
+                "category": category,
+                "opaque": info.get("opaque"),
+                "pending": key in self.pending_images,
+            }
+            categories[category] = categories.get(category, 0) + size
+        categories["scaled_cache"] = self.scaled_cache_bytes
+
+        return {
+            "images": images,
+            "categories": categories,
+            "total_bytes": sum(categories.values()),
+            "budget_bytes": self.memory_budget,
+            "scaled_cache": self.get_scaled_cache_info(),
+            "asset_cache": self.asset_cache.get_info() if self.asset_cache else None,
+        }
+
+    def print_memory_report(self):
+        """打印圖片記憶體使用報告（除錯用）"""
+        report = self.get_memory_report()
+        mb = 1024 * 1024
+        print("\n=== 圖片記憶體 ===")
+        print(
+            f"總計: {report['total_bytes'] / mb:.1f} MB / {report['budget_bytes'] / mb:.0f} MB"
+        )
+        for category, size in sorted(report["categories"].items()):
+            print(f"  {category}: {size / mb:.1f} MB")
+        scaled = report["scaled_cache"]
+        print(
+            f"縮放快取: {scaled['entries']} 項, 命中率 {scaled['hit_rate'] * 100:.1f}%"
+        )
+        if report["asset_cache"]:
+            asset = report["asset_cache"]
+            print(f"圖片快取: {asset['hits']} 次命中, 重新產生 {asset['rebuilds']} 項")
+        for key, info in sorted(
+            report["images"].items(), key=lambda item: -item[1]["bytes"]
+        ):
+            kind = "不透明" if info["opaque"] else "透明"
+            print(
+                f"  {key}: {info['size'][0]}x{info['size'][1]} {kind} "
+                f"{info['bytes'] / mb:.2f} MB"
+            )
+        print("=================\n")
+
+    def _scaling_mode(self):
+        """目前的縮放模式（F2 切換像素完整縮放時改變）"""
+        return (
+            ImageScaling.USE_PIXEL_PERFECT_SCALING,
+            ImageScaling.PIXEL_PERFECT_FILTER,
+        )
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """估計圖片佔用的記憶體大小"""
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    def _scaled_budget(self):
+        """縮放快取可用的記憶體：快取上限與總上限扣除原始圖片後兩者取小"""
+        images_bytes = sum(self._surface_bytes(s) for s in self.images.values())
+        return min(self.scaled_cache_budget, max(0, self.memory_budget - images_bytes))
+
+    def _evict_scaled(self):
+        """淘汰最久未使用的縮放結果，直到符合記憶體預算（至少保留最新的一張）"""
+        budget = self._scaled_budget()
+        while self.scaled_cache_bytes > budget and len(self.scaled_cache) > 1:
+            _, surface = self.scaled_cache.popitem(last=False)
+            self.scaled_cache_bytes -= self._surface_bytes(surface)
+
+    def _discard_scaled(self, key):
+        """移除指定圖片的所有縮放結果"""
+        for cache_key in [k for k in self.scaled_cache if k[0] == key]:
+            surface = self.scaled_cache.pop(cache_key)
+            self.scaled_cache_bytes -= self._surface_bytes(surface)
 
     def get_background_for_time(self, location, time_period):
         """
@@ -207,11 +552,23 @@ class ImageManager:
         Returns:
             pygame.Surface: 角色圖片
         """
+        image_key = self._character_image_key(character, emotion, outfit)
+        if image_key is None:
+            return None
+        return self.get_image(image_key)
+
+    def _character_image_key(self, character, emotion="normal", outfit="default"):
+        """
+        獲取角色圖片的識別鍵
+
+        Returns:
+            str: 圖片識別鍵，沒有對應圖片時返回None
+        """
         if character == "nyanko":
             if emotion == "happy":
-                return self.get_image("nyanko_happy")
+                return "nyanko_happy"
             else:
-                return self.get_image("nyanko_normal")
+                return "nyanko_normal"
 
         return None
 
@@ -230,20 +587,17 @@ class ImageManager:
         Returns:
             pygame.Surface: 縮放後的角色圖片
         """
-        # 獲取原始圖片
-        original_image = self.get_character_image(character, emotion, outfit)
+        image_key = self._character_image_key(character, emotion, outfit)
 
-        if original_image is None:
+        if image_key is None:
             return None
 
         # 如果沒有指定目標尺寸，返回原始圖片
         if target_size is None:
-            return original_image
-
-        # 使用像素完整縮放圖片
-        from config.settings import ImageScaling
+            return self.get_image(image_key)
 
-        return ImageScaling.pixel_perfect_scale(original_image, target_size)
+        # 使用像素完整縮放圖片（快取）
+        return self.get_scaled_image(image_key, target_size)
 
     def get_adaptive_character_size(self, screen_width, screen_height):
         """
@@ -256,8 +610,6 @@ class ImageManager:
         Returns:
             tuple: (character_width, character_height)
         """
-        from config.settings import ImageScaling
-
         return ImageScaling.calculate_character_size(screen_width, screen_height)
 
     def get_adaptive_character_position(
@@ -275,8 +627,6 @@ class ImageManager:
         Returns:
             tuple: (x, y) 位置座標
         """
-        from config.settings import ImageScaling
-
         return ImageScaling.calculate_character_position(
             screen_width, screen_height, char_width, char_height
         )
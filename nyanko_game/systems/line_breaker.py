@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+文字換行系統
+支援中日文的換行規則（禁則處理）：中日文字元之間可以換行，英數字單詞只在空白處換行，
+句號、逗號、右括號等不可出現在行首，左括號不可出現在行尾。
+換行點依文字快取，排版結果依 (文字, 字體, 寬度) 快取
+"""
+
+from collections import OrderedDict
+from typing import List, Tuple
+
+import pygame
+
+from systems.font_manager import font_manager
+
+
+# 不可出現在行首的字元（標點符號、右括號、長音、小假名等）
+NO_LINE_START = frozenset(
+    "。．，、,.!！?？:：;；…‥・ー～〜"
+    ")）]］}｝」』】〕〉》〗〙〛’”"
+    "々ゝゞヽヾぁぃぅぇぉっゃゅょゎァィゥェォッャュョヮヵヶ"
+)
+
+# 不可出現在行尾的字元（左括號、左引號）
+NO_LINE_END = frozenset("(（[［{｛「『【〔〈《〖〘〚‘“")
+
+# 視為中日文（字元前後可換行）的 Unicode 範圍
+CJK_RANGES = (
+    (0x2E80, 0x2FDF),  # 部首
+    (0x3000, 0x303F),  # 中日文標點
+    (0x3040, 0x30FF),  # 平假名、片假名
+    (0x3100, 0x312F),  # 注音符號
+    (0x31F0, 0x31FF),  # 片假名擴充
+    (0x3400, 0x4DBF),  # 擴充 A
+    (0x4E00, 0x9FFF),  # 中日韓統一表意文字
+    (0xF900, 0xFAFF),  # 相容表意文字
+    (0xFF00, 0xFFEF),  # 全形字元
+)
+
+
+def is_cjk(char: str) -> bool:
+    """
+    判斷字元是否為中日文字元
+
+    Args:
+        char (str): 字元
+
+    Returns:
+        bool: 是否為中日文字元
+    """
+    code = ord(char)
+    if code < 0x2E80:
+        return False
+    for low, high in CJK_RANGES:
+        if low <= code <= high:
+            return True
+    return False
+
+
+class LineBreaker:
+    """換行處理器"""
+
+    LAYOUT_CACHE_SIZE = 256  # 快取的排版結果數量
+    BREAK_CACHE_SIZE = 256  # 快取的換行點數量
+
+    def __init__(self):
+        """初始化換行處理器"""
+        self.layouts = OrderedDict()  # (文字, 字體, 寬度) -> 每行的 (開始, 結束) 索引
+        self.break_cache = OrderedDict()  # 文字 -> 可換行位置
+        self.layout_hits = 0
+        self.layout_misses = 0
+
+    def wrap(
+        self, text: str, font: pygame.font.Font, max_width: int
+    ) -> Tuple[Tuple[int, int], ...]:
+        """
+        計算文字換行（結果快取）
+
+        Args:
+            text (str): 文字
+            font (pygame.font.Font): 字體
+            max_width (int): 最大寬度
+
+        Returns:
+            tuple: 每行在原文字中的 (開始, 結束) 索引
+        """
+        key = (text, font, max_width)
+        ranges = self.layouts.get(key)
+        if ranges is not None:
+            self.layouts.move_to_end(key)
+            self.layout_hits += 1
+            return ranges
+
+        self.layout_misses += 1
+        ranges = self._layout(text, font, max_width)
+        self.layouts[key] = ranges
+        if len(self.layouts) > self.LAYOUT_CACHE_SIZE:
+            self.layouts.popitem(last=False)
+        return ranges
+
+    def wrap_lines(
+        self, text: str, font: pygame.font.Font, max_width: int
+    ) -> List[str]:
+        """
+        計算文字換行，回傳每行文字
+
+        Args:
+            text (str): 文字
+            font (pygame.font.Font): 字體
+            max_width (int): 最大寬度
+
+        Returns:
+            List[str]: 每行文字
+        """
+        return [text[start:end] for start, end in self.wrap(text, font, max_width)]
+
+    def get_break_opportunities(self, text: str) -> bytes:
+        """
+        獲取文字的可換行位置（與字體、寬度無關，依文字快取）
+
+        Args:
+            text (str): 文字
+
+        Returns:
+            bytes: 長度為 len(text) + 1，第 i 個值為 1 表示可以在第 i 個字元之前換行
+        """
+        breaks = self.break_cache.get(text)
+        if breaks is not None:
+            self.break_cache.move_to_end(text)
+            return breaks
+
+        allowed = bytearray(len(text) + 1)
+        for index in range(1, len(text)):
+            allowed[index] = self._can_break(text[index - 1], text[index])
+        allowed[len(text)] = 1
+        breaks = bytes(allowed)
+
+        self.break_cache[text] = breaks
+        if len(self.break_cache) > self.BREAK_CACHE_SIZE:
+            self.break_cache.popitem(last=False)
+        return breaks
+
+    def _can_break(self, before: str, after: str) -> bool:
+        """
+        判斷兩個字元之間是否可以換行
+
+        Args:
+            before (str): 前一個字元
+            after (str): 後一個字元
+
+        Returns:
+            bool: 是否可以換行
+        """
+        # 禁則：標點不放行首、左括號不放行尾
+        if after in NO_LINE_START or before in NO_LINE_END:
+            return False
+        # 空白之後可以換行（空白本身會在行尾被去除）
+        if before == " " or before == "　":
+            return True
+        if after == " " or after == "　":
+            return False
+        # 中日文字元前後可以換行，英數字單詞內不換行
+        return is_cjk(before) or is_cjk(after)
+
+    def _layout(
+        self, text: str, font: pygame.font.Font, max_width: int
+    ) -> Tuple[Tuple[int, int], ...]:
+        """
+        以字元寬度表累加寬度找出換行位置，每行只實際測量一次
+
+        Args:
+            text (str): 文字
+            font (pygame.font.Font): 字體
+            max_width (int): 最大寬度
+
+        Returns:
+            tuple: 每行在原文字中的 (開始, 結束) 索引
+        """
+        breaks = self.get_break_opportunities(text)
+        widths = [font_manager.get_char_width(font, char) for char in text]
+        ranges = []
+        start = 0
+
+        while start < len(text):
+            # 行首不保留空白與換行字元
+            if text[start] in " 　\n":
+                start += 1
+                continue
+
+            end = self._find_line_end(text, widths, breaks, start, max_width)
+
+            # 字元寬度表為整數近似值，以實際渲染寬度確認，超出時退回前一個換行點
+            while end - start > 1 and font.size(text[start:end])[0] > max_width:
+                end = self._previous_break(text, breaks, start, end)
+
+            ranges.append((start, end))
+            start = end
+
+        return tuple(ranges)
+
+    def _find_line_end(
+        self,
+        text: str,
+        widths: List[int],
+        breaks: bytes,
+        start: int,
+        max_width: int,
+    ) -> int:
+        """
+        找出從 start 開始的一行的結束位置
+
+        Args:
+            text (str): 文字
+            widths (List[int]): 每個字元的寬度
+            breaks (bytes): 可換行位置
+            start (int): 行首索引
+            max_width (int): 最大寬度
+
+        Returns:
+            int: 行尾索引（不含，已去除行尾空白）
+        """
+        line_width = 0
+        last_break = start
+
+        for index in range(start, len(text)):
+            if text[index] == "\n":
+                return self._strip_end(text, start, index)
+            if index > start and breaks[index]:
+                last_break = index
+            line_width += widths[index]
+            if line_width > max_width and index > start:
+                if breaks[index]:
+                    return self._strip_end(text, start, index)
+                if last_break > start:
+                    return self._strip_end(text, start, last_break)
+                # 沒有可換行的位置（單詞太長），強制分行
+                return index
+
+        return self._strip_end(text, start, len(text))
+
+    def _previous_break(self, text: str, breaks: bytes, start: int, end: int) -> int:
+        """
+        找出 end 之前的換行點（沒有時少放一個字元）
+
+        Args:
+            text (str): 文字
+            breaks (bytes): 可換行位置
+            start (int): 行首索引
+            end (int): 目前的行尾索引
+
+        Returns:
+            int: 新的行尾索引
+        """
+        for index in range(end - 1, start, -1):
+            if breaks[index]:
+                stripped = self._strip_end(text, start, index)
+                if stripped > start:
+                    return stripped
+        return end - 1
+
+    def _strip_end(self, text: str, start: int, end: int) -> int:
+        """
+        去除行尾空白
+
+        Args:
+            text (str): 文字
+            start (int): 行首索引
+            end (int): 行尾索引
+
+        Returns:
+            int: 去除空白後的行尾索引
+        """
+        while end > start and text[end - 1] in " 　":
+            end -= 1
+        return end
+
+    def clear_cache(self):
+        """清除排版快取（例如更換字體時）"""
+        self.layouts.clear()
+        self.break_cache.clear()
+
+    def get_info(self) -> dict:
+        """
+        獲取快取狀況（除錯資訊用）
+
+        Returns:
+            dict: 快取的排版數量與命中次數
+        """
+        return {
+            "layouts": len(self.layouts),
+            "break_tables": len(self.break_cache),
+            "hits": self.layout_hits,
+            "misses": self.layout_misses,
+        }
+
+
+# 全域換行處理器實例
+line_breaker = LineBreaker()
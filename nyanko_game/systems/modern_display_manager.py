@@ -28,6 +28,13 @@ class ModernDisplayManager:
         # 虛擬表面用於縮放渲染
         self.virtual_surface = None
 
+        # 預先配置的縮放目標（與螢幕格式相同時直接是螢幕的子表面，縮放結果不需要再 blit）
+        self.scaled_target = None
+        self.scaled_target_direct = False
+        self._scaled_target_screen = None
+        self.letterbox_rects = []  # 縮放畫面外的黑邊區域
+        self.integer_scale = 0  # 整數倍縮放的倍數，非整數倍時為 0
+
         # 顯示能力
         self.supported_resolutions = self._detect_supported_resolutions()
         self.optimal_resolution = self._find_optimal_resolution()
@@ -161,6 +168,7 @@ class ModernDisplayManager:
         if self.needs_scaling:
             self._setup_scaling_params(target_w, target_h)
             self.virtual_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.scaled_target = None
 
         flags = pygame.DOUBLEBUF
         return pygame.display.set_mode(self.current_resolution, flags)
@@ -191,6 +199,7 @@ class ModernDisplayManager:
             flags = pygame.FULLSCREEN | pygame.DOUBLEBUF
             print(f"全螢幕模式: {native_w}x{native_h} (需要縮放)")
 
+        self.scaled_target = None
         return pygame.display.set_mode(self.current_resolution, flags)
 
     def _setup_scaling_params(self, display_w: int, display_h: int):
@@ -210,32 +219,183 @@ class ModernDisplayManager:
         self.offset_x = (display_w - scaled_w) // 2
         self.offset_y = (display_h - scaled_h) // 2
 
+        # 整數倍縮放（例如 4K 顯示 1080p 畫面）可以只重新縮放變更的區域
+        rounded = round(self.scale_factor)
+        if rounded >= 1 and abs(self.scale_factor - rounded) < 1e-6:
+            self.integer_scale = rounded
+        else:
+            self.integer_scale = 0
+
         print(
             f"縮放設定: 比例={self.scale_factor:.3f}, 偏移=({self.offset_x}, {self.offset_y})"
         )
 
-    def render_frame(self, screen: pygame.Surface, render_callback):
-        """渲染一幀畫面"""
-        if self.needs_scaling:
+    def render_frame(
+        self,
+        screen: pygame.Surface,
+        render_callback,
+        dirty_rects: Optional[List[pygame.Rect]] = None,
+    ) -> Optional[List[pygame.Rect]]:
+        """
+        渲染一幀畫面
+
+        Args:
+            screen: 顯示表面
+            render_callback: 渲染回調 render_callback(surface)
+            dirty_rects: 這一幀有變更的區域（遊戲座標），None 表示整個畫面。
+                指定時只重繪這些區域（以裁剪區域限制繪製範圍），縮放時也只重新縮放這些區域
+
+        Returns:
+            list: 螢幕上有變更的區域（可傳給 pygame.display.update），None 表示整個畫面
+        """
+        if not self.needs_scaling:
+            # 直接渲染
+            if dirty_rects is None:
+                screen.fill(Colors.BACKGROUND_COLOR)
+                render_callback(screen)
+                return None
+            return self._render_regions(screen, render_callback, dirty_rects)
+
+        self._ensure_scaled_target(screen)
+        if dirty_rects is not None and not self.integer_scale:
+            # 非整數倍縮放時各區域分開縮放會產生接縫，改為整個畫面重新縮放
+            dirty_rects = None
+
+        if dirty_rects is None:
             # 使用虛擬表面渲染
             self.virtual_surface.fill(Colors.BACKGROUND_COLOR)
             render_callback(self.virtual_surface)
+            self._scale_into(self.virtual_surface, self.scaled_target)
 
-            # 縮放並繪製到實際螢幕
-            scaled_w = int(SCREEN_WIDTH * self.scale_factor)
-            scaled_h = int(SCREEN_HEIGHT * self.scale_factor)
+            # 居中繪製（直接寫入螢幕子表面時不需要 blit），黑邊每幀重新填滿
+            if not self.scaled_target_direct:
+                screen.blit(self.scaled_target, (self.offset_x, self.offset_y))
+            for rect in self.letterbox_rects:
+                screen.fill(Colors.BLACK, rect)
+            return None
+
+        # 整數倍縮放：遊戲座標的區域剛好對應到螢幕上整數倍的區域
+        scale = self.integer_scale
+        screen_rects = []
+        for region in self._render_regions(
+            self.virtual_surface, render_callback, dirty_rects
+        ):
+            target_rect = pygame.Rect(
+                region.x * scale, region.y * scale, region.w * scale, region.h * scale
+            )
+            self._scale_into(
+                self.virtual_surface.subsurface(region),
+                self.scaled_target.subsurface(target_rect),
+            )
+            screen_rect = target_rect.move(self.offset_x, self.offset_y)
+            if not self.scaled_target_direct:
+                screen.blit(self.scaled_target, screen_rect.topleft, area=target_rect)
+            screen_rects.append(screen_rect)
+        return screen_rects
+
+    def _render_regions(
+        self, surface: pygame.Surface, render_callback, dirty_rects
+    ) -> List[pygame.Rect]:
+        """
+        只重繪變更的區域：重疊的區域合併，每個區域設為裁剪區域後呼叫渲染回調
+
+        Returns:
+            list: 實際重繪的區域
+        """
+        regions = []
+        for rect in dirty_rects:
+            region = pygame.Rect(rect).clip(surface.get_rect())
+            if not region:
+                continue
+            # 與已有的區域重疊時合併（合併後可能再與其他區域重疊）
+            overlapping = region.collidelistall(regions)
+            while overlapping:
+                region = region.unionall([regions[i] for i in overlapping])
+                regions = [r for i, r in enumerate(regions) if i not in overlapping]
+                overlapping = region.collidelistall(regions)
+            regions.append(region)
+
+        for region in regions:
+            surface.set_clip(region)
+            try:
+                surface.fill(Colors.BACKGROUND_COLOR)
+                render_callback(surface)
+            finally:
+                surface.set_clip(None)
+        return regions
+
+    def _ensure_scaled_target(self, screen: pygame.Surface):
+        """
+        準備縮放用的表面（顯示模式或螢幕改變時才重新配置，之後每幀重複使用）
+
+        虛擬表面轉為與螢幕相同的像素格式；縮放目標優先使用螢幕的子表面，
+        transform.scale 直接寫入螢幕，不需要額外配置與 blit
+        """
+        scaled_size = (
+            int(SCREEN_WIDTH * self.scale_factor),
+            int(SCREEN_HEIGHT * self.scale_factor),
+        )
+        if (
+            self.scaled_target is not None
+            and self._scaled_target_screen is screen
+            and self.scaled_target.get_size() == scaled_size
+        ):
+            return
 
-            scaled_surface = ImageScaling.pixel_perfect_scale(
-                self.virtual_surface, (scaled_w, scaled_h)
+        if (
+            self.virtual_surface is None
+            or self.virtual_surface.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT)
+            or self.virtual_surface.get_bitsize() != screen.get_bitsize()
+            or self.virtual_surface.get_masks() != screen.get_masks()
+        ):
+            self.virtual_surface = pygame.Surface(
+                (SCREEN_WIDTH, SCREEN_HEIGHT), 0, screen
             )
 
-            # 清空螢幕並居中繪製
-            screen.fill(Colors.BLACK)
-            screen.blit(scaled_surface, (self.offset_x, self.offset_y))
+        target_rect = pygame.Rect((self.offset_x, self.offset_y), scaled_size)
+        if screen.get_rect().contains(target_rect):
+            self.scaled_target = screen.subsurface(target_rect)
+            self.scaled_target_direct = True
         else:
-            # 直接渲染
-            screen.fill(Colors.BACKGROUND_COLOR)
-            render_callback(screen)
+            self.scaled_target = pygame.Surface(scaled_size, 0, self.virtual_surface)
+            self.scaled_target_direct = False
+        self._scaled_target_screen = screen
+
+        # 縮放畫面外的黑邊（上下左右）
+        screen_w, screen_h = screen.get_size()
+        self.letterbox_rects = [
+            rect
+            for rect in (
+                pygame.Rect(0, 0, screen_w, target_rect.top),
+                pygame.Rect(
+                    0, target_rect.bottom, screen_w, screen_h - target_rect.bottom
+                ),
+                pygame.Rect(0, target_rect.top, target_rect.left, target_rect.h),
+                pygame.Rect(
+                    target_rect.right,
+                    target_rect.top,
+                    screen_w - target_rect.right,
+                    target_rect.h,
+                ),
+            )
+            if rect.w > 0 and rect.h > 0
+        ]
+
+    def _scale_into(self, source: pygame.Surface, dest: pygame.Surface):
+        """
+        將來源縮放寫入預先配置的目標表面（與 ImageScaling.pixel_perfect_scale 相同的演算法，
+        但不配置新的表面）
+        """
+        size = dest.get_size()
+        if (
+            self.integer_scale
+            or not ImageScaling.USE_PIXEL_PERFECT_SCALING
+            or ImageScaling.PIXEL_PERFECT_FILTER
+        ):
+            # 整數倍或最近鄰縮放
+            pygame.transform.scale(source, size, dest)
+        else:
+            pygame.transform.smoothscale(source, size, dest)
 
     def transform_mouse_position(
         self, screen_pos: Tuple[int, int]
@@ -285,6 +445,7 @@ class ModernDisplayManager:
             "needs_scaling": self.needs_scaling,
             "scale_factor": self.scale_factor,
             "offset": (self.offset_x, self.offset_y),
+            "integer_scale": self.integer_scale,
             "supported_resolutions": self.supported_resolutions,
             "optimal_resolution": self.optimal_resolution,
         }
@@ -10,6 +10,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
+from systems.condition_compiler import compile_condition
+
 
 class ProgressType(Enum):
     """進度類型"""
@@ -36,6 +38,7 @@ class Achievement:
         self.name = name
         self.description = description
         self.unlock_condition = unlock_condition
+        self.condition = compile_condition(unlock_condition)
         self.reward = reward or {}
         self.is_unlocked = False
         self.unlock_date = None
@@ -46,32 +49,7 @@ class Achievement:
             return False
 
         # 檢查解鎖條件
-        for key, value in self.unlock_condition.items():
-            if key == "affection_min":
-                if game_state.get("nyanko_affection", 0) < value:
-                    return False
-            elif key == "day_count_min":
-                if game_state.get("day_count", 0) < value:
-                    return False
-            elif key == "dialogue_count_min":
-                if game_state.get("dialogue_count", 0) < value:
-                    return False
-            elif key == "special_events":
-                completed_events = game_state.get("completed_special_events", [])
-                for required_event in value:
-                    if required_event not in completed_events:
-                        return False
-            elif key == "flags":
-                flags = game_state.get("flags", {})
-                for flag_key, flag_value in value.items():
-                    if flags.get(flag_key) != flag_value:
-                        return False
-            else:
-                # 通用條件檢查
-                if game_state.get(key) != value:
-                    return False
-
-        return True
+        return self.condition.check(game_state)
 
     def unlock(self):
         """解鎖成就"""
@@ -8,6 +8,8 @@ import pygame
 from typing import Dict, List, Optional, Any, Callable
 from config.settings import *
 from systems.dialogue_system import DialogueNode
+from systems.font_manager import font_manager
+from systems.condition_compiler import compile_condition
 
 
 class UnifiedChoice:
@@ -42,6 +44,7 @@ class UnifiedChoice:
         self.affection_change = choice_data.get("affection_change", 0)
         self.flags = choice_data.get("flags", {})
         self.conditions = choice_data.get("conditions", {})
+        self.condition = compile_condition(self.conditions)
 
         # 活動相關
         self.activity_id = choice_data.get("activity_id")
@@ -88,28 +91,7 @@ class UnifiedChoice:
 
     def _check_conditions(self, game_state: Dict[str, Any]) -> bool:
         """檢查選擇條件"""
-        # 檢查好感度條件
-        if "affection_min" in self.conditions:
-            if game_state.get("nyanko_affection", 0) < self.conditions["affection_min"]:
-                return False
-
-        if "affection_max" in self.conditions:
-            if game_state.get("nyanko_affection", 0) > self.conditions["affection_max"]:
-                return False
-
-        # 檢查時間條件
-        if "time_period" in self.conditions:
-            current_period = game_state.get("current_time_period", "")
-            if current_period != self.conditions["time_period"]:
-                return False
-
-        # 檢查旗標條件
-        if "flags" in self.conditions:
-            for flag, required_value in self.conditions["flags"].items():
-                if game_state.get("flags", {}).get(flag) != required_value:
-                    return False
-
-        return True
+        return self.condition.check(game_state)
 
     def get_display_text(self) -> str:
         """獲取顯示文字"""
@@ -161,20 +143,9 @@ class UnifiedChoiceSystem:
 
     def _initialize_ui(self):
         """初始化UI"""
-        try:
-            self.font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.DIALOGUE_FONT_SIZE
-            )
-            self.title_font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.SPEAKER_FONT_SIZE
-            )
-            self.desc_font = pygame.font.Font(
-                FontSettings.DEFAULT_FONT, FontSettings.FONT_SIZE_SMALL
-            )
-        except (FileNotFoundError, OSError):
-            self.font = pygame.font.Font(None, FontSettings.DIALOGUE_FONT_SIZE)
-            self.title_font = pygame.font.Font(None, FontSettings.SPEAKER_FONT_SIZE)
-            self.desc_font = pygame.font.Font(None, FontSettings.FONT_SIZE_SMALL)
+        self.font = font_manager.get_font(FontSettings.DIALOGUE_FONT_SIZE)
+        self.title_font = font_manager.get_font(FontSettings.SPEAKER_FONT_SIZE)
+        self.desc_font = font_manager.get_font(FontSettings.FONT_SIZE_SMALL)
 
     def show_choices(
         self,
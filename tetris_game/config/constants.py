@@ -3,6 +3,11 @@
 定義遊戲中所有使用的常數
 """
 
+# ============================
+# 版本資訊
+# ============================
+BUILD_VERSION = "2.0.0"  # 遊戲版本（遙測、排行榜記錄用）
+
 # ============================
 # 視窗設定
 # ============================
@@ -15,9 +20,16 @@ FPS = 60  # 遊戲幀率
 # ============================
 GRID_WIDTH = 10  # 遊戲區域寬度（格數）
 GRID_HEIGHT = 20  # 遊戲區域高度（格數）
+GRID_BUFFER_ROWS = 2  # 可見區域上方的隱藏緩衝行數（現代規則的出生緩衝區）
+MIN_GRID_WIDTH = 4  # 最小寬度（I 方塊必須能橫放）
+MIN_GRID_HEIGHT = 4  # 最小高度
 CELL_SIZE = 30  # 每個格子的像素大小
 FALL_SPEED = 500  # 方塊下落速度（毫秒）- 基礎值，實際由等級決定
 
+# 大型遊戲區域的最大像素尺寸（超過時自動縮小格子大小）
+MAX_BOARD_PIXEL_WIDTH = 1200
+MAX_BOARD_PIXEL_HEIGHT = 900
+
 # 遊戲區域位置
 GRID_X = (WINDOW_WIDTH - GRID_WIDTH * CELL_SIZE) // 2
 GRID_Y = 20
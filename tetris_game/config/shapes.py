@@ -56,6 +56,21 @@ TETROMINO_SHAPES = {
 # 形狀類型對應顏色索引
 SHAPE_COLORS = {"I": 0, "O": 1, "T": 2, "S": 3, "Z": 4, "J": 5, "L": 6}
 
+# 預先計算的方塊格子偏移表（碰撞檢測只需走訪 4 個格子，而非整個 4x4 矩陣）
+# TETROMINO_BLOCKS[形狀][旋轉] = ((col, row), ...)
+TETROMINO_BLOCKS = {
+    shape_type: [
+        tuple(
+            (col_idx, row_idx)
+            for row_idx, row in enumerate(rotation_shape)
+            for col_idx, cell in enumerate(row)
+            if cell
+        )
+        for rotation_shape in rotations
+    ]
+    for shape_type, rotations in TETROMINO_SHAPES.items()
+}
+
 # ============================
 # SRS Wall Kick 資料
 # ============================
@@ -3,5 +3,14 @@
 """
 
 from .game import Game
+from .versus import VersusMatch
+from .bot import TetrisBot, BotController
+from .inputs import KeyboardController
 
-__all__ = ["Game"]
+__all__ = [
+    "Game",
+    "VersusMatch",
+    "TetrisBot",
+    "BotController",
+    "KeyboardController",
+]
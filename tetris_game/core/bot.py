@@ -0,0 +1,208 @@
+"""
+AI 對手模組
+TetrisBot 負責評估落點，BotController 將選好的落點轉換為逐幀的輸入遮罩，
+讓 AI 與人類玩家走完全相同的輸入路徑（可用於對戰、網路同步與重播）
+"""
+
+from game_objects.bitboard import BitBoard
+from game_objects.tetromino import Tetromino
+from core.move_generator import (
+    MOVE_INPUTS,
+    MOVE_DAS_LEFT,
+    MOVE_DAS_RIGHT,
+    MOVE_SOFT_DROP,
+    MOVE_HOLD,
+    MOVE_HARD_DROP,
+    generate_drop_placements,
+    generate_reachable_placements,
+)
+
+# 落點評估權重（總高度、消行數、空洞、凹凸度）
+DEFAULT_BOT_WEIGHTS = {
+    "aggregate_height": -0.510066,
+    "lines": 0.760666,
+    "holes": -0.35663,
+    "bumpiness": -0.184483,
+}
+
+
+class TetrisBot:
+    """AI 落點選擇器類別"""
+
+    def __init__(self, weights=None, use_hold=True, full_search=False):
+        """
+        初始化 AI
+        參數：
+        - weights: 評估權重 dict（預設 DEFAULT_BOT_WEIGHTS）
+        - use_hold: 是否考慮 Hold 方塊
+        - full_search: True 使用完整可到達搜尋（含 tuck/spin），False 只用硬降落點
+        """
+        self.weights = dict(DEFAULT_BOT_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+        self.use_hold = use_hold
+        self.full_search = full_search
+
+    def evaluate(self, board, placement):
+        """
+        評估落點分數（越高越好）
+        參數：
+        - board: 放置前的 BitBoard
+        - placement: Placement 物件
+        """
+        result = board.copy()
+        lines = result.place(
+            placement.shape_type, placement.rotation, placement.x, placement.y
+        )
+        heights = result.column_heights()
+        bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+        weights = self.weights
+        return (
+            weights["aggregate_height"] * sum(heights)
+            + weights["lines"] * lines
+            + weights["holes"] * result.count_holes()
+            + weights["bumpiness"] * bumpiness
+        )
+
+    def candidate_placements(self, game, board):
+        """列舉當前方塊（以及 Hold 方塊）的所有候選落點"""
+        generate = (
+            generate_reachable_placements
+            if self.full_search
+            else generate_drop_placements
+        )
+        placements = generate(game, game.current_tetromino, board)
+
+        if self.use_hold and game.can_hold:
+            hold_source = game.hold_tetromino or game.next_tetromino
+            if hold_source and hold_source.shape_type != game.current_tetromino.shape_type:
+                hold_piece = Tetromino(
+                    hold_source.shape_type, game.grid.width, game.grid.buffer_rows
+                )
+                placements.extend(generate(game, hold_piece, board, use_hold=True))
+
+        return placements
+
+    def choose_placement(self, game):
+        """
+        選擇最佳落點
+        參數：
+        - game: Game 物件
+        返回：Placement 或 None（沒有可用落點）
+        """
+        board = BitBoard.from_grid(game.grid)
+        best = None
+        best_score = None
+        for placement in self.candidate_placements(game, board):
+            score = self.evaluate(board, placement)
+            if best_score is None or score > best_score:
+                best = placement
+                best_score = score
+        return best
+
+
+class BotController:
+    """
+    AI 輸入控制器類別
+    每幀呼叫 next_input(game) 取得 (held, pressed) 輸入遮罩
+    """
+
+    def __init__(self, bot=None, think_frames=6, max_piece_frames=120):
+        """
+        初始化控制器
+        參數：
+        - bot: TetrisBot 物件（預設建立一個）
+        - think_frames: 每個方塊開始操作前的等待幀數（控制 AI 速度）
+        - max_piece_frames: 單一方塊最多操作幀數（超過則直接硬降，避免卡住）
+        """
+        self.bot = bot or TetrisBot()
+        self.think_frames = think_frames
+        self.max_piece_frames = max_piece_frames
+        self.reset()
+
+    def reset(self):
+        """重置控制器狀態（新方塊或新遊戲時）"""
+        self.plan = []  # 尚未執行的移動指令
+        self.target = None  # 目標 Placement
+        self.piece = None  # 目前規劃的方塊（保留參照，以 is 判斷是否換了方塊）
+        self.wait_frames = self.think_frames
+        self.piece_frames = 0
+        self.hold_move = None  # 正在按住的移動（DAS/軟降）
+
+    def _plan_for(self, game):
+        """為當前方塊重新規劃路徑"""
+        self.target = self.bot.choose_placement(game)
+        if self.target is None:
+            self.plan = [MOVE_HARD_DROP]
+        else:
+            self.plan = ([MOVE_HOLD] if self.target.use_hold else []) + list(
+                self.target.path
+            )
+            self.plan.append(MOVE_HARD_DROP)
+        self.piece = game.current_tetromino
+        self.piece_frames = 0
+        self.hold_move = None
+
+    def needs_plan(self, game):
+        """這一幀呼叫 next_input 是否會執行落點搜尋（供多 AI 分攤運算量）"""
+        return (
+            not game.game_over
+            and game.current_tetromino is not self.piece
+            and self.wait_frames <= 0
+        )
+
+    def next_input(self, game, allow_plan=True):
+        """
+        取得這一幀的輸入
+        參數：
+        - game: Game 物件
+        - allow_plan: False 時即使需要規劃也延到之後的幀（運算預算用完時）
+        返回：(held, pressed)
+        """
+        if game.game_over:
+            return 0, 0
+
+        # 換了新方塊：先等待思考時間再規劃
+        if game.current_tetromino is not self.piece:
+            if self.wait_frames > 0:
+                self.wait_frames -= 1
+                return 0, 0
+            if not allow_plan:
+                return 0, 0
+            self.wait_frames = self.think_frames
+            self._plan_for(game)
+
+        self.piece_frames += 1
+        if self.piece_frames > self.max_piece_frames:
+            self.plan = [MOVE_HARD_DROP]
+            self.hold_move = None
+
+        # 正在按住的移動：持續按住直到到位
+        if self.hold_move is not None:
+            piece = game.current_tetromino
+            if self.hold_move == MOVE_DAS_LEFT:
+                done = not game.grid.is_valid_position(piece, -1, 0)
+            elif self.hold_move == MOVE_DAS_RIGHT:
+                done = not game.grid.is_valid_position(piece, 1, 0)
+            else:
+                done = not game.grid.is_valid_position(piece, 0, 1)
+            if not done:
+                return MOVE_INPUTS[self.hold_move], 0
+            self.hold_move = None
+
+        if not self.plan:
+            return 0, 0
+
+        move = self.plan.pop(0)
+        bit = MOVE_INPUTS[move]
+
+        if move in (MOVE_DAS_LEFT, MOVE_DAS_RIGHT, MOVE_SOFT_DROP):
+            self.hold_move = move
+
+        # Hold 後換成另一個方塊，下一幀重新規劃
+        if move == MOVE_HOLD:
+            self.piece = None
+            self.wait_frames = 0
+            self.plan = []
+
+        return bit, bit
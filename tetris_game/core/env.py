@@ -0,0 +1,389 @@
+"""
+強化學習環境模組（Gym 風格介面）
+TetrisEnv 以 reset(seed) / step(action) 操作無視窗的 Game，
+觀察值寫入預先配置的 NumPy 緩衝區，呼叫端直接讀取這些陣列（不需複製）；
+VecEnv 一次推進多個環境，所有環境的觀察值位於同一組批次陣列中
+
+動作模式：
+- "input": 動作為輸入遮罩（INPUT_* 位元組合，0~127），每個動作推進 frames_per_action 幀
+- "placement": 動作為落點索引 rotation * width + 最左欄（使用 Hold 時再加 4 * width），
+  可用的索引由觀察值中的 action_mask 標示
+
+需要安裝 numpy（選用依賴）：
+pip install numpy
+"""
+
+import sys
+import os
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 嘗試導入 numpy，如果失敗則在建立環境時提示安裝
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from core.game import Game
+from core.move_generator import MOVE_CW, MOVE_CCW, generate_drop_placements
+from game_objects.bitboard import BitBoard, PIECE_MASKS
+from game_objects.tetromino import Tetromino
+from config.constants import GRID_WIDTH, GRID_HEIGHT, GRID_BUFFER_ROWS, BLACK
+from config.shapes import TETROMINO_SHAPES
+
+ACTION_MODES = ("input", "placement")
+INPUT_ACTION_COUNT = 128  # 7 個輸入位元的所有組合
+SHAPE_INDEX = {shape: index for index, shape in enumerate(TETROMINO_SHAPES)}
+SCALAR_FIELDS = ("combo", "back_to_back", "can_hold", "level")
+MAX_VECTOR_WIDTH = 62  # 超過此寬度時位元遮罩無法放入 int64
+
+
+def observation_shapes(width, height, buffer_rows):
+    """
+    觀察值各欄位的形狀與型別
+    返回：{名稱: (shape, dtype)}
+    """
+    return {
+        "board": ((height + buffer_rows, width), np.uint8),  # 已填充格子（含緩衝區）
+        "heights": ((width,), np.int16),  # 每欄高度
+        "pieces": ((3, len(SHAPE_INDEX)), np.uint8),  # 當前 / 下一個 / Hold 的 one-hot
+        "piece_position": ((3,), np.int16),  # 當前方塊 x, y, rotation
+        "scalars": ((len(SCALAR_FIELDS),), np.int32),  # combo, B2B, 可否 Hold, 等級
+        "action_mask": ((8 * width,), np.uint8),  # placement 模式下可用的動作
+    }
+
+
+def action_count(mode, width, use_hold=True):
+    """動作空間大小"""
+    if mode == "input":
+        return INPUT_ACTION_COUNT
+    return (8 if use_hold else 4) * width
+
+
+class TetrisEnv:
+    """
+    俄羅斯方塊強化學習環境類別
+    step 返回的 obs / info 每次都是同一個物件，內容就地更新
+    """
+
+    def __init__(
+        self,
+        mode="placement",
+        width=GRID_WIDTH,
+        height=GRID_HEIGHT,
+        buffer_rows=GRID_BUFFER_ROWS,
+        use_hold=True,
+        frames_per_action=1,
+        max_steps=0,
+        death_penalty=1.0,
+        buffers=None,
+    ):
+        """
+        初始化環境
+        參數：
+        - mode: 動作模式（"input" 或 "placement"）
+        - width, height, buffer_rows: 遊戲區域尺寸
+        - use_hold: placement 模式是否提供 Hold 落點
+        - frames_per_action: input 模式每個動作推進的幀數
+        - max_steps: 每回合最多步數（0 表示不限制，超過時 truncated 為 True）
+        - death_penalty: 遊戲結束時扣除的獎勵
+        - buffers: 外部提供的觀察值陣列 dict（VecEnv 使用）；None 則自行配置
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("強化學習環境需要 numpy：pip install numpy")
+        if mode not in ACTION_MODES:
+            raise ValueError(f"未知的動作模式：{mode}（可用：{', '.join(ACTION_MODES)}）")
+
+        self.mode = mode
+        self.width = width
+        self.height = height
+        self.buffer_rows = buffer_rows
+        self.use_hold = use_hold
+        self.frames_per_action = frames_per_action
+        self.max_steps = max_steps
+        self.death_penalty = death_penalty
+        self.n_actions = action_count(mode, width, use_hold)
+
+        # 觀察值緩衝區（只配置一次，之後就地寫入）
+        shapes = observation_shapes(width, height, buffer_rows)
+        if buffers is None:
+            buffers = {
+                name: np.zeros(shape, dtype) for name, (shape, dtype) in shapes.items()
+            }
+        self.obs = buffers
+        self.board = buffers["board"]
+        self.heights = buffers["heights"]
+        self.pieces = buffers["pieces"]
+        self.piece_position = buffers["piece_position"]
+        self.scalars = buffers["scalars"]
+        self.action_mask = buffers["action_mask"]
+
+        # 棋盤解碼用的暫存陣列（位元遮罩 → 格子）
+        self._row_masks = np.zeros((height + buffer_rows, 1), np.int64)
+        self._bits = np.zeros((height + buffer_rows, width), np.int64)
+        self._shifts = np.arange(width, dtype=np.int64)
+
+        # placement 模式的動作表（索引 → Placement）
+        self._placements = [None] * self.n_actions
+
+        self.info = {"score": 0, "lines": 0, "pieces": 0, "steps": 0}
+        self.game = None
+        self.board_version = None
+        self.steps = 0
+        self.pieces_placed = 0
+
+    def reset(self, seed=None):
+        """
+        開始新回合
+        參數：
+        - seed: 7-bag 隨機種子
+        返回：(obs, info)
+        """
+        self.game = Game(self.width, self.height, self.buffer_rows, seed=seed, verbose=False)
+        self.game.lock_listeners.append(self._on_lock)
+        self.board_version = None
+        self.steps = 0
+        self.pieces_placed = 0
+        self.lines_this_step = 0
+        self._write_observation()
+        self._update_info()
+        return self.obs, self.info
+
+    def _on_lock(self, game, result):
+        """方塊鎖定時累計消行數（作為獎勵）"""
+        self.pieces_placed += 1
+        self.lines_this_step += result["lines"]
+
+    def step(self, action):
+        """
+        執行一個動作
+        參數：
+        - action: 輸入遮罩（input 模式）或落點索引（placement 模式）
+        返回：(obs, reward, terminated, truncated, info)
+        """
+        game = self.game
+        self.lines_this_step = 0
+        action = int(action)
+
+        if self.mode == "input":
+            # 第一幀視為剛按下，之後的幀持續按住
+            game.step(action, action)
+            for _ in range(self.frames_per_action - 1):
+                if game.game_over:
+                    break
+                game.step(action, 0)
+        else:
+            placement = self._placements[action] if 0 <= action < self.n_actions else None
+            if placement is None:
+                # 不合法的落點：直接硬降當前方塊
+                placement = self._placements[self._first_valid_action()]
+            self._apply_placement(placement)
+
+        self.steps += 1
+        reward = float(self.lines_this_step)
+        terminated = game.game_over
+        if terminated:
+            reward -= self.death_penalty
+        truncated = bool(self.max_steps) and self.steps >= self.max_steps and not terminated
+
+        self._write_observation()
+        self._update_info()
+        return self.obs, reward, terminated, truncated, self.info
+
+    def _first_valid_action(self):
+        """第一個可用的落點索引"""
+        for index, placement in enumerate(self._placements):
+            if placement is not None:
+                return index
+        return 0
+
+    def _apply_placement(self, placement):
+        """
+        直接把方塊放到落點並鎖定（與實際按鍵路徑的結果相同，但不需逐幀模擬）
+        參數：
+        - placement: Placement 物件（None 表示沒有任何可用落點）
+        """
+        game = self.game
+        if placement is None:
+            game.game_over = True
+            return
+        if placement.use_hold:
+            game.hold_piece()
+
+        piece = game.current_tetromino
+        game.score += (placement.y - piece.y) * 2  # 硬降分數
+        piece.x = placement.x
+        piece.y = placement.y
+        piece.rotation = placement.rotation
+        path = placement.path
+        game.last_move_was_rotation = bool(path) and path[-1] in (MOVE_CW, MOVE_CCW)
+        game.lock_piece()
+
+    def _write_observation(self):
+        """把遊戲狀態寫入觀察值緩衝區"""
+        game = self.game
+        grid = game.grid
+        bitboard = None
+
+        # 棋盤只在內容改變時重新解碼
+        if grid.version != self.board_version:
+            self.board_version = grid.version
+            bitboard = BitBoard.from_grid(grid)
+            if self.width <= MAX_VECTOR_WIDTH:
+                self._row_masks[:, 0] = bitboard.rows
+                np.right_shift(self._row_masks, self._shifts, out=self._bits)
+                np.bitwise_and(self._bits, 1, out=self._bits)
+                self.board[...] = self._bits
+            else:
+                # 超寬區域的位元遮罩超過 int64，逐行寫入
+                for index, row in enumerate(grid.buffer + grid.grid):
+                    self.board[index] = [color != BLACK for color in row]
+            self.heights[:] = bitboard.column_heights()
+
+        pieces = self.pieces
+        pieces.fill(0)
+        pieces[0, SHAPE_INDEX[game.current_tetromino.shape_type]] = 1
+        pieces[1, SHAPE_INDEX[game.next_tetromino.shape_type]] = 1
+        if game.hold_tetromino is not None:
+            pieces[2, SHAPE_INDEX[game.hold_tetromino.shape_type]] = 1
+
+        current = game.current_tetromino
+        position = self.piece_position
+        position[0] = current.x
+        position[1] = current.y
+        position[2] = current.rotation
+
+        scalars = self.scalars
+        scalars[0] = game.combo_count
+        scalars[1] = game.back_to_back_count
+        scalars[2] = game.can_hold
+        scalars[3] = game.level
+
+        if self.mode == "placement":
+            self._update_placements(bitboard or BitBoard.from_grid(grid))
+
+    def _update_placements(self, bitboard):
+        """重新列舉當前方塊的落點並更新 action_mask"""
+        table = self._placements
+        for index in range(self.n_actions):
+            table[index] = None
+        self.action_mask.fill(0)
+
+        game = self.game
+        if game.game_over:
+            return
+
+        width = self.width
+        candidates = generate_drop_placements(game, game.current_tetromino, bitboard)
+        if self.use_hold and game.can_hold:
+            source = game.hold_tetromino or game.next_tetromino
+            if source.shape_type != game.current_tetromino.shape_type:
+                hold_piece = Tetromino(source.shape_type, width, game.grid.buffer_rows)
+                candidates += generate_drop_placements(
+                    game, hold_piece, bitboard, use_hold=True
+                )
+
+        for placement in candidates:
+            min_col = PIECE_MASKS[placement.shape_type][placement.rotation][0]
+            index = placement.rotation * width + placement.x + min_col
+            if placement.use_hold:
+                index += 4 * width
+            if table[index] is None:
+                table[index] = placement
+                self.action_mask[index] = 1
+
+    def _update_info(self):
+        """就地更新 info dict"""
+        info = self.info
+        info["score"] = self.game.score
+        info["lines"] = self.game.lines_cleared
+        info["pieces"] = self.pieces_placed
+        info["steps"] = self.steps
+
+
+class VecEnv:
+    """
+    向量化環境類別
+    所有環境的觀察值存放在批次陣列中（第一維為環境編號），
+    step 一次推進所有環境，結束的環境自動重新開始
+    """
+
+    def __init__(self, num_envs, **env_kwargs):
+        """
+        初始化向量化環境
+        參數：
+        - num_envs: 環境數量
+        - env_kwargs: 傳給 TetrisEnv 的參數
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("強化學習環境需要 numpy：pip install numpy")
+
+        width = env_kwargs.get("width", GRID_WIDTH)
+        height = env_kwargs.get("height", GRID_HEIGHT)
+        buffer_rows = env_kwargs.get("buffer_rows", GRID_BUFFER_ROWS)
+        shapes = observation_shapes(width, height, buffer_rows)
+
+        self.num_envs = num_envs
+        self.obs = {
+            name: np.zeros((num_envs,) + shape, dtype)
+            for name, (shape, dtype) in shapes.items()
+        }
+        self.envs = [
+            TetrisEnv(
+                buffers={name: batch[index] for name, batch in self.obs.items()},
+                **env_kwargs,
+            )
+            for index in range(num_envs)
+        ]
+        self.n_actions = self.envs[0].n_actions
+
+        # 每步結果（就地更新）
+        self.rewards = np.zeros(num_envs, np.float32)
+        self.terminated = np.zeros(num_envs, np.bool_)
+        self.truncated = np.zeros(num_envs, np.bool_)
+        # 最近一次結束的回合統計
+        self.episode_lines = np.zeros(num_envs, np.int32)
+        self.episode_scores = np.zeros(num_envs, np.int64)
+        self.episode_count = 0
+        self.seed = None
+
+    def reset(self, seed=None):
+        """
+        重新開始所有環境
+        參數：
+        - seed: 基礎種子（第 i 個環境使用 seed + i）
+        返回：obs（批次陣列 dict）
+        """
+        self.seed = seed
+        for index, env in enumerate(self.envs):
+            env.reset(None if seed is None else seed + index)
+        return self.obs
+
+    def step(self, actions):
+        """
+        推進所有環境一步
+        參數：
+        - actions: 每個環境的動作（長度為 num_envs 的序列或陣列）
+        返回：(obs, rewards, terminated, truncated)
+        """
+        rewards = self.rewards
+        terminated = self.terminated
+        truncated = self.truncated
+        for index, env in enumerate(self.envs):
+            _, reward, done, cut, info = env.step(actions[index])
+            rewards[index] = reward
+            terminated[index] = done
+            truncated[index] = cut
+            if done or cut:
+                self.episode_lines[index] = info["lines"]
+                self.episode_scores[index] = info["score"]
+                self.episode_count += 1
+                env.reset(
+                    None
+                    if self.seed is None
+                    else self.seed + index + self.episode_count * self.num_envs
+                )
+        return self.obs, rewards, terminated, truncated
@@ -0,0 +1,199 @@
+"""
+Finesse 分析模組
+每個方塊鎖定時計算到達該落點所需的最少按鍵數，並與玩家實際的按鍵數比較
+
+最少按鍵數的計算：
+1. 以出生位置為起點，只用平移、DAS 與旋轉做逐層廣度優先搜尋（不含軟降），
+   找到第一個硬降後與鎖定位置相同格子的狀態即為最佳解（一般落點只需搜尋數十個狀態）
+2. 搜尋不到時（tuck、spin 等需要軟降的落點），改用 generate_reachable_placements 的完整搜尋
+
+按鍵數計算方式與 Game.piece_inputs 相同：平移、旋轉、軟降每按一次算一鍵，
+DAS 移到牆邊算一鍵，Hold 與硬降不計
+"""
+
+import os
+import sys
+import time
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.shapes import TETROMINO_BLOCKS
+from game_objects.bitboard import BitBoard
+from game_objects.tetromino import Tetromino
+from core.move_generator import (
+    MOVE_LEFT,
+    MOVE_RIGHT,
+    MOVE_DAS_LEFT,
+    MOVE_DAS_RIGHT,
+    MOVE_CW,
+    MOVE_CCW,
+    generate_reachable_placements,
+)
+
+# 統計檔欄位
+STATS_FIELDS = ("piece", "shape", "x", "y", "rotation", "optimal", "actual", "extra", "path")
+
+
+def _target_states(shape_type, x, y, rotation):
+    """
+    列出與鎖定位置佔據相同格子的所有 (x, y, rotation)
+    （I、S、Z、O 的不同旋轉狀態可能產生相同的格子）
+    """
+    blocks = TETROMINO_BLOCKS[shape_type]
+    target = sorted((x + col, y + row) for col, row in blocks[rotation])
+    states = set()
+    for candidate, candidate_blocks in enumerate(blocks):
+        cells = sorted(candidate_blocks)
+        offset_x = target[0][0] - cells[0][0]
+        offset_y = target[0][1] - cells[0][1]
+        if sorted((offset_x + col, offset_y + row) for col, row in cells) == target:
+            states.add((offset_x, offset_y, candidate))
+    return states
+
+
+def find_optimal_path(game, tetromino=None, board=None):
+    """
+    計算當前方塊到達目前位置（硬降後）的最少按鍵路徑
+    參數：
+    - game: Game 物件（game.grid 為尚未放置方塊的盤面）
+    - tetromino: 要分析的方塊（預設為當前方塊，位置視為鎖定位置）
+    - board: BitBoard（預設由 game.grid 建立）
+    返回：移動指令列表（不含硬降），無法到達時為 None
+    """
+    piece = tetromino or game.current_tetromino
+    board = board or BitBoard.from_grid(game.grid)
+    shape_type = piece.shape_type
+    lock_y = board.drop_y(shape_type, piece.rotation, piece.x, piece.y)
+    targets = _target_states(shape_type, piece.x, lock_y, piece.rotation)
+
+    spawn = Tetromino(shape_type, game.grid.width, game.grid.buffer_rows)
+    if board.collides(shape_type, spawn.rotation, spawn.x, spawn.y):
+        return None
+    if game.grid.buffer_rows and not board.collides(
+        shape_type, spawn.rotation, spawn.x, spawn.y + 1
+    ):
+        spawn.move(0, 1)  # 與 Game.enter_playfield 相同，出生後立即下移一行
+    start = (spawn.x, spawn.y, spawn.rotation)
+
+    # 逐層廣度優先搜尋（每層為同樣的按鍵數）
+    visited = {start: []}
+    frontier = [start]
+    probe = spawn.copy()
+    while frontier:
+        next_frontier = []
+        for state in frontier:
+            x, y, rotation = state
+            path = visited[state]
+            if (x, board.drop_y(shape_type, rotation, x, y), rotation) in targets:
+                return path
+
+            neighbors = []
+            for direction, tap, das in (
+                (-1, MOVE_LEFT, MOVE_DAS_LEFT),
+                (1, MOVE_RIGHT, MOVE_DAS_RIGHT),
+            ):
+                wall_x = x
+                while not board.collides(shape_type, rotation, wall_x + direction, y):
+                    wall_x += direction
+                if wall_x != x:
+                    neighbors.append(((x + direction, y, rotation), tap))
+                if abs(wall_x - x) > 1:
+                    neighbors.append(((wall_x, y, rotation), das))
+            for clockwise, move in ((True, MOVE_CW), (False, MOVE_CCW)):
+                new_rotation = (rotation + (1 if clockwise else -1)) % 4
+                if not board.collides(shape_type, new_rotation, x, y):
+                    # 不需要 kick 的旋轉直接以位元棋盤判定（與 find_rotation 的第一步相同）
+                    neighbors.append(((x, y, new_rotation), move))
+                    continue
+                probe.x, probe.y, probe.rotation = x, y, rotation
+                result = game.find_rotation(probe, clockwise)
+                if result is not None:
+                    neighbors.append((result[:3], move))
+
+            for next_state, move in neighbors:
+                if next_state not in visited:
+                    visited[next_state] = path + [move]
+                    next_frontier.append(next_state)
+        frontier = next_frontier
+
+    # 需要軟降的落點（tuck、spin）：使用完整搜尋
+    for placement in generate_reachable_placements(game, spawn, board):
+        if (placement.x, placement.y, placement.rotation) in targets:
+            return placement.path
+    return None
+
+
+class FinesseAnalyzer:
+    """
+    Finesse 分析器類別
+    attach(game) 後於每次鎖定前分析落點，結果累計在分析器中並可串流寫入 CSV 統計檔
+    """
+
+    def __init__(self, stats_path=None):
+        """
+        初始化分析器
+        參數：
+        - stats_path: CSV 統計檔路徑（None 表示不寫檔；檔案已存在時接續寫入）
+        """
+        self.pieces = 0  # 分析的方塊數
+        self.perfect = 0  # 按鍵數為最佳的方塊數
+        self.extra_inputs = 0  # 累計多按的鍵數
+        self.last = None  # 最近一次的分析結果
+        self.last_time = 0.0  # 最近一次分析耗時（秒）
+
+        self.stats_file = None
+        if stats_path:
+            new_file = not os.path.exists(stats_path) or os.path.getsize(stats_path) == 0
+            self.stats_file = open(stats_path, "a", encoding="utf-8")
+            if new_file:
+                self.stats_file.write(",".join(STATS_FIELDS) + "\n")
+                self.stats_file.flush()
+
+    def attach(self, game):
+        """將分析器掛上遊戲的鎖定前監聽器"""
+        game.pre_lock_listeners.append(self.on_pre_lock)
+
+    def on_pre_lock(self, game):
+        """方塊鎖定前的監聽器（此時方塊位於鎖定位置，盤面尚未放置方塊）"""
+        start = time.perf_counter()
+        piece = game.current_tetromino
+        path = find_optimal_path(game)
+        actual = game.piece_inputs
+        # 無法重建路徑時（例如出生位置已被擋住）不計入統計
+        optimal = len(path) if path is not None else actual
+        extra = max(0, actual - optimal)
+
+        self.pieces += 1
+        if extra == 0:
+            self.perfect += 1
+        self.extra_inputs += extra
+        self.last = {
+            "shape": piece.shape_type,
+            "x": piece.x,
+            "y": piece.y,
+            "rotation": piece.rotation,
+            "optimal": optimal,
+            "actual": actual,
+            "extra": extra,
+            "path": path or [],
+        }
+        self.last_time = time.perf_counter() - start
+
+        if self.stats_file:
+            values = [self.pieces] + [self.last[field] for field in STATS_FIELDS[1:-1]]
+            values.append(" ".join(self.last["path"]))
+            self.stats_file.write(",".join(str(value) for value in values) + "\n")
+            self.stats_file.flush()
+
+    def accuracy(self):
+        """按鍵數為最佳的方塊比例（0~100）"""
+        if self.pieces == 0:
+            return 100.0
+        return self.perfect * 100.0 / self.pieces
+
+    def close(self):
+        """關閉統計檔"""
+        if self.stats_file:
+            self.stats_file.close()
+            self.stats_file = None
@@ -13,9 +13,21 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from game_objects.tetromino import Tetromino
 from game_objects.grid import GameGrid
+from core.inputs import (
+    INPUT_LEFT,
+    INPUT_RIGHT,
+    INPUT_SOFT_DROP,
+    INPUT_ROTATE_CW,
+    INPUT_ROTATE_CCW,
+    INPUT_HOLD,
+    INPUT_HARD_DROP,
+    FINESSE_INPUTS,
+    keys_to_input_mask,
+)
 from config.constants import (
     GRID_WIDTH,
     GRID_HEIGHT,
+    GRID_BUFFER_ROWS,
     FALL_SPEED,
     BLACK,
     DAS_DELAY,
@@ -30,13 +42,63 @@ from config.constants import (
 )
 from config.shapes import TETROMINO_SHAPES, WALL_KICK_DATA
 
+# 快照需要保存的純量狀態（計時器皆為整數幀／毫秒，確保重新模擬結果一致）
+SNAPSHOT_FIELDS = (
+    "can_hold",
+    "score",
+    "level",
+    "lines_cleared",
+    "fall_timer",
+    "game_over",
+    "das_timer_left",
+    "das_timer_right",
+    "das_active_left",
+    "das_active_right",
+    "lock_delay_timer",
+    "lock_delay_resets",
+    "is_on_ground",
+    "last_move_was_rotation",
+    "t_spin_type",
+    "last_kick_index",
+    "last_kick_offset",
+    "back_to_back_count",
+    "last_clear_was_difficult",
+    "action_text",
+    "action_text_timer",
+    "combo_count",
+    "perfect_clear_count",
+    "piece_inputs",
+    "last_lock_result",
+)
+
 
 class Game:
     """遊戲控制器物件類別"""
 
-    def __init__(self):
-        """初始化遊戲"""
-        self.grid = GameGrid(GRID_WIDTH, GRID_HEIGHT)
+    def __init__(
+        self,
+        width=GRID_WIDTH,
+        height=GRID_HEIGHT,
+        buffer_rows=GRID_BUFFER_ROWS,
+        seed=None,
+        verbose=True,
+    ):
+        """
+        初始化遊戲
+        參數：
+        - width: 遊戲區域寬度（格數）
+        - height: 遊戲區域可見高度（格數）
+        - buffer_rows: 可見區域上方的隱藏緩衝行數
+        - seed: 7-bag 隨機種子（相同種子產生相同方塊序列，用於對戰與重播）
+        - verbose: 是否輸出除錯訊息（大量無視窗模擬時關閉）
+        """
+        self.grid = GameGrid(width, height, buffer_rows)
+        self.verbose = verbose
+
+        # 每局獨立的隨機數產生器（不影響全域 random 狀態）
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.rng_state = None  # rng 狀態快取（只有填充方塊袋時才會改變）
 
         # 7-bag 隨機器系統
         self.piece_bag = []  # 當前的方塊袋
@@ -44,6 +106,7 @@ class Game:
 
         self.current_tetromino = self.spawn_tetromino()
         self.next_tetromino = self.spawn_tetromino()
+        self.enter_playfield()
         self.hold_tetromino = None  # Hold 功能的方塊
         self.can_hold = True  # 是否可以使用 Hold 功能
         self.score = 0
@@ -85,11 +148,38 @@ class Game:
         # Perfect Clear (All Clear) 系統
         self.perfect_clear_count = 0  # Perfect Clear 次數
 
+        # 當前方塊已使用的按鍵次數（不含 Hold 與硬降，finesse 分析使用）
+        self.piece_inputs = 0
+
+        # 方塊鎖定結果與監聽器（對戰、統計等模組使用）
+        self.last_lock_result = None  # 最近一次鎖定的結果 dict
+        self.lock_listeners = []  # 鎖定後呼叫的函數 listener(game, result)
+        self.pre_lock_listeners = []  # 鎖定前（方塊尚未放置）呼叫的函數 listener(game)
+
+    def log(self, message):
+        """輸出除錯訊息（verbose 關閉時不輸出）"""
+        if self.verbose:
+            print(message)
+
     def fill_bag(self):
         """填充 7-bag 系統的方塊袋"""
         shapes = list(TETROMINO_SHAPES.keys())
-        random.shuffle(shapes)  # 隨機排列7種方塊
+        self.rng.shuffle(shapes)  # 隨機排列7種方塊
         self.piece_bag.extend(shapes)
+        self.rng_state = None
+
+    def enter_playfield(self):
+        """
+        當前方塊出生後的處理（現代規則）
+        在隱藏緩衝區內出生的方塊若下方有空間，立即下移一行，讓方塊馬上出現在可見區域
+        """
+        piece = self.current_tetromino
+        if (
+            self.grid.buffer_rows
+            and self.grid.is_valid_position(piece)
+            and self.grid.is_valid_position(piece, 0, 1)
+        ):
+            piece.move(0, 1)
 
     def spawn_tetromino(self):
         """使用 7-bag 系統生成新的 Tetromino"""
@@ -97,7 +187,25 @@ class Game:
             self.fill_bag()
 
         shape_type = self.piece_bag.pop(0)  # 取出袋子中的第一個方塊
-        return Tetromino(shape_type)
+        return Tetromino(shape_type, self.grid.width, self.grid.buffer_rows)
+
+    def preview_pieces(self, count):
+        """
+        預覽接下來的方塊類型（不改變遊戲狀態）
+        依序為下一個方塊、方塊袋剩餘的方塊，不足時以複製的 rng 推算之後的袋子
+        參數：
+        - count: 預覽數量
+        返回：方塊類型列表
+        """
+        pieces = [self.next_tetromino.shape_type] + self.piece_bag[: count - 1]
+        if len(pieces) < count:
+            rng = random.Random()
+            rng.setstate(self.rng.getstate())
+            while len(pieces) < count:
+                shapes = list(TETROMINO_SHAPES.keys())
+                rng.shuffle(shapes)  # 與 fill_bag 相同的洗牌順序
+                pieces.extend(shapes)
+        return pieces[:count]
 
     def hold_piece(self):
         """
@@ -108,21 +216,30 @@ class Game:
 
         if self.hold_tetromino is None:
             # 第一次使用 Hold，儲存當前方塊並生成新方塊
-            self.hold_tetromino = Tetromino(self.current_tetromino.shape_type)
+            self.hold_tetromino = Tetromino(
+                self.current_tetromino.shape_type,
+                self.grid.width,
+                self.grid.buffer_rows,
+            )
             self.current_tetromino = self.next_tetromino
             self.next_tetromino = self.spawn_tetromino()
+            self.enter_playfield()
         else:
             # 交換 Hold 方塊與當前方塊
             temp = self.hold_tetromino
-            self.hold_tetromino = Tetromino(self.current_tetromino.shape_type)
+            self.hold_tetromino = Tetromino(
+                self.current_tetromino.shape_type,
+                self.grid.width,
+                self.grid.buffer_rows,
+            )
             self.current_tetromino = temp
             # 重置位置
-            self.current_tetromino.x = GRID_WIDTH // 2 - 2
-            self.current_tetromino.y = 0
-            self.current_tetromino.rotation = 0
+            self.current_tetromino.reset_position()
+            self.enter_playfield()
 
         # 使用 Hold 後需要等到方塊鎖定才能再次使用
         self.can_hold = False
+        self.piece_inputs = 0
         return True
 
     def update(self, dt):
@@ -182,25 +299,29 @@ class Game:
 
     def lock_piece(self):
         """鎖定方塊並處理後續邏輯"""
+        for listener in self.pre_lock_listeners:
+            listener(self)
+
         # 檢測 T-spin
         t_spin_type = self.check_t_spin()
         is_tspin = t_spin_type is not None
 
         # Debug: 顯示 T-spin 檢測結果
         if self.current_tetromino.shape_type == "T" and self.last_move_was_rotation:
-            print(
+            self.log(
                 f"T-spin 檢測: {t_spin_type}, 最後動作是旋轉: {self.last_move_was_rotation}"
             )
 
         # 放置方塊
-        self.grid.place_tetromino(self.current_tetromino)
+        touched_rows = self.grid.place_tetromino(self.current_tetromino)
 
-        # 檢查行消除
-        lines = self.grid.check_lines()
+        # 檢查行消除（只檢查方塊所在的行）
+        lines = self.grid.check_lines(touched_rows)
 
         # 檢查 Perfect Clear
         is_perfect_clear = self.grid.is_perfect_clear() if lines > 0 else False
 
+        b2b_before = self.back_to_back_count
         if lines > 0:
             self.lines_cleared += lines
             self.score += self.calculate_score(
@@ -214,6 +335,23 @@ class Game:
             # 沒有消行，重置 combo
             self.combo_count = 0
 
+        # 記錄鎖定結果（供對戰攻擊計算等使用）
+        self.last_lock_result = {
+            "shape_type": self.current_tetromino.shape_type,
+            "x": self.current_tetromino.x,
+            "y": self.current_tetromino.y,
+            "rotation": self.current_tetromino.rotation,
+            "lines": lines,
+            "cleared_rows": list(self.grid.filled_rows) if lines > 0 else [],
+            "t_spin": t_spin_type,
+            "perfect_clear": is_perfect_clear,
+            "combo": self.combo_count,
+            "back_to_back": lines > 0 and self.back_to_back_count > max(b2b_before, 1),
+            "inputs": self.piece_inputs,
+        }
+        for listener in self.lock_listeners:
+            listener(self, self.last_lock_result)
+
         # 重置狀態
         self.is_on_ground = False
         self.lock_delay_timer = 0
@@ -226,13 +364,16 @@ class Game:
         # 生成新方塊
         self.current_tetromino = self.next_tetromino
         self.next_tetromino = self.spawn_tetromino()
+        self.piece_inputs = 0
 
         # 方塊鎖定後可以再次使用 Hold
         self.can_hold = True
 
-        # 檢查遊戲結束
-        if not self.grid.is_valid_position(self.current_tetromino):
+        # 檢查遊戲結束（鎖定在緩衝區內或新方塊無法出生）
+        if self.grid.is_game_over(self.current_tetromino):
             self.game_over = True
+        else:
+            self.enter_playfield()
 
     def reset_lock_delay(self):
         """
@@ -256,8 +397,104 @@ class Game:
 
     def restart_game(self):
         """重啟遊戲"""
-        # 完全重新初始化
-        self.__init__()
+        # 完全重新初始化（保留遊戲區域尺寸、隨機種子與鎖定監聽器）
+        listeners = self.lock_listeners
+        pre_listeners = self.pre_lock_listeners
+        self.__init__(
+            self.grid.width,
+            self.grid.height,
+            self.grid.buffer_rows,
+            seed=self.seed,
+            verbose=self.verbose,
+        )
+        self.lock_listeners = listeners
+        self.pre_lock_listeners = pre_listeners
+
+    def receive_garbage(self, hole_columns):
+        """
+        接收垃圾行（對戰模式）
+        參數：
+        - hole_columns: 每一行垃圾的缺口欄位（由上到下）
+        返回：True 如果因垃圾行導致遊戲結束
+        """
+        if self.game_over or not hole_columns:
+            return False
+
+        overflow = self.grid.add_garbage_rows(hole_columns)
+
+        # 當前方塊若與上升的方塊重疊，將其往上推
+        pushes = 0
+        while (
+            not self.grid.is_valid_position(self.current_tetromino)
+            and pushes <= len(hole_columns)
+        ):
+            self.current_tetromino.move(0, -1)
+            pushes += 1
+
+        if overflow or self.grid.is_game_over(self.current_tetromino):
+            self.game_over = True
+        return self.game_over
+
+    def snapshot(self):
+        """
+        建立完整遊戲狀態快照（rollback 網路同步使用）
+        方塊物件以參照保存並另外記錄其位置，還原後未換方塊時仍是同一物件
+        返回：可傳給 restore 的 tuple
+        """
+        pieces = tuple(
+            (piece, piece.x, piece.y, piece.rotation) if piece else None
+            for piece in (
+                self.current_tetromino,
+                self.next_tetromino,
+                self.hold_tetromino,
+            )
+        )
+        # rng 只在填充方塊袋時前進，沿用快取避免每幀複製完整狀態
+        if self.rng_state is None:
+            self.rng_state = self.rng.getstate()
+        return (
+            self.grid.snapshot(),
+            pieces,
+            self.piece_bag[:],
+            self.rng_state,
+            tuple(getattr(self, name) for name in SNAPSHOT_FIELDS),
+        )
+
+    def restore(self, state):
+        """
+        還原遊戲狀態快照
+        參數：
+        - state: snapshot() 返回的 tuple
+        """
+        grid_state, pieces, piece_bag, rng_state, values = state
+        self.grid.restore(grid_state)
+
+        restored = []
+        for entry in pieces:
+            if entry is None:
+                restored.append(None)
+                continue
+            piece, piece.x, piece.y, piece.rotation = entry
+            restored.append(piece)
+        self.current_tetromino, self.next_tetromino, self.hold_tetromino = restored
+
+        self.piece_bag = piece_bag[:]
+        if rng_state is not self.rng_state:
+            self.rng.setstate(rng_state)
+            self.rng_state = rng_state
+        for name, value in zip(SNAPSHOT_FIELDS, values):
+            setattr(self, name, value)
+
+    def step(self, held, pressed, dt=1000 // FPS):
+        """
+        以輸入遮罩推進一幀（無視窗模擬、AI 與網路同步使用）
+        參數：
+        - held: 按住的動作遮罩
+        - pressed: 剛按下的動作遮罩
+        - dt: 時間差（毫秒），預設為固定的一幀
+        """
+        self.handle_input_mask(held, pressed)
+        self.update(dt)
 
     def handle_input(self, keys_pressed, keys_just_pressed):
         """
@@ -269,87 +506,53 @@ class Game:
         if self.game_over:
             return
 
+        # 重啟遊戲
+        if keys_just_pressed.get(pygame.K_r, False):
+            self.restart_game()
+            return
+
+        held, pressed = keys_to_input_mask(keys_pressed, keys_just_pressed)
+        self.handle_input_mask(held, pressed)
+
+    def handle_input_mask(self, held, pressed):
+        """
+        處理輸入遮罩（鍵盤、AI 與網路輸入共用）
+        參數：
+        - held: 按住的動作遮罩（INPUT_* 位元）
+        - pressed: 剛按下的動作遮罩（INPUT_* 位元）
+        """
+        if self.game_over:
+            return
+
+        # 記錄當前方塊的按鍵次數（每個剛按下的按鍵算一次）
+        if pressed & FINESSE_INPUTS:
+            self.piece_inputs += bin(pressed & FINESSE_INPUTS).count("1")
+
         # DAS 水平移動系統
-        self.handle_horizontal_movement(keys_pressed, keys_just_pressed)
+        self.handle_horizontal_input(held, pressed)
 
         # 加速下落
-        if keys_pressed[pygame.K_DOWN]:
+        if held & INPUT_SOFT_DROP:
             if self.grid.is_valid_position(self.current_tetromino, 0, 1):
                 self.current_tetromino.move(0, 1)
                 self.last_move_was_rotation = False
                 self.reset_lock_delay()
                 self.score += 1  # 手動下落獲得額外分數
 
-        # 重啟遊戲
-        if keys_just_pressed.get(pygame.K_r, False):
-            self.restart_game()
-
         # 順時針旋轉
-        if keys_just_pressed.get(pygame.K_UP, False) or keys_just_pressed.get(
-            pygame.K_x, False
-        ):
-            original_rotation = self.current_tetromino.rotation
-            new_rotation = (original_rotation + 1) % 4
-
-            # 重置kick資訊
-            self.last_kick_index = None
-            self.last_kick_offset = None
-
-            # 嘗試直接旋轉
-            if self.grid.is_valid_position_at(
-                self.current_tetromino.get_rotated_shape(new_rotation),
-                self.current_tetromino.x,
-                self.current_tetromino.y,
-            ):
-                # 直接旋轉成功
-                self.current_tetromino.rotation = new_rotation
-                self.last_move_was_rotation = True
-                self.reset_lock_delay()
-            else:
-                # 嘗試 SRS Wall Kick
-                if self.try_wall_kick(original_rotation, new_rotation):
-                    self.last_move_was_rotation = True
-                    self.reset_lock_delay()
-                else:
-                    # 旋轉失敗，保持原狀態
-                    self.last_move_was_rotation = False
+        if pressed & INPUT_ROTATE_CW:
+            self.rotate_current(True)
 
         # 逆時針旋轉
-        if keys_just_pressed.get(pygame.K_z, False):
-            original_rotation = self.current_tetromino.rotation
-            new_rotation = (original_rotation - 1) % 4
-
-            # 重置kick資訊
-            self.last_kick_index = None
-            self.last_kick_offset = None
-
-            # 嘗試直接旋轉
-            if self.grid.is_valid_position_at(
-                self.current_tetromino.get_rotated_shape(new_rotation),
-                self.current_tetromino.x,
-                self.current_tetromino.y,
-            ):
-                # 直接旋轉成功
-                self.current_tetromino.rotation = new_rotation
-                self.last_move_was_rotation = True
-                self.reset_lock_delay()
-            else:
-                # 嘗試 SRS Wall Kick
-                if self.try_wall_kick(original_rotation, new_rotation):
-                    self.last_move_was_rotation = True
-                    self.reset_lock_delay()
-                else:
-                    # 旋轉失敗，保持原狀態
-                    self.last_move_was_rotation = False
+        if pressed & INPUT_ROTATE_CCW:
+            self.rotate_current(False)
 
         # Hold 功能
-        if keys_just_pressed.get(pygame.K_c, False) or keys_just_pressed.get(
-            pygame.K_LSHIFT, False
-        ):
+        if pressed & INPUT_HOLD:
             self.hold_piece()
 
         # 硬降（Hard Drop）
-        if keys_just_pressed.get(pygame.K_SPACE, False):
+        if pressed & INPUT_HARD_DROP:
             drop_distance = 0
             while self.grid.is_valid_position(self.current_tetromino, 0, 1):
                 self.current_tetromino.move(0, 1)
@@ -361,6 +564,96 @@ class Game:
             # 硬降後立即鎖定方塊
             self.lock_piece()
 
+    def rotate_current(self, clockwise):
+        """
+        旋轉當前方塊（直接旋轉失敗時嘗試 Wall Kick）
+        參數：
+        - clockwise: True 為順時針，False 為逆時針
+        返回：True 如果旋轉成功
+        """
+        original_rotation = self.current_tetromino.rotation
+        new_rotation = (original_rotation + (1 if clockwise else -1)) % 4
+
+        # 重置kick資訊
+        self.last_kick_index = None
+        self.last_kick_offset = None
+
+        # 嘗試直接旋轉
+        if self.grid.is_valid_position_at(
+            self.current_tetromino.get_rotated_shape(new_rotation),
+            self.current_tetromino.x,
+            self.current_tetromino.y,
+        ):
+            # 直接旋轉成功
+            self.current_tetromino.rotation = new_rotation
+            self.last_move_was_rotation = True
+            self.reset_lock_delay()
+            return True
+
+        # 嘗試 SRS Wall Kick
+        if self.try_wall_kick(original_rotation, new_rotation):
+            self.last_move_was_rotation = True
+            self.reset_lock_delay()
+            return True
+
+        # 旋轉失敗，保持原狀態
+        self.last_move_was_rotation = False
+        return False
+
+    def find_rotation(self, tetromino, clockwise):
+        """
+        計算方塊旋轉後的位置（不修改任何遊戲狀態，供 AI 移動搜尋使用）
+        與 rotate_current 使用相同的直接旋轉與 kick 順序
+        參數：
+        - tetromino: Tetromino 物件
+        - clockwise: True 為順時針，False 為逆時針
+        返回：(x, y, rotation, kick_index) 或 None（旋轉失敗）
+        """
+        new_rotation = (tetromino.rotation + (1 if clockwise else -1)) % 4
+        rotated_shape = tetromino.get_rotated_shape(new_rotation)
+
+        if self.grid.is_valid_position_at(rotated_shape, tetromino.x, tetromino.y):
+            return tetromino.x, tetromino.y, new_rotation, None
+
+        for kick_index, (kick_x, kick_y) in self.get_kick_candidates(
+            tetromino.shape_type, tetromino.rotation, new_rotation
+        ):
+            test_x = tetromino.x + kick_x
+            test_y = tetromino.y + kick_y
+            if self.grid.is_valid_position_at(rotated_shape, test_x, test_y):
+                return test_x, test_y, new_rotation, kick_index
+
+        return None
+
+    def get_kick_candidates(self, shape_type, old_rotation, new_rotation):
+        """
+        依 try_wall_kick 的嘗試順序列出所有 kick
+        返回：[(kick_index, (kick_x, kick_y)), ...]
+        （特殊kick索引 20+，標準SRS索引 0+，額外kick索引 10+）
+        """
+        candidates = []
+        if shape_type == "T":
+            special_kicks = self.get_test_scenario_kicks(old_rotation, new_rotation)
+            if special_kicks:
+                candidates.extend(
+                    (20 + index, kick) for index, kick in enumerate(special_kicks)
+                )
+
+        if shape_type != "O":
+            kick_data_type = "I" if shape_type == "I" else "JLSTZ"
+            kick_tests = WALL_KICK_DATA[kick_data_type].get(
+                (old_rotation, new_rotation), []
+            )
+            candidates.extend(enumerate(kick_tests))
+
+        if shape_type == "T":
+            extra_kicks = self.get_extra_kick_sequence(old_rotation, new_rotation)
+            candidates.extend(
+                (10 + index, kick) for index, kick in enumerate(extra_kicks)
+            )
+
+        return candidates
+
     def handle_horizontal_movement(self, keys_pressed, keys_just_pressed):
         """
         處理 DAS 水平移動系統
@@ -368,11 +661,21 @@ class Game:
         - keys_pressed: 當前按下的鍵
         - keys_just_pressed: 剛按下的鍵
         """
+        held, pressed = keys_to_input_mask(keys_pressed, keys_just_pressed)
+        self.handle_horizontal_input(held, pressed)
+
+    def handle_horizontal_input(self, held, pressed):
+        """
+        處理 DAS 水平移動系統（輸入遮罩版本）
+        參數：
+        - held: 按住的動作遮罩
+        - pressed: 剛按下的動作遮罩
+        """
         # 檢查按鍵狀態
-        left_pressed = keys_pressed[pygame.K_LEFT]
-        right_pressed = keys_pressed[pygame.K_RIGHT]
-        left_just_pressed = keys_just_pressed.get(pygame.K_LEFT, False)
-        right_just_pressed = keys_just_pressed.get(pygame.K_RIGHT, False)
+        left_pressed = held & INPUT_LEFT
+        right_pressed = held & INPUT_RIGHT
+        left_just_pressed = pressed & INPUT_LEFT
+        right_just_pressed = pressed & INPUT_RIGHT
 
         # 處理左移
         if left_pressed:
@@ -647,18 +950,11 @@ class Game:
         # 這是一個簡化的檢測，在實際遊戲中可能需要更精確的檢測
 
         # 檢查底部10行是否有大量的方塊（測試情境的特徵）
-        red_color_index = 4  # 紅色方塊的索引
-        filled_count = 0
-        total_cells = 0
-
-        # 檢查底部10行
-        start_row = max(0, GRID_HEIGHT - 10)
-        for row in range(start_row, GRID_HEIGHT):
-            for col in range(GRID_WIDTH):
-                total_cells += 1
-                # 檢查是否有任何非零值（佔用的格子）
-                if self.grid.grid[row][col] != 0:
-                    filled_count += 1
+        # 使用每行的已填充格數，成本與區域寬度無關
+        start_row = max(0, self.grid.height - 10)
+        rows = range(start_row, self.grid.height)
+        filled_count = sum(self.grid.get_row_count(row) for row in rows)
+        total_cells = len(rows) * self.grid.width
 
         # 如果佔用方塊比例超過30%，認為是測試情境
         filled_ratio = filled_count / total_cells if total_cells > 0 else 0
@@ -695,26 +991,18 @@ class Game:
         for i, (corner_x, corner_y) in enumerate(corners):
             # 檢查是否為牆壁、地板或已放置的方塊
             # 根據標準規則：牆壁和地板也算作被佔用
-            is_filled = False
-
-            if corner_x < 0 or corner_x >= GRID_WIDTH:
-                # 左右牆壁
-                is_filled = True
-            elif corner_y >= GRID_HEIGHT:
-                # 地板
-                is_filled = True
-            elif corner_y < 0:
+            if corner_y < -self.grid.buffer_rows:
                 # 頂部邊界（通常不會發生，但為了安全）
                 is_filled = True
-            elif self.grid.grid[corner_y][corner_x] != BLACK:
-                # 已放置的方塊
-                is_filled = True
+            else:
+                # 左右牆壁、地板或已放置的方塊（含緩衝區）
+                is_filled = self.grid.is_occupied(corner_x, corner_y)
 
             if is_filled:
                 filled_corners.append(i)
 
         # Debug 輸出
-        print(
+        self.log(
             f"T-spin 檢測: 中心位置=({center_x},{center_y}), 被填充的角落={len(filled_corners)}/4 {filled_corners}, 旋轉={self.current_tetromino.rotation}"
         )
 
@@ -747,23 +1035,23 @@ class Game:
             # 在 SRS JLSTZ 中，最後一個kick通常是 TST/Fin kick
             if self.last_kick_index == 4:  # 最後一個kick索引
                 is_tst_or_fin_kick = True
-                print(
+                self.log(
                     f"檢測到特殊kick: 索引={self.last_kick_index}, 偏移={self.last_kick_offset}"
                 )
             elif (
                 self.last_kick_offset and abs(self.last_kick_offset[1]) == 2
             ):  # 垂直移動2格的kick
                 is_tst_or_fin_kick = True
-                print(f"檢測到Fin kick: 偏移={self.last_kick_offset}")
+                self.log(f"檢測到Fin kick: 偏移={self.last_kick_offset}")
 
         # 判斷T-Spin類型
         if front_filled_count == 2 or is_tst_or_fin_kick:
             # 如果前角（指向側）的兩個角都被填充，或使用了特殊kick，則為正常 T-spin
-            print("檢測到正常 T-spin!")
+            self.log("檢測到正常 T-spin!")
             return "tspin"
         else:
             # 否則為 Mini T-spin
-            print("檢測到 Mini T-spin!")
+            self.log("檢測到 Mini T-spin!")
             return "mini"
 
     def calculate_score(
@@ -895,8 +1183,8 @@ class Game:
         """提升遊戲等級和速度"""
         new_level = self.lines_cleared // LINES_PER_LEVEL + 1
         if new_level > self.level:
-            print(f"🎉 等級提升！Level {self.level} → {new_level}")
-            print(
+            self.log(f"🎉 等級提升！Level {self.level} → {new_level}")
+            self.log(
                 f"📈 下落速度：{self.get_fall_speed_for_level(self.level)} → {self.get_fall_speed_for_level(new_level)} frames"
             )
             self.level = new_level
@@ -0,0 +1,127 @@
+"""
+輸入位元遮罩模組
+將鍵盤輸入轉換為與裝置無關的位元遮罩，供 AI、對戰與網路同步使用
+
+每一幀的輸入由兩個遮罩組成：
+- held: 當前按住的動作（對應 keys_pressed）
+- pressed: 這一幀剛按下的動作（對應 keys_just_pressed）
+"""
+
+import pygame
+
+# ============================
+# 輸入動作位元
+# ============================
+INPUT_LEFT = 1 << 0  # 左移
+INPUT_RIGHT = 1 << 1  # 右移
+INPUT_SOFT_DROP = 1 << 2  # 軟降
+INPUT_ROTATE_CW = 1 << 3  # 順時針旋轉
+INPUT_ROTATE_CCW = 1 << 4  # 逆時針旋轉
+INPUT_HOLD = 1 << 5  # Hold
+INPUT_HARD_DROP = 1 << 6  # 硬降
+
+# 計入每個方塊按鍵次數的動作（finesse 分析使用；Hold 與硬降不計）
+FINESSE_INPUTS = (
+    INPUT_LEFT | INPUT_RIGHT | INPUT_SOFT_DROP | INPUT_ROTATE_CW | INPUT_ROTATE_CCW
+)
+
+INPUT_NAMES = {
+    INPUT_LEFT: "LEFT",
+    INPUT_RIGHT: "RIGHT",
+    INPUT_SOFT_DROP: "SOFT_DROP",
+    INPUT_ROTATE_CW: "ROTATE_CW",
+    INPUT_ROTATE_CCW: "ROTATE_CCW",
+    INPUT_HOLD: "HOLD",
+    INPUT_HARD_DROP: "HARD_DROP",
+}
+
+# ============================
+# 按鍵配置
+# ============================
+
+# 單人預設按鍵（與 main.py 的操作說明一致）
+DEFAULT_KEYMAP = {
+    pygame.K_LEFT: INPUT_LEFT,
+    pygame.K_RIGHT: INPUT_RIGHT,
+    pygame.K_DOWN: INPUT_SOFT_DROP,
+    pygame.K_UP: INPUT_ROTATE_CW,
+    pygame.K_x: INPUT_ROTATE_CW,
+    pygame.K_z: INPUT_ROTATE_CCW,
+    pygame.K_c: INPUT_HOLD,
+    pygame.K_LSHIFT: INPUT_HOLD,
+    pygame.K_SPACE: INPUT_HARD_DROP,
+}
+
+# 本地雙人對戰：玩家一（左側，WASD）
+PLAYER1_KEYMAP = {
+    pygame.K_a: INPUT_LEFT,
+    pygame.K_d: INPUT_RIGHT,
+    pygame.K_s: INPUT_SOFT_DROP,
+    pygame.K_w: INPUT_ROTATE_CW,
+    pygame.K_q: INPUT_ROTATE_CCW,
+    pygame.K_e: INPUT_HOLD,
+    pygame.K_SPACE: INPUT_HARD_DROP,
+}
+
+# 本地雙人對戰：玩家二（右側，方向鍵）
+PLAYER2_KEYMAP = {
+    pygame.K_LEFT: INPUT_LEFT,
+    pygame.K_RIGHT: INPUT_RIGHT,
+    pygame.K_DOWN: INPUT_SOFT_DROP,
+    pygame.K_UP: INPUT_ROTATE_CW,
+    pygame.K_RCTRL: INPUT_ROTATE_CCW,
+    pygame.K_RSHIFT: INPUT_HOLD,
+    pygame.K_RETURN: INPUT_HARD_DROP,
+}
+
+
+def keys_to_input_mask(keys_pressed, keys_just_pressed, keymap=DEFAULT_KEYMAP):
+    """
+    將 pygame 鍵盤狀態轉換為輸入遮罩
+    參數：
+    - keys_pressed: 當前按下的鍵（pygame.key.get_pressed() 或可索引物件）
+    - keys_just_pressed: 剛按下的鍵（dict）
+    - keymap: 按鍵對應表 {pygame 按鍵: 輸入位元}
+    返回：(held, pressed)
+    """
+    held = 0
+    pressed = 0
+    for key, bit in keymap.items():
+        if keys_pressed[key]:
+            held |= bit
+        if keys_just_pressed.get(key, False):
+            pressed |= bit
+    return held, pressed
+
+
+def describe_input_mask(mask):
+    """將輸入遮罩轉換為可讀字串（除錯用）"""
+    names = [name for bit, name in INPUT_NAMES.items() if mask & bit]
+    return "+".join(names) if names else "-"
+
+
+class KeyboardController:
+    """
+    鍵盤輸入控制器類別
+    與 BotController 介面相同（next_input(game)），讓對戰模式可以混用人類與 AI
+    """
+
+    def __init__(self, keymap=DEFAULT_KEYMAP):
+        """
+        初始化控制器
+        參數：
+        - keymap: 按鍵對應表
+        """
+        self.keymap = keymap
+        self.held = 0
+        self.pressed = 0
+
+    def update(self, keys_pressed, keys_just_pressed):
+        """每幀事件處理後更新鍵盤狀態"""
+        self.held, self.pressed = keys_to_input_mask(
+            keys_pressed, keys_just_pressed, self.keymap
+        )
+
+    def next_input(self, game):
+        """取得這一幀的輸入 (held, pressed)"""
+        return self.held, self.pressed
@@ -0,0 +1,454 @@
+"""
+排行榜模組
+以 SQLite 儲存各模式的成績（marathon、sprint 40 行、ultra 2 分鐘），並提供本機 HTTP/JSON 伺服器，
+讓多台機台共用同一份排行榜
+
+排序方式：
+- marathon、ultra：分數高者在前
+- sprint：完成時間短者在前（沒有完成 40 行的局不列入）
+
+查詢都透過索引完成，不需要掃描整個表格：
+- 前 N 名：(mode, score) / (mode, time_ms) 索引依序讀取前 N 筆
+- 名次：在同一個索引上計算比指定成績更好的筆數
+- 玩家最佳成績：(mode, player, score) / (mode, player, time_ms) 索引讀取第一筆
+
+遊戲結束時由 AsyncSubmitter 在背景執行緒送出，畫面不需要等待磁碟或網路
+
+命令列：
+    python -m core.leaderboard --db leaderboard.db --serve --port 8765    # 共用排行榜伺服器
+    python -m core.leaderboard --db leaderboard.db --top marathon
+    python main.py --leaderboard http://192.168.0.10:8765                 # 機台連到伺服器
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.constants import BUILD_VERSION
+
+# 模式 → (排序欄位, 排序方向)
+MODES = {
+    "marathon": ("score", "DESC"),
+    "sprint": ("time_ms", "ASC"),
+    "ultra": ("score", "DESC"),
+}
+DEFAULT_PORT = 8765
+MAX_PLAYER_LENGTH = 16
+MAX_TOP_ENTRIES = 100
+ENTRY_FIELDS = ("mode", "player", "score", "time_ms", "lines", "level", "seed", "build", "created")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    mode TEXT NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    time_ms INTEGER,
+    lines INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    seed INTEGER,
+    build TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_mode_score ON scores (mode, score DESC);
+CREATE INDEX IF NOT EXISTS scores_mode_time ON scores (mode, time_ms);
+CREATE INDEX IF NOT EXISTS scores_player_score ON scores (mode, player, score DESC);
+CREATE INDEX IF NOT EXISTS scores_player_time ON scores (mode, player, time_ms);
+"""
+
+
+def game_entry(game, player, mode="marathon", time_ms=None):
+    """
+    由遊戲結果建立成績資料
+    參數：
+    - game: Game 物件
+    - player: 玩家名稱
+    - mode: 遊戲模式
+    - time_ms: 完成時間（毫秒，sprint 模式使用）
+    """
+    return {
+        "mode": mode,
+        "player": player,
+        "score": game.score,
+        "time_ms": time_ms,
+        "lines": game.lines_cleared,
+        "level": game.level,
+        "seed": game.seed,
+    }
+
+
+def normalize_entry(entry):
+    """
+    檢查並補齊成績資料
+    參數：
+    - entry: 成績 dict（至少需要 mode、player、score；sprint 需要 time_ms）
+    返回：新的 dict
+    """
+    mode = entry.get("mode")
+    if mode not in MODES:
+        raise ValueError(f"未知的模式：{mode}")
+    player = str(entry.get("player") or "player").strip()[:MAX_PLAYER_LENGTH] or "player"
+    time_ms = entry.get("time_ms")
+    if time_ms is not None:
+        time_ms = int(time_ms)
+        if time_ms < 0:
+            raise ValueError(f"時間不可為負數：{time_ms}")
+    elif MODES[mode][0] == "time_ms":
+        raise ValueError(f"{mode} 模式需要完成時間")
+    score = int(entry.get("score", 0))
+    if score < 0:
+        raise ValueError(f"分數不可為負數：{score}")
+    seed = entry.get("seed")
+    return {
+        "mode": mode,
+        "player": player,
+        "score": score,
+        "time_ms": time_ms,
+        "lines": int(entry.get("lines", 0)),
+        "level": int(entry.get("level", 1)),
+        "seed": None if seed is None else int(seed),
+        "build": str(entry.get("build") or BUILD_VERSION),
+        "created": float(entry.get("created") or time.time()),
+    }
+
+
+def _metric(mode):
+    """模式的排序欄位、方向，以及該欄位的有效條件"""
+    column, direction = MODES[mode]
+    # sprint 只排名有完成時間的局；time_ms >= 0 同時讓查詢使用 (mode, time_ms) 索引的範圍
+    condition = "time_ms >= 0" if column == "time_ms" else "1"
+    return column, direction, condition
+
+
+class Leaderboard:
+    """
+    SQLite 排行榜類別
+    同一個物件可以在多個執行緒中使用（內部以鎖保護連線）
+    """
+
+    def __init__(self, path):
+        """
+        初始化排行榜
+        參數：
+        - path: SQLite 檔案路徑（不存在時自動建立；":memory:" 為記憶體資料庫）
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock, self.connection:
+            if path != ":memory:":
+                # WAL 讓伺服器讀取時不會阻擋寫入
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(SCHEMA)
+
+    def _query(self, sql, parameters=()):
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def submit(self, entry):
+        """
+        新增一筆成績
+        參數：
+        - entry: 成績 dict（見 normalize_entry）
+        返回：{"id": 成績編號, "rank": 名次（sprint 未完成時為 None）}
+        """
+        entry = normalize_entry(entry)
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                f"INSERT INTO scores ({', '.join(ENTRY_FIELDS)}) "
+                f"VALUES ({', '.join('?' * len(ENTRY_FIELDS))})",
+                [entry[field] for field in ENTRY_FIELDS],
+            )
+            entry_id = cursor.lastrowid
+        column = MODES[entry["mode"]][0]
+        value = entry[column]
+        rank = None if value is None else self.rank(entry["mode"], value)
+        return {"id": entry_id, "rank": rank}
+
+    def top(self, mode, count=10):
+        """
+        前 N 名
+        參數：
+        - mode: 遊戲模式
+        - count: 筆數（最多 MAX_TOP_ENTRIES）
+        返回：成績 dict 列表（依名次排序，同分時先達成者在前）
+        """
+        column, direction, condition = _metric(mode)
+        count = max(0, min(int(count), MAX_TOP_ENTRIES))
+        rows = self._query(
+            f"SELECT * FROM scores WHERE mode = ? AND {condition} "
+            f"ORDER BY {column} {direction}, id LIMIT ?",
+            (mode, count),
+        )
+        return [dict(row) for row in rows]
+
+    def rank(self, mode, value):
+        """
+        指定成績的名次（1 為第一名；與已有成績同分時排在同一名次）
+        參數：
+        - mode: 遊戲模式
+        - value: 分數（marathon、ultra）或完成時間毫秒（sprint）
+        """
+        column, direction, condition = _metric(mode)
+        better = ">" if direction == "DESC" else "<"
+        rows = self._query(
+            f"SELECT COUNT(*) FROM scores WHERE mode = ? AND {condition} "
+            f"AND {column} {better} ?",
+            (mode, value),
+        )
+        return rows[0][0] + 1
+
+    def best(self, mode, player):
+        """
+        玩家在指定模式的最佳成績
+        返回：成績 dict 或 None
+        """
+        column, direction, condition = _metric(mode)
+        rows = self._query(
+            f"SELECT * FROM scores WHERE mode = ? AND player = ? AND {condition} "
+            f"ORDER BY {column} {direction}, id LIMIT 1",
+            (mode, player),
+        )
+        return dict(rows[0]) if rows else None
+
+    def count(self, mode):
+        """指定模式的成績筆數"""
+        _, _, condition = _metric(mode)
+        return self._query(
+            f"SELECT COUNT(*) FROM scores WHERE mode = ? AND {condition}", (mode,)
+        )[0][0]
+
+    def close(self):
+        """關閉資料庫連線"""
+        with self.lock:
+            self.connection.close()
+
+
+class RemoteLeaderboard:
+    """
+    遠端排行榜類別
+    透過 HTTP/JSON 連到 LeaderboardServer，介面與 Leaderboard 相同
+    """
+
+    def __init__(self, url, timeout=3.0):
+        """
+        初始化遠端排行榜
+        參數：
+        - url: 伺服器網址（例如 http://127.0.0.1:8765）
+        - timeout: 每次請求的逾時秒數
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, path, parameters=None, body=None):
+        url = self.url + path
+        if parameters:
+            url += "?" + urllib.parse.urlencode(parameters)
+        data = None if body is None else json.dumps(body).encode("utf-8")
+        request = urllib.request.Request(
+            url, data=data, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    def submit(self, entry):
+        """新增一筆成績，返回 {"id", "rank"}"""
+        return self._request("/submit", body=entry)
+
+    def top(self, mode, count=10):
+        """前 N 名"""
+        return self._request("/top", {"mode": mode, "n": count})["entries"]
+
+    def rank(self, mode, value):
+        """指定成績的名次"""
+        return self._request("/rank", {"mode": mode, "value": value})["rank"]
+
+    def best(self, mode, player):
+        """玩家在指定模式的最佳成績"""
+        return self._request("/best", {"mode": mode, "player": player})["entry"]
+
+    def count(self, mode):
+        """指定模式的成績筆數"""
+        return self._request("/count", {"mode": mode})["count"]
+
+    def close(self):
+        """遠端排行榜不需要關閉連線"""
+
+
+def open_leaderboard(target):
+    """
+    依目標開啟排行榜
+    參數：
+    - target: SQLite 檔案路徑，或 http:// 開頭的伺服器網址
+    """
+    if target.startswith(("http://", "https://")):
+        return RemoteLeaderboard(target)
+    return Leaderboard(target)
+
+
+class AsyncSubmitter:
+    """
+    非同步成績送出類別
+    排行榜的開啟與所有操作都在單一背景執行緒進行，呼叫端只拿到 Future，不會等待磁碟或網路
+    """
+
+    def __init__(self, target):
+        """
+        初始化送出器
+        參數：
+        - target: SQLite 檔案路徑或伺服器網址（見 open_leaderboard）
+        """
+        self.target = target
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leaderboard")
+        self.board = None
+        self.closed = False
+
+    def _board(self):
+        if self.board is None:
+            self.board = open_leaderboard(self.target)
+        return self.board
+
+    def submit(self, entry):
+        """
+        送出成績
+        參數：
+        - entry: 成績 dict，或返回成績 dict 的函數（在背景執行緒呼叫，例如先重播驗證）
+        返回：Future，結果為 {"id", "rank"}（失敗時為例外）
+        """
+
+        def task():
+            return self._board().submit(entry() if callable(entry) else entry)
+
+        return self.executor.submit(task)
+
+    def best(self, mode, player):
+        """查詢玩家最佳成績，返回 Future"""
+        return self.executor.submit(lambda: self._board().best(mode, player))
+
+    def close(self):
+        """等待尚未完成的送出並關閉排行榜（可重複呼叫）"""
+        if self.closed:
+            return
+        self.closed = True
+        self.executor.submit(lambda: self.board and self.board.close())
+        self.executor.shutdown(wait=True)
+
+
+class LeaderboardRequestHandler(BaseHTTPRequestHandler):
+    """排行榜 HTTP 請求處理類別（board 由 LeaderboardServer 設定）"""
+
+    board = None
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        query = {key: values[0] for key, values in urllib.parse.parse_qs(url.query).items()}
+        try:
+            mode = query.get("mode", "marathon")
+            if mode not in MODES:
+                raise ValueError(f"未知的模式：{mode}")
+            if url.path == "/top":
+                payload = {"mode": mode, "entries": self.board.top(mode, query.get("n", 10))}
+            elif url.path == "/rank":
+                payload = {"mode": mode, "rank": self.board.rank(mode, float(query["value"]))}
+            elif url.path == "/best":
+                payload = {"mode": mode, "entry": self.board.best(mode, query["player"])}
+            elif url.path == "/count":
+                payload = {"mode": mode, "count": self.board.count(mode)}
+            else:
+                self._send_json(404, {"error": f"未知的路徑：{url.path}"})
+                return
+        except (KeyError, ValueError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(200, payload)
+
+    def do_POST(self):
+        if urllib.parse.urlparse(self.path).path != "/submit":
+            self._send_json(404, {"error": f"未知的路徑：{self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            entry = json.loads(self.rfile.read(length).decode("utf-8"))
+            if not isinstance(entry, dict):
+                raise ValueError("成績資料必須是 JSON 物件")
+            result = self.board.submit(entry)
+        except (TypeError, ValueError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(200, result)
+
+    def log_message(self, format, *args):
+        # 不輸出每個請求的存取紀錄
+        pass
+
+
+class LeaderboardServer(ThreadingHTTPServer):
+    """本機排行榜伺服器類別（每個請求一個執行緒，共用同一個 Leaderboard）"""
+
+    daemon_threads = True
+
+    def __init__(self, board, host="127.0.0.1", port=DEFAULT_PORT):
+        """
+        初始化伺服器
+        參數：
+        - board: Leaderboard 物件
+        - host, port: 監聽位址（port 為 0 時自動選擇）
+        """
+        handler = type("Handler", (LeaderboardRequestHandler,), {"board": board})
+        super().__init__((host, port), handler)
+        self.board = board
+
+
+def main():
+    """命令列入口：啟動排行榜伺服器或顯示前 N 名"""
+    parser = argparse.ArgumentParser(description="Tetris 排行榜")
+    parser.add_argument("--db", default="leaderboard.db", help="SQLite 檔案路徑")
+    parser.add_argument("--serve", action="store_true", help="啟動 HTTP/JSON 伺服器")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--top", choices=sorted(MODES), default=None, help="顯示前 N 名")
+    parser.add_argument("-n", type=int, default=10)
+    args = parser.parse_args()
+
+    board = Leaderboard(args.db)
+    if args.top:
+        column = MODES[args.top][0]
+        print(f"🏆 {args.top} 前 {args.n} 名（共 {board.count(args.top):,} 筆）")
+        for rank, entry in enumerate(board.top(args.top, args.n), start=1):
+            value = f"{entry['time_ms'] / 1000:.2f}s" if column == "time_ms" else f"{entry['score']:,}"
+            print(f"  {rank:>3}. {entry['player']:<{MAX_PLAYER_LENGTH}} {value}")
+
+    if args.serve:
+        server = LeaderboardServer(board, args.host, args.port)
+        print(f"🌐 排行榜伺服器：http://{args.host}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n伺服器已停止")
+        finally:
+            server.server_close()
+    board.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,599 @@
+"""
+對戰比賽伺服器（asyncio）
+以精簡的二進位協定在 TCP socket 上進行鎖步（lockstep）對戰：
+客戶端只傳送每幀的輸入遮罩，伺服器收齊所有玩家的輸入後推進權威模擬，
+再把該幀所有玩家的輸入廣播回去，客戶端以相同種子在本地重現整場比賽
+
+協定（網路位元組序）：
+- 標頭：type (u8) + payload 長度 (u16)
+- JOIN     客戶端→伺服器  match_id (u32), player_count (u8)
+- WELCOME  伺服器→客戶端  slot (u8), player_count (u8)
+- START    伺服器→客戶端  seed (u32), width (u16), height (u16), buffer_rows (u8)
+- INPUT    客戶端→伺服器  frame (u32), held (u8), pressed (u8)
+- FRAME    伺服器→客戶端  frame (u32), 每位玩家 held (u8) + pressed (u8)
+- CHECKSUM 伺服器→客戶端  frame (u32), checksum (u32)
+- RESULT   伺服器→客戶端  frame (u32), winner (u8，255 表示無勝者)
+
+本地壓力測試：
+    python -m core.match_server --load-test 100
+    python -m core.match_server --load-test 20 --rollback --latency 80
+"""
+
+import argparse
+import asyncio
+from collections import deque
+import random
+import socket
+import struct
+import sys
+import os
+import time
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.versus import VersusMatch
+from core.bot import BotController
+from core.rollback import RollbackSession, DEFAULT_MAX_ROLLBACK
+from config.constants import GRID_WIDTH, GRID_HEIGHT, GRID_BUFFER_ROWS, FPS
+
+# ============================
+# 協定常數
+# ============================
+MSG_JOIN = 1
+MSG_WELCOME = 2
+MSG_START = 3
+MSG_INPUT = 4
+MSG_FRAME = 5
+MSG_CHECKSUM = 6
+MSG_RESULT = 7
+
+HEADER = struct.Struct("!BH")
+JOIN = struct.Struct("!IB")
+WELCOME = struct.Struct("!BB")
+START = struct.Struct("!IHHB")
+INPUT = struct.Struct("!IBB")
+FRAME_HEADER = struct.Struct("!I")
+CHECKSUM = struct.Struct("!II")
+RESULT = struct.Struct("!IB")
+
+NO_WINNER = 255
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7777
+CHECKSUM_INTERVAL = 60  # 每隔多少幀送出一次校驗值
+DEFAULT_INPUT_DELAY = 2  # 客戶端預先送出的輸入幀數（管線深度）
+
+
+def encode_message(msg_type, payload=b""):
+    """組合一則訊息（標頭 + payload）"""
+    return HEADER.pack(msg_type, len(payload)) + payload
+
+
+async def read_message(reader):
+    """
+    讀取一則訊息
+    返回：(msg_type, payload)
+    """
+    header = await reader.readexactly(HEADER.size)
+    msg_type, length = HEADER.unpack(header)
+    payload = await reader.readexactly(length) if length else b""
+    return msg_type, payload
+
+
+def encode_frame(frame, inputs):
+    """組合 FRAME 訊息（該幀所有玩家的輸入）"""
+    payload = FRAME_HEADER.pack(frame) + bytes(
+        value for held, pressed in inputs for value in (held, pressed)
+    )
+    return encode_message(MSG_FRAME, payload)
+
+
+def decode_frame(payload):
+    """解析 FRAME 訊息，返回 (frame, [(held, pressed), ...])"""
+    (frame,) = FRAME_HEADER.unpack_from(payload)
+    data = payload[FRAME_HEADER.size :]
+    return frame, [(data[i], data[i + 1]) for i in range(0, len(data), 2)]
+
+
+class ServerMatch:
+    """伺服器端的一場比賽（收集輸入並推進權威模擬）"""
+
+    def __init__(self, match_id, player_count, width, height, buffer_rows, max_frames):
+        """
+        初始化比賽
+        參數：
+        - match_id: 比賽編號
+        - player_count: 玩家人數
+        - width, height, buffer_rows: 遊戲區域尺寸
+        - max_frames: 最長幀數（超過則以無勝者結束，0 表示不限制）
+        """
+        self.match_id = match_id
+        self.player_count = player_count
+        self.width = width
+        self.height = height
+        self.buffer_rows = buffer_rows
+        self.max_frames = max_frames
+        self.writers = []
+        self.match = None
+        self.pending_inputs = {}  # frame -> [輸入或 None]
+        self.finished = False
+
+    def start(self):
+        """所有玩家到齊，建立模擬並通知客戶端"""
+        seed = random.randrange(2**32)
+        self.match = VersusMatch(
+            self.player_count, seed, self.width, self.height, self.buffer_rows
+        )
+        message = encode_message(
+            MSG_START, START.pack(seed, self.width, self.height, self.buffer_rows)
+        )
+        self.broadcast(message)
+
+    def broadcast(self, message):
+        """傳送訊息給所有玩家"""
+        for writer in self.writers:
+            if not writer.is_closing():
+                writer.write(message)
+
+    def receive_input(self, slot, frame, held, pressed):
+        """
+        收到玩家輸入；收齊某幀所有輸入後推進模擬
+        返回：本次推進的幀數
+        """
+        if self.finished or self.match is None or frame < self.match.frame:
+            return 0
+        inputs = self.pending_inputs.setdefault(frame, [None] * self.player_count)
+        inputs[slot] = (held, pressed)
+
+        stepped = 0
+        while True:
+            current = self.pending_inputs.get(self.match.frame)
+            if current is None or None in current:
+                break
+            del self.pending_inputs[self.match.frame]
+            frame = self.match.frame
+            finished = self.match.step(current)
+            stepped += 1
+            self.broadcast(encode_frame(frame, current))
+
+            if (frame + 1) % CHECKSUM_INTERVAL == 0:
+                self.broadcast(
+                    encode_message(
+                        MSG_CHECKSUM, CHECKSUM.pack(frame, self.match.checksum())
+                    )
+                )
+
+            if finished or (self.max_frames and self.match.frame >= self.max_frames):
+                winner = self.match.winner
+                self.broadcast(
+                    encode_message(
+                        MSG_RESULT,
+                        RESULT.pack(frame, NO_WINNER if winner is None else winner),
+                    )
+                )
+                self.finished = True
+                break
+        return stepped
+
+
+class MatchServer:
+    """asyncio 對戰伺服器類別"""
+
+    def __init__(
+        self,
+        host=DEFAULT_HOST,
+        port=DEFAULT_PORT,
+        width=GRID_WIDTH,
+        height=GRID_HEIGHT,
+        buffer_rows=GRID_BUFFER_ROWS,
+        max_frames=0,
+    ):
+        """
+        初始化伺服器
+        參數：
+        - host, port: 監聽位址（port 為 0 時由系統分配）
+        - width, height, buffer_rows: 遊戲區域尺寸
+        - max_frames: 每場比賽最長幀數（0 表示不限制）
+        """
+        self.host = host
+        self.port = port
+        self.width = width
+        self.height = height
+        self.buffer_rows = buffer_rows
+        self.max_frames = max_frames
+        self.matches = {}
+        self.server = None
+
+        # 統計
+        self.frames_stepped = 0
+        self.matches_finished = 0
+
+    async def start(self):
+        """開始監聽"""
+        self.server = await asyncio.start_server(
+            self.handle_client, self.host, self.port
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def stop(self):
+        """停止伺服器"""
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        """處理一個客戶端連線"""
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        match = None
+        try:
+            msg_type, payload = await read_message(reader)
+            if msg_type != MSG_JOIN:
+                return
+            match_id, player_count = JOIN.unpack(payload)
+
+            match = self.matches.get(match_id)
+            if match is None or match.match is not None:
+                match = ServerMatch(
+                    match_id,
+                    max(2, player_count),
+                    self.width,
+                    self.height,
+                    self.buffer_rows,
+                    self.max_frames,
+                )
+                self.matches[match_id] = match
+
+            slot = len(match.writers)
+            match.writers.append(writer)
+            writer.write(
+                encode_message(MSG_WELCOME, WELCOME.pack(slot, match.player_count))
+            )
+            if len(match.writers) == match.player_count:
+                match.start()
+
+            # 持續讀取直到客戶端關閉連線（比賽結束後客戶端可能仍有輸入在途中）
+            while True:
+                msg_type, payload = await read_message(reader)
+                if msg_type == MSG_INPUT and not match.finished:
+                    frame, held, pressed = INPUT.unpack(payload)
+                    self.frames_stepped += match.receive_input(
+                        slot, frame, held, pressed
+                    )
+                    if match.finished:
+                        self.matches_finished += 1
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if match is not None and match.finished:
+                self.matches.pop(match.match_id, None)
+            writer.close()
+
+
+class MatchClient:
+    """
+    對戰客戶端類別
+    在本地以相同種子重現整場比賽，並透過 controller 決定自己的輸入
+    """
+
+    def __init__(self, controller=None, input_delay=DEFAULT_INPUT_DELAY):
+        """
+        初始化客戶端
+        參數：
+        - controller: 具有 next_input(game) 方法的物件（預設為 AI 控制器）
+        - input_delay: 預先送出的輸入幀數
+        """
+        self.controller = controller or BotController()
+        self.input_delay = input_delay
+        self.slot = None
+        self.match = None
+        self.result = None
+        self.desyncs = 0
+
+    async def play(self, host, port, match_id, player_count=2):
+        """
+        連線並進行一場比賽
+        返回：勝者編號（None 表示無勝者）
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(encode_message(MSG_JOIN, JOIN.pack(match_id, player_count)))
+
+            while True:
+                msg_type, payload = await read_message(reader)
+
+                if msg_type == MSG_WELCOME:
+                    self.slot, player_count = WELCOME.unpack(payload)
+
+                elif msg_type == MSG_START:
+                    seed, width, height, buffer_rows = START.unpack(payload)
+                    self.match = VersusMatch(
+                        player_count, seed, width, height, buffer_rows
+                    )
+                    # 預先送出前幾幀的空輸入，建立輸入管線
+                    for frame in range(self.input_delay):
+                        writer.write(encode_message(MSG_INPUT, INPUT.pack(frame, 0, 0)))
+
+                elif msg_type == MSG_FRAME:
+                    frame, inputs = decode_frame(payload)
+                    self.match.step(inputs)
+                    # 以目前狀態決定 input_delay 幀之後的輸入
+                    game = self.match.players[self.slot].game
+                    held, pressed = self.controller.next_input(game)
+                    writer.write(
+                        encode_message(
+                            MSG_INPUT,
+                            INPUT.pack(frame + self.input_delay, held, pressed),
+                        )
+                    )
+
+                elif msg_type == MSG_CHECKSUM:
+                    frame, checksum = CHECKSUM.unpack(payload)
+                    if self.match.checksum() != checksum:
+                        self.desyncs += 1
+
+                elif msg_type == MSG_RESULT:
+                    frame, winner = RESULT.unpack(payload)
+                    self.result = None if winner == NO_WINNER else winner
+                    return self.result
+
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+class RollbackClient:
+    """
+    Rollback 對戰客戶端類別
+    以固定幀率在本地推進比賽，本地輸入不必等待伺服器確認；
+    伺服器的 FRAME 訊息作為確認輸入，預測錯誤時由 RollbackSession 回滾重算
+    與 MatchClient 使用相同的伺服器與協定（只是把輸入延遲設為 0）
+    """
+
+    def __init__(
+        self,
+        controller=None,
+        max_rollback=DEFAULT_MAX_ROLLBACK,
+        frame_time=1 / FPS,
+        latency=0.0,
+    ):
+        """
+        初始化客戶端
+        參數：
+        - controller: 具有 next_input(game) 方法的物件（預設為 AI 控制器）
+        - max_rollback: 最多領先確認輸入的幀數
+        - frame_time: 每幀的時間（秒）
+        - latency: 模擬的單向網路延遲（秒，測試用）
+        """
+        self.controller = controller or BotController()
+        self.max_rollback = max_rollback
+        self.frame_time = frame_time
+        self.latency = latency
+        self.slot = None
+        self.session = None
+        self.result = None
+        self.finished = False
+        self.outgoing = deque()  # 模擬延遲：(送出時間, 訊息)
+        self.incoming = deque()  # 模擬延遲：(處理時間, (類型, payload))
+
+    @property
+    def desyncs(self):
+        """不同步次數"""
+        return self.session.desyncs if self.session else 0
+
+    def send(self, writer, message):
+        """傳送訊息（有模擬延遲時排入延遲佇列）"""
+        if self.latency > 0:
+            self.outgoing.append((time.perf_counter() + self.latency, message))
+        else:
+            writer.write(message)
+
+    def handle_message(self, msg_type, payload):
+        """處理伺服器訊息（確認輸入、校驗值與比賽結果）"""
+        if msg_type == MSG_FRAME:
+            frame, inputs = decode_frame(payload)
+            self.session.confirm_inputs(frame, inputs)
+        elif msg_type == MSG_CHECKSUM:
+            self.session.add_checksum(*CHECKSUM.unpack(payload))
+        elif msg_type == MSG_RESULT:
+            frame, winner = RESULT.unpack(payload)
+            self.result = None if winner == NO_WINNER else winner
+            self.finished = True
+
+    def flush_delayed(self, writer):
+        """送出／處理延遲時間已到的訊息（模擬延遲用）"""
+        now = time.perf_counter()
+        while self.outgoing and self.outgoing[0][0] <= now:
+            writer.write(self.outgoing.popleft()[1])
+        while self.incoming and self.incoming[0][0] <= now and not self.finished:
+            self.handle_message(*self.incoming.popleft()[1])
+
+    async def receive(self, reader):
+        """持續接收伺服器訊息"""
+        while not self.finished:
+            message = await read_message(reader)
+            if self.latency > 0:
+                self.incoming.append((time.perf_counter() + self.latency, message))
+            else:
+                self.handle_message(*message)
+
+    async def play(self, host, port, match_id, player_count=2):
+        """
+        連線並進行一場比賽
+        返回：勝者編號（None 表示無勝者）
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(encode_message(MSG_JOIN, JOIN.pack(match_id, player_count)))
+
+            # 等待分配位置與比賽開始
+            while self.session is None:
+                msg_type, payload = await read_message(reader)
+                if msg_type == MSG_WELCOME:
+                    self.slot, player_count = WELCOME.unpack(payload)
+                elif msg_type == MSG_START:
+                    seed, width, height, buffer_rows = START.unpack(payload)
+                    match = VersusMatch(player_count, seed, width, height, buffer_rows)
+                    self.session = RollbackSession(match, self.slot, self.max_rollback)
+
+            receiver = asyncio.ensure_future(self.receive(reader))
+            loop = asyncio.get_running_loop()
+            next_tick = loop.time()
+            game = self.session.match.players[self.slot].game
+            try:
+                while not self.finished:
+                    if receiver.done() and not self.incoming:
+                        receiver.result()  # 連線中斷時拋出例外
+                    self.flush_delayed(writer)
+                    if self.finished:
+                        break
+                    if self.session.can_advance():
+                        frame = self.session.frame
+                        held, pressed = self.controller.next_input(game)
+                        self.session.advance((held, pressed))
+                        self.send(
+                            writer,
+                            encode_message(MSG_INPUT, INPUT.pack(frame, held, pressed)),
+                        )
+                    else:
+                        # 領先太多：等待確認輸入（仍先處理已抵達的回滾）
+                        self.session.stalls += 1
+                        self.session.synchronize()
+
+                    next_tick += self.frame_time
+                    await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            finally:
+                receiver.cancel()
+
+            # 最後一次回滾並比對校驗值
+            self.session.synchronize()
+            return self.result
+        finally:
+            writer.close()
+
+
+async def run_load_test(
+    match_count,
+    host=DEFAULT_HOST,
+    port=0,
+    max_frames=3600,
+    think_frames=4,
+    rollback=False,
+    latency=0.0,
+):
+    """
+    本地壓力測試：啟動伺服器並同時進行多場 AI 對 AI 比賽
+    參數：
+    - match_count: 同時進行的比賽數
+    - host, port: 伺服器位址（port 為 0 時自動分配）
+    - max_frames: 每場比賽最長幀數
+    - think_frames: AI 每個方塊的思考幀數
+    - rollback: 是否使用 RollbackClient（以 60 FPS 實際時間進行）
+    - latency: RollbackClient 模擬的單向網路延遲（秒）
+    返回：統計資訊 dict
+    """
+    server = MatchServer(host, port, max_frames=max_frames)
+    await server.start()
+
+    if rollback:
+        clients = [
+            RollbackClient(BotController(think_frames=think_frames), latency=latency)
+            for _ in range(match_count * 2)
+        ]
+    else:
+        clients = [
+            MatchClient(BotController(think_frames=think_frames))
+            for _ in range(match_count * 2)
+        ]
+    start_time = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client.play(host, server.port, index // 2)
+            for index, client in enumerate(clients)
+        )
+    )
+    elapsed = time.perf_counter() - start_time
+    await server.stop()
+
+    stats = {
+        "matches": match_count,
+        "matches_finished": server.matches_finished,
+        "frames": server.frames_stepped,
+        "elapsed": elapsed,
+        "frames_per_second": server.frames_stepped / elapsed if elapsed else 0,
+        "desyncs": sum(client.desyncs for client in clients),
+    }
+    if rollback:
+        sessions = [client.session.stats() for client in clients]
+        stats["rollbacks"] = sum(session["rollbacks"] for session in sessions)
+        stats["resimulated_frames"] = sum(
+            session["resimulated_frames"] for session in sessions
+        )
+        stats["max_rollback_depth"] = max(
+            session["max_rollback_depth"] for session in sessions
+        )
+        stats["rollback_ms"] = sum(session["rollback_ms"] for session in sessions)
+        stats["stalls"] = sum(session["stalls"] for session in sessions)
+    return stats
+
+
+def main():
+    """命令列入口：啟動伺服器或執行本地壓力測試"""
+    parser = argparse.ArgumentParser(description="Tetris 對戰比賽伺服器")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--load-test", type=int, default=0, help="同時進行的比賽數")
+    parser.add_argument("--max-frames", type=int, default=3600)
+    parser.add_argument(
+        "--rollback", action="store_true", help="壓力測試使用 rollback 客戶端"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="模擬的單向延遲（毫秒）"
+    )
+    args = parser.parse_args()
+
+    if args.load_test:
+        stats = asyncio.run(
+            run_load_test(
+                args.load_test,
+                args.host,
+                0,
+                args.max_frames,
+                rollback=args.rollback,
+                latency=args.latency / 1000,
+            )
+        )
+        print("📊 壓力測試結果")
+        print(f"  比賽數: {stats['matches']}（完成 {stats['matches_finished']}）")
+        print(f"  模擬幀數: {stats['frames']:,}")
+        print(f"  耗時: {stats['elapsed']:.2f}s")
+        print(f"  吞吐量: {stats['frames_per_second']:,.0f} 幀/秒")
+        print(f"  不同步次數: {stats['desyncs']}")
+        if args.rollback:
+            resimulated = stats["resimulated_frames"]
+            print(f"  回滾次數: {stats['rollbacks']:,}（重新模擬 {resimulated:,} 幀）")
+            print(f"  最大回滾深度: {stats['max_rollback_depth']} 幀")
+            if resimulated:
+                per_frame = stats["rollback_ms"] / resimulated
+                print(f"  平均重新模擬: {per_frame:.3f} ms/幀")
+            print(f"  等待確認次數: {stats['stalls']:,}")
+        return
+
+    async def serve():
+        server = MatchServer(args.host, args.port, max_frames=args.max_frames)
+        await server.start()
+        print(f"🎮 對戰伺服器啟動：{args.host}:{server.port}")
+        await server.server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\n伺服器已停止")
+
+
+if __name__ == "__main__":
+    main()
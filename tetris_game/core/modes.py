@@ -0,0 +1,220 @@
+"""
+計時遊戲模式模組
+在 Game 之上提供 Sprint（40 行計時）與 Ultra（2 分鐘計分）模式
+
+計時方式：
+- 遊戲以固定的 1/60 秒 tick 推進（Game.step），TickClock 以 time.perf_counter_ns 的整數奈秒
+  決定每一幀要執行幾個 tick，不會因為 clock.tick 的毫秒捨入而累積誤差
+- 官方成績為 tick 數換算的時間（tick × 1000 / FPS 毫秒），與負載、幀率無關；
+  同時記錄實際經過的牆鐘時間，供比對延遲
+- 每個 tick 的輸入遮罩都會記錄，結束後以相同種子重播，結果一致才算驗證通過
+"""
+
+import os
+import sys
+import threading
+import time
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.game import Game
+from config.constants import FPS
+
+MODE_MARATHON = "marathon"
+MODE_SPRINT = "sprint"
+MODE_ULTRA = "ultra"
+TIMED_MODES = (MODE_SPRINT, MODE_ULTRA)
+
+SPRINT_LINES = 40  # Sprint 目標行數
+SPRINT_SPLIT_LINES = 10  # 每消除幾行記錄一次分段時間
+ULTRA_SECONDS = 120  # Ultra 時間限制
+ULTRA_SPLIT_SECONDS = 30  # 每隔幾秒記錄一次分段分數
+ULTRA_TICKS = ULTRA_SECONDS * FPS
+NS_PER_SECOND = 1_000_000_000
+
+
+def ticks_to_ms(ticks):
+    """tick 數 → 毫秒（整數，無條件捨去）"""
+    return ticks * 1000 // FPS
+
+
+def format_time(ms):
+    """毫秒 → m:ss.mmm"""
+    minutes, ms = divmod(int(ms), 60000)
+    seconds, ms = divmod(ms, 1000)
+    return f"{minutes}:{seconds:02d}.{ms:03d}"
+
+
+class TickClock:
+    """
+    固定 tick 時鐘類別
+    以 perf_counter_ns 計算從開始到現在應該執行的 tick 總數，每幀返回還需要執行幾個 tick
+    """
+
+    def __init__(self, rate=FPS, max_catch_up=5):
+        """
+        初始化時鐘
+        參數：
+        - rate: 每秒 tick 數
+        - max_catch_up: 每幀最多補執行的 tick 數（視窗被拖曳等長時間停頓時不追趕，時間視為暫停）
+        """
+        self.rate = rate
+        self.max_catch_up = max_catch_up
+        self.start_ns = None
+        self.ticks = 0
+
+    def due(self):
+        """返回這一幀需要執行的 tick 數（第一次呼叫時開始計時）"""
+        now = time.perf_counter_ns()
+        if self.start_ns is None:
+            self.start_ns = now
+        target = (now - self.start_ns) * self.rate // NS_PER_SECOND
+        count = target - self.ticks
+        if count > self.max_catch_up:
+            # 把起點往後移，讓停頓的時間不計入
+            self.start_ns += (count - self.max_catch_up) * NS_PER_SECOND // self.rate
+            count = self.max_catch_up
+        self.ticks += count
+        return count
+
+
+class TimedMode:
+    """
+    計時模式類別
+    以 step(held, pressed) 取代 Game.step 推進遊戲，記錄輸入、分段時間並判斷結束
+    """
+
+    def __init__(self, game, mode):
+        """
+        初始化計時模式
+        參數：
+        - game: 新建立的 Game 物件（需要指定種子，才能重播驗證）
+        - mode: MODE_SPRINT 或 MODE_ULTRA
+        """
+        if mode not in TIMED_MODES:
+            raise ValueError(f"未知的計時模式：{mode}")
+        if game.seed is None:
+            raise ValueError("計時模式需要指定種子才能重播驗證")
+        self.game = game
+        self.mode = mode
+        self.ticks = 0
+        self.held_inputs = bytearray()  # 每個 tick 的輸入遮罩（重播用）
+        self.pressed_inputs = bytearray()
+        self.splits = []  # [(標籤, tick 數, 分數), ...]
+        self.next_split = SPRINT_SPLIT_LINES if mode == MODE_SPRINT else ULTRA_SPLIT_SECONDS * FPS
+        self.finished = False
+        self.completed = False  # 是否有成績（Sprint 需要完成 40 行；Ultra 結束時一定有成績）
+        self.start_ns = None
+        self.wall_ns = 0  # 實際經過的時間（奈秒）
+        self.verified = None  # 重播驗證結果（None 表示尚未驗證）
+        self.verify_thread = None
+
+    def step(self, held, pressed):
+        """
+        推進一個 tick
+        參數：
+        - held, pressed: 輸入遮罩（見 core.inputs）
+        """
+        if self.finished:
+            return
+        now = time.perf_counter_ns()
+        if self.start_ns is None:
+            self.start_ns = now
+
+        self.game.step(held, pressed)
+        self.ticks += 1
+        self.held_inputs.append(held)
+        self.pressed_inputs.append(pressed)
+        self.wall_ns = time.perf_counter_ns() - self.start_ns
+
+        game = self.game
+        if self.mode == MODE_SPRINT:
+            while game.lines_cleared >= self.next_split and self.next_split <= SPRINT_LINES:
+                self.splits.append((f"{self.next_split}L", self.ticks, game.score))
+                self.next_split += SPRINT_SPLIT_LINES
+            if game.lines_cleared >= SPRINT_LINES:
+                self.finished = True
+                self.completed = True
+        else:
+            if self.ticks >= self.next_split:
+                self.splits.append((f"{self.ticks // FPS}s", self.ticks, game.score))
+                self.next_split += ULTRA_SPLIT_SECONDS * FPS
+            if self.ticks >= ULTRA_TICKS:
+                self.finished = True
+                self.completed = True
+        if game.game_over:
+            self.finished = True
+            # Ultra 提前 Game Over 仍以分數計；Sprint 沒有完成 40 行則沒有成績
+            self.completed = self.completed or self.mode == MODE_ULTRA
+
+    def elapsed_ms(self):
+        """官方經過時間（毫秒，由 tick 數換算）"""
+        return ticks_to_ms(self.ticks)
+
+    def remaining_ms(self):
+        """Ultra 剩餘時間（毫秒）"""
+        return max(0, ticks_to_ms(ULTRA_TICKS - self.ticks))
+
+    def display_time(self):
+        """畫面上顯示的計時（Sprint 為經過時間，Ultra 為剩餘時間）"""
+        if self.mode == MODE_SPRINT:
+            return format_time(self.elapsed_ms())
+        return format_time(self.remaining_ms())
+
+    def result(self):
+        """結束時的成績 dict"""
+        return {
+            "mode": self.mode,
+            "completed": self.completed,
+            "ticks": self.ticks,
+            "time_ms": self.elapsed_ms(),
+            "wall_ms": self.wall_ns // 1_000_000,
+            "score": self.game.score,
+            "lines": self.game.lines_cleared,
+            "splits": [(label, ticks_to_ms(ticks), score) for label, ticks, score in self.splits],
+            "verified": self.verified,
+        }
+
+    def verify(self):
+        """
+        以相同種子與記錄的輸入重播，確認 tick 數、分數與行數一致
+        返回：True 表示驗證通過
+        """
+        grid = self.game.grid
+        replay = TimedMode(
+            Game(grid.width, grid.height, grid.buffer_rows, seed=self.game.seed, verbose=False),
+            self.mode,
+        )
+        for held, pressed in zip(self.held_inputs, self.pressed_inputs):
+            replay.step(held, pressed)
+        self.verified = (
+            replay.finished == self.finished
+            and replay.ticks == self.ticks
+            and replay.game.score == self.game.score
+            and replay.game.lines_cleared == self.game.lines_cleared
+        )
+        return self.verified
+
+    def verify_in_background(self):
+        """在背景執行緒重播驗證（結束後呼叫一次）"""
+        if self.verify_thread is None:
+            self.verify_thread = threading.Thread(target=self.verify, daemon=True)
+            self.verify_thread.start()
+
+    def leaderboard_entry(self, player):
+        """
+        排行榜成績資料（等待重播驗證完成；會阻塞，請在背景執行緒呼叫）
+        參數：
+        - player: 玩家名稱
+        """
+        from core.leaderboard import game_entry
+
+        if not self.completed:
+            raise ValueError(f"未完成 {SPRINT_LINES} 行，沒有成績")
+        if self.verify_thread is not None:
+            self.verify_thread.join()
+        if not (self.verified or self.verify()):
+            raise ValueError("重播驗證失敗，成績不予記錄")
+        time_ms = self.elapsed_ms() if self.mode == MODE_SPRINT else None
+        return game_entry(self.game, player, self.mode, time_ms)
@@ -0,0 +1,269 @@
+"""
+落點生成模組
+列舉當前方塊所有可到達的落點，以及到達落點所需的輸入序列
+
+提供兩種搜尋：
+- generate_drop_placements: 只旋轉、平移後硬降（快速，AI 對手使用）
+- generate_reachable_placements: 完整廣度優先搜尋，包含軟降後的平移與旋轉（tuck、T-spin），
+  旋轉結果使用 Game.find_rotation，與實際遊戲的 kick 規則一致
+"""
+
+from collections import deque
+
+from config.shapes import TETROMINO_BLOCKS
+from game_objects.bitboard import BitBoard
+from core.inputs import (
+    INPUT_LEFT,
+    INPUT_RIGHT,
+    INPUT_SOFT_DROP,
+    INPUT_ROTATE_CW,
+    INPUT_ROTATE_CCW,
+    INPUT_HOLD,
+    INPUT_HARD_DROP,
+)
+
+# ============================
+# 移動指令
+# ============================
+MOVE_LEFT = "L"  # 左移一格（點按）
+MOVE_RIGHT = "R"  # 右移一格（點按）
+MOVE_DAS_LEFT = "DL"  # 按住左鍵移到牆邊（DAS）
+MOVE_DAS_RIGHT = "DR"  # 按住右鍵移到牆邊（DAS）
+MOVE_CW = "CW"  # 順時針旋轉
+MOVE_CCW = "CCW"  # 逆時針旋轉
+MOVE_SOFT_DROP = "SD"  # 軟降到底
+MOVE_HOLD = "H"  # Hold
+MOVE_HARD_DROP = "HD"  # 硬降
+
+# 移動指令對應的輸入位元（DAS 與軟降需要按住多幀）
+MOVE_INPUTS = {
+    MOVE_LEFT: INPUT_LEFT,
+    MOVE_RIGHT: INPUT_RIGHT,
+    MOVE_DAS_LEFT: INPUT_LEFT,
+    MOVE_DAS_RIGHT: INPUT_RIGHT,
+    MOVE_CW: INPUT_ROTATE_CW,
+    MOVE_CCW: INPUT_ROTATE_CCW,
+    MOVE_SOFT_DROP: INPUT_SOFT_DROP,
+    MOVE_HOLD: INPUT_HOLD,
+    MOVE_HARD_DROP: INPUT_HARD_DROP,
+}
+
+
+class Placement:
+    """落點物件類別（方塊最終鎖定的位置與到達路徑）"""
+
+    __slots__ = (
+        "shape_type",
+        "x",
+        "y",
+        "rotation",
+        "path",
+        "use_hold",
+        "last_rotation",
+        "kick_index",
+    )
+
+    def __init__(
+        self,
+        shape_type,
+        x,
+        y,
+        rotation,
+        path,
+        use_hold=False,
+        last_rotation=False,
+        kick_index=None,
+    ):
+        """
+        初始化落點
+        參數：
+        - shape_type: 方塊類型
+        - x, y, rotation: 鎖定時的位置與旋轉
+        - path: 到達落點的移動指令列表（不含最後的硬降）
+        - use_hold: 是否需要先 Hold
+        - last_rotation: 最後一個動作是否為旋轉（T-spin 判定）
+        - kick_index: 最後一次旋轉使用的 kick 索引
+        """
+        self.shape_type = shape_type
+        self.x = x
+        self.y = y
+        self.rotation = rotation
+        self.path = path
+        self.use_hold = use_hold
+        self.last_rotation = last_rotation
+        self.kick_index = kick_index
+
+    def cells(self):
+        """獲取落點佔據的格子（排序後的 tuple，可用於比較相同形狀的落點）"""
+        return tuple(
+            sorted(
+                (self.x + col, self.y + row)
+                for col, row in TETROMINO_BLOCKS[self.shape_type][self.rotation]
+            )
+        )
+
+    def input_count(self):
+        """到達落點所需的按鍵次數（含硬降）"""
+        return len(self.path) + (1 if self.use_hold else 0) + 1
+
+    def __repr__(self):
+        return (
+            f"Placement({self.shape_type}, x={self.x}, y={self.y}, "
+            f"rot={self.rotation}, path={self.path}, hold={self.use_hold})"
+        )
+
+
+def _rotation_moves(rotation):
+    """從旋轉狀態 0 到目標旋轉狀態的最短旋轉指令"""
+    return {0: [], 1: [MOVE_CW], 2: [MOVE_CW, MOVE_CW], 3: [MOVE_CCW]}[rotation]
+
+
+def generate_drop_placements(game, tetromino=None, board=None, use_hold=False):
+    """
+    列舉「旋轉 + 平移 + 硬降」可到達的落點（不含 tuck 與 spin）
+    參數：
+    - game: Game 物件
+    - tetromino: 要搜尋的方塊（預設為當前方塊）
+    - board: BitBoard（預設由 game.grid 建立；大量搜尋時可重複使用）
+    - use_hold: 標記這些落點需要先使用 Hold
+    返回：Placement 列表（相同格子的落點只保留一個）
+    """
+    piece = tetromino or game.current_tetromino
+    board = board or BitBoard.from_grid(game.grid)
+    shape_type = piece.shape_type
+
+    placements = []
+    seen_cells = set()
+    for rotation in range(4):
+        # 在出生位置旋轉（旋轉失敗則放棄此旋轉狀態）
+        probe = piece.copy()
+        for move in _rotation_moves(rotation):
+            result = game.find_rotation(probe, move == MOVE_CW)
+            if result is None:
+                probe = None
+                break
+            probe.x, probe.y, probe.rotation, _ = result
+        if probe is None:
+            continue
+
+        start_x = probe.x
+        y = probe.y
+        if board.collides(shape_type, probe.rotation, start_x, y):
+            continue
+
+        # 往左、往右逐格掃描直到碰撞
+        for direction, tap, das in (
+            (-1, MOVE_LEFT, MOVE_DAS_LEFT),
+            (1, MOVE_RIGHT, MOVE_DAS_RIGHT),
+        ):
+            x = start_x if direction < 0 else start_x + 1
+            while not board.collides(shape_type, probe.rotation, x, y):
+                drop_y = board.drop_y(shape_type, probe.rotation, x, y)
+                placement = Placement(
+                    shape_type, x, drop_y, probe.rotation, None, use_hold
+                )
+                cells = placement.cells()
+                if cells not in seen_cells:
+                    seen_cells.add(cells)
+                    distance = abs(x - start_x)
+                    at_wall = board.collides(
+                        shape_type, probe.rotation, x + direction, y
+                    )
+                    if distance > 1 and at_wall:
+                        horizontal = [das]
+                    else:
+                        horizontal = [tap] * distance
+                    placement.path = _rotation_moves(rotation) + horizontal
+                    placements.append(placement)
+                x += direction
+
+    return placements
+
+
+def generate_reachable_placements(
+    game, tetromino=None, board=None, use_hold=False, use_das=True
+):
+    """
+    廣度優先搜尋所有可到達的落點（包含軟降後的 tuck、旋轉與 T-spin）
+    每個落點保留按鍵數最少的路徑
+    參數：
+    - game: Game 物件
+    - tetromino: 要搜尋的方塊（預設為當前方塊）
+    - board: BitBoard（預設由 game.grid 建立）
+    - use_hold: 標記這些落點需要先使用 Hold
+    - use_das: 是否允許 DAS 移到牆邊（視為一次按鍵）
+    返回：Placement 列表
+    """
+    piece = tetromino or game.current_tetromino
+    board = board or BitBoard.from_grid(game.grid)
+    shape_type = piece.shape_type
+    if board.collides(shape_type, piece.rotation, piece.x, piece.y):
+        return []
+
+    probe = piece.copy()
+    start = (piece.x, piece.y, piece.rotation)
+    # 狀態 -> (路徑, 最後是否旋轉, kick 索引)
+    visited = {start: ([], False, None)}
+    queue = deque([start])
+    placements = {}
+
+    while queue:
+        state = queue.popleft()
+        x, y, rotation = state
+        path, last_rotation, kick_index = visited[state]
+
+        # 在此狀態硬降，產生落點
+        drop_y = board.drop_y(shape_type, rotation, x, y)
+        placement = Placement(
+            shape_type,
+            x,
+            drop_y,
+            rotation,
+            path,
+            use_hold,
+            last_rotation,  # 硬降不會清除旋轉標記（與 Game 一致）
+            kick_index,
+        )
+        cells = placement.cells()
+        existing = placements.get(cells)
+        if existing is None or (
+            # 相同格子時，優先保留最後動作為旋轉的路徑（保留 T-spin 可能）
+            shape_type == "T"
+            and placement.last_rotation
+            and not existing.last_rotation
+        ):
+            placements[cells] = placement
+
+        neighbors = []
+        # 平移
+        if not board.collides(shape_type, rotation, x - 1, y):
+            neighbors.append(((x - 1, y, rotation), MOVE_LEFT, False, None))
+        if not board.collides(shape_type, rotation, x + 1, y):
+            neighbors.append(((x + 1, y, rotation), MOVE_RIGHT, False, None))
+        if use_das:
+            for direction, move in ((-1, MOVE_DAS_LEFT), (1, MOVE_DAS_RIGHT)):
+                wall_x = x
+                while not board.collides(shape_type, rotation, wall_x + direction, y):
+                    wall_x += direction
+                if abs(wall_x - x) > 1:
+                    neighbors.append(((wall_x, y, rotation), move, False, None))
+        # 軟降到底
+        if drop_y != y:
+            neighbors.append(((x, drop_y, rotation), MOVE_SOFT_DROP, False, None))
+        # 旋轉（使用遊戲本身的 kick 規則）
+        for clockwise, move in ((True, MOVE_CW), (False, MOVE_CCW)):
+            probe.x, probe.y, probe.rotation = x, y, rotation
+            result = game.find_rotation(probe, clockwise)
+            if result is not None:
+                new_x, new_y, new_rotation, new_kick = result
+                neighbors.append(
+                    ((new_x, new_y, new_rotation), move, True, new_kick)
+                )
+
+        for next_state, move, is_rotation, next_kick in neighbors:
+            if next_state not in visited:
+                visited[next_state] = (path + [move], is_rotation, next_kick)
+                queue.append(next_state)
+
+    return list(placements.values())
+
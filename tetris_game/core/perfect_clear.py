@@ -0,0 +1,616 @@
+"""
+Perfect Clear 求解模組
+給定盤面（最多 4 行）、Hold 與接下來的方塊序列，搜尋能把盤面完全清空的落點順序
+
+搜尋方式：
+- 只看底部 h 行的「場地」（h 為能整除成 4 格方塊的最小高度），場地以每行一個位元遮罩表示
+- 每個方塊的落點以場地上的廣度優先搜尋列舉（平移、軟降、原地旋轉），
+  不使用 kick，因此找到的落點在實際遊戲中一定可到達
+- 每個節點可選擇放置當前方塊，或使用 Hold 改放 Hold 中（或下一個）的方塊
+- 先只搜尋不產生懸空（被覆蓋空格）的落點，找不到才搜尋全部落點；
+  大部分開局的 Perfect Clear 不需要懸空，第一階段的節點數通常少一到兩個數量級
+- 方塊序列依 7-bag 規則推算（Game.preview_pieces），不需要消耗遊戲的隨機數
+
+剪枝（都不會排除可行解）：
+- 格數：剩餘空格必須剛好由可用的方塊填滿
+- 孤立區域：完全填滿的欄把場地切成互不相通的左右兩邊，每邊的空格數都必須是 4 的倍數
+- 奇偶性：以欄的奇偶著色，只有 I（直放 ±4）、T、J、L（±2）能改變兩色空格的差，
+  差值超過可用方塊能補償的範圍就不可能完成
+- 記憶化：失敗與成功的子場地（場地, 剩餘序列, Hold）都記在表中，跨方塊重複使用
+
+命令列（分析訓練資料中錯過的 Perfect Clear）：
+    python -m core.perfect_clear --data data/human
+"""
+
+import argparse
+import sys
+import os
+import threading
+import time
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.move_generator import Placement
+from config.constants import GRID_WIDTH, BLACK
+from config.shapes import TETROMINO_BLOCKS
+
+PC_MAX_HEIGHT = 4  # 求解的最大場地高度
+DEFAULT_NODE_LIMIT = 50000  # 每次求解最多展開的節點數
+MEMO_LIMIT = 200000  # 記憶表的最大項目數（超過時清空）
+X_OFFSET = 3  # 方塊矩陣左上角最多在第 -3 欄（位元索引需為非負數）
+
+
+class SearchLimitReached(Exception):
+    """搜尋節點數超過上限"""
+
+
+def _piece_table(width):
+    """
+    預先計算每種方塊在每個旋轉與欄位的位移遮罩
+    返回：{形狀: [(旋轉, 最小列, 最大列, {x: ((列, 遮罩), ...)}, 合法欄位元), ...]}
+    欄位 x 對應位元 (1 << (x + X_OFFSET))；格子完全相同的旋轉只保留一個（O 型）
+    """
+    table = {}
+    for shape_type, rotations in TETROMINO_BLOCKS.items():
+        entries = []
+        seen = set()
+        for rotation, blocks in enumerate(rotations):
+            min_col = min(col for col, _ in blocks)
+            max_col = max(col for col, _ in blocks)
+            min_row = min(row for _, row in blocks)
+            max_row = max(row for _, row in blocks)
+            if frozenset(blocks) in seen:
+                continue
+            seen.add(frozenset(blocks))
+
+            row_masks = {}
+            for col, row in blocks:
+                row_masks[row] = row_masks.get(row, 0) | (1 << col)
+            shifted = {}
+            valid_bits = 0
+            for x in range(-min_col, width - max_col):
+                shifted[x] = tuple(
+                    (row, mask << x if x >= 0 else mask >> -x)
+                    for row, mask in sorted(row_masks.items())
+                )
+                valid_bits |= 1 << (x + X_OFFSET)
+            entries.append((rotation, min_row, max_row, shifted, valid_bits))
+        table[shape_type] = entries
+    return table
+
+
+def _flood(seeds, free):
+    """在同一列上水平擴展可到達的欄位元（只能經過 free 中的位元）"""
+    while True:
+        grown = (seeds | (seeds << 1) | (seeds >> 1)) & free
+        if grown == seeds:
+            return seeds
+        seeds = grown
+
+
+class PerfectClearSolver:
+    """
+    Perfect Clear 求解器類別
+    同一個求解器可重複使用；記憶表在多次求解之間保留（同一局遊戲連續求解時大量命中）
+    """
+
+    def __init__(
+        self,
+        width=GRID_WIDTH,
+        max_height=PC_MAX_HEIGHT,
+        use_hold=True,
+        node_limit=DEFAULT_NODE_LIMIT,
+    ):
+        """
+        初始化求解器
+        參數：
+        - width: 遊戲區域寬度
+        - max_height: 求解的最大場地高度
+        - use_hold: 是否允許使用 Hold
+        - node_limit: 每次求解最多展開的節點數（None 表示不限制）
+        """
+        self.width = width
+        self.full_mask = (1 << width) - 1
+        self.even_columns = sum(1 << x for x in range(0, width, 2))
+        self.even_count = (width + 1) // 2
+        self.max_height = max_height
+        self.use_hold = use_hold
+        self.node_limit = node_limit
+        self.pieces = _piece_table(width)
+        self.memo = {}  # (場地, 剩餘序列, Hold) → 解（tuple）或 None
+        self.placement_cache = {}  # (場地, 形狀) → (落點列表, 無懸空落點列表)
+
+        # 最近一次求解的統計
+        self.nodes = 0
+        self.limit_reached = False
+
+    # ============================
+    # 場地操作
+    # ============================
+
+    def _free_bits(self, rows, height, entry, y):
+        """方塊（某旋轉）在第 y 列不碰撞的欄位元（場地以上視為空）"""
+        _, _, max_row, shifted, valid_bits = entry
+        if y + max_row < 0:
+            return valid_bits
+        bits = 0
+        for x, piece_rows in shifted.items():
+            for row, mask in piece_rows:
+                target = y + row
+                if target >= height or (target >= 0 and rows[target] & mask):
+                    break
+            else:
+                bits |= 1 << (x + X_OFFSET)
+        return bits
+
+    def placements(self, rows, shape_type, allow_overhang=True):
+        """
+        列舉方塊在場地上所有可到達、且完全落在場地內的落點
+        由上往下逐列計算每個旋轉可到達的欄位元：上一列可到達且這一列不碰撞的位置往下移，
+        再於同一列反覆水平擴展與原地旋轉直到不再變化
+        參數：
+        - rows: 場地（由上到下的位元遮罩 tuple）
+        - shape_type: 方塊類型
+        - allow_overhang: False 表示只返回放置後沒有被覆蓋空格的落點
+        返回：[(x, y, rotation, 放置並消行後的場地), ...]（被覆蓋空格少的在前）
+        """
+        key = (rows, shape_type)
+        cached = self.placement_cache.get(key)
+        if cached is not None:
+            return cached[0] if allow_overhang else cached[1]
+
+        height = len(rows)
+        full = self.full_mask
+        entries = self.pieces[shape_type]
+        count = len(entries)
+        results = []
+        seen_fields = set()
+
+        # 場地以上全空：所有欄位與旋轉都可直接到達
+        top = -max(entry[2] for entry in entries) - 1
+        reach = [entry[4] for entry in entries]
+        free_next = [self._free_bits(rows, height, entry, top + 1) for entry in entries]
+        for y in range(top + 1, height):
+            free = free_next
+            reach = [reach[index] & free[index] for index in range(count)]
+            changed = True
+            while changed:
+                changed = False
+                for index in range(count):
+                    grown = _flood(reach[index], free[index])
+                    if count > 1:
+                        grown |= (
+                            reach[(index + 1) % count] | reach[index - 1]
+                        ) & free[index]
+                    if grown != reach[index]:
+                        reach[index] = grown
+                        changed = True
+
+            # 著地：下一列會碰撞的可到達位置
+            free_next = [self._free_bits(rows, height, entry, y + 1) for entry in entries]
+            for index, entry in enumerate(entries):
+                rotation, min_row, _, shifted, _ = entry
+                landed = reach[index] & ~free_next[index]
+                if not landed or y + min_row < 0:
+                    continue
+                while landed:
+                    bit = landed & -landed
+                    landed ^= bit
+                    x = bit.bit_length() - 1 - X_OFFSET
+                    new_rows = list(rows)
+                    for row, mask in shifted[x]:
+                        new_rows[y + row] |= mask
+                    field = tuple(row for row in new_rows if row != full)
+                    if field not in seen_fields:
+                        seen_fields.add(field)
+                        results.append((x, y, rotation, field))
+
+        # 優先嘗試不產生被覆蓋空格的落點
+        covered = {item[3]: self._covered_cells(item[3]) for item in results}
+        results.sort(key=lambda item: covered[item[3]])
+        flat = [item for item in results if not covered[item[3]]]
+        self.placement_cache[key] = (results, flat)
+        return results if allow_overhang else flat
+
+    def _covered_cells(self, rows):
+        """計算上方有方塊覆蓋的空格數（排序用）"""
+        covered = 0
+        count = 0
+        for mask in rows:
+            count += bin(covered & ~mask).count("1")
+            covered |= mask
+        return count
+
+    def _is_feasible(self, rows, pieces, hold):
+        """
+        剪枝檢查
+        參數：
+        - rows: 場地
+        - pieces: 剩餘方塊序列（tuple）
+        - hold: Hold 中的方塊（或 None）
+        返回：False 表示一定無法完成
+        """
+        width = self.width
+        height = len(rows)
+        filled = sum(bin(mask).count("1") for mask in rows)
+        empty = height * width - filled
+        needed = empty // 4
+        if empty % 4 or needed > len(pieces) + (1 if hold else 0):
+            return False
+
+        # 孤立區域：填滿的欄把場地切開，每段的空格數必須是 4 的倍數
+        full_columns = self.full_mask
+        for mask in rows:
+            full_columns &= mask
+        if full_columns:
+            segment = 0
+            for x in range(width + 1):
+                bit = 1 << x
+                if x == width or full_columns & bit:
+                    if segment:
+                        segment_filled = sum(bin(mask & segment).count("1") for mask in rows)
+                        segment_cells = bin(segment).count("1") * height
+                        if (segment_cells - segment_filled) % 4:
+                            return False
+                    segment = 0
+                else:
+                    segment |= bit
+
+        even_filled = sum(bin(mask & self.even_columns).count("1") for mask in rows)
+        even_empty = self.even_count * height - even_filled
+        odd_empty = empty - even_empty
+
+        # 奇偶性：可用方塊能補償的欄奇偶差有限
+        usable = pieces[: needed + 1] + ((hold,) if hold else ())
+        capacity = 0
+        for shape_type in usable:
+            if shape_type == "I":
+                capacity += 4
+            elif shape_type in ("T", "J", "L"):
+                capacity += 2
+        return abs(even_empty - odd_empty) <= capacity
+
+    # ============================
+    # 搜尋
+    # ============================
+
+    def _search(self, rows, pieces, hold, can_hold, allow_overhang):
+        """
+        深度優先搜尋
+        返回：((形狀, x, y, rotation, 是否 Hold, 場地高度), ...) 或 None
+        """
+        if not rows:
+            return ()
+
+        memo_key = (rows, pieces, hold, allow_overhang)
+        if can_hold and memo_key in self.memo:
+            return self.memo[memo_key]
+
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise SearchLimitReached()
+
+        solution = None
+        if pieces and self._is_feasible(rows, pieces, hold):
+            current = pieces[0]
+            options = [(current, pieces[1:], hold, False)]
+            if self.use_hold and can_hold:
+                if hold is None:
+                    if len(pieces) > 1:
+                        options.append((pieces[1], pieces[2:], current, True))
+                elif hold != current:
+                    options.append((hold, pieces[1:], current, True))
+
+            height = len(rows)
+            for shape_type, rest, next_hold, used_hold in options:
+                for x, y, rotation, field in self.placements(
+                    rows, shape_type, allow_overhang
+                ):
+                    sub = self._search(field, rest, next_hold, True, allow_overhang)
+                    if sub is not None:
+                        solution = (
+                            (shape_type, x, y, rotation, used_hold, height),
+                        ) + sub
+                        break
+                if solution is not None:
+                    break
+
+        if can_hold:
+            if len(self.memo) >= MEMO_LIMIT:
+                self.memo.clear()
+                self.placement_cache.clear()
+            self.memo[memo_key] = solution
+        return solution
+
+    def solve_field(self, rows, pieces, hold=None, can_hold=True):
+        """
+        在指定場地上求解
+        參數：
+        - rows: 場地（由上到下的位元遮罩）
+        - pieces: 方塊序列（第一個為當前方塊）
+        - hold: Hold 中的方塊
+        - can_hold: 當前方塊是否還能 Hold
+        返回：解的步驟 tuple 或 None（無解或超過節點上限，見 limit_reached）
+        """
+        self.nodes = 0
+        self.limit_reached = False
+        rows = tuple(rows)
+        pieces = tuple(pieces)
+        try:
+            for allow_overhang in (False, True):
+                solution = self._search(rows, pieces, hold, can_hold, allow_overhang)
+                if solution is not None:
+                    return solution
+        except SearchLimitReached:
+            self.limit_reached = True
+        return None
+
+    def candidate_heights(self, rows, piece_count):
+        """
+        可能的 Perfect Clear 場地高度（由低到高）
+        參數：
+        - rows: 整個盤面（由上到下的位元遮罩，最後一個為最底行）
+        - piece_count: 可用方塊數（含 Hold）
+        """
+        stack_height = len(rows)
+        for index, mask in enumerate(rows):
+            if mask:
+                stack_height = len(rows) - index
+                break
+        else:
+            stack_height = 0
+        filled = sum(bin(mask).count("1") for mask in rows)
+
+        heights = []
+        for height in range(max(stack_height, 1), self.max_height + 1):
+            empty = height * self.width - filled
+            if empty > 0 and empty % 4 == 0 and empty // 4 <= piece_count:
+                heights.append(height)
+        return heights
+
+    def solve(self, rows, grid_height, pieces, hold=None, can_hold=True):
+        """
+        求解整個盤面的 Perfect Clear
+        參數：
+        - rows: 整個盤面（由上到下的位元遮罩，最後一個為最底行）
+        - grid_height: 可見區域高度（rows 的最後 grid_height 行為可見區域）
+        - pieces: 方塊序列（第一個為當前方塊）
+        - hold: Hold 中的方塊
+        - can_hold: 當前方塊是否還能 Hold
+        返回：Placement 列表（座標為遊戲座標）或 None
+        """
+        nodes = 0
+        limited = False
+        filled = sum(bin(mask).count("1") for mask in rows)
+        for height in self.candidate_heights(rows, len(pieces) + (1 if hold else 0)):
+            # 只保留會用到的方塊，讓下一個方塊的求解能直接命中記憶表
+            needed = (height * self.width - filled) // 4
+            usable = pieces[: needed if hold else needed + 1]
+            steps = self.solve_field(rows[len(rows) - height :], usable, hold, can_hold)
+            nodes += self.nodes
+            limited = limited or self.limit_reached
+            if steps is not None:
+                self.nodes = nodes
+                return [
+                    Placement(
+                        shape_type,
+                        x,
+                        grid_height - field_height + y,
+                        rotation,
+                        [],
+                        use_hold,
+                    )
+                    for shape_type, x, y, rotation, use_hold, field_height in steps
+                ]
+        self.nodes = nodes
+        self.limit_reached = limited
+        return None
+
+    def game_position(self, game, preview=None):
+        """
+        取得遊戲目前狀態的求解輸入
+        參數：
+        - game: Game 物件
+        - preview: 使用的後續方塊數（None 表示依最大場地高度自動決定）
+        返回：solve 的參數 tuple，或 None（尺寸不符或緩衝區有方塊）
+        """
+        grid = game.grid
+        if grid.width != self.width or grid.is_game_over():
+            return None
+        if preview is None:
+            preview = self.max_height * self.width // 4 + 1
+        hold = game.hold_tetromino.shape_type if game.hold_tetromino else None
+        pieces = [game.current_tetromino.shape_type] + game.preview_pieces(preview)
+        return board_rows(grid), grid.height, pieces, hold, game.can_hold
+
+    def solve_game(self, game, preview=None):
+        """
+        求解遊戲目前狀態的 Perfect Clear
+        參數：
+        - game: Game 物件
+        - preview: 使用的後續方塊數
+        返回：Placement 列表或 None
+        """
+        position = self.game_position(game, preview)
+        return self.solve(*position) if position else None
+
+
+def board_rows(grid):
+    """GameGrid → 由上到下的位元遮罩列表（只取可見區域，緩衝區有方塊時不可能 Perfect Clear）"""
+    rows = []
+    for y, row in enumerate(grid.grid):
+        mask = 0
+        if grid.row_counts[y]:
+            for x, cell in enumerate(row):
+                if cell != BLACK:
+                    mask |= 1 << x
+        rows.append(mask)
+    return rows
+
+
+class PerfectClearHint:
+    """
+    Perfect Clear 提示類別
+    盤面、當前方塊或 Hold 改變時在背景執行緒重新求解，主迴圈只讀取最近一次的結果
+    （冷啟動的開局求解可能需要數秒，不能在繪製的那一幀完成）
+    """
+
+    def __init__(self, width=GRID_WIDTH, node_limit=DEFAULT_NODE_LIMIT):
+        """
+        初始化提示
+        參數：
+        - width: 遊戲區域寬度
+        - node_limit: 每次求解最多展開的節點數
+        """
+        self.solver = PerfectClearSolver(width, node_limit=node_limit)
+        self.state = None  # 最近一次開始求解的遊戲狀態
+        self.solution_state = None  # solution 對應的遊戲狀態
+        self.solution = None
+        self.solving = False
+        self.solve_ms = 0.0
+
+    def _state_of(self, game):
+        """判斷是否需要重新求解的狀態鍵值"""
+        return (
+            game,
+            game.grid.version,
+            game.current_tetromino.shape_type,
+            game.hold_tetromino.shape_type if game.hold_tetromino else None,
+            game.can_hold,
+        )
+
+    def _solve(self, state, position):
+        """背景執行緒：求解並記錄結果"""
+        began = time.perf_counter()
+        solution = self.solver.solve(*position) if position else None
+        self.solve_ms = (time.perf_counter() - began) * 1000
+        self.solution = solution
+        self.solution_state = state
+        self.solving = False
+
+    def update(self, game):
+        """
+        取得目前方塊的提示
+        參數：
+        - game: Game 物件
+        返回：(Placement, 解的方塊數) 或 None（無解、求解中或遊戲結束）
+        """
+        if game.game_over:
+            return None
+        state = self._state_of(game)
+        if state != self.state and not self.solving:
+            # 求解輸入在主執行緒取得，背景執行緒不會讀取正在變動的遊戲物件
+            self.state = state
+            self.solving = True
+            threading.Thread(
+                target=self._solve,
+                args=(state, self.solver.game_position(game)),
+                daemon=True,
+            ).start()
+
+        if self.solution and self.solution_state == state:
+            return self.solution[0], len(self.solution)
+        return None
+
+
+def analyze_training_data(root, node_limit=DEFAULT_NODE_LIMIT, limit=None):
+    """
+    批次分析訓練資料（core.training_data）中每個鎖定前的盤面是否能 Perfect Clear
+    參數：
+    - root: 訓練資料資料夾
+    - node_limit: 每個盤面最多展開的節點數
+    - limit: 最多分析的紀錄數
+    返回：統計 dict（含錯過的 Perfect Clear 列表）
+    """
+    from core.training_data import TrainingDataReader, SHAPE_NAMES, NO_PIECE
+
+    reader = TrainingDataReader(root)
+    solver = PerfectClearSolver(
+        reader.width, min(PC_MAX_HEIGHT, reader.height), node_limit=node_limit
+    )
+    stats = {
+        "records": 0,
+        "candidates": 0,
+        "solvable": 0,
+        "achieved": 0,
+        "missed": [],
+        "limit_reached": 0,
+    }
+
+    total = len(reader) if limit is None else min(limit, len(reader))
+    for shard_index in range(len(reader.shards)):
+        records = reader.shard_records(shard_index)
+        for local in range(len(records)):
+            if stats["records"] >= total:
+                return stats
+            stats["records"] += 1
+            record = records[local]
+            board = reader.unpack_boards(record)
+            rows = [
+                sum(1 << x for x in range(reader.width) if cell_row[x])
+                for cell_row in board
+            ]
+            if any(rows[: reader.buffer_rows]):
+                continue
+            rows = rows[reader.buffer_rows :]
+            if any(rows[: reader.height - solver.max_height]) or not any(rows):
+                continue
+
+            pieces = [SHAPE_NAMES[record["piece"]]] + [
+                SHAPE_NAMES[value] for value in record["queue"] if value != NO_PIECE
+            ]
+            hold = SHAPE_NAMES[record["hold"]] if record["hold"] != NO_PIECE else None
+            can_hold = not record["used_hold"]
+            stats["candidates"] += 1
+            solution = solver.solve(rows, reader.height, pieces, hold, can_hold)
+            if solver.limit_reached:
+                stats["limit_reached"] += 1
+            if solution is None:
+                continue
+            stats["solvable"] += 1
+
+            # 玩家在解所需的方塊數內達成 Perfect Clear 時，之後某個方塊鎖定前的盤面會是全空
+            later = records[local + 1 : local + 1 + len(solution)]
+            achieved = any(not mask.any() for mask in later["board"])
+            if achieved:
+                stats["achieved"] += 1
+            else:
+                stats["missed"].append(
+                    {
+                        "shard": reader.shards[shard_index]["file"],
+                        "move": int(record["move"]),
+                        "pieces": len(solution),
+                    }
+                )
+    return stats
+
+
+def main():
+    """命令列入口：分析訓練資料中的 Perfect Clear 機會"""
+    parser = argparse.ArgumentParser(description="Tetris Perfect Clear 批次分析")
+    parser.add_argument("--data", required=True, help="訓練資料資料夾")
+    parser.add_argument("--node-limit", type=int, default=DEFAULT_NODE_LIMIT)
+    parser.add_argument("--limit", type=int, default=None, help="最多分析的紀錄數")
+    args = parser.parse_args()
+
+    began = time.perf_counter()
+    stats = analyze_training_data(args.data, args.node_limit, args.limit)
+    elapsed = time.perf_counter() - began
+
+    print("📊 Perfect Clear 分析結果")
+    print(f"  分析紀錄: {stats['records']:,}（{elapsed:.1f} 秒）")
+    print(f"  低盤面（≤{PC_MAX_HEIGHT} 行）: {stats['candidates']:,}")
+    print(f"  可 Perfect Clear: {stats['solvable']:,}")
+    print(f"  實際達成: {stats['achieved']:,}")
+    print(f"  錯過: {len(stats['missed']):,}")
+    print(f"  超過節點上限: {stats['limit_reached']:,}")
+    for missed in stats["missed"][:20]:
+        print(
+            f"    {missed['shard']} 第 {missed['move']} 個方塊："
+            f"{missed['pieces']} 個方塊內可 Perfect Clear"
+        )
+
+
+if __name__ == "__main__":
+    main()
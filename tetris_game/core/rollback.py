@@ -0,0 +1,188 @@
+"""
+Rollback 網路同步模組
+本地輸入立即套用，遠端輸入先以預測值模擬；確認的輸入抵達後若與預測不同，
+還原到該幀之前的快照並以正確輸入重新模擬到目前幀
+
+需求：
+- VersusMatch 完全由種子與輸入決定（7-bag 使用獨立的 rng，計時器皆為整數）
+- VersusMatch.snapshot() / restore() 可快速保存與還原整場比賽狀態
+"""
+
+import time
+
+DEFAULT_MAX_ROLLBACK = 8  # 最多可預測（領先確認輸入）的幀數
+CHECKSUM_HISTORY = 120  # 已確定幀的校驗值保留幀數（等待伺服器校驗訊息）
+
+
+class RollbackSession:
+    """
+    Rollback 同步工作階段類別
+    每幀呼叫 advance(local_input)；收到伺服器確認的輸入時呼叫 confirm_inputs
+    """
+
+    def __init__(self, match, local_slot, max_rollback=DEFAULT_MAX_ROLLBACK):
+        """
+        初始化工作階段
+        參數：
+        - match: VersusMatch 物件（所有客戶端使用相同的種子）
+        - local_slot: 本地玩家編號
+        - max_rollback: 最多領先確認輸入的幀數（也是單次最多重新模擬的幀數）
+        """
+        self.match = match
+        self.local_slot = local_slot
+        self.player_count = len(match.players)
+        self.max_rollback = max_rollback
+
+        self.frame = 0  # 下一個要模擬的幀
+        self.confirmed_frame = -1  # 已收到所有玩家確認輸入的最後一幀
+        self.last_confirmed = [(0, 0)] * self.player_count
+
+        self.local_inputs = {}  # frame -> 本地輸入
+        self.confirmed_inputs = {}  # frame -> 確認的輸入列表
+        self.used_inputs = {}  # frame -> 模擬時實際使用的輸入列表
+        self.snapshots = {}  # frame -> 模擬該幀之前的比賽快照
+        self.checksums = {}  # frame -> 模擬該幀之後的校驗值
+        self.pending_checksums = []  # 等待比對的 (frame, checksum)
+        self.rollback_frame = None  # 需要重新模擬的最早幀
+
+        # 統計
+        self.rollbacks = 0
+        self.resimulated_frames = 0
+        self.max_rollback_depth = 0
+        self.rollback_time = 0.0
+        self.stalls = 0
+        self.desyncs = 0
+
+    def predict_input(self, slot):
+        """
+        預測遠端玩家的輸入：延續最後確認的按住狀態，但不重複「剛按下」的動作
+        （重複硬降或旋轉的代價遠高於晚一幀才套用）
+        """
+        held, _ = self.last_confirmed[slot]
+        return held, 0
+
+    def inputs_for(self, frame):
+        """組合某一幀要使用的輸入（確認值優先，其次為本地輸入與預測值）"""
+        confirmed = self.confirmed_inputs.get(frame)
+        if confirmed is not None:
+            return confirmed
+        return [
+            self.local_inputs[frame] if slot == self.local_slot else self.predict_input(slot)
+            for slot in range(self.player_count)
+        ]
+
+    def can_advance(self):
+        """是否可以再往前模擬一幀（領先確認輸入不超過 max_rollback）"""
+        return self.frame - self.confirmed_frame <= self.max_rollback
+
+    def confirm_inputs(self, frame, inputs):
+        """
+        收到伺服器確認的某一幀所有玩家輸入（依幀數順序抵達）
+        參數：
+        - frame: 幀數
+        - inputs: [(held, pressed), ...]
+        """
+        inputs = list(inputs)
+        self.confirmed_inputs[frame] = inputs
+        self.confirmed_frame = frame
+        self.last_confirmed = inputs
+
+        used = self.used_inputs.get(frame)
+        if used is not None and used != inputs:
+            if self.rollback_frame is None or frame < self.rollback_frame:
+                self.rollback_frame = frame
+
+    def add_checksum(self, frame, checksum):
+        """記錄伺服器送來的校驗值（在該幀確定後比對）"""
+        self.pending_checksums.append((frame, checksum))
+
+    def _simulate(self, frame):
+        """保存快照並以當前已知的輸入模擬一幀"""
+        inputs = self.inputs_for(frame)
+        self.snapshots[frame] = self.match.snapshot()
+        self.used_inputs[frame] = inputs
+        self.match.step(inputs)
+        self.checksums[frame] = self.match.checksum()
+
+    def rollback(self):
+        """
+        若有預測錯誤，還原快照並重新模擬到目前幀
+        返回：重新模擬的幀數
+        """
+        start = self.rollback_frame
+        if start is None:
+            return 0
+        self.rollback_frame = None
+
+        began = time.perf_counter()
+        self.match.restore(self.snapshots[start])
+        for frame in range(start, self.frame):
+            self._simulate(frame)
+        self.rollback_time += time.perf_counter() - began
+
+        depth = self.frame - start
+        self.rollbacks += 1
+        self.resimulated_frames += depth
+        self.max_rollback_depth = max(self.max_rollback_depth, depth)
+        return depth
+
+    def advance(self, local_input):
+        """
+        推進一幀
+        參數：
+        - local_input: 本地玩家這一幀的 (held, pressed)
+        返回：True 如果成功推進；False 表示領先太多，需要等待確認輸入
+        """
+        self.synchronize()
+        if not self.can_advance():
+            self.stalls += 1
+            return False
+
+        self.local_inputs[self.frame] = local_input
+        self._simulate(self.frame)
+        self.frame += 1
+        return True
+
+    def synchronize(self):
+        """處理已抵達的確認輸入：必要時回滾、比對校驗值並丟棄舊資料"""
+        self.rollback()
+        self._verify_checksums()
+        self._discard_old_frames()
+
+    def _verify_checksums(self):
+        """比對已確定幀的校驗值"""
+        remaining = []
+        for frame, checksum in self.pending_checksums:
+            if frame > self.confirmed_frame or frame >= self.frame:
+                remaining.append((frame, checksum))
+            elif self.checksums.get(frame, checksum) != checksum:
+                self.desyncs += 1
+        self.pending_checksums = remaining
+
+    def _discard_old_frames(self):
+        """
+        丟棄不再可能被回滾的幀資料
+        只保留第一個未確認幀之後的快照（已確認且已重新模擬的幀不會再改變）
+        """
+        oldest = min(self.confirmed_frame + 1, self.frame)
+        for frame in [frame for frame in self.snapshots if frame < oldest]:
+            del self.snapshots[frame]
+            del self.used_inputs[frame]
+            self.local_inputs.pop(frame, None)
+            self.confirmed_inputs.pop(frame, None)
+        for frame in [
+            frame for frame in self.checksums if frame < oldest - CHECKSUM_HISTORY
+        ]:
+            del self.checksums[frame]
+
+    def stats(self):
+        """返回 rollback 統計資訊 dict"""
+        return {
+            "frames": self.frame,
+            "rollbacks": self.rollbacks,
+            "resimulated_frames": self.resimulated_frames,
+            "max_rollback_depth": self.max_rollback_depth,
+            "rollback_ms": self.rollback_time * 1000,
+            "stalls": self.stalls,
+            "desyncs": self.desyncs,
+        }
@@ -0,0 +1,211 @@
+"""
+大逃殺模式（99 人對戰）
+一位玩家（或 AI）對上 98 個 AI，所有人互相傳送垃圾行
+
+效能設計：
+- 模擬成本幾乎都在 AI 的落點搜尋，遊戲本身每幀只有數十微秒
+- BotScheduler 限制每幀最多執行的落點搜尋次數，超出的 AI 延到下一幀再規劃，
+  避免開局或大量方塊同時鎖定時所有 AI 在同一幀思考造成卡頓
+- 排程只依幀數與玩家順序決定，相同種子與輸入仍可重現
+
+無視窗壓力測試：
+    python -m core.royale --frames 3600
+"""
+
+import argparse
+import random
+import sys
+import os
+import time
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.versus import VersusMatch
+from core.bot import BotController, TetrisBot
+from config.constants import GRID_WIDTH, GRID_HEIGHT, GRID_BUFFER_ROWS
+
+ROYALE_PLAYERS = 99  # 預設玩家人數
+DEFAULT_PLANS_PER_FRAME = 6  # 每幀最多執行的 AI 落點搜尋次數
+BOT_THINK_FRAMES = (4, 24)  # AI 思考幀數範圍（不同 AI 速度不同）
+
+
+class BotScheduler:
+    """
+    多 AI 輸入排程器類別
+    每幀輪流決定哪些 AI 可以執行落點搜尋，其餘需要規劃的 AI 等待下一幀
+    """
+
+    def __init__(self, controllers, plans_per_frame=DEFAULT_PLANS_PER_FRAME):
+        """
+        初始化排程器
+        參數：
+        - controllers: BotController 列表
+        - plans_per_frame: 每幀最多執行的落點搜尋次數
+        """
+        self.controllers = controllers
+        self.plans_per_frame = plans_per_frame
+        self.start = 0  # 本幀優先規劃的起始位置（輪替，避免固定順序餓死後面的 AI）
+        self.deferred = 0  # 累計被延後的規劃次數
+
+    def collect_inputs(self, games):
+        """
+        取得所有 AI 這一幀的輸入
+        參數：
+        - games: 與 controllers 對應的 Game 列表
+        返回：[(held, pressed), ...]
+        """
+        count = len(self.controllers)
+        inputs = [None] * count
+        plans = 0
+        for offset in range(count):
+            index = (self.start + offset) % count
+            controller = self.controllers[index]
+            game = games[index]
+            allow_plan = True
+            if controller.needs_plan(game):
+                if plans < self.plans_per_frame:
+                    plans += 1
+                else:
+                    allow_plan = False
+                    self.deferred += 1
+            inputs[index] = controller.next_input(game, allow_plan)
+        if count:
+            self.start = (self.start + 1) % count
+        return inputs
+
+
+class RoyaleMatch:
+    """
+    大逃殺比賽類別
+    第 0 號玩家由外部控制器（鍵盤或 AI）控制，其餘由 BotScheduler 控制
+    """
+
+    def __init__(
+        self,
+        controller=None,
+        player_count=ROYALE_PLAYERS,
+        seed=None,
+        width=GRID_WIDTH,
+        height=GRID_HEIGHT,
+        buffer_rows=GRID_BUFFER_ROWS,
+        plans_per_frame=DEFAULT_PLANS_PER_FRAME,
+    ):
+        """
+        初始化比賽
+        參數：
+        - controller: 第 0 號玩家的控制器（None 表示也由 AI 控制）
+        - player_count: 玩家人數
+        - seed: 比賽種子
+        - width, height, buffer_rows: 遊戲區域尺寸
+        - plans_per_frame: 每幀最多執行的 AI 落點搜尋次數
+        """
+        names = ["YOU" if controller else "AI 1"] + [
+            f"AI {index + 1}" for index in range(1, player_count)
+        ]
+        self.match = VersusMatch(
+            player_count, seed, width, height, buffer_rows, names=names
+        )
+        self.controller = controller
+
+        # AI 速度由種子決定（可重現）；不考慮 Hold，讓每次落點搜尋的候選數減半
+        rng = random.Random(self.match.seed)
+        first_bot = 1 if controller else 0
+        bots = [
+            BotController(
+                TetrisBot(use_hold=False),
+                think_frames=rng.randint(*BOT_THINK_FRAMES),
+            )
+            for _ in range(first_bot, player_count)
+        ]
+        self.scheduler = BotScheduler(bots, plans_per_frame)
+        self.bot_games = [player.game for player in self.match.players[first_bot:]]
+
+        # 效能統計（毫秒）
+        self.last_step_ms = 0.0
+        self.max_step_ms = 0.0
+        self.total_step_ms = 0.0
+
+    @property
+    def players(self):
+        """所有玩家"""
+        return self.match.players
+
+    @property
+    def finished(self):
+        """比賽是否結束"""
+        return self.match.finished
+
+    def rank_of(self, index):
+        """
+        玩家目前名次（存活者並列為存活人數的名次）
+        參數：
+        - index: 玩家編號
+        """
+        player = self.match.players[index]
+        if player.alive:
+            return len(self.match.alive_players())
+        # 被擊倒的玩家：名次 = 1 + 比他晚被擊倒或仍存活的人數
+        return 1 + sum(
+            1
+            for other in self.match.players
+            if other is not player
+            and (
+                other.alive
+                or (
+                    other.knocked_out_frame is not None
+                    and player.knocked_out_frame is not None
+                    and other.knocked_out_frame > player.knocked_out_frame
+                )
+            )
+        )
+
+    def step(self):
+        """
+        推進一幀
+        返回：True 如果比賽在這一幀結束
+        """
+        began = time.perf_counter()
+        inputs = self.scheduler.collect_inputs(self.bot_games)
+        if self.controller:
+            inputs.insert(0, self.controller.next_input(self.match.players[0].game))
+        finished = self.match.step(inputs)
+
+        elapsed = (time.perf_counter() - began) * 1000
+        self.last_step_ms = elapsed
+        self.max_step_ms = max(self.max_step_ms, elapsed)
+        self.total_step_ms += elapsed
+        return finished
+
+
+def main():
+    """命令列入口：無視窗模擬全 AI 大逃殺並輸出每幀耗時"""
+    parser = argparse.ArgumentParser(description="Tetris 大逃殺壓力測試")
+    parser.add_argument("--players", type=int, default=ROYALE_PLAYERS)
+    parser.add_argument("--frames", type=int, default=3600)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--plans-per-frame", type=int, default=DEFAULT_PLANS_PER_FRAME
+    )
+    args = parser.parse_args()
+
+    royale = RoyaleMatch(
+        None, args.players, args.seed, plans_per_frame=args.plans_per_frame
+    )
+    frames = 0
+    while frames < args.frames and not royale.step():
+        frames += 1
+    frames = royale.match.frame
+
+    print("📊 大逃殺壓力測試結果")
+    print(f"  玩家數: {args.players}（剩餘 {len(royale.match.alive_players())}）")
+    print(f"  模擬幀數: {frames:,}")
+    print(f"  平均每幀: {royale.total_step_ms / max(frames, 1):.2f} ms")
+    print(f"  最慢一幀: {royale.max_step_ms:.2f} ms")
+    print(f"  延後規劃次數: {royale.scheduler.deferred:,}")
+    if royale.finished and royale.match.winner is not None:
+        print(f"  勝者: {royale.players[royale.match.winner].name}")
+
+
+if __name__ == "__main__":
+    main()
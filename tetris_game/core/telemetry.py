@@ -0,0 +1,621 @@
+"""
+遊戲遙測模組
+每局結束時將種子、規則、分數、等級曲線、T-spin / B2B / Combo 統計、每秒方塊數與
+幀時間百分位數寫入只追加的欄式儲存，並提供依等級、玩家、版本分組的彙總查詢
+
+檔案結構：
+    資料夾/
+        meta.json               # 已提交的列數、欄位格式與字串欄位的字典
+        score.bin               # 每個欄位一個檔案：連續的固定長度數值（欄位 dtype）
+        lines.bin
+        level_02.bin            # 等級曲線：到達每個等級的時間各一個欄位
+        ...
+
+設計：
+- 字串欄位（玩家、版本、規則、模式）以字典編碼為 uint16，查詢時只比較整數
+- 寫入先累積在記憶體，flush 時一次追加到各欄位檔，最後才更新 meta.json 的列數；
+  寫入中斷時讀取端只看到已提交的列，下次開啟寫入器會截掉多出的部分
+- 讀取時以 np.memmap 開啟欄位，查詢只載入用到的欄位；分組百分位數以排序後分段、
+  np.partition 選取計算，數百萬局的查詢在一秒內完成
+
+命令列：
+    python -m core.telemetry --db data/telemetry --simulate 20          # 無視窗產生 AI 對局
+    python -m core.telemetry --db data/telemetry --query score --by player
+    python -m core.telemetry --db data/telemetry --levels
+
+需要安裝 numpy（選用依賴）：
+pip install numpy
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 嘗試導入 numpy，如果失敗則在建立寫入器時提示安裝
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from core.game import Game
+from config.constants import BUILD_VERSION, FPS
+
+FORMAT_VERSION = 1
+META_FILE = "meta.json"
+COLUMN_PATTERN = "{}.bin"
+LEVEL_CURVE_SIZE = 20  # 記錄到達等級 2 ~ 21 的時間
+LEVEL_COLUMNS = tuple(f"level_{level:02d}" for level in range(2, 2 + LEVEL_CURVE_SIZE))
+FLUSH_ROWS = 1024  # 累積多少局才寫入檔案（關閉寫入器時一定會寫入）
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+# 欄位：(名稱, dtype)
+COLUMNS = (
+    ("ended", "int64"),  # 結束時間（Unix 秒）
+    ("player", "uint16"),  # 字串欄位（字典編碼）
+    ("build", "uint16"),
+    ("ruleset", "uint16"),
+    ("mode", "uint16"),
+    ("seed", "int64"),  # -1 表示未指定種子
+    ("topped_out", "uint8"),  # 1 為 Game Over，0 為中途重新開始
+    ("score", "int64"),
+    ("lines", "int32"),
+    ("level", "int16"),
+    ("pieces", "int32"),
+    ("tspins", "int32"),  # T-spin 次數（不含 Mini）
+    ("tspin_minis", "int32"),
+    ("b2b", "int32"),  # Back-to-back 次數
+    ("max_combo", "int16"),
+    ("perfect_clears", "int16"),
+    ("duration", "float32"),  # 遊戲時間（秒）
+    ("pps", "float32"),  # 每秒方塊數
+    ("frame_p50", "float32"),  # 幀時間百分位數（毫秒）
+    ("frame_p95", "float32"),
+    ("frame_p99", "float32"),
+) + tuple(
+    (name, "float32") for name in LEVEL_COLUMNS  # 到達各等級的時間（秒），未到達為 NaN
+)
+STRING_COLUMNS = ("player", "build", "ruleset", "mode")
+COLUMN_TYPES = dict(COLUMNS)
+
+
+def percentile_values(values, q=DEFAULT_PERCENTILES):
+    """
+    計算百分位數（與 np.percentile 的線性內插相同，NaN 視為缺值）
+    以一次 np.partition 選出需要的位置，不需要完整排序
+    參數：
+    - values: 一維數值陣列
+    - q: 百分位數
+    返回：(有效數值個數, 百分位數列表)
+    """
+    values = np.asarray(values)
+    count = len(values)
+    if values.dtype.kind == "f":
+        # np.partition 會把 NaN 排到最後，只在前面的有效數值中選取
+        count -= int(np.count_nonzero(np.isnan(values)))
+    if count == 0:
+        return 0, []
+    positions = [percent / 100 * (count - 1) for percent in q]
+    kth = sorted({int(position) for position in positions})
+    kth = sorted(set(kth) | {min(index + 1, count - 1) for index in kth})
+    selected = np.partition(values, kth)
+    result = []
+    for position in positions:
+        low = int(position)
+        high = min(low + 1, count - 1)
+        fraction = position - low
+        result.append(
+            float(selected[low]) + (float(selected[high]) - float(selected[low])) * fraction
+        )
+    return count, result
+
+
+def load_meta(root):
+    """讀取資料夾的 meta.json（不存在時返回 None）"""
+    path = os.path.join(root, META_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def ruleset_name(game):
+    """遊戲規則名稱（遊戲區域尺寸，例如 10x20+2）"""
+    grid = game.grid
+    return f"{grid.width}x{grid.height}+{grid.buffer_rows}"
+
+
+class GameTelemetry:
+    """
+    單局遙測收集器類別
+    掛在 Game 的 lock_listeners 上累計統計，主迴圈每幀呼叫 tick；
+    遊戲結束時呼叫 finish 寫入一列（Game.restart_game 原地重開時自動結算上一局）
+    """
+
+    def __init__(self, writer, game, player="", mode="marathon"):
+        """
+        初始化收集器
+        參數：
+        - writer: TelemetryWriter
+        - game: 要記錄的 Game 物件
+        - player: 玩家名稱
+        - mode: 遊戲模式名稱
+        """
+        self.writer = writer
+        self.game = game
+        self.player = player
+        self.mode = mode
+        self.reset()
+        game.lock_listeners.append(self._on_lock)
+
+    def reset(self):
+        """重置單局統計"""
+        self.grid = self.game.grid  # restart_game 會建立新的遊戲區域，用來偵測重開
+        self.seed = self.game.seed
+        self.pieces = 0
+        self.tspins = 0
+        self.tspin_minis = 0
+        self.b2b = 0
+        self.max_combo = 0
+        self.elapsed = 0.0  # 遊戲時間（毫秒）
+        self.frame_times = array("f")
+        self.level_times = [float("nan")] * LEVEL_CURVE_SIZE  # 到達等級 2 起的時間（秒）
+        self.last_level = self.game.level
+        self.finished = False
+        self._snapshot()
+
+    def _snapshot(self):
+        """記下遊戲的累計數值（restart_game 會原地清除，結算上一局時使用記下的值）"""
+        game = self.game
+        self.score = game.score
+        self.lines = game.lines_cleared
+        self.level = game.level
+        self.perfect_clears = game.perfect_clear_count
+
+    def _on_lock(self, game, result):
+        self.pieces += 1
+        if result["t_spin"] == "mini":
+            self.tspin_minis += 1
+        elif result["t_spin"]:
+            self.tspins += 1
+        if result["back_to_back"]:
+            self.b2b += 1
+        self.max_combo = max(self.max_combo, game.combo_count)
+        # 記錄升級時間（一次消行可能跨過多個等級）
+        for level in range(self.last_level + 1, game.level + 1):
+            if 2 <= level < 2 + LEVEL_CURVE_SIZE:
+                self.level_times[level - 2] = self.elapsed / 1000
+        self.last_level = game.level
+        self._snapshot()
+
+    def tick(self, dt, frame_ms=None):
+        """
+        每幀呼叫一次
+        參數：
+        - dt: 這一幀推進的遊戲時間（毫秒）
+        - frame_ms: 這一幀實際花費的時間（毫秒，預設與 dt 相同）
+        """
+        if self.game.grid is not self.grid:
+            # 遊戲被原地重新開始：結算上一局（未 Game Over）並開始新的統計
+            self.finish(topped_out=False)
+            self.reset()
+        if self.finished or self.game.game_over:
+            return
+        self._snapshot()
+        self.elapsed += dt
+        self.frame_times.append(dt if frame_ms is None else frame_ms)
+
+    def finish(self, topped_out=None):
+        """
+        結算這一局並寫入一列（重複呼叫或沒有放置任何方塊時不寫入）
+        參數：
+        - topped_out: 是否為 Game Over（預設依 game.game_over 判斷）
+        返回：寫入的列 dict 或 None
+        """
+        if self.finished:
+            return None
+        self.finished = True
+        if self.pieces == 0:
+            return None
+
+        game = self.game
+        if game.grid is self.grid:
+            self._snapshot()
+            if topped_out is None:
+                topped_out = game.game_over
+        if self.frame_times:
+            _, (frame_p50, frame_p95, frame_p99) = percentile_values(
+                np.frombuffer(self.frame_times, np.float32), (50, 95, 99)
+            )
+        else:
+            frame_p50 = frame_p95 = frame_p99 = 0.0
+        duration = self.elapsed / 1000
+        row = {
+            "ended": int(time.time()),
+            "player": self.player,
+            "build": BUILD_VERSION,
+            "ruleset": ruleset_name(game),
+            "mode": self.mode,
+            "seed": -1 if self.seed is None else self.seed,
+            "topped_out": int(bool(topped_out)),
+            "score": self.score,
+            "lines": self.lines,
+            "level": self.level,
+            "pieces": self.pieces,
+            "tspins": self.tspins,
+            "tspin_minis": self.tspin_minis,
+            "b2b": self.b2b,
+            "max_combo": self.max_combo,
+            "perfect_clears": self.perfect_clears,
+            "duration": duration,
+            "pps": self.pieces / duration if duration > 0 else 0.0,
+            "frame_p50": frame_p50,
+            "frame_p95": frame_p95,
+            "frame_p99": frame_p99,
+        }
+        row.update(zip(LEVEL_COLUMNS, self.level_times))
+        self.writer.append(row)
+        return row
+
+
+class TelemetryWriter:
+    """
+    遙測寫入器類別
+    以欄式檔案只追加地儲存每局結果（資料夾已存在時接續追加）
+    """
+
+    def __init__(self, root, flush_rows=FLUSH_ROWS):
+        """
+        初始化寫入器
+        參數：
+        - root: 資料夾路徑（不存在時自動建立）
+        - flush_rows: 累積多少列才寫入檔案
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("遙測儲存需要 numpy：pip install numpy")
+
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.flush_rows = flush_rows
+        self.pending = []  # 尚未寫入檔案的列
+
+        meta = load_meta(root)
+        columns = [list(column) for column in COLUMNS]
+        if meta is None:
+            self.meta = {
+                "format": FORMAT_VERSION,
+                "rows": 0,
+                "columns": columns,
+                "dictionaries": {name: [] for name in STRING_COLUMNS},
+            }
+        else:
+            if meta["columns"] != columns:
+                raise ValueError(f"資料夾 {root} 的欄位格式與目前版本不一致")
+            self.meta = meta
+            # 截掉上次寫入中斷時多出的部分（只保留已提交的列）
+            for name, dtype in COLUMNS:
+                path = self.column_path(name)
+                committed = self.meta["rows"] * np.dtype(dtype).itemsize
+                if os.path.exists(path) and os.path.getsize(path) > committed:
+                    with open(path, "r+b") as f:
+                        f.truncate(committed)
+        self.codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in self.meta["dictionaries"].items()
+        }
+
+    def column_path(self, name):
+        """欄位檔路徑"""
+        return os.path.join(self.root, COLUMN_PATTERN.format(name))
+
+    def encode(self, name, value):
+        """字串 → 字典編碼（新的字串加到字典尾端）"""
+        codes = self.codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            codes[value] = code
+            self.meta["dictionaries"][name].append(value)
+        return code
+
+    def append(self, row):
+        """
+        追加一列
+        參數：
+        - row: 欄位名稱 → 值的 dict（字串欄位為 str）
+        """
+        self.pending.append(row)
+        if len(self.pending) >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        """將累積的列寫入各欄位檔並提交"""
+        if not self.pending:
+            return
+        rows = self.pending
+        for name, dtype in COLUMNS:
+            if name in STRING_COLUMNS:
+                values = [self.encode(name, row[name]) for row in rows]
+            else:
+                values = [row[name] for row in rows]
+            with open(self.column_path(name), "ab") as f:
+                np.asarray(values, dtype=dtype).tofile(f)
+        self.meta["rows"] += len(rows)
+        self.pending = []
+        self.write_meta()
+
+    def write_meta(self):
+        """寫入 meta.json（先寫暫存檔再替換，避免中斷時留下損壞的檔案）"""
+        path = os.path.join(self.root, META_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, path)
+
+    def close(self):
+        """寫入剩餘的列"""
+        self.flush()
+
+
+class TelemetryStore:
+    """
+    遙測查詢類別
+    欄位以 np.memmap 按需開啟；篩選條件以關鍵字參數指定，例如 store.percentiles("score", by="level", player="alice")
+    """
+
+    def __init__(self, root):
+        """
+        初始化查詢器
+        參數：
+        - root: TelemetryWriter 寫入的資料夾
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("遙測查詢需要 numpy：pip install numpy")
+
+        meta = load_meta(root)
+        if meta is None:
+            raise FileNotFoundError(f"找不到遙測資料：{os.path.join(root, META_FILE)}")
+        self.root = root
+        self.meta = meta
+        self.rows = meta["rows"]
+        self.dictionaries = meta["dictionaries"]
+        self.maps = {}
+
+    def __len__(self):
+        """已提交的局數"""
+        return self.rows
+
+    def column(self, name):
+        """
+        取得欄位資料（np.memmap，不會整個載入記憶體）
+        參數：
+        - name: 欄位名稱
+        """
+        values = self.maps.get(name)
+        if values is None:
+            dtype = COLUMN_TYPES[name]
+            if self.rows == 0:
+                values = np.zeros(0, dtype)
+            else:
+                values = np.memmap(
+                    os.path.join(self.root, COLUMN_PATTERN.format(name)),
+                    dtype=dtype,
+                    mode="r",
+                    shape=(self.rows,),
+                )
+            self.maps[name] = values
+        return values
+
+    def decode(self, name, code):
+        """字典編碼 → 字串"""
+        return self.dictionaries[name][code]
+
+    def mask(self, **filters):
+        """
+        依篩選條件建立布林遮罩（字串欄位比對字串，其他欄位比對數值）
+        返回：bool 陣列，或沒有條件時為 None
+        """
+        mask = None
+        for name, value in filters.items():
+            if name in STRING_COLUMNS:
+                values = self.dictionaries[name]
+                if value not in values:
+                    return np.zeros(self.rows, np.bool_)
+                value = values.index(value)
+            selected = self.column(name) == value
+            mask = selected if mask is None else mask & selected
+        return mask
+
+    def _groups(self, values, by, mask):
+        """
+        依分組欄位切分數值
+        返回：[(分組值, 該組的數值), ...]
+        """
+        if mask is not None:
+            values = values[mask]
+        if by is None:
+            return [(None, values)]
+        keys = np.asarray(self.column(by))
+        if mask is not None:
+            keys = keys[mask]
+        # 依分組排序，每組成為連續的一段
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        values = values[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)]
+        groups = []
+        for start, end in zip(starts, ends):
+            key = keys[start].item()
+            if by in STRING_COLUMNS:
+                key = self.decode(by, key)
+            groups.append((key, values[start:end]))
+        return groups
+
+    def percentiles(self, name, by=None, q=DEFAULT_PERCENTILES, **filters):
+        """
+        分組百分位數
+        參數：
+        - name: 數值欄位名稱
+        - by: 分組欄位（例如 "level"、"player"、"build"；None 表示不分組）
+        - q: 百分位數
+        - filters: 篩選條件
+        返回：{分組值: {"games": 局數, "p50": ..., ...}}
+        """
+        values = np.asarray(self.column(name))
+        result = {}
+        for key, group in self._groups(values, by, self.mask(**filters)):
+            count, percentiles = percentile_values(group, q)
+            if count == 0:
+                continue
+            stats = {"games": count}
+            for percent, value in zip(q, percentiles):
+                stats[f"p{percent:g}"] = value
+            result[key] = stats
+        return result
+
+    def level_percentiles(self, q=DEFAULT_PERCENTILES, **filters):
+        """
+        到達各等級所需時間的百分位數（等級曲線）
+        返回：{等級: {"games": 到達該等級的局數, "p50": 秒數, ...}}
+        """
+        mask = self.mask(**filters)
+        result = {}
+        for level, name in enumerate(LEVEL_COLUMNS, start=2):
+            times = np.asarray(self.column(name))
+            if mask is not None:
+                times = times[mask]
+            count, percentiles = percentile_values(times, q)
+            if count == 0:
+                continue
+            stats = {"games": count}
+            for percent, value in zip(q, percentiles):
+                stats[f"p{percent:g}"] = value
+            result[level] = stats
+        return result
+
+    def summary(self, by=None, **filters):
+        """
+        分組摘要（局數、平均分數、最高分、平均行數與每秒方塊數）
+        返回：{分組值: {...}}
+        """
+        mask = self.mask(**filters)
+        columns = {
+            name: np.asarray(self.column(name)) for name in ("score", "lines", "pps")
+        }
+        if by is None:
+            keys = np.zeros(self.rows, np.int64)
+        else:
+            keys = np.asarray(self.column(by))
+        if mask is not None:
+            keys = keys[mask]
+            columns = {name: values[mask] for name, values in columns.items()}
+
+        unique, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        totals = {
+            name: np.bincount(inverse, weights=values, minlength=len(unique))
+            for name, values in columns.items()
+        }
+        best = np.full(len(unique), np.iinfo(np.int64).min)
+        np.maximum.at(best, inverse, columns["score"])
+
+        result = {}
+        for index, key in enumerate(unique.tolist()):
+            if by is None:
+                key = None
+            elif by in STRING_COLUMNS:
+                key = self.decode(by, key)
+            games = int(counts[index])
+            result[key] = {
+                "games": games,
+                "mean_score": float(totals["score"][index] / games),
+                "best_score": int(best[index]),
+                "mean_lines": float(totals["lines"][index] / games),
+                "mean_pps": float(totals["pps"][index] / games),
+            }
+        return result
+
+
+def simulate_bot_games(root, games, seed=None, max_pieces=1000):
+    """
+    無視窗產生 AI 對局並寫入遙測資料
+    參數：
+    - root: 資料夾路徑
+    - games: 對局數
+    - seed: 第一局的種子（之後每局加一；None 表示隨機）
+    - max_pieces: 每局最多放置的方塊數（達到時視為中途結束）
+    返回：寫入的局數
+    """
+    from core.bot import BotController
+
+    writer = TelemetryWriter(root)
+    dt = 1000 // FPS
+    for game_index in range(games):
+        game_seed = None if seed is None else seed + game_index
+        game = Game(seed=game_seed, verbose=False)
+        telemetry = GameTelemetry(writer, game, player="bot")
+        controller = BotController(think_frames=0)
+        while not game.game_over and telemetry.pieces < max_pieces:
+            began = time.perf_counter()
+            game.step(*controller.next_input(game), dt)
+            telemetry.tick(dt, (time.perf_counter() - began) * 1000)
+        telemetry.finish()
+    writer.close()
+    return games
+
+
+def print_table(title, result):
+    """以文字表格輸出查詢結果"""
+    print(title)
+    for key, stats in result.items():
+        values = "  ".join(
+            f"{name}={value:,.2f}" if isinstance(value, float) else f"{name}={value:,}"
+            for name, value in stats.items()
+        )
+        print(f"  {key}: {values}")
+
+
+def main():
+    """命令列入口：產生 AI 對局或查詢遙測資料"""
+    parser = argparse.ArgumentParser(description="Tetris 遊戲遙測")
+    parser.add_argument("--db", required=True, help="資料夾路徑")
+    parser.add_argument("--simulate", type=int, default=0, help="產生的 AI 對局數")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-pieces", type=int, default=1000)
+    parser.add_argument("--query", default=None, help="百分位數查詢的欄位（例如 score、pps）")
+    parser.add_argument("--by", default=None, help="分組欄位（例如 level、player、build）")
+    parser.add_argument("--levels", action="store_true", help="顯示等級曲線百分位數")
+    parser.add_argument("--player", default=None, help="只查詢指定玩家")
+    args = parser.parse_args()
+
+    if args.simulate:
+        began = time.perf_counter()
+        simulate_bot_games(args.db, args.simulate, args.seed, args.max_pieces)
+        print(f"💾 已寫入 {args.simulate:,} 局（{time.perf_counter() - began:.1f} 秒）")
+
+    store = TelemetryStore(args.db)
+    filters = {"player": args.player} if args.player else {}
+    began = time.perf_counter()
+    if args.query:
+        result = store.percentiles(args.query, by=args.by, **filters)
+        title = f"📊 {args.query} 百分位數" + (f"（依 {args.by} 分組）" if args.by else "")
+    elif args.levels:
+        result = store.level_percentiles(**filters)
+        title = "📈 到達各等級的時間（秒）"
+    else:
+        result = store.summary(by=args.by, **filters)
+        title = f"📊 {len(store):,} 局摘要" + (f"（依 {args.by} 分組）" if args.by else "")
+    elapsed = time.perf_counter() - began
+    print_table(title, result)
+    print(f"⏱️ 查詢耗時 {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
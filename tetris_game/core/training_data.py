@@ -0,0 +1,486 @@
+"""
+訓練資料匯出模組（模仿學習用）
+記錄人類或 AI 每次鎖定方塊時的 (盤面, 方塊, Hold, 佇列, 選擇的落點, 獎勵)，
+以追加方式寫入記憶體映射的 NumPy 檔案，並以小型 JSON 索引描述所有分片
+
+檔案結構：
+    資料夾/
+        index.json              # 盤面尺寸、欄位格式與每個分片的摘要
+        game_000000.bin         # 一局遊戲一個分片：連續的固定長度紀錄（RECORD dtype）
+        game_000001.bin
+
+設計：
+- 每筆紀錄長度固定，分片只會追加，讀取時以 np.memmap 隨機存取，不需要整個載入記憶體
+- 盤面以 np.packbits 壓縮為佔用位元（10x22 的盤面只需 28 bytes）
+- 紀錄先寫入預先配置的區塊，滿了才一次寫入檔案
+- 讀取時以檔案大小決定紀錄數，寫入中斷時仍可讀取已寫入的部分
+
+無視窗產生 AI 對局資料：
+    python -m core.training_data --out data/bot --games 20
+
+需要安裝 numpy（選用依賴）：
+pip install numpy
+"""
+
+import argparse
+import bisect
+import json
+import sys
+import os
+import time
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 嘗試導入 numpy，如果失敗則在建立匯出器時提示安裝
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from core.game import Game
+from config.constants import GRID_WIDTH, GRID_HEIGHT, GRID_BUFFER_ROWS, BLACK
+from config.shapes import TETROMINO_SHAPES
+
+FORMAT_VERSION = 1
+INDEX_FILE = "index.json"
+SHARD_PATTERN = "game_{:06d}.bin"
+SHAPE_INDEX = {shape: index for index, shape in enumerate(TETROMINO_SHAPES)}
+SHAPE_NAMES = list(TETROMINO_SHAPES)
+NO_PIECE = len(SHAPE_INDEX)  # Hold 為空或佇列不足時的填充值
+DEFAULT_QUEUE_SIZE = 5  # 下一個方塊 + 方塊袋中已決定的後續方塊
+CHUNK_RECORDS = 256  # 每次寫入檔案的紀錄數
+
+
+def record_dtype(width, height, buffer_rows, queue_size=DEFAULT_QUEUE_SIZE):
+    """
+    一筆訓練紀錄的 NumPy 結構型別
+    參數：
+    - width, height, buffer_rows: 遊戲區域尺寸
+    - queue_size: 記錄的佇列長度
+    """
+    board_bytes = ((height + buffer_rows) * width + 7) // 8
+    return np.dtype(
+        [
+            ("board", np.uint8, (board_bytes,)),  # 鎖定前盤面（含緩衝區，由上到下的佔用位元）
+            ("piece", np.uint8),  # 當前方塊（SHAPE_INDEX）
+            ("hold", np.uint8),  # Hold 方塊（NO_PIECE 表示空）
+            ("queue", np.uint8, (queue_size,)),  # queue[0] 為畫面上的下一個方塊
+            ("used_hold", np.uint8),  # 這個方塊是否由 Hold 換出
+            ("x", np.int16),  # 選擇的落點（方塊矩陣左上角）
+            ("y", np.int16),
+            ("rotation", np.uint8),
+            ("lines", np.uint8),  # 消除行數
+            ("reward", np.float32),  # 鎖定造成的分數變化
+            ("move", np.uint32),  # 這局的第幾個方塊
+        ]
+    )
+
+
+def load_index(root):
+    """讀取資料夾的 JSON 索引（不存在時返回 None）"""
+    path = os.path.join(root, INDEX_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class GameRecorder:
+    """
+    單局遊戲的紀錄器類別
+    掛在 Game 的 pre_lock_listeners / lock_listeners 上，一局寫入一個分片
+    （Game.restart_game 原地重開時自動結束上一個分片並開始新的分片）
+    """
+
+    def __init__(self, writer, game, shard, source="human"):
+        """
+        初始化紀錄器
+        參數：
+        - writer: 所屬的 TrainingDataWriter
+        - game: 要記錄的 Game 物件
+        - shard: 索引中的分片資訊 dict
+        - source: 資料來源標籤（"human" 或 "bot"）
+        """
+        self.writer = writer
+        self.game = game
+        self.shard = shard
+        self.source = source
+        self.file = open(os.path.join(writer.root, shard["file"]), "ab")
+        self.grid = game.grid  # restart_game 會建立新的遊戲區域，用來偵測重開
+        self.chunk = np.zeros(CHUNK_RECORDS, writer.dtype)
+        self.pending = 0  # 區塊中尚未寫入檔案的紀錄數
+        self.board = np.zeros((writer.rows, writer.width), np.bool_)
+        self.score_before = 0
+        self.last_score = 0  # 最近一次鎖定後的分數（重開後結算上一局時使用）
+        self.last_lines = 0
+        self.closed = False
+
+        game.pre_lock_listeners.append(self._before_lock)
+        game.lock_listeners.append(self._after_lock)
+
+    def _before_lock(self, game):
+        """鎖定前：記錄盤面、方塊與佇列"""
+        if game.grid is not self.grid:
+            # 遊戲被原地重新開始：結束上一局的分片，這一局寫入新的分片
+            self._next_shard(game)
+        record = self.chunk[self.pending]
+        grid = game.grid
+        board = self.board
+        board.fill(False)
+        buffer_rows = grid.buffer_rows
+        for y in range(-buffer_rows, grid.height):
+            if grid.get_row_count(y):
+                row = grid.grid[y] if y >= 0 else grid.buffer[y]
+                board[y + buffer_rows] = [color != BLACK for color in row]
+        record["board"] = np.packbits(board, axis=None)
+
+        record["piece"] = SHAPE_INDEX[game.current_tetromino.shape_type]
+        hold = game.hold_tetromino
+        record["hold"] = SHAPE_INDEX[hold.shape_type] if hold else NO_PIECE
+        queue = [game.next_tetromino.shape_type] + game.piece_bag
+        size = self.writer.queue_size
+        record["queue"] = [
+            SHAPE_INDEX[queue[i]] if i < len(queue) else NO_PIECE for i in range(size)
+        ]
+        record["used_hold"] = not game.can_hold
+        self.score_before = game.score
+
+    def _after_lock(self, game, result):
+        """鎖定後：補上落點與獎勵，區塊滿了就寫入檔案"""
+        record = self.chunk[self.pending]
+        record["x"] = result["x"]
+        record["y"] = result["y"]
+        record["rotation"] = result["rotation"]
+        record["lines"] = result["lines"]
+        record["reward"] = game.score - self.score_before
+        record["move"] = self.shard["records"]
+        self.shard["records"] += 1
+        self.last_score = game.score
+        self.last_lines = game.lines_cleared
+        self.pending += 1
+        if self.pending == CHUNK_RECORDS:
+            self.flush()
+
+    def flush(self):
+        """將區塊中的紀錄寫入檔案"""
+        if self.pending:
+            self.chunk[: self.pending].tofile(self.file)
+            self.file.flush()
+            self.pending = 0
+
+    def _finish_shard(self, score, lines, complete):
+        """寫入剩餘紀錄、關閉分片檔案並記下這一局的結果"""
+        self.flush()
+        self.file.close()
+        self.shard["score"] = score
+        self.shard["lines"] = lines
+        self.shard["complete"] = complete
+
+    def _next_shard(self, game):
+        """結束目前的分片（未 Game Over），由寫入器開始新的分片"""
+        self._finish_shard(self.last_score, self.last_lines, False)
+        self.shard = self.writer.new_shard(game, self.source)
+        self.file = open(os.path.join(self.writer.root, self.shard["file"]), "ab")
+        self.grid = game.grid
+        self.last_score = 0
+        self.last_lines = 0
+        self.writer.write_index()
+
+    def close(self):
+        """結束這一局：寫入剩餘紀錄、移除監聽器並更新索引"""
+        if self.closed:
+            return
+        self.closed = True
+        game = self.game
+        if game.grid is self.grid:
+            self._finish_shard(game.score, game.lines_cleared, game.game_over)
+        else:
+            # 重開後還沒有鎖定任何方塊：結算上一局，新的一局沒有紀錄不開分片
+            self._finish_shard(self.last_score, self.last_lines, False)
+        if self._before_lock in game.pre_lock_listeners:
+            game.pre_lock_listeners.remove(self._before_lock)
+        if self._after_lock in game.lock_listeners:
+            game.lock_listeners.remove(self._after_lock)
+        self.writer.recorders.remove(self)
+        self.writer.write_index()
+
+
+class TrainingDataWriter:
+    """
+    訓練資料寫入器類別
+    管理一個資料夾的索引；每個 attach 的遊戲寫入自己的分片（資料夾已存在時接續追加）
+    """
+
+    def __init__(
+        self,
+        root,
+        width=GRID_WIDTH,
+        height=GRID_HEIGHT,
+        buffer_rows=GRID_BUFFER_ROWS,
+        queue_size=DEFAULT_QUEUE_SIZE,
+    ):
+        """
+        初始化寫入器
+        參數：
+        - root: 資料夾路徑（不存在時自動建立）
+        - width, height, buffer_rows: 遊戲區域尺寸（同一資料夾內必須一致）
+        - queue_size: 記錄的佇列長度
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("訓練資料匯出需要 numpy：pip install numpy")
+
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.width = width
+        self.height = height
+        self.buffer_rows = buffer_rows
+        self.rows = height + buffer_rows
+        self.queue_size = queue_size
+        self.dtype = record_dtype(width, height, buffer_rows, queue_size)
+        self.recorders = []
+
+        index = load_index(root)
+        layout = {
+            "width": width,
+            "height": height,
+            "buffer_rows": buffer_rows,
+            "queue_size": queue_size,
+        }
+        if index is None:
+            self.index = dict(
+                format=FORMAT_VERSION,
+                **layout,
+                record_bytes=self.dtype.itemsize,
+                shards=[],
+            )
+        else:
+            existing = {key: index.get(key) for key in layout}
+            if existing != layout:
+                raise ValueError(f"資料夾 {root} 的格式為 {existing}，與 {layout} 不一致")
+            self.index = index
+
+    def attach(self, game, source="human"):
+        """
+        開始記錄一局遊戲
+        參數：
+        - game: Game 物件（尺寸必須與寫入器一致）
+        - source: 資料來源標籤
+        返回：GameRecorder（遊戲結束後呼叫 close）
+        """
+        shard = self.new_shard(game, source)
+        recorder = GameRecorder(self, game, shard, source)
+        self.recorders.append(recorder)
+        return recorder
+
+    def new_shard(self, game, source="human"):
+        """
+        在索引中加入一局遊戲的分片
+        參數：
+        - game: Game 物件（尺寸必須與寫入器一致）
+        - source: 資料來源標籤
+        返回：分片資訊 dict
+        """
+        grid = game.grid
+        if (grid.width, grid.height, grid.buffer_rows) != (
+            self.width,
+            self.height,
+            self.buffer_rows,
+        ):
+            raise ValueError(
+                f"遊戲區域 {grid.width}x{grid.height}+{grid.buffer_rows} "
+                f"與資料夾格式 {self.width}x{self.height}+{self.buffer_rows} 不一致"
+            )
+
+        shards = self.index["shards"]
+        shard = {
+            "file": SHARD_PATTERN.format(len(shards)),
+            "records": 0,
+            "source": source,
+            "seed": game.seed,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "complete": False,
+        }
+        shards.append(shard)
+        return shard
+
+    def write_index(self):
+        """寫入 JSON 索引（先寫暫存檔再替換，避免中斷時留下損壞的索引）"""
+        path = os.path.join(self.root, INDEX_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, path)
+
+    def close(self):
+        """結束所有仍在記錄的遊戲"""
+        for recorder in list(self.recorders):
+            recorder.close()
+        self.write_index()
+
+
+class TrainingDataReader:
+    """
+    訓練資料讀取器類別
+    所有分片以 np.memmap 開啟（按需載入），整個資料集可用全域索引隨機存取
+    """
+
+    def __init__(self, root):
+        """
+        初始化讀取器
+        參數：
+        - root: TrainingDataWriter 寫入的資料夾
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("訓練資料讀取需要 numpy：pip install numpy")
+
+        index = load_index(root)
+        if index is None:
+            raise FileNotFoundError(f"找不到訓練資料索引：{os.path.join(root, INDEX_FILE)}")
+        self.root = root
+        self.index = index
+        self.width = index["width"]
+        self.height = index["height"]
+        self.buffer_rows = index["buffer_rows"]
+        self.rows = self.height + self.buffer_rows
+        self.dtype = record_dtype(
+            self.width, self.height, self.buffer_rows, index["queue_size"]
+        )
+
+        # 以檔案大小決定紀錄數（忽略寫入中斷造成的不完整紀錄）
+        self.shards = index["shards"]
+        self.counts = []
+        for shard in self.shards:
+            path = os.path.join(root, shard["file"])
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            self.counts.append(size // self.dtype.itemsize)
+        self.offsets = [0]
+        for count in self.counts:
+            self.offsets.append(self.offsets[-1] + count)
+        self.maps = [None] * len(self.shards)
+
+    def __len__(self):
+        """資料集的紀錄總數"""
+        return self.offsets[-1]
+
+    def shard_records(self, shard_index):
+        """
+        取得單一分片的所有紀錄（np.memmap，不會載入記憶體）
+        參數：
+        - shard_index: 分片編號
+        """
+        records = self.maps[shard_index]
+        if records is None:
+            count = self.counts[shard_index]
+            if count == 0:
+                records = np.zeros(0, self.dtype)
+            else:
+                records = np.memmap(
+                    os.path.join(self.root, self.shards[shard_index]["file"]),
+                    dtype=self.dtype,
+                    mode="r",
+                    shape=(count,),
+                )
+            self.maps[shard_index] = records
+        return records
+
+    def locate(self, index):
+        """全域索引 → (分片編號, 分片內索引)"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"紀錄索引超出範圍：{index}")
+        shard_index = bisect.bisect_right(self.offsets, index) - 1
+        return shard_index, index - self.offsets[shard_index]
+
+    def __getitem__(self, index):
+        """讀取單筆紀錄"""
+        shard_index, local = self.locate(index)
+        return self.shard_records(shard_index)[local]
+
+    def get_batch(self, indices):
+        """
+        讀取多筆紀錄（隨機抽樣訓練批次用）
+        參數：
+        - indices: 全域索引序列
+        返回：結構陣列（複製到記憶體）
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        indices = np.where(indices < 0, indices + len(self), indices)
+        if len(indices) and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError(f"紀錄索引超出範圍（共 {len(self)} 筆）")
+        batch = np.empty(len(indices), self.dtype)
+        shard_ids = np.searchsorted(self.offsets, indices, side="right") - 1
+        for shard_index in np.unique(shard_ids):
+            selected = shard_ids == shard_index
+            local = indices[selected] - self.offsets[shard_index]
+            batch[selected] = self.shard_records(shard_index)[local]
+        return batch
+
+    def unpack_boards(self, records):
+        """
+        將紀錄中的壓縮盤面展開
+        參數：
+        - records: 單筆紀錄或結構陣列
+        返回：bool 陣列，形狀為 (..., 行數, 寬度)
+        """
+        packed = np.asarray(records["board"])
+        cells = self.rows * self.width
+        boards = np.unpackbits(packed, axis=-1, count=cells).astype(np.bool_)
+        return boards.reshape(packed.shape[:-1] + (self.rows, self.width))
+
+
+def record_bot_games(root, games, seed=None, max_pieces=1000):
+    """
+    無視窗產生 AI 對局並寫入訓練資料
+    參數：
+    - root: 資料夾路徑
+    - games: 對局數
+    - seed: 第一局的種子（之後每局加一；None 表示隨機）
+    - max_pieces: 每局最多放置的方塊數
+    返回：寫入的紀錄數
+    """
+    from core.bot import BotController
+
+    writer = TrainingDataWriter(root)
+    total = 0
+    for game_index in range(games):
+        game_seed = None if seed is None else seed + game_index
+        game = Game(seed=game_seed, verbose=False)
+        recorder = writer.attach(game, source="bot")
+        controller = BotController(think_frames=0)
+        while not game.game_over and recorder.shard["records"] < max_pieces:
+            game.step(*controller.next_input(game))
+        total += recorder.shard["records"]
+        recorder.close()
+    writer.close()
+    return total
+
+
+def main():
+    """命令列入口：產生 AI 對局資料或顯示資料夾摘要"""
+    parser = argparse.ArgumentParser(description="Tetris 訓練資料匯出")
+    parser.add_argument("--out", required=True, help="資料夾路徑")
+    parser.add_argument("--games", type=int, default=0, help="產生的 AI 對局數")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-pieces", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.games:
+        began = time.perf_counter()
+        total = record_bot_games(args.out, args.games, args.seed, args.max_pieces)
+        elapsed = time.perf_counter() - began
+        print(f"💾 已寫入 {total:,} 筆紀錄（{total / max(elapsed, 1e-9):,.0f} 筆/秒）")
+
+    reader = TrainingDataReader(args.out)
+    size = len(reader) * reader.dtype.itemsize
+    print("📊 訓練資料摘要")
+    print(f"  盤面: {reader.width}x{reader.height} + {reader.buffer_rows} 緩衝行")
+    print(f"  分片: {len(reader.shards):,}")
+    print(f"  紀錄: {len(reader):,}（每筆 {reader.dtype.itemsize} bytes，共 {size / 1e6:.1f} MB）")
+
+
+if __name__ == "__main__":
+    main()
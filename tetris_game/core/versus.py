@@ -0,0 +1,357 @@
+"""
+對戰模式核心邏輯
+在多個 Game 之間交換垃圾行：攻擊表由 Game.calculate_score 的鎖定結果
+（T-spin、Back-to-back、Combo、Perfect Clear）推導，並支援垃圾佇列與抵銷
+
+VersusMatch 只依賴輸入遮罩與隨機種子，相同的輸入序列必定產生相同的結果，
+因此可以直接用於本地對戰、網路對戰伺服器與重播
+"""
+
+import random
+
+from core.game import Game
+from config.constants import GRID_WIDTH, GRID_HEIGHT, GRID_BUFFER_ROWS
+
+# ============================
+# 攻擊表（送出的垃圾行數）
+# ============================
+LINE_CLEAR_ATTACK = {0: 0, 1: 0, 2: 1, 3: 2, 4: 4}
+TSPIN_ATTACK = {0: 0, 1: 2, 2: 4, 3: 6}
+TSPIN_MINI_ATTACK = {0: 0, 1: 0, 2: 1}
+BACK_TO_BACK_BONUS = 1
+PERFECT_CLEAR_ATTACK = 10
+# Combo 加成（索引為 combo 次數 - 1，超過表長使用最後一個值）
+COMBO_ATTACK = [0, 0, 1, 1, 1, 2, 2, 3, 3, 4, 4, 4, 5]
+
+# ============================
+# 垃圾行設定
+# ============================
+GARBAGE_DELAY_FRAMES = 20  # 攻擊送達後延遲多少幀才能進場（可被抵銷的時間窗）
+GARBAGE_CAP_PER_LOCK = 8  # 每次鎖定最多進場的垃圾行數
+
+# 快照需要保存的玩家狀態
+PLAYER_SNAPSHOT_FIELDS = (
+    "attack_sent",
+    "garbage_received",
+    "pending_attack",
+    "lock_happened",
+    "cleared_lines",
+    "knocked_out_frame",
+    "last_attacker",
+    "knockouts",
+)
+
+
+def calculate_attack(result):
+    """
+    根據鎖定結果計算攻擊行數
+    參數：
+    - result: Game.last_lock_result
+    返回：攻擊行數
+    """
+    lines = result["lines"]
+    if lines == 0:
+        return 0
+
+    if result["t_spin"] == "mini":
+        attack = TSPIN_MINI_ATTACK.get(lines, 0)
+    elif result["t_spin"] == "tspin":
+        attack = TSPIN_ATTACK.get(lines, 0)
+    else:
+        attack = LINE_CLEAR_ATTACK.get(lines, lines)
+
+    if result["back_to_back"]:
+        attack += BACK_TO_BACK_BONUS
+
+    combo = result["combo"]
+    if combo > 0:
+        attack += COMBO_ATTACK[min(combo - 1, len(COMBO_ATTACK) - 1)]
+
+    if result["perfect_clear"]:
+        attack += PERFECT_CLEAR_ATTACK
+
+    return attack
+
+
+class GarbageQueue:
+    """垃圾行佇列類別（等待進場的攻擊）"""
+
+    def __init__(self):
+        """初始化佇列"""
+        # 每筆攻擊：[行數, 缺口欄位, 剩餘延遲幀數]
+        self.entries = []
+
+    def total(self):
+        """佇列中的垃圾總行數"""
+        return sum(entry[0] for entry in self.entries)
+
+    def push(self, lines, hole, delay=GARBAGE_DELAY_FRAMES):
+        """加入一筆攻擊"""
+        if lines > 0:
+            self.entries.append([lines, hole, delay])
+
+    def cancel(self, attack):
+        """
+        用自己的攻擊抵銷佇列中的垃圾（先進先抵銷）
+        返回：抵銷後剩餘、需要送出的攻擊行數
+        """
+        while attack > 0 and self.entries:
+            entry = self.entries[0]
+            used = min(attack, entry[0])
+            entry[0] -= used
+            attack -= used
+            if entry[0] == 0:
+                self.entries.pop(0)
+        return attack
+
+    def tick(self):
+        """推進一幀（減少延遲計時）"""
+        for entry in self.entries:
+            if entry[2] > 0:
+                entry[2] -= 1
+
+    def pop_ready(self, cap=GARBAGE_CAP_PER_LOCK):
+        """
+        取出已可進場的垃圾行
+        返回：每一行的缺口欄位列表
+        """
+        holes = []
+        while self.entries and self.entries[0][2] <= 0 and len(holes) < cap:
+            entry = self.entries[0]
+            count = min(entry[0], cap - len(holes))
+            holes.extend([entry[1]] * count)
+            entry[0] -= count
+            if entry[0] == 0:
+                self.entries.pop(0)
+        return holes
+
+    def copy(self):
+        """複製佇列（快照用）"""
+        queue = GarbageQueue()
+        queue.entries = [list(entry) for entry in self.entries]
+        return queue
+
+
+class VersusPlayer:
+    """對戰玩家類別（一個 Game 加上垃圾佇列與統計）"""
+
+    def __init__(self, index, game, name=None):
+        """
+        初始化玩家
+        參數：
+        - index: 玩家編號
+        - game: Game 物件
+        - name: 顯示名稱
+        """
+        self.index = index
+        self.game = game
+        self.name = name or f"P{index + 1}"
+        self.garbage = GarbageQueue()
+        self.attack_sent = 0  # 累計送出的攻擊
+        self.garbage_received = 0  # 累計進場的垃圾行
+        self.pending_attack = 0  # 本幀鎖定產生、尚未分配的攻擊
+        self.lock_happened = False  # 本幀是否鎖定了方塊
+        self.cleared_lines = False  # 本幀鎖定是否有消行
+        self.knocked_out_frame = None  # 被擊倒的幀數
+        self.last_attacker = None  # 最後攻擊自己的玩家編號（擊倒歸屬）
+        self.knockouts = 0  # 擊倒數
+
+        game.lock_listeners.append(self._on_lock)
+
+    @property
+    def alive(self):
+        """玩家是否仍存活"""
+        return not self.game.game_over
+
+    def _on_lock(self, game, result):
+        """方塊鎖定時記錄攻擊（在 Game.lock_piece 中呼叫）"""
+        self.lock_happened = True
+        self.cleared_lines = result["lines"] > 0
+        self.pending_attack += calculate_attack(result)
+
+
+class VersusMatch:
+    """
+    對戰比賽類別
+    所有玩家使用相同的種子（相同的方塊序列），每次 step 推進一幀
+    """
+
+    def __init__(
+        self,
+        player_count=2,
+        seed=None,
+        width=GRID_WIDTH,
+        height=GRID_HEIGHT,
+        buffer_rows=GRID_BUFFER_ROWS,
+        names=None,
+    ):
+        """
+        初始化比賽
+        參數：
+        - player_count: 玩家人數
+        - seed: 比賽種子（None 則隨機產生）
+        - width, height, buffer_rows: 遊戲區域尺寸
+        - names: 玩家名稱列表
+        """
+        if player_count < 2:
+            raise ValueError("對戰至少需要 2 名玩家")
+
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # 垃圾缺口與目標選擇使用獨立的隨機數產生器，確保可重現
+        self.rng = random.Random(self.seed ^ 0x5EED)
+        self.rng_state = None  # rng 狀態快取（只有送出攻擊時才會改變）
+        self.frame = 0
+        self.winner = None
+        self.finished = False
+        self.players = [
+            VersusPlayer(
+                index,
+                Game(width, height, buffer_rows, seed=self.seed, verbose=False),
+                names[index] if names else None,
+            )
+            for index in range(player_count)
+        ]
+
+    def alive_players(self):
+        """獲取仍存活的玩家"""
+        return [player for player in self.players if player.alive]
+
+    def choose_target(self, attacker):
+        """
+        選擇攻擊目標（兩人對戰時為對手；多人時隨機選擇存活的其他玩家）
+        參數：
+        - attacker: VersusPlayer
+        """
+        candidates = [
+            player
+            for player in self.players
+            if player is not attacker and player.alive
+        ]
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+        return candidates[self.rng.randrange(len(candidates))]
+
+    def send_attack(self, attacker, lines):
+        """
+        送出攻擊：先抵銷自己佇列中的垃圾，剩餘的送給目標
+        參數：
+        - attacker: VersusPlayer
+        - lines: 攻擊行數
+        """
+        remaining = attacker.garbage.cancel(lines)
+        if remaining <= 0:
+            return
+        self.rng_state = None
+        target = self.choose_target(attacker)
+        if target is None:
+            return
+        hole = self.rng.randrange(target.game.grid.width)
+        target.garbage.push(remaining, hole)
+        target.last_attacker = attacker.index
+        attacker.attack_sent += remaining
+
+    def step(self, inputs):
+        """
+        推進一幀
+        參數：
+        - inputs: 每位玩家的 (held, pressed) 輸入遮罩列表
+        返回：True 如果比賽在這一幀結束
+        """
+        if self.finished:
+            return False
+
+        for player, (held, pressed) in zip(self.players, inputs):
+            if not player.alive:
+                continue
+            player.lock_happened = False
+            player.game.step(held, pressed)
+
+        # 依玩家順序分配攻擊並處理垃圾進場（固定順序以確保可重現）
+        for player in self.players:
+            if player.pending_attack:
+                attack = player.pending_attack
+                player.pending_attack = 0
+                self.send_attack(player, attack)
+
+        for player in self.players:
+            player.garbage.tick()
+            if not player.alive:
+                continue
+            # 垃圾在沒有消行的鎖定之後進場
+            if player.lock_happened and not player.cleared_lines:
+                holes = player.garbage.pop_ready()
+                if holes:
+                    player.garbage_received += len(holes)
+                    player.game.receive_garbage(holes)
+
+        self.frame += 1
+        return self._check_finished()
+
+    def _check_finished(self):
+        """檢查比賽是否結束（只剩一名玩家存活）"""
+        for player in self.players:
+            if not player.alive and player.knocked_out_frame is None:
+                player.knocked_out_frame = self.frame
+                if player.last_attacker is not None:
+                    self.players[player.last_attacker].knockouts += 1
+
+        alive = self.alive_players()
+        if len(alive) <= 1:
+            self.finished = True
+            self.winner = alive[0].index if alive else None
+            return True
+        return False
+
+    def snapshot(self):
+        """
+        建立整場比賽的快照（所有玩家的遊戲狀態、垃圾佇列與統計）
+        返回：可傳給 restore 的 tuple
+        """
+        if self.rng_state is None:
+            self.rng_state = self.rng.getstate()
+        return (
+            self.frame,
+            self.winner,
+            self.finished,
+            self.rng_state,
+            tuple(
+                (
+                    player.game.snapshot(),
+                    [list(entry) for entry in player.garbage.entries],
+                    tuple(getattr(player, name) for name in PLAYER_SNAPSHOT_FIELDS),
+                )
+                for player in self.players
+            ),
+        )
+
+    def restore(self, state):
+        """
+        還原比賽快照（就地還原，鎖定監聽器與物件參照保持不變）
+        參數：
+        - state: snapshot() 返回的 tuple
+        """
+        self.frame, self.winner, self.finished, rng_state, players = state
+        if rng_state is not self.rng_state:
+            self.rng.setstate(rng_state)
+            self.rng_state = rng_state
+        for player, (game_state, entries, values) in zip(self.players, players):
+            player.game.restore(game_state)
+            player.garbage.entries = [list(entry) for entry in entries]
+            for name, value in zip(PLAYER_SNAPSHOT_FIELDS, values):
+                setattr(player, name, value)
+
+    def checksum(self):
+        """
+        比賽狀態的簡易校驗值（用於確認伺服器與客戶端模擬一致）
+        """
+        value = self.frame
+        for player in self.players:
+            game = player.game
+            value = (value * 31 + game.score) & 0xFFFFFFFF
+            value = (value * 31 + game.grid.filled_cells) & 0xFFFFFFFF
+            value = (value * 31 + game.current_tetromino.x) & 0xFFFFFFFF
+            value = (value * 31 + game.current_tetromino.y + 64) & 0xFFFFFFFF
+            value = (value * 31 + player.garbage.total()) & 0xFFFFFFFF
+        return value
@@ -4,5 +4,6 @@
 
 from .tetromino import Tetromino
 from .grid import GameGrid
+from .bitboard import BitBoard
 
-__all__ = ["Tetromino", "GameGrid"]
+__all__ = ["Tetromino", "GameGrid", "BitBoard"]
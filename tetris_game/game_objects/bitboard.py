@@ -0,0 +1,171 @@
+"""
+位元棋盤物件類別
+以每行一個整數位元遮罩表示遊戲區域，提供 AI 搜尋用的快速碰撞、落點與消行計算
+
+座標與 GameGrid 相同：第 0 行為可見區域頂部，負數行為隱藏緩衝區
+第 x 欄對應位元 (1 << x)
+"""
+
+from config.constants import BLACK
+from config.shapes import TETROMINO_BLOCKS
+
+# 預先計算每種形狀與旋轉的位元遮罩
+# PIECE_MASKS[形狀][旋轉] = (最小欄, 最大欄, ((row, mask), ...))
+PIECE_MASKS = {}
+for _shape_type, _rotations in TETROMINO_BLOCKS.items():
+    PIECE_MASKS[_shape_type] = []
+    for _blocks in _rotations:
+        _rows = {}
+        for _col, _row in _blocks:
+            _rows[_row] = _rows.get(_row, 0) | (1 << _col)
+        PIECE_MASKS[_shape_type].append(
+            (
+                min(col for col, _ in _blocks),
+                max(col for col, _ in _blocks),
+                tuple(sorted(_rows.items())),
+            )
+        )
+
+
+class BitBoard:
+    """位元棋盤物件類別"""
+
+    __slots__ = ("width", "height", "buffer_rows", "rows", "full_mask")
+
+    def __init__(self, width, height, buffer_rows=0, rows=None):
+        """
+        初始化位元棋盤
+        參數：
+        - width: 寬度
+        - height: 可見高度
+        - buffer_rows: 隱藏緩衝行數
+        - rows: 每行的位元遮罩（由上到下，含緩衝區）；None 表示空棋盤
+        """
+        self.width = width
+        self.height = height
+        self.buffer_rows = buffer_rows
+        self.full_mask = (1 << width) - 1
+        self.rows = list(rows) if rows is not None else [0] * (height + buffer_rows)
+
+    @classmethod
+    def from_grid(cls, grid):
+        """從 GameGrid 建立位元棋盤"""
+        rows = []
+        for row in grid.buffer + grid.grid:
+            mask = 0
+            for x, color in enumerate(row):
+                if color != BLACK:
+                    mask |= 1 << x
+            rows.append(mask)
+        return cls(grid.width, grid.height, grid.buffer_rows, rows)
+
+    def copy(self):
+        """複製棋盤"""
+        return BitBoard(self.width, self.height, self.buffer_rows, self.rows)
+
+    def key(self):
+        """可雜湊的棋盤鍵值（用於記憶化搜尋）"""
+        return tuple(self.rows)
+
+    def row_mask(self, y):
+        """獲取指定行的遮罩（緩衝區以上為空，地板以下為全滿）"""
+        index = y + self.buffer_rows
+        if index < 0:
+            return 0
+        if y >= self.height:
+            return self.full_mask
+        return self.rows[index]
+
+    def collides(self, shape_type, rotation, x, y):
+        """
+        檢查方塊在 (x, y) 是否與牆壁、地板或已放置方塊碰撞
+        參數：
+        - shape_type: 方塊類型
+        - rotation: 旋轉狀態
+        - x, y: 方塊 4x4 矩陣左上角位置
+        """
+        min_col, max_col, piece_rows = PIECE_MASKS[shape_type][rotation]
+        if x + min_col < 0 or x + max_col >= self.width:
+            return True
+        for row, mask in piece_rows:
+            target_y = y + row
+            if target_y >= self.height:
+                return True
+            index = target_y + self.buffer_rows
+            if index >= 0 and self.rows[index] & (mask << x if x >= 0 else mask >> -x):
+                return True
+        return False
+
+    def drop_y(self, shape_type, rotation, x, y):
+        """計算方塊從 (x, y) 直落後的 Y 位置（假設起始位置合法）"""
+        # 水平位置固定，預先位移方塊遮罩，之後只需逐行比對
+        _, _, piece_rows = PIECE_MASKS[shape_type][rotation]
+        offset = self.buffer_rows
+        shifted = [
+            (row + offset, mask << x if x >= 0 else mask >> -x)
+            for row, mask in piece_rows
+        ]
+        rows = self.rows
+        limit = len(rows)
+        while True:
+            next_y = y + 1
+            for row, mask in shifted:
+                index = next_y + row
+                if index >= limit or (index >= 0 and rows[index] & mask):
+                    return y
+            y = next_y
+
+    def place(self, shape_type, rotation, x, y):
+        """
+        放置方塊並消除填滿的行（原地修改）
+        返回：消除的行數
+        """
+        _, _, piece_rows = PIECE_MASKS[shape_type][rotation]
+        touched = []
+        for row, mask in piece_rows:
+            index = y + row + self.buffer_rows
+            if index >= 0:
+                self.rows[index] |= mask << x if x >= 0 else mask >> -x
+                touched.append(index)
+
+        cleared = 0
+        for index in sorted(touched):
+            if self.rows[index] == self.full_mask:
+                del self.rows[index]
+                self.rows.insert(0, 0)
+                cleared += 1
+        return cleared
+
+    def column_heights(self):
+        """獲取每欄的高度（從可見區域底部算起）"""
+        heights = [0] * self.width
+        remaining = self.full_mask
+        total_rows = len(self.rows)
+        for index, mask in enumerate(self.rows):
+            found = mask & remaining
+            if found:
+                height = total_rows - index
+                for x in range(self.width):
+                    if found & (1 << x):
+                        heights[x] = height
+                remaining &= ~found
+                if not remaining:
+                    break
+        return heights
+
+    def count_holes(self):
+        """計算被上方方塊覆蓋的空洞數"""
+        holes = 0
+        covered = 0
+        for mask in self.rows:
+            holes += bin(covered & ~mask).count("1")
+            covered |= mask
+        return holes
+
+    def filled_cells(self):
+        """計算已填充格數"""
+        return sum(bin(mask).count("1") for mask in self.rows)
+
+    def is_empty(self):
+        """檢查棋盤是否全空（Perfect Clear）"""
+        return not any(self.rows)
@@ -1,36 +1,124 @@
 """
 遊戲區域物件類別
 管理遊戲網格、方塊放置、行消除等邏輯
+
+座標系統：
+- 可見區域為第 0 ~ height-1 行（與舊版相同，self.grid 只保存可見行）
+- 隱藏緩衝區為第 -buffer_rows ~ -1 行（現代規則的出生緩衝區），保存在 self.buffer
+- 緩衝區以上的位置視為空白（與舊版 y < 0 的處理方式一致）
+
+效能設計：
+- 碰撞檢測只走訪方塊的 4 個格子
+- 每行維護已填充格數（row_counts），消行只檢查方塊所在的行
+- 維護總填充格數與每行格數，Perfect Clear 與頂出檢測為 O(1)
 """
 
 import pygame
 from config.constants import (
     BLACK,
     WHITE,
+    GRAY,
     CELL_SIZE,
     GRID_X,
     GRID_Y,
-    GRID_WIDTH,
-    GRID_HEIGHT,
     GRID_COLOR,
+    GRID_BUFFER_ROWS,
+    MIN_GRID_WIDTH,
+    MIN_GRID_HEIGHT,
 )
+from config.shapes import TETROMINO_BLOCKS
 
 
 class GameGrid:
     """遊戲區域物件類別"""
 
-    def __init__(self, width, height):
+    def __init__(self, width, height, buffer_rows=GRID_BUFFER_ROWS):
         """
         初始化遊戲區域
         參數：
         - width: 遊戲區域寬度
-        - height: 遊戲區域高度
+        - height: 遊戲區域高度（可見行數）
+        - buffer_rows: 可見區域上方的隱藏緩衝行數
         """
+        if width < MIN_GRID_WIDTH or height < MIN_GRID_HEIGHT:
+            raise ValueError(
+                f"遊戲區域至少需要 {MIN_GRID_WIDTH}x{MIN_GRID_HEIGHT}，收到 {width}x{height}"
+            )
+        if buffer_rows < 0:
+            raise ValueError(f"緩衝行數不可為負數：{buffer_rows}")
+
         self.width = width
         self.height = height
+        self.buffer_rows = buffer_rows
         self.grid = [[BLACK for _ in range(width)] for _ in range(height)]
+        self.buffer = [[BLACK for _ in range(width)] for _ in range(buffer_rows)]
+
+        # 每行已填充格數（與 grid / buffer 一一對應）
+        self.row_counts = [0] * height
+        self.buffer_counts = [0] * buffer_rows
+        self.filled_cells = 0  # 整個區域（含緩衝區）的已填充格數
+
+        # 最近一次 check_lines 消除的行（消除前的行索引，由上到下）
         self.filled_rows = []
 
+        # 內容版本號（每次放置、消行或推入垃圾行時遞增，供繪製快取判斷是否需要重繪）
+        self.version = 0
+
+    def _row(self, y):
+        """
+        取得指定行的格子列表
+        負數 y 透過 Python 的負索引直接對應到緩衝區（-1 為緩衝區最底行）
+        """
+        return self.grid[y] if y >= 0 else self.buffer[y]
+
+    def is_occupied(self, x, y):
+        """
+        檢查指定格子是否被佔用（牆壁與地板視為佔用，緩衝區以上視為空白）
+        參數：
+        - x: X 位置
+        - y: Y 位置
+        返回：True 如果被佔用
+        """
+        if x < 0 or x >= self.width or y >= self.height:
+            return True
+        if y < -self.buffer_rows:
+            return False
+        return self._row(y)[x] != BLACK
+
+    def get_cell(self, x, y):
+        """
+        獲取指定格子的顏色（超出範圍時返回 BLACK）
+        參數：
+        - x: X 位置
+        - y: Y 位置
+        """
+        if x < 0 or x >= self.width or y >= self.height or y < -self.buffer_rows:
+            return BLACK
+        return self._row(y)[x]
+
+    def get_row_count(self, y):
+        """獲取指定行的已填充格數"""
+        return self.row_counts[y] if y >= 0 else self.buffer_counts[y]
+
+    def _blocks_valid(self, blocks, x, y):
+        """檢查一組格子偏移在 (x, y) 是否合法（只走訪方塊本身的格子）"""
+        width = self.width
+        height = self.height
+        top = -self.buffer_rows
+        for col, row in blocks:
+            new_x = x + col
+            new_y = y + row
+
+            # 檢查邊界
+            if new_x < 0 or new_x >= width or new_y >= height:
+                return False
+
+            # 檢查是否與已放置的方塊重疊
+            if new_y >= top and self._row(new_y)[new_x] != BLACK:
+                return False
+
+        return True
+
     def is_valid_position(self, tetromino, offset_x=0, offset_y=0):
         """
         檢查方塊位置是否合法
@@ -40,22 +128,11 @@ class GameGrid:
         - offset_y: Y 軸偏移量
         返回：True 如果位置合法，False 如果不合法
         """
-        shape = tetromino.get_current_shape()
-        for row_idx, row in enumerate(shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    new_x = tetromino.x + col_idx + offset_x
-                    new_y = tetromino.y + row_idx + offset_y
-
-                    # 檢查邊界
-                    if new_x < 0 or new_x >= self.width or new_y >= self.height:
-                        return False
-
-                    # 檢查是否與已放置的方塊重疊
-                    if new_y >= 0 and self.grid[new_y][new_x] != BLACK:
-                        return False
-
-        return True
+        return self._blocks_valid(
+            TETROMINO_BLOCKS[tetromino.shape_type][tetromino.rotation],
+            tetromino.x + offset_x,
+            tetromino.y + offset_y,
+        )
 
     def is_valid_position_at(self, shape, x, y):
         """
@@ -66,102 +143,206 @@ class GameGrid:
         - y: Y 位置
         返回：True 如果位置合法，False 如果不合法
         """
-        for row_idx, row in enumerate(shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    new_x = x + col_idx
-                    new_y = y + row_idx
-
-                    # 檢查邊界
-                    if new_x < 0 or new_x >= self.width or new_y >= self.height:
-                        return False
-
-                    # 檢查是否與已放置的方塊重疊
-                    if new_y >= 0 and self.grid[new_y][new_x] != BLACK:
-                        return False
-
-        return True
+        blocks = [
+            (col_idx, row_idx)
+            for row_idx, row in enumerate(shape)
+            for col_idx, cell in enumerate(row)
+            if cell
+        ]
+        return self._blocks_valid(blocks, x, y)
 
     def place_tetromino(self, tetromino):
         """
         將方塊放置到遊戲區域
         參數：
         - tetromino: Tetromino 物件
+        返回：方塊所佔據的行（由上到下，去除重複）
         """
-        blocks = tetromino.get_blocks()
-        for x, y in blocks:
-            if y >= 0:  # 只放置在可見區域內
-                self.grid[y][x] = tetromino.color
-
-    def check_lines(self):
-        """檢查並消除填滿的行"""
-        lines_cleared = 0
-        y = self.height - 1
-
-        while y >= 0:
-            if all(cell != BLACK for cell in self.grid[y]):
-                # 找到完整的行，清除它
-                self.clear_line(y)
-                lines_cleared += 1
-            else:
-                y -= 1
+        self.version += 1
+        touched_rows = []
+        top = -self.buffer_rows
+        for x, y in tetromino.get_blocks():
+            if y >= top:  # 只放置在可見區域與緩衝區內
+                row = self._row(y)
+                if row[x] == BLACK:
+                    self.filled_cells += 1
+                    if y >= 0:
+                        self.row_counts[y] += 1
+                    else:
+                        self.buffer_counts[y] += 1
+                row[x] = tetromino.color
+                if y not in touched_rows:
+                    touched_rows.append(y)
+        touched_rows.sort()
+        return touched_rows
+
+    def check_lines(self, rows=None):
+        """
+        檢查並消除填滿的行
+        參數：
+        - rows: 需要檢查的行（通常為剛放置方塊所佔的行）；None 表示檢查整個區域
+        返回：消除的行數（被消除的行索引記錄在 self.filled_rows）
+        """
+        if rows is None:
+            rows = range(-self.buffer_rows, self.height)
+
+        full_rows = sorted(
+            y
+            for y in set(rows)
+            if -self.buffer_rows <= y < self.height
+            and self.get_row_count(y) == self.width
+        )
+        self.filled_rows = full_rows
 
-        return lines_cleared
+        # 由上往下消除：上方的行下移不會影響下方尚未處理的行索引
+        for y in full_rows:
+            self.clear_line(y)
+
+        return len(full_rows)
 
     def is_perfect_clear(self):
         """檢查是否為 Perfect Clear (All Clear)"""
-        return all(all(cell == BLACK for cell in row) for row in self.grid)
+        return self.filled_cells == 0
 
     def clear_line(self, row):
         """
         清除指定行
         參數：
-        - row: 要清除的行索引
+        - row: 要清除的行索引（可為負數表示緩衝區）
         """
-        # 刪除指定行
-        del self.grid[row]
+        self.filled_cells -= self.get_row_count(row)
+
+        # 刪除指定行，並讓上方所有行下移一格
+        if row >= 0:
+            del self.grid[row]
+            del self.row_counts[row]
+            if self.buffer_rows:
+                # 緩衝區最底行移入可見區域頂部
+                self.grid.insert(0, self.buffer.pop())
+                self.row_counts.insert(0, self.buffer_counts.pop())
+            else:
+                self.grid.insert(0, [BLACK for _ in range(self.width)])
+                self.row_counts.insert(0, 0)
+                return
+        else:
+            del self.buffer[row]
+            del self.buffer_counts[row]
+
         # 在頂部添加新的空白行
-        self.grid.insert(0, [BLACK for _ in range(self.width)])
+        self.buffer.insert(0, [BLACK for _ in range(self.width)])
+        self.buffer_counts.insert(0, 0)
 
-    def is_game_over(self):
-        """檢查遊戲是否結束"""
-        # 如果第一行有方塊，遊戲結束
-        return any(cell != BLACK for cell in self.grid[0])
+    def add_garbage_rows(self, hole_columns, color=GRAY):
+        """
+        從底部推入垃圾行（對戰模式），整個區域往上移
+        參數：
+        - hole_columns: 每一行垃圾的缺口欄位（由上到下）
+        - color: 垃圾方塊顏色
+        返回：True 如果有方塊被推出區域頂部（溢出）
+        """
+        self.version += 1
+        overflow = False
+        for hole in hole_columns:
+            # 最頂部的行被推出區域
+            if self.buffer_rows:
+                top_count = self.buffer_counts.pop(0)
+                self.buffer.pop(0)
+                self.buffer.append(self.grid.pop(0))
+                self.buffer_counts.append(self.row_counts.pop(0))
+            else:
+                top_count = self.row_counts.pop(0)
+                self.grid.pop(0)
+            if top_count:
+                overflow = True
+                self.filled_cells -= top_count
+
+            # 底部加入一行只有一個缺口的垃圾
+            row = [color for _ in range(self.width)]
+            row[hole % self.width] = BLACK
+            self.grid.append(row)
+            self.row_counts.append(self.width - 1)
+            self.filled_cells += self.width - 1
+
+        return overflow
+
+    def snapshot(self):
+        """
+        建立遊戲區域快照（rollback 網路同步使用）
+        返回：可傳給 restore 的 tuple
+        """
+        return (
+            [row[:] for row in self.grid],
+            [row[:] for row in self.buffer],
+            self.row_counts[:],
+            self.buffer_counts[:],
+            self.filled_cells,
+            self.filled_rows,
+        )
+
+    def restore(self, state):
+        """
+        還原遊戲區域快照（快照本身保持不變，可重複還原）
+        參數：
+        - state: snapshot() 返回的 tuple
+        """
+        grid, buffer, row_counts, buffer_counts, filled_cells, filled_rows = state
+        self.grid = [row[:] for row in grid]
+        self.buffer = [row[:] for row in buffer]
+        self.row_counts = row_counts[:]
+        self.buffer_counts = buffer_counts[:]
+        self.filled_cells = filled_cells
+        self.filled_rows = filled_rows
+        self.version += 1
+
+    def is_game_over(self, tetromino=None):
+        """
+        檢查是否頂出（Game 以同一規則判斷遊戲結束）
+        - 鎖定頂出：隱藏緩衝區內有已放置的格子（方塊鎖定在可見區域上方，或被垃圾行推入緩衝區）
+        - 出生頂出：剛出生的方塊與已放置的格子重疊
+        參數：
+        - tetromino: 剛出生的方塊（None 表示只檢查鎖定頂出）
+        """
+        if self.buffer_rows and any(self.buffer_counts):
+            return True
+        return tetromino is not None and not self.is_valid_position(tetromino)
 
-    def draw(self, screen, offset_x=0, offset_y=0):
+    def draw(self, screen, offset_x=0, offset_y=0, cell_size=CELL_SIZE):
         """
-        繪製遊戲區域和已放置的方塊
+        繪製遊戲區域和已放置的方塊（只繪製可見區域）
         參數：
         - screen: pygame 螢幕物件
         - offset_x: X 軸偏移量
         - offset_y: Y 軸偏移量
+        - cell_size: 每個格子的像素大小
         """
         # 使用偏移量或默認的 GRID_X, GRID_Y
         grid_x = GRID_X if offset_x == 0 else offset_x
         grid_y = GRID_Y if offset_y == 0 else offset_y
 
-        # 繪製已放置的方塊
+        # 繪製已放置的方塊（跳過空行）
         for row_idx, row in enumerate(self.grid):
+            if not self.row_counts[row_idx]:
+                continue
             for col_idx, color in enumerate(row):
                 if color != BLACK:
-                    x = grid_x + col_idx * CELL_SIZE
-                    y = grid_y + row_idx * CELL_SIZE
-                    pygame.draw.rect(screen, color, (x, y, CELL_SIZE, CELL_SIZE))
-                    pygame.draw.rect(screen, WHITE, (x, y, CELL_SIZE, CELL_SIZE), 1)
+                    x = grid_x + col_idx * cell_size
+                    y = grid_y + row_idx * cell_size
+                    pygame.draw.rect(screen, color, (x, y, cell_size, cell_size))
+                    pygame.draw.rect(screen, WHITE, (x, y, cell_size, cell_size), 1)
 
         # 繪製網格線
-        for x in range(GRID_WIDTH + 1):
+        for x in range(self.width + 1):
             pygame.draw.line(
                 screen,
                 GRID_COLOR,
-                (grid_x + x * CELL_SIZE, grid_y),
-                (grid_x + x * CELL_SIZE, grid_y + GRID_HEIGHT * CELL_SIZE),
+                (grid_x + x * cell_size, grid_y),
+                (grid_x + x * cell_size, grid_y + self.height * cell_size),
             )
 
-        for y in range(GRID_HEIGHT + 1):
+        for y in range(self.height + 1):
             pygame.draw.line(
                 screen,
                 GRID_COLOR,
-                (grid_x, grid_y + y * CELL_SIZE),
-                (grid_x + GRID_WIDTH * CELL_SIZE, grid_y + y * CELL_SIZE),
+                (grid_x, grid_y + y * cell_size),
+                (grid_x + self.width * cell_size, grid_y + y * cell_size),
             )
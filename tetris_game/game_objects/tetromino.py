@@ -4,23 +4,37 @@ Tetromino 四格方塊物件類別
 """
 
 from config.constants import GRID_WIDTH, TETROMINO_COLORS
-from config.shapes import TETROMINO_SHAPES, SHAPE_COLORS
+from config.shapes import TETROMINO_SHAPES, TETROMINO_BLOCKS, SHAPE_COLORS
 
 
 class Tetromino:
     """四格方塊物件類別"""
 
-    def __init__(self, shape_type):
+    def __init__(self, shape_type, grid_width=GRID_WIDTH, buffer_rows=0):
         """
         初始化 Tetromino 物件
         參數：
         - shape_type: 方塊類型 (I, O, T, S, Z, J, L)
+        - grid_width: 遊戲區域寬度（決定出生的 X 位置）
+        - buffer_rows: 遊戲區域的隱藏緩衝行數（決定出生的 Y 位置）
         """
         self.shape_type = shape_type
         self.shapes = TETROMINO_SHAPES[shape_type]
         self.color = TETROMINO_COLORS[SHAPE_COLORS[shape_type]]
-        self.x = GRID_WIDTH // 2 - 2  # 方塊在遊戲區域中的 X 位置
-        self.y = -1 if shape_type == "I" else 0  # I 方塊稍微高一點出現
+        self.grid_width = grid_width
+        self.buffer_rows = buffer_rows
+        self.reset_position()
+
+    def reset_position(self):
+        """
+        將方塊重置到出生位置與初始旋轉狀態
+        沒有緩衝區時方塊頂端在可見區域第 0 行出生；
+        有緩衝區時往上移到緩衝區內（現代規則），方塊底部在第 -1 行，緩衝行數不足時盡量上移
+        """
+        rows = [row for _, row in TETROMINO_BLOCKS[self.shape_type][0]]
+        piece_height = max(rows) - min(rows) + 1
+        self.x = self.grid_width // 2 - 2  # 方塊在遊戲區域中的 X 位置
+        self.y = -min(rows) - min(self.buffer_rows, piece_height)
         self.rotation = 0  # 當前旋轉狀態（0-3）
 
     def get_rotation_center(self):
@@ -77,13 +91,10 @@ class Tetromino:
 
     def get_blocks(self):
         """獲取方塊所佔據的所有格子位置"""
-        blocks = []
-        shape = self.get_current_shape()
-        for row_idx, row in enumerate(shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    blocks.append((self.x + col_idx, self.y + row_idx))
-        return blocks
+        return [
+            (self.x + col, self.y + row)
+            for col, row in TETROMINO_BLOCKS[self.shape_type][self.rotation]
+        ]
 
     def get_ghost_blocks(self, grid):
         """
@@ -92,10 +103,7 @@ class Tetromino:
         - grid: GameGrid 物件
         返回：幽靈方塊的所有格子位置
         """
-        ghost_tetromino = Tetromino(self.shape_type)
-        ghost_tetromino.x = self.x
-        ghost_tetromino.y = self.y
-        ghost_tetromino.rotation = self.rotation
+        ghost_tetromino = self.copy()
 
         # 向下移動直到碰撞
         while grid.is_valid_position(ghost_tetromino, 0, 1):
@@ -105,7 +113,7 @@ class Tetromino:
 
     def copy(self):
         """創建方塊的副本"""
-        new_tetromino = Tetromino(self.shape_type)
+        new_tetromino = Tetromino(self.shape_type, self.grid_width, self.buffer_rows)
         new_tetromino.x = self.x
         new_tetromino.y = self.y
         new_tetromino.rotation = self.rotation
@@ -22,31 +22,211 @@ Tetris Windows 遊戲主程式
 - Z: 逆時針旋轉
 - Space: 硬降
 - C/Shift: Hold 功能
+- P: Perfect Clear 提示（顯示下一步的落點）
 - R: 重新開始
 
+命令列參數（可選）：
+- --width / --height: 遊戲區域尺寸（例如 4 寬練習、40 高、100x100 壓力測試）
+- --buffer-rows: 可見區域上方的隱藏緩衝行數
+- --mode versus: 本地對戰模式（--p1 / --p2 指定 human 或 ai）
+- --mode royale: 99 人大逃殺（--players 指定人數，--p1 ai 觀看全 AI 比賽）
+- --mode sprint / ultra: 40 行計時 / 2 分鐘計分（固定 tick 計時，結束後重播驗證成績）
+- --seed: 固定方塊序列的隨機種子
+- --record: 單人模式下將每次鎖定方塊的盤面與落點寫入訓練資料資料夾（需要 numpy）
+- --finesse-log: 單人模式下將每個方塊的 finesse 分析結果寫入 CSV 檔
+- --telemetry: 單人模式下將每局的統計寫入遙測資料夾（--player 指定玩家名稱，需要 numpy）
+- --no-effects: 關閉消行粒子特效（特效需要 numpy，未安裝時自動關閉）
+- --leaderboard: 排行榜 SQLite 檔案或共用伺服器網址（遊戲結束時在背景送出成績）
+
 需要安裝：
 pip install pygame
 """
 
+import argparse
 import pygame
+import random
 import sys
 import atexit
 from core import Game
 from ui import UIRenderer
 from ui.windowkill_manager import WindowKillManager
-from config.constants import FPS
+from ui.versus_window import VersusWindow
+from ui.royale_window import RoyaleWindow
+from core.bot import BotController
+from core.royale import ROYALE_PLAYERS
+from core.perfect_clear import PerfectClearHint
+from core.finesse import FinesseAnalyzer
+from core.leaderboard import AsyncSubmitter
+from core.modes import MODE_MARATHON, TIMED_MODES, TimedMode, TickClock, format_time
+from core.inputs import (
+    KeyboardController,
+    keys_to_input_mask,
+    DEFAULT_KEYMAP,
+    PLAYER1_KEYMAP,
+    PLAYER2_KEYMAP,
+)
+from config.constants import FPS, GRID_WIDTH, GRID_HEIGHT, GRID_BUFFER_ROWS
+
+
+def parse_args():
+    """解析命令列參數（遊戲區域尺寸）"""
+    parser = argparse.ArgumentParser(description="Tetris Windows 多視窗俄羅斯方塊")
+    parser.add_argument("--width", type=int, default=GRID_WIDTH, help="遊戲區域寬度")
+    parser.add_argument("--height", type=int, default=GRID_HEIGHT, help="遊戲區域高度")
+    parser.add_argument(
+        "--buffer-rows", type=int, default=GRID_BUFFER_ROWS, help="隱藏緩衝行數"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["single", "sprint", "ultra", "versus", "royale"],
+        default="single",
+        help="遊戲模式",
+    )
+    parser.add_argument(
+        "--p1", choices=["human", "ai"], default="human", help="對戰模式玩家一"
+    )
+    parser.add_argument(
+        "--p2", choices=["human", "ai"], default="ai", help="對戰模式玩家二"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="隨機種子")
+    parser.add_argument(
+        "--players", type=int, default=ROYALE_PLAYERS, help="大逃殺模式人數"
+    )
+    parser.add_argument(
+        "--record", metavar="DIR", default=None, help="單人模式訓練資料輸出資料夾"
+    )
+    parser.add_argument(
+        "--finesse-log", metavar="PATH", default=None, help="單人模式 finesse 統計 CSV 檔"
+    )
+    parser.add_argument(
+        "--telemetry", metavar="DIR", default=None, help="單人模式遙測資料夾"
+    )
+    parser.add_argument(
+        "--no-effects", action="store_true", help="關閉消行粒子特效"
+    )
+    parser.add_argument("--player", default="player", help="遙測與排行榜記錄的玩家名稱")
+    parser.add_argument(
+        "--leaderboard",
+        metavar="PATH_OR_URL",
+        default="leaderboard.db",
+        help="排行榜 SQLite 檔案或伺服器網址（none 表示停用）",
+    )
+    return parser.parse_args()
+
+
+def run_versus(args):
+    """
+    啟動本地對戰模式
+    兩位人類玩家時分別使用 WASD 與方向鍵；只有一位人類時使用單人預設按鍵
+    """
+    seats = [args.p1, args.p2]
+    humans = seats.count("human")
+    keymaps = (
+        [PLAYER1_KEYMAP, PLAYER2_KEYMAP] if humans == 2 else [DEFAULT_KEYMAP] * 2
+    )
+    controllers = [
+        KeyboardController(keymap) if seat == "human" else BotController()
+        for seat, keymap in zip(seats, keymaps)
+    ]
+
+    print("⚔️ 本地對戰模式啟動！")
+    if humans == 2:
+        print("  玩家一：A/D 移動、S 軟降、W/Q 旋轉、E Hold、Space 硬降")
+        print("  玩家二：←→ 移動、↓ 軟降、↑/右Ctrl 旋轉、右Shift Hold、Enter 硬降")
+    print("  比賽結束後按 R 再戰")
+
+    VersusWindow(
+        controllers, args.seed, args.width, args.height, args.buffer_rows
+    ).run()
+
+
+def run_royale(args):
+    """啟動大逃殺模式（玩家使用單人預設按鍵，其餘全部由 AI 控制）"""
+    controller = KeyboardController(DEFAULT_KEYMAP) if args.p1 == "human" else None
+
+    print(f"👑 大逃殺模式啟動！共 {args.players} 名玩家")
+    print("  操作與單人模式相同，比賽結束後按 R 再戰")
+
+    RoyaleWindow(
+        controller,
+        args.players,
+        args.seed,
+        args.width,
+        args.height,
+        args.buffer_rows,
+    ).run()
 
 
 def main():
     """主程式函數"""
+    args = parse_args()
+
     # 初始化 Pygame
     pygame.init()
 
+    if args.mode == "versus":
+        run_versus(args)
+        return
+    if args.mode == "royale":
+        run_royale(args)
+        return
+
     # 創建 WindowKill 風格的窗口管理器
-    window_manager = WindowKillManager()
+    window_manager = WindowKillManager(args.width, args.height)
+
+    # 訓練資料紀錄（選用）
+    data_writer = None
+    if args.record:
+        from core.training_data import TrainingDataWriter
+
+        data_writer = TrainingDataWriter(
+            args.record, args.width, args.height, args.buffer_rows
+        )
+        print(f"💾 訓練資料將寫入：{args.record}")
+
+    # 遙測紀錄（選用；每局結束時寫入一列）
+    telemetry_writer = None
+    telemetry = None
+    if args.telemetry:
+        from core.telemetry import TelemetryWriter, GameTelemetry
+
+        telemetry_writer = TelemetryWriter(args.telemetry, flush_rows=1)
+        print(f"📊 遙測資料將寫入：{args.telemetry}")
+
+    # 排行榜（遊戲結束時在背景執行緒送出成績）
+    leaderboard = None
+    if args.leaderboard and args.leaderboard.lower() != "none":
+        leaderboard = AsyncSubmitter(args.leaderboard)
+        window_manager.leaderboard = leaderboard
+        window_manager.player_name = args.player
+
+    # Finesse 分析（每次鎖定時比較實際按鍵數與最少按鍵數，顯示於資訊視窗）
+    finesse = FinesseAnalyzer(args.finesse_log)
+    window_manager.finesse = finesse
+    if args.finesse_log:
+        print(f"📝 Finesse 統計將寫入：{args.finesse_log}")
+
+    # 消行粒子特效（選用；需要 numpy）
+    effects = None
+    if not args.no_effects:
+        from ui.effects import NUMPY_AVAILABLE, EffectsSystem
+
+        if NUMPY_AVAILABLE:
+            effects = EffectsSystem()
+            window_manager.effects = effects
+        else:
+            print("⚠️ 未安裝 numpy，消行粒子特效已關閉")
 
     # 設定清理函數
     def cleanup():
+        if data_writer:
+            data_writer.close()
+        finesse.close()
+        if leaderboard:
+            leaderboard.close()
+        if telemetry_writer:
+            telemetry.finish()
+            telemetry_writer.close()
         window_manager.close_all_windows()
         pygame.quit()
 
@@ -58,10 +238,51 @@ def main():
     # 設定時鐘物件控制幀率
     clock = pygame.time.Clock()
 
+    # 計時模式（Sprint / Ultra）以固定 tick 推進遊戲
+    game_mode = args.mode if args.mode in TIMED_MODES else MODE_MARATHON
+    timed = game_mode in TIMED_MODES
+    timed_mode = None
+    tick_clock = None
+    pending_pressed = 0  # 尚未被 tick 處理的按鍵（這一幀沒有 tick 時留到下一幀）
+
     # 建立遊戲物件和渲染器
-    game = Game()
+    def new_game():
+        """依照命令列指定的尺寸建立新遊戲"""
+        nonlocal telemetry, timed_mode, tick_clock
+        seed = args.seed
+        if timed and seed is None:
+            # 計時模式需要種子才能重播驗證，每局隨機選一個
+            seed = random.randrange(1 << 31)
+        new = Game(args.width, args.height, args.buffer_rows, seed=seed)
+        if timed:
+            timed_mode = TimedMode(new, args.mode)
+            tick_clock = TickClock()
+            window_manager.timed_mode = timed_mode
+        if data_writer:
+            # 上一局的紀錄器在這裡結束，每局寫入一個分片
+            for recorder in list(data_writer.recorders):
+                recorder.close()
+            data_writer.attach(new, source="human")
+        finesse.attach(new)
+        if effects:
+            effects.clear()
+            effects.attach(new)
+        if telemetry_writer:
+            # 中途重新開始的上一局也會寫入（topped_out 為 0）
+            if telemetry:
+                telemetry.finish()
+            telemetry = GameTelemetry(
+                telemetry_writer, new, player=args.player, mode=game_mode
+            )
+        return new
+
+    game = new_game()
     renderer = UIRenderer()
 
+    # Perfect Clear 提示（按 P 切換，求解在背景執行緒進行）
+    pc_hint = PerfectClearHint(args.width)
+    show_pc_hint = False
+
     # 鍵盤狀態追蹤
     keys_pressed = pygame.key.get_pressed()
     keys_just_pressed = {}
@@ -75,6 +296,7 @@ def main():
     print("  Z: 逆時針旋轉")
     print("  Space: 硬降")
     print("  C/Shift: Hold 功能")
+    print("  P: Perfect Clear 提示")
     print("  R: 重新開始")
     print()
     print("🌟 特色功能：")
@@ -105,7 +327,9 @@ def main():
     def restart_game():
         """重新開始遊戲的回調函數"""
         nonlocal game, last_score, last_lines_cleared, last_action_text, game_over_shown
-        game = Game()
+        nonlocal pending_pressed
+        game = new_game()
+        pending_pressed = 0
         last_score = 0
         last_lines_cleared = 0
         last_action_text = ""
@@ -138,10 +362,15 @@ def main():
                 elif event.type == pygame.KEYDOWN:
                     keys_just_pressed[event.key] = True
 
-                    # 重新開始遊戲
-                    if event.key == pygame.K_r and game.game_over:
+                    # 重新開始遊戲（計時模式隨時可以按 R 重來）
+                    if event.key == pygame.K_r and (game.game_over or timed):
                         restart_game()
 
+                    # 切換 Perfect Clear 提示
+                    elif event.key == pygame.K_p:
+                        show_pc_hint = not show_pc_hint
+                        print(f"💡 Perfect Clear 提示：{'開啟' if show_pc_hint else '關閉'}")
+
             # 更新鍵盤狀態
             keys_pressed = pygame.key.get_pressed()
 
@@ -149,24 +378,48 @@ def main():
             # 遊戲邏輯更新
             # ============================
 
-            # 處理鍵盤輸入（在更新遊戲狀態之前，確保在lock delay期間可以旋轉）
-            game.handle_input(keys_pressed, keys_just_pressed)
-
-            # 更新遊戲狀態
-            game.update(dt)
+            if timed:
+                # 計時模式：依 perf_counter_ns 執行到期的固定 tick，剛按下的鍵只交給第一個 tick
+                held, pressed = keys_to_input_mask(keys_pressed, keys_just_pressed)
+                pending_pressed |= pressed
+                for _ in range(tick_clock.due()):
+                    timed_mode.step(held, pending_pressed)
+                    pending_pressed = 0
+            else:
+                # 處理鍵盤輸入（在更新遊戲狀態之前，確保在lock delay期間可以旋轉）
+                game.handle_input(keys_pressed, keys_just_pressed)
+
+                # 更新遊戲狀態
+                game.update(dt)
+            if telemetry:
+                telemetry.tick(dt)
 
             # ============================
             # Game Over 處理
             # ============================
 
-            # 檢測 Game Over 並顯示視窗
-            if game.game_over and not game_over_shown:
+            # 檢測 Game Over 並顯示視窗（計時模式完成時也顯示成績）
+            finished = game.game_over or (timed and timed_mode.finished)
+            if finished and not game_over_shown:
+                if timed:
+                    result = timed_mode.result()
+                    splits = "  ".join(
+                        f"{label} {format_time(ms)}" for label, ms, _ in result["splits"]
+                    )
+                    print(
+                        f"⏱️ {game_mode} 結束：{format_time(result['time_ms'])}"
+                        f"（實際經過 {format_time(result['wall_ms'])}），分數 {result['score']:,}"
+                    )
+                    if splits:
+                        print(f"   分段：{splits}")
                 print("💀 遊戲結束！顯示 Game Over 視窗")
+                if telemetry:
+                    telemetry.finish()
                 window_manager.show_game_over_window(game, restart_game)
                 game_over_shown = True
 
             # 如果遊戲重新開始，隱藏 Game Over 視窗
-            elif not game.game_over and game_over_shown:
+            elif not finished and game_over_shown:
                 window_manager.hide_game_over_window()
                 game_over_shown = False
 
@@ -207,6 +460,7 @@ def main():
             # ============================
 
             # 使用 WindowKill 風格窗口管理器渲染所有視窗
+            window_manager.pc_hint = pc_hint.update(game) if show_pc_hint else None
             window_manager.render_all_windows(game)
 
     except KeyboardInterrupt:
@@ -0,0 +1,250 @@
+"""
+消行特效模組
+消行、T-spin、Perfect Clear 時產生粒子、閃光與行收合動畫
+
+設計：
+- 粒子存放在預先配置的 NumPy 陣列（位置、速度、剩餘壽命、顏色），存活的粒子固定排在陣列前段，
+  每幀以向量運算一次更新全部粒子，死亡的粒子以布林遮罩壓縮掉，不會產生新的物件
+- 繪製時以 pygame.surfarray.pixels3d 取得畫面像素，用一次索引寫入畫出所有粒子（與原像素取最大值，
+  效果類似加色混合），成本與粒子數成正比且沒有逐顆的 pygame 呼叫
+- 粒子數量有上限（capacity），超過時新的粒子直接捨棄，數千顆粒子時每幀成本仍然固定
+- 粒子座標以格子為單位，與格子大小、震動偏移無關
+- 消除的行由鎖定結果的 cleared_rows（即 GameGrid.check_lines 記錄的 filled_rows）取得，
+  行內各格的顏色在鎖定前先複製下來（消行後原本的格子已經被移除）
+
+需要安裝 numpy（選用依賴）：
+pip install numpy
+"""
+
+# 嘗試導入 numpy，如果失敗則在建立特效系統時提示安裝
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+import pygame
+
+from config.constants import WHITE, PURPLE, YELLOW
+from config.shapes import TETROMINO_BLOCKS
+
+GRAVITY = 30.0  # 粒子重力（格/秒²）
+LINE_PARTICLES = 6  # 消除的行每格產生的粒子數
+LINE_PARTICLE_SPEED = 8.0  # 消行粒子最大初速（格/秒）
+LINE_PARTICLE_LIFE = 600  # 消行粒子壽命（毫秒）
+TSPIN_PARTICLES = 80  # T-spin 爆發粒子數
+PERFECT_CLEAR_PARTICLES = 800  # Perfect Clear 全盤粒子數
+FLASH_DURATION = 180  # 消行閃光與行收合動畫時間（毫秒）
+BOARD_FLASH_DURATION = 400  # Perfect Clear 全盤閃光時間（毫秒）
+
+
+class EffectsSystem:
+    """
+    粒子特效系統類別
+    attach(game) 後於每次鎖定消行時產生特效；每幀呼叫 update(dt) 與 draw(surface, ...)
+    """
+
+    def __init__(self, capacity=4096, seed=None):
+        """
+        初始化特效系統
+        參數：
+        - capacity: 同時存活的粒子上限
+        - seed: 特效用亂數種子（與遊戲的方塊序列無關）
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("粒子特效需要 numpy：pip install numpy")
+
+        self.capacity = capacity
+        self.count = 0  # 存活的粒子數（陣列前 count 個）
+        self.position = np.zeros((capacity, 2), np.float32)  # (x, y) 格
+        self.velocity = np.zeros((capacity, 2), np.float32)  # 格/秒
+        self.life = np.zeros(capacity, np.float32)  # 剩餘壽命（毫秒）
+        self.max_life = np.ones(capacity, np.float32)
+        self.color = np.zeros((capacity, 3), np.float32)
+        self._step = np.zeros((capacity, 2), np.float32)  # 更新用的暫存陣列
+        self._alive = np.zeros(capacity, bool)
+        self.rng = np.random.default_rng(seed)
+
+        # 閃光與行收合：[行, 剩餘時間, 總時間, 顏色]；行為 None 表示全盤閃光
+        self.flashes = []
+        self.pending_rows = {}  # 鎖定前複製的行顏色 {行: [顏色, ...]}
+
+    def attach(self, game):
+        """將特效系統掛上遊戲的鎖定監聽器"""
+        game.pre_lock_listeners.append(self.on_pre_lock)
+        game.lock_listeners.append(self.on_lock)
+
+    def on_pre_lock(self, game):
+        """鎖定前複製方塊所在各行的顏色（只有這些行可能被消除）"""
+        piece = game.current_tetromino
+        grid = game.grid
+        rows = {}
+        for col, row in TETROMINO_BLOCKS[piece.shape_type][piece.rotation]:
+            y = piece.y + row
+            if 0 <= y < grid.height:
+                if y not in rows:
+                    rows[y] = list(grid.grid[y])
+                rows[y][piece.x + col] = piece.color
+        self.pending_rows = rows
+
+    def on_lock(self, game, result):
+        """鎖定監聽器：依照消行、T-spin 與 Perfect Clear 產生特效"""
+        rows = self.pending_rows
+        self.pending_rows = {}
+
+        for y in result["cleared_rows"]:
+            colors = rows.get(y)
+            if colors is None:
+                continue
+            self.emit_row(y, colors)
+            self.flashes.append([y, FLASH_DURATION, FLASH_DURATION, WHITE])
+
+        if result["t_spin"]:
+            blocks = TETROMINO_BLOCKS[result["shape_type"]][result["rotation"]]
+            center_x = result["x"] + sum(col for col, _ in blocks) / 4 + 0.5
+            center_y = result["y"] + sum(row for _, row in blocks) / 4 + 0.5
+            self.emit_burst(center_x, center_y, PURPLE, TSPIN_PARTICLES, 12.0, 800)
+
+        if result["perfect_clear"]:
+            grid = game.grid
+            self.emit(
+                self.rng.uniform(0, grid.width, PERFECT_CLEAR_PARTICLES),
+                self.rng.uniform(0, grid.height, PERFECT_CLEAR_PARTICLES),
+                np.array(YELLOW, np.float32),
+                6.0,
+                1200,
+            )
+            self.flashes.append([None, BOARD_FLASH_DURATION, BOARD_FLASH_DURATION, YELLOW])
+
+    def emit(self, xs, ys, colors, speed, life_ms):
+        """
+        產生一批粒子（超過上限的部分捨棄）
+        參數：
+        - xs, ys: 粒子起點陣列（格）
+        - colors: (n, 3) 或 (3,) 的顏色
+        - speed: 最大初速（格/秒），方向隨機
+        - life_ms: 最長壽命（毫秒），每顆粒子在一半到最長之間隨機
+        """
+        start = self.count
+        n = min(len(xs), self.capacity - start)
+        if n <= 0:
+            return
+        end = start + n
+        angle = self.rng.uniform(0, 2 * np.pi, n)
+        magnitude = self.rng.uniform(0.2, 1.0, n) * speed
+        self.position[start:end, 0] = xs[:n]
+        self.position[start:end, 1] = ys[:n]
+        self.velocity[start:end, 0] = np.cos(angle) * magnitude
+        self.velocity[start:end, 1] = np.sin(angle) * magnitude - speed * 0.5  # 稍微往上噴
+        life = self.rng.uniform(0.5, 1.0, n) * life_ms
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.color[start:end] = colors[:n] if np.ndim(colors) == 2 else colors
+        self.count = end
+
+    def emit_row(self, y, colors):
+        """
+        消除的行：每格產生數顆與方塊同色的粒子
+        參數：
+        - y: 行索引
+        - colors: 該行各格顏色（消除前）
+        """
+        width = len(colors)
+        cells = np.repeat(np.arange(width, dtype=np.float32), LINE_PARTICLES)
+        xs = cells + self.rng.uniform(0, 1, len(cells))
+        ys = y + self.rng.uniform(0, 1, len(cells))
+        palette = np.array(colors, np.float32)
+        self.emit(xs, ys, palette[cells.astype(np.intp)], LINE_PARTICLE_SPEED, LINE_PARTICLE_LIFE)
+
+    def emit_burst(self, x, y, color, count, speed, life_ms):
+        """從單一點向四周爆發"""
+        self.emit(
+            np.full(count, x, np.float32),
+            np.full(count, y, np.float32),
+            np.array(color, np.float32),
+            speed,
+            life_ms,
+        )
+
+    def update(self, dt):
+        """
+        更新所有粒子與閃光
+        參數：
+        - dt: 經過時間（毫秒）
+        """
+        for flash in self.flashes:
+            flash[1] -= dt
+        if self.flashes:
+            self.flashes = [flash for flash in self.flashes if flash[1] > 0]
+
+        n = self.count
+        if n == 0:
+            return
+        seconds = dt / 1000.0
+        velocity = self.velocity[:n]
+        step = self._step[:n]
+        velocity[:, 1] += GRAVITY * seconds
+        np.multiply(velocity, seconds, out=step)
+        self.position[:n] += step
+        life = self.life[:n]
+        life -= dt
+
+        alive = self._alive[:n]
+        np.greater(life, 0, out=alive)
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            # 壓縮：存活的粒子移到陣列前段
+            for array in (self.position, self.velocity, self.life, self.max_life, self.color):
+                array[:survivors] = array[:n][alive]
+            self.count = survivors
+
+    def draw(self, surface, offset_x, offset_y, cell_size, board_width, board_height):
+        """
+        繪製閃光與粒子
+        參數：
+        - surface: pygame Surface
+        - offset_x, offset_y: 遊戲區域左上角像素位置
+        - cell_size: 格子像素大小
+        - board_width, board_height: 遊戲區域格數（全盤閃光用）
+        """
+        for row, remaining, duration, color in self.flashes:
+            fraction = remaining / duration
+            fade = tuple(int(c * fraction) for c in color)
+            if row is None:
+                rect = (offset_x, offset_y, board_width * cell_size, board_height * cell_size)
+            else:
+                # 行收合：閃光帶的高度隨時間縮成中線
+                band = max(1, int(cell_size * fraction))
+                top = offset_y + row * cell_size + (cell_size - band) // 2
+                rect = (offset_x, top, board_width * cell_size, band)
+            surface.fill(fade, rect, special_flags=pygame.BLEND_RGB_ADD)
+
+        n = self.count
+        if n == 0:
+            return
+        width, height = surface.get_size()
+        size = 2 if cell_size >= 12 else 1
+        xs = (self.position[:n, 0] * cell_size + offset_x).astype(np.intp)
+        ys = (self.position[:n, 1] * cell_size + offset_y).astype(np.intp)
+        inside = (xs >= 0) & (xs <= width - size) & (ys >= 0) & (ys <= height - size)
+        xs = xs[inside]
+        ys = ys[inside]
+        fade = (self.life[:n] / self.max_life[:n])[inside]
+        colors = (self.color[:n][inside] * fade[:, None]).astype(np.uint8)
+
+        pixels = pygame.surfarray.pixels3d(surface)
+        try:
+            for dx in range(size):
+                for dy in range(size):
+                    px = xs + dx
+                    py = ys + dy
+                    pixels[px, py] = np.maximum(pixels[px, py], colors)
+        finally:
+            del pixels  # 解除 Surface 鎖定
+
+    def clear(self):
+        """清除所有特效（重新開始時使用）"""
+        self.count = 0
+        self.flashes = []
+        self.pending_rows = {}
@@ -0,0 +1,220 @@
+"""
+無視窗像素渲染器
+將遊戲區域、當前方塊與幽靈方塊直接寫入 NumPy RGB 或灰階陣列，不需要建立顯示視窗，
+供視覺型 AI 與縮圖產生使用
+
+流程：
+1. 每個批次位置快取一張顏色索引平面（每格一個 uint8），已放置方塊只在 grid.version 改變時重寫
+2. 每幀複製索引平面並畫上幽靈與當前方塊（各 4 格）
+3. 以預先計算的像素→格子索引表，透過 np.take 放大並查色票，寫入預先配置的輸出陣列
+
+需要安裝 numpy（選用依賴）：
+pip install numpy
+"""
+
+# 嘗試導入 numpy，如果失敗則在建立渲染器時提示安裝
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+import pygame
+
+from config.constants import BLACK, GRAY, TETROMINO_COLORS
+from config.shapes import SHAPE_COLORS, TETROMINO_BLOCKS
+
+# 顏色索引：0 為空白，1~7 為方塊顏色，8 為垃圾行，9~15 為幽靈方塊，16 為網格線
+EMPTY_INDEX = 0
+GARBAGE_INDEX = len(TETROMINO_COLORS) + 1
+GHOST_OFFSET = GARBAGE_INDEX + 1
+GRID_LINE_INDEX = GHOST_OFFSET + len(TETROMINO_COLORS)
+COLOR_INDEX = {color: index + 1 for index, color in enumerate(TETROMINO_COLORS)}
+COLOR_INDEX[GRAY] = GARBAGE_INDEX
+GRID_LINE_COLOR = (40, 40, 40)  # 網格線顏色（比垃圾行的灰色暗，避免兩者混淆）
+
+
+def build_palette():
+    """建立色票（索引 → RGB）"""
+    palette = [BLACK] + list(TETROMINO_COLORS) + [GRAY]
+    palette += [tuple(c // 3 for c in color) for color in TETROMINO_COLORS]
+    palette.append(GRID_LINE_COLOR)
+    return palette
+
+
+class PixelRenderer:
+    """
+    批次像素渲染器類別
+    render(games) 一次渲染多個遊戲區域，返回形狀為 (N, 高, 寬, 3) 或 (N, 高, 寬) 的陣列
+    （返回的是同一個預先配置的陣列，下次呼叫會被覆寫）
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        cell_size=4,
+        batch_size=1,
+        grayscale=False,
+        show_ghost=True,
+        grid_lines=False,
+        buffer_rows=0,
+    ):
+        """
+        初始化渲染器
+        參數：
+        - width, height: 遊戲區域格數（可見區域）
+        - cell_size: 每格像素大小
+        - batch_size: 一次最多渲染的遊戲區域數
+        - grayscale: True 輸出灰階（uint8 亮度），False 輸出 RGB
+        - show_ghost: 是否畫出幽靈方塊
+        - grid_lines: 是否畫出網格線（每格左上邊緣）
+        - buffer_rows: 一併渲染的隱藏緩衝行數（畫在可見區域上方，0 表示只渲染可見區域）
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("像素渲染器需要 numpy：pip install numpy")
+
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.batch_size = batch_size
+        self.grayscale = grayscale
+        self.show_ghost = show_ghost
+        self.buffer_rows = buffer_rows
+        self.rows = height + buffer_rows  # 索引平面的行數
+
+        palette = np.array(build_palette(), dtype=np.uint8)
+        if grayscale:
+            # ITU-R BT.601 亮度
+            weights = np.array([299, 587, 114], dtype=np.uint32)
+            palette = ((palette.astype(np.uint32) @ weights) // 1000).astype(np.uint8)
+        self.palette = palette
+
+        # 顏色索引平面：locked 為已放置方塊（每個批次位置一張快取），planes 為加上方塊後的結果
+        self.locked = np.zeros((batch_size, self.rows, width), np.uint8)
+        self.locked_keys = [None] * batch_size  # 每個位置快取的 (遊戲區域, version)
+        self.planes = np.zeros((batch_size, self.rows, width), np.uint8)
+
+        # 像素 → 格子 的索引表
+        pixel_height = self.rows * cell_size
+        pixel_width = width * cell_size
+        self.row_lookup = np.arange(pixel_height) // cell_size
+        self.col_lookup = np.arange(pixel_width) // cell_size
+        self._rows_expanded = np.zeros((batch_size, pixel_height, width), np.uint8)
+        self._pixels = np.zeros((batch_size, pixel_height, pixel_width), np.uint8)
+
+        if grid_lines and cell_size > 1:
+            self.grid_line_mask = (self.row_lookup * cell_size == np.arange(pixel_height))[
+                :, None
+            ] | (self.col_lookup * cell_size == np.arange(pixel_width))[None, :]
+        else:
+            self.grid_line_mask = None
+
+        shape = (batch_size, pixel_height, pixel_width)
+        if not grayscale:
+            shape += (3,)
+        self.output = np.zeros(shape, np.uint8)
+
+    def _locked_plane(self, index, grid):
+        """
+        取得已放置方塊的索引平面（同一位置的遊戲區域與 grid.version 都未改變時直接使用快取）
+        參數：
+        - index: 批次位置
+        - grid: GameGrid 物件
+        """
+        plane = self.locked[index]
+        key = self.locked_keys[index]
+        if key is not None and key[0] is grid and key[1] == grid.version:
+            return plane
+
+        if (grid.width, grid.height) != (self.width, self.height):
+            raise ValueError(
+                f"渲染器尺寸為 {self.width}x{self.height}，"
+                f"遊戲區域為 {grid.width}x{grid.height}"
+            )
+
+        plane.fill(EMPTY_INDEX)
+        # 從最底行往上填，空行直接跳過
+        for y in range(self.height - 1, -self.buffer_rows - 1, -1):
+            if y < -grid.buffer_rows:
+                break
+            if not grid.get_row_count(y):
+                continue
+            plane_row = plane[y + self.buffer_rows]
+            for col_index, color in enumerate(grid.grid[y] if y >= 0 else grid.buffer[y]):
+                if color != BLACK:
+                    plane_row[col_index] = COLOR_INDEX.get(color, GARBAGE_INDEX)
+        self.locked_keys[index] = (grid, grid.version)
+        return plane
+
+    def _paint_piece(self, plane, game):
+        """在索引平面上畫出幽靈方塊與當前方塊"""
+        if game.game_over:
+            return
+        piece = game.current_tetromino
+        color_index = SHAPE_COLORS[piece.shape_type] + 1
+        top = -self.buffer_rows
+        row_offset = self.buffer_rows
+        blocks = TETROMINO_BLOCKS[piece.shape_type][piece.rotation]
+
+        if self.show_ghost:
+            ghost_y = piece.y
+            while game.grid.is_valid_position(piece, 0, ghost_y - piece.y + 1):
+                ghost_y += 1
+            ghost_index = GHOST_OFFSET + color_index - 1
+            for col, row in blocks:
+                y = ghost_y + row
+                if y >= top:
+                    plane[y + row_offset, piece.x + col] = ghost_index
+
+        for col, row in blocks:
+            y = piece.y + row
+            if y >= top:
+                plane[y + row_offset, piece.x + col] = color_index
+
+    def render(self, games):
+        """
+        渲染多個遊戲區域
+        參數：
+        - games: Game 列表（長度不可超過 batch_size）
+        返回：輸出陣列的前 len(games) 個（視圖，不複製）
+        """
+        count = len(games)
+        if count > self.batch_size:
+            raise ValueError(f"一次最多渲染 {self.batch_size} 個遊戲區域，收到 {count}")
+
+        for index, game in enumerate(games):
+            plane = self.planes[index]
+            np.copyto(plane, self._locked_plane(index, game.grid))
+            self._paint_piece(plane, game)
+
+        planes = self.planes[:count]
+        rows = self._rows_expanded[:count]
+        pixels = self._pixels[:count]
+        np.take(planes, self.row_lookup, axis=1, out=rows)
+        np.take(rows, self.col_lookup, axis=2, out=pixels)
+        if self.grid_line_mask is not None:
+            pixels[:, self.grid_line_mask] = GRID_LINE_INDEX
+
+        output = self.output[:count]
+        np.take(self.palette, pixels, axis=0, out=output)
+        return output
+
+    def render_one(self, game):
+        """渲染單一遊戲區域，返回 (高, 寬, 3) 或 (高, 寬) 陣列"""
+        return self.render([game])[0]
+
+    def to_surface(self, pixels):
+        """
+        將 RGB 陣列轉換為 pygame Surface（縮圖用，不需要顯示視窗）
+        參數：
+        - pixels: render_one 的結果
+        """
+        if pixels.ndim == 2:
+            pixels = np.stack([pixels] * 3, axis=-1)
+        return pygame.surfarray.make_surface(pixels.swapaxes(0, 1))
+
+    def save_thumbnail(self, game, path):
+        """將遊戲區域存成圖片檔（PNG 等 pygame 支援的格式）"""
+        pygame.image.save(self.to_surface(self.render_one(game)), path)
@@ -17,8 +17,8 @@ from config.constants import (
     GRID_X,
     GRID_Y,
     LOCK_DELAY_MAX,
-    GRID_WIDTH,
 )
+from ui.text_cache import shared_text_cache
 
 
 class UIRenderer:
@@ -28,6 +28,58 @@ class UIRenderer:
         """初始化渲染器"""
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 20)
+        self.action_font = pygame.font.Font(None, 32)
+        self.text_cache = shared_text_cache
+        self.controls_panel = None  # 預先繪製的控制說明面板（第一次繪製時建立）
+
+    def render_text(self, font, text, color):
+        """以文字快取渲染文字（內容不變時不會重新點陣化）"""
+        return self.text_cache.render(font, text, color)
+
+    def build_controls_panel(self):
+        """
+        預先繪製固定不變的控制說明列表
+        返回：透明背景的 Surface（左上角對應原本第一行的位置）
+        """
+        controls = [
+            "Controls:",
+            "←→: Move (DAS)",
+            "↓: Soft Drop",
+            "X/↑: Rotate CW",
+            "Z: Rotate CCW",
+            "Space: Hard Drop",
+            "C/Shift: Hold",
+            "R: Restart",
+            "",
+            "Features:",
+            "• SRS Rotation",
+            "• 7-bag System",
+            "• Ghost Piece",
+            "• Hold Function",
+            "• T-Spin Detection",
+            "• Perfect Clear",
+            "• Combo System",
+            "• Back-to-Back",
+        ]
+
+        items = []
+        for i, control in enumerate(controls):
+            # 使用較小的字體間距和適當的顏色
+            if control == "":
+                continue  # 跳過空行
+            elif control.startswith("•"):
+                # 功能說明使用較小的字體
+                items.append((self.small_font, control, CYAN, (0, i * 22)))
+            elif control in ["Controls:", "Features:"]:
+                # 標題使用白色
+                items.append((self.font, control, WHITE, (0, i * 22)))
+            else:
+                # 普通控制說明
+                items.append((self.font, control, LIGHT_GRAY, (0, i * 22)))
+
+        width = max(font.size(text)[0] for font, text, _, _ in items)
+        height = len(controls) * 22 + self.font.get_height()
+        return self.text_cache.render_panel((width, height), items)
 
     def draw_current_tetromino(self, screen, game):
         """
@@ -101,7 +153,7 @@ class UIRenderer:
         hold_y = 50
 
         # 繪製 Hold 標題
-        hold_text = self.font.render("HOLD", True, WHITE)
+        hold_text = self.render_text(self.font, "HOLD", WHITE)
         screen.blit(hold_text, (hold_x, hold_y))
 
         # 繪製 Hold 方塊框
@@ -132,7 +184,7 @@ class UIRenderer:
         next_y = 250  # 調整位置避免與控制說明重疊
 
         # 繪製 Next 標題
-        next_text = self.font.render("NEXT", True, WHITE)
+        next_text = self.render_text(self.font, "NEXT", WHITE)
         screen.blit(next_text, (next_x, next_y))
 
         # 繪製 Next 方塊框
@@ -159,18 +211,18 @@ class UIRenderer:
         - screen: pygame 螢幕物件
         - game: Game 物件
         """
-        info_x = GRID_X + GRID_WIDTH * CELL_SIZE + 20
+        info_x = GRID_X + game.grid.width * CELL_SIZE + 20
 
         # 分數
-        score_text = self.font.render(f"Score: {game.score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {game.score}", WHITE)
         screen.blit(score_text, (info_x, 50))
 
         # 等級
-        level_text = self.font.render(f"Level: {game.level}", True, WHITE)
+        level_text = self.render_text(self.font, f"Level: {game.level}", WHITE)
         screen.blit(level_text, (info_x, 80))
 
         # 已消除行數
-        lines_text = self.font.render(f"Lines: {game.lines_cleared}", True, WHITE)
+        lines_text = self.render_text(self.font, f"Lines: {game.lines_cleared}", WHITE)
         screen.blit(lines_text, (info_x, 110))
 
         # 當前速度
@@ -179,73 +231,41 @@ class UIRenderer:
             speed_str = f"{current_speed/1000:.1f}s"
         else:
             speed_str = f"{current_speed}ms"
-        speed_text = self.font.render(f"Speed: {speed_str}", True, CYAN)
+        speed_text = self.render_text(self.font, f"Speed: {speed_str}", CYAN)
         screen.blit(speed_text, (info_x, 140))
 
         # 下一等級進度
         lines_to_next = (game.level * 10) - game.lines_cleared
         if lines_to_next > 0:
-            progress_text = self.small_font.render(f"Next: {lines_to_next} lines", True, YELLOW)
+            progress_text = self.render_text(
+                self.small_font, f"Next: {lines_to_next} lines", YELLOW
+            )
             screen.blit(progress_text, (info_x, 170))
         else:
-            progress_text = self.small_font.render("Max Level!", True, RED)
+            progress_text = self.render_text(self.small_font, "Max Level!", RED)
             screen.blit(progress_text, (info_x, 170))
 
-        # 控制說明
-        controls = [
-            "Controls:",
-            "←→: Move (DAS)",
-            "↓: Soft Drop",
-            "X/↑: Rotate CW",
-            "Z: Rotate CCW",
-            "Space: Hard Drop",
-            "C/Shift: Hold",
-            "R: Restart",
-            "",
-            "Features:",
-            "• SRS Rotation",
-            "• 7-bag System",
-            "• Ghost Piece",
-            "• Hold Function",
-            "• T-Spin Detection",
-            "• Perfect Clear",
-            "• Combo System",
-            "• Back-to-Back",
-        ]
-
-        for i, control in enumerate(controls):
-            # 使用較小的字體間距和適當的顏色
-            if control == "":
-                continue  # 跳過空行
-            elif control.startswith("•"):
-                # 功能說明使用較小的字體
-                control_text = self.small_font.render(control, True, CYAN)
-                screen.blit(control_text, (info_x, 150 + i * 22))
-            elif control in ["Controls:", "Features:"]:
-                # 標題使用白色
-                control_text = self.font.render(control, True, WHITE)
-                screen.blit(control_text, (info_x, 150 + i * 22))
-            else:
-                # 普通控制說明
-                control_text = self.font.render(control, True, LIGHT_GRAY)
-                screen.blit(control_text, (info_x, 150 + i * 22))
+        # 控制說明（固定內容，使用預先繪製的面板）
+        if self.controls_panel is None:
+            self.controls_panel = self.build_controls_panel()
+        screen.blit(self.controls_panel, (info_x, 150))
 
         # Back-to-back 顯示
         if game.back_to_back_count > 0:
-            b2b_text = self.font.render(
-                f"Back-to-Back: {game.back_to_back_count}", True, YELLOW
+            b2b_text = self.render_text(
+                self.font, f"Back-to-Back: {game.back_to_back_count}", YELLOW
             )
             screen.blit(b2b_text, (info_x, 480))
 
         # Combo 顯示
         if game.combo_count > 1:
-            combo_text = self.font.render(f"Combo: {game.combo_count}x", True, GREEN)
+            combo_text = self.render_text(self.font, f"Combo: {game.combo_count}x", GREEN)
             screen.blit(combo_text, (info_x, 505))
 
         # Perfect Clear 計數顯示
         if game.perfect_clear_count > 0:
-            pc_text = self.font.render(
-                f"Perfect Clear: {game.perfect_clear_count}", True, CYAN
+            pc_text = self.render_text(
+                self.font, f"Perfect Clear: {game.perfect_clear_count}", CYAN
             )
             screen.blit(pc_text, (info_x, 530))
 
@@ -254,9 +274,8 @@ class UIRenderer:
             # 計算閃爍效果
             if game.action_text_timer % 10 < 5:  # 閃爍效果
                 action_color = RED if "T-SPIN" in game.action_text else YELLOW
-                action_font = pygame.font.Font(None, 32)
-                action_surface = action_font.render(
-                    game.action_text, True, action_color
+                action_surface = self.render_text(
+                    self.action_font, game.action_text, action_color
                 )
                 screen.blit(action_surface, (info_x, 555))
 
@@ -268,8 +287,8 @@ class UIRenderer:
 
         # 遊戲結束提示
         if game.game_over:
-            game_over_text = self.font.render("GAME OVER", True, RED)
-            restart_text = self.font.render("Press R to restart", True, WHITE)
+            game_over_text = self.render_text(self.font, "GAME OVER", RED)
+            restart_text = self.render_text(self.font, "Press R to restart", WHITE)
             screen.blit(game_over_text, (info_x, 400))
             screen.blit(restart_text, (info_x, 430))
 
@@ -0,0 +1,343 @@
+"""
+大逃殺視窗
+中央為玩家的遊戲區域，左右兩側以縮小版網格顯示其他所有玩家
+
+繪製效能：
+- 所有縮小版遊戲區域共用一張格子圖集（每種顏色預先繪製一個格子），以 blits 批次貼上
+- 縮小版遊戲區域繪製到一張常駐的面板 Surface，只有 grid.version 或存活狀態改變的格子才重繪
+"""
+
+import math
+import pygame
+import sys
+import time
+
+from config.constants import (
+    WHITE,
+    BLACK,
+    GRAY,
+    LIGHT_GRAY,
+    RED,
+    YELLOW,
+    GREEN,
+    CYAN,
+    TETROMINO_COLORS,
+    FPS,
+)
+from .window_manager import fit_cell_size
+from .versus_window import draw_board
+
+MINI_COLUMNS = 7  # 每側縮小版網格的欄數
+MINI_PADDING = 4  # 縮小版遊戲區域之間的間距
+MAIN_BOARD_MAX = (300, 520)  # 玩家遊戲區域的最大像素尺寸
+INFO_WIDTH = 150  # 玩家資訊欄寬度
+DEAD_TINT = (40, 0, 0)  # 被擊倒玩家的底色
+
+
+class CellAtlas:
+    """
+    共用格子圖集類別
+    每種顏色預先繪製一個格子，繪製時只需從圖集貼上對應區域
+    """
+
+    def __init__(self, cell_size, colors):
+        """
+        初始化圖集
+        參數：
+        - cell_size: 格子大小（像素）
+        - colors: 需要的顏色列表
+        """
+        self.cell_size = cell_size
+        self.surface = pygame.Surface((cell_size * len(colors), cell_size))
+        self.areas = {}
+        for index, color in enumerate(colors):
+            area = pygame.Rect(index * cell_size, 0, cell_size, cell_size)
+            self.surface.fill(color, area)
+            if cell_size >= 4:
+                # 格子夠大時加上暗色邊框，與主遊戲區域的外觀一致
+                pygame.draw.rect(
+                    self.surface, tuple(c // 2 for c in color), area, 1
+                )
+            self.areas[color] = area
+
+    def area_for(self, color):
+        """獲取顏色對應的圖集區域（未知顏色動態加入）"""
+        area = self.areas.get(color)
+        if area is None:
+            old = self.surface
+            index = len(self.areas)
+            self.surface = pygame.Surface((self.cell_size * (index + 1), self.cell_size))
+            self.surface.blit(old, (0, 0))
+            area = pygame.Rect(index * self.cell_size, 0, self.cell_size, self.cell_size)
+            self.surface.fill(color, area)
+            self.areas[color] = area
+        return area
+
+
+class MiniBoardPanel:
+    """
+    縮小版遊戲區域面板類別
+    在一張常駐 Surface 上排列多個縮小版遊戲區域，並只重繪有變化的格子
+    """
+
+    def __init__(self, players, board_width, board_height, cell_size, columns=MINI_COLUMNS):
+        """
+        初始化面板
+        參數：
+        - players: 要顯示的 VersusPlayer 列表
+        - board_width, board_height: 遊戲區域格數
+        - cell_size: 縮小版格子大小
+        - columns: 每列顯示的遊戲區域數
+        """
+        self.players = players
+        self.board_width = board_width
+        self.board_height = board_height
+        self.cell_size = cell_size
+        self.columns = columns
+        self.tile_width = board_width * cell_size + MINI_PADDING
+        self.tile_height = board_height * cell_size + MINI_PADDING
+        rows = max(1, math.ceil(len(players) / columns))
+        self.surface = pygame.Surface((self.tile_width * columns, self.tile_height * rows))
+        self.surface.fill(BLACK)
+        self.atlas = CellAtlas(cell_size, TETROMINO_COLORS + [GRAY])
+        self.versions = [None] * len(players)  # 每個格子上次繪製時的 (version, alive)
+        self.redrawn = 0  # 最近一次 update 重繪的遊戲區域數
+
+    def tile_origin(self, index):
+        """第 index 個遊戲區域在面板上的左上角位置"""
+        return (
+            (index % self.columns) * self.tile_width,
+            (index // self.columns) * self.tile_height,
+        )
+
+    def update(self):
+        """重繪有變化的縮小版遊戲區域"""
+        self.redrawn = 0
+        cell = self.cell_size
+        atlas = self.atlas
+        for index, player in enumerate(self.players):
+            grid = player.game.grid
+            state = (grid.version, player.alive)
+            if self.versions[index] == state:
+                continue
+            self.versions[index] = state
+            self.redrawn += 1
+
+            origin_x, origin_y = self.tile_origin(index)
+            board_rect = pygame.Rect(
+                origin_x, origin_y, self.board_width * cell, self.board_height * cell
+            )
+            self.surface.fill(BLACK if player.alive else DEAD_TINT, board_rect)
+
+            sequence = []
+            for row_index, row in enumerate(grid.grid):
+                if not grid.row_counts[row_index]:
+                    continue
+                y = origin_y + row_index * cell
+                for col_index, color in enumerate(row):
+                    if color != BLACK:
+                        sequence.append(
+                            (
+                                atlas.surface,
+                                (origin_x + col_index * cell, y),
+                                atlas.area_for(color),
+                            )
+                        )
+            if sequence:
+                self.surface.blits(sequence, doreturn=False)
+
+            border = GRAY if player.alive else RED
+            pygame.draw.rect(self.surface, border, board_rect.inflate(2, 2), 1)
+
+
+class RoyaleWindow:
+    """大逃殺視窗類別"""
+
+    def __init__(
+        self,
+        controller=None,
+        player_count=99,
+        seed=None,
+        width=10,
+        height=20,
+        buffer_rows=2,
+    ):
+        """
+        初始化視窗
+        參數：
+        - controller: 玩家控制器（KeyboardController；None 表示觀看全 AI 比賽）
+        - player_count: 玩家人數
+        - seed: 比賽種子
+        - width, height, buffer_rows: 遊戲區域尺寸
+        """
+        self.controller = controller
+        self.player_count = player_count
+        self.seed = seed
+        self.board_size = (width, height, buffer_rows)
+
+        self.font = pygame.font.Font(None, 30)
+        self.small_font = pygame.font.Font(None, 22)
+        self.large_font = pygame.font.Font(None, 56)
+
+        self.cell_size = fit_cell_size(width, height, *MAIN_BOARD_MAX)
+        self.main_width = width * self.cell_size
+        self.main_height = height * self.cell_size
+
+        # 其他玩家平均分配到左右兩側
+        others = player_count - 1
+        side_rows = max(1, math.ceil(math.ceil(others / 2) / MINI_COLUMNS))
+        available = self.main_height + 60
+        self.mini_cell = max(
+            1, min(4, (available // side_rows - MINI_PADDING) // height)
+        )
+        self.clock = pygame.time.Clock()
+        self.new_match()
+
+        left_width = self.left_panel.surface.get_width()
+        right_width = self.right_panel.surface.get_width()
+        self.left_x = 10
+        self.main_x = self.left_x + left_width + 20
+        self.info_x = self.main_x + self.main_width + 15
+        self.right_x = self.info_x + INFO_WIDTH
+        self.board_y = 50
+        screen_height = max(
+            self.board_y + self.main_height + 50,
+            self.board_y + self.left_panel.surface.get_height() + 20,
+        )
+        self.screen = pygame.display.set_mode(
+            (self.right_x + right_width + 10, screen_height)
+        )
+        pygame.display.set_caption(f"TETRIS {player_count}")
+
+        # 效能統計
+        self.render_ms = 0.0
+
+    def new_match(self):
+        """開始新比賽"""
+        # core.royale 可單獨以 python -m core.royale 執行，只在需要時才匯入
+        from core.royale import RoyaleMatch
+
+        width, height, buffer_rows = self.board_size
+        self.royale = RoyaleMatch(
+            self.controller, self.player_count, self.seed, width, height, buffer_rows
+        )
+        if self.controller and hasattr(self.controller, "reset"):
+            self.controller.reset()
+
+        others = self.royale.players[1:]
+        half = math.ceil(len(others) / 2)
+        self.left_panel = MiniBoardPanel(others[:half], width, height, self.mini_cell)
+        self.right_panel = MiniBoardPanel(others[half:], width, height, self.mini_cell)
+
+    def draw_main(self):
+        """繪製玩家（第 0 號）的遊戲區域與資訊"""
+        player = self.royale.players[0]
+        game = player.game
+        board_x = self.main_x
+        board_y = self.board_y
+
+        pygame.draw.rect(
+            self.screen,
+            CYAN,
+            (board_x - 3, board_y - 3, self.main_width + 6, self.main_height + 6),
+            3,
+        )
+        draw_board(self.screen, game, board_x, board_y, self.cell_size)
+
+        # 垃圾行計量表
+        pending = player.garbage.total()
+        meter_h = min(pending * self.cell_size, self.main_height)
+        meter_x = board_x - 14
+        pygame.draw.rect(self.screen, GRAY, (meter_x, board_y, 8, self.main_height), 1)
+        if meter_h:
+            pygame.draw.rect(
+                self.screen,
+                RED,
+                (meter_x, board_y + self.main_height - meter_h, 8, meter_h),
+            )
+
+        alive = len(self.royale.match.alive_players())
+        info_items = [
+            (player.name, WHITE, self.font),
+            (f"#{self.royale.rank_of(0)} / {self.player_count}", YELLOW, self.font),
+            (f"Alive {alive}", GREEN, self.small_font),
+            (f"Score {game.score}", WHITE, self.small_font),
+            (f"Lines {game.lines_cleared}", WHITE, self.small_font),
+            (f"Sent {player.attack_sent}", YELLOW, self.small_font),
+            (f"K.O. {player.knockouts}", GREEN, self.small_font),
+            (f"Sim {self.royale.last_step_ms:.1f} ms", LIGHT_GRAY, self.small_font),
+            (f"Draw {self.render_ms:.1f} ms", LIGHT_GRAY, self.small_font),
+        ]
+        y = board_y
+        for text, color, font in info_items:
+            surface = font.render(text, True, color)
+            self.screen.blit(surface, (self.info_x, y))
+            y += surface.get_height() + 6
+
+        if game.action_text and game.action_text_timer > 0:
+            action = self.small_font.render(game.action_text, True, YELLOW)
+            self.screen.blit(action, (board_x, board_y + self.main_height + 10))
+
+        if game.game_over:
+            over = self.font.render("K.O.", True, RED)
+            self.screen.blit(
+                over,
+                over.get_rect(
+                    center=(
+                        board_x + self.main_width // 2,
+                        board_y + self.main_height // 2,
+                    )
+                ),
+            )
+
+    def render(self):
+        """渲染整個畫面"""
+        began = time.perf_counter()
+        self.screen.fill(BLACK)
+
+        self.left_panel.update()
+        self.right_panel.update()
+        self.screen.blit(self.left_panel.surface, (self.left_x, self.board_y))
+        self.screen.blit(self.right_panel.surface, (self.right_x, self.board_y))
+        self.draw_main()
+
+        match = self.royale.match
+        if match.finished:
+            if match.winner is None:
+                message = "DRAW"
+            else:
+                message = f"{match.players[match.winner].name} WINS!"
+            text = self.large_font.render(message, True, YELLOW)
+            self.screen.blit(
+                text, text.get_rect(center=(self.screen.get_width() // 2, 24))
+            )
+
+        pygame.display.flip()
+        self.render_ms = (time.perf_counter() - began) * 1000
+
+    def run(self):
+        """大逃殺主迴圈"""
+        while True:
+            self.clock.tick(FPS)
+
+            keys_just_pressed = {}
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN:
+                    keys_just_pressed[event.key] = True
+                    if event.key == pygame.K_r and self.royale.finished:
+                        self.new_match()
+
+            if self.controller and hasattr(self.controller, "update"):
+                self.controller.update(pygame.key.get_pressed(), keys_just_pressed)
+
+            if not self.royale.finished and self.royale.step():
+                winner = self.royale.match.winner
+                print(
+                    f"🏆 大逃殺結束！勝者："
+                    f"{self.royale.players[winner].name if winner is not None else '無'}"
+                )
+
+            self.render()
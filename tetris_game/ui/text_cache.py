@@ -0,0 +1,79 @@
+"""
+文字 Surface 快取模組
+font.render 每次都要重新點陣化字型，HUD 上的分數、等級等文字大多數幀都沒有變化，
+以 (字型, 文字, 顏色, 抗鋸齒) 為鍵快取已渲染的 Surface，超過上限時淘汰最久未使用的項目
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """
+    文字 Surface 快取類別（LRU）
+    以 render(font, text, color) 取代 font.render(text, True, color)
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        初始化快取
+        參數：
+        - max_entries: 最多保留的 Surface 數量
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """
+        取得文字 Surface（快取中沒有時才呼叫 font.render）
+        參數：
+        - font: pygame.font.Font 物件
+        - text: 文字內容
+        - color: 文字顏色
+        - antialias: 是否抗鋸齒
+        返回：Surface（與其他呼叫者共用，請勿直接修改）
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def render_panel(self, size, items):
+        """
+        將固定不變的多行文字預先繪製到一張透明 Surface（每幀只需 blit 一次）
+        參數：
+        - size: 面板大小 (寬, 高)
+        - items: [(font, 文字, 顏色, (x, y)), ...]，座標相對於面板左上角
+        返回：Surface
+        """
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        for font, text, color, position in items:
+            panel.blit(font.render(text, True, color), position)
+        return panel
+
+    def clear(self):
+        """清除所有快取"""
+        self.entries.clear()
+
+    def hit_rate(self):
+        """快取命中率（0~100）"""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits * 100.0 / total
+
+
+# 各渲染器共用的快取（同一字型物件的相同文字只渲染一次）
+shared_text_cache = TextCache()
@@ -0,0 +1,217 @@
+"""
+本地對戰視窗
+在單一 Pygame 視窗中並排顯示多個遊戲區域、垃圾行計量表與對戰資訊
+支援人類對人類、人類對 AI、AI 對 AI
+"""
+
+import pygame
+import sys
+
+from core.versus import VersusMatch
+from core.inputs import KeyboardController
+from config.constants import (
+    WHITE,
+    BLACK,
+    GRAY,
+    LIGHT_GRAY,
+    RED,
+    YELLOW,
+    GREEN,
+    CYAN,
+    FPS,
+)
+from .window_manager import fit_cell_size
+
+
+def draw_board(screen, game, offset_x, offset_y, cell_size):
+    """
+    繪製單一遊戲區域（已放置方塊、幽靈方塊與當前方塊）
+    參數：
+    - screen: pygame 螢幕物件
+    - game: Game 物件
+    - offset_x, offset_y: 遊戲區域左上角位置
+    - cell_size: 格子大小
+    """
+    game.grid.draw(screen, offset_x, offset_y, cell_size)
+    if game.game_over:
+        return
+
+    piece = game.current_tetromino
+    ghost_color = tuple(c // 3 for c in piece.color)
+    for x, y in piece.get_ghost_blocks(game.grid):
+        if y >= 0:
+            pygame.draw.rect(
+                screen,
+                ghost_color,
+                (offset_x + x * cell_size, offset_y + y * cell_size, cell_size, cell_size),
+            )
+
+    for x, y in piece.get_blocks():
+        if y >= 0:
+            rect = (
+                offset_x + x * cell_size,
+                offset_y + y * cell_size,
+                cell_size,
+                cell_size,
+            )
+            pygame.draw.rect(screen, piece.color, rect)
+            pygame.draw.rect(screen, WHITE, rect, 1)
+
+
+class VersusWindow:
+    """本地對戰視窗類別"""
+
+    def __init__(self, controllers, seed=None, width=10, height=20, buffer_rows=2):
+        """
+        初始化對戰視窗
+        參數：
+        - controllers: 每位玩家的控制器（KeyboardController 或 BotController）
+        - seed: 比賽種子
+        - width, height, buffer_rows: 遊戲區域尺寸
+        """
+        self.controllers = controllers
+        self.seed = seed
+        self.board_size = (width, height, buffer_rows)
+
+        self.font = pygame.font.Font(None, 32)
+        self.small_font = pygame.font.Font(None, 22)
+        self.large_font = pygame.font.Font(None, 56)
+
+        # 每個遊戲區域的面板大小（區域 + 計量表 + 資訊）
+        self.cell_size = fit_cell_size(width, height, 420, 640)
+        self.panel_width = width * self.cell_size + 140
+        self.panel_height = height * self.cell_size + 100
+        self.screen = pygame.display.set_mode(
+            (self.panel_width * len(controllers), self.panel_height)
+        )
+        pygame.display.set_caption("TETRIS VERSUS")
+        self.clock = pygame.time.Clock()
+        self.new_match()
+
+    def new_match(self):
+        """開始新比賽"""
+        width, height, buffer_rows = self.board_size
+        self.match = VersusMatch(
+            len(self.controllers),
+            self.seed,
+            width,
+            height,
+            buffer_rows,
+            names=[
+                "AI" if not isinstance(c, KeyboardController) else f"P{i + 1}"
+                for i, c in enumerate(self.controllers)
+            ],
+        )
+        for controller in self.controllers:
+            if hasattr(controller, "reset"):
+                controller.reset()
+
+    def draw_player(self, player, panel_x):
+        """繪製一位玩家的面板"""
+        game = player.game
+        board_x = panel_x + 40
+        board_y = 60
+        board_w = game.grid.width * self.cell_size
+        board_h = game.grid.height * self.cell_size
+
+        # 名稱與邊框
+        name_text = self.font.render(player.name, True, WHITE)
+        self.screen.blit(name_text, (board_x, 20))
+        pygame.draw.rect(
+            self.screen, CYAN, (board_x - 3, board_y - 3, board_w + 6, board_h + 6), 3
+        )
+        draw_board(self.screen, game, board_x, board_y, self.cell_size)
+
+        # 垃圾行計量表（左側）
+        pending = player.garbage.total()
+        meter_h = min(pending * self.cell_size, board_h)
+        pygame.draw.rect(self.screen, GRAY, (panel_x + 15, board_y, 12, board_h), 1)
+        if meter_h:
+            pygame.draw.rect(
+                self.screen,
+                RED,
+                (panel_x + 15, board_y + board_h - meter_h, 12, meter_h),
+            )
+
+        # 右側資訊
+        info_x = board_x + board_w + 15
+        info_items = [
+            (f"Score {game.score}", WHITE),
+            (f"Lines {game.lines_cleared}", WHITE),
+            (f"Sent {player.attack_sent}", YELLOW),
+            (f"Recv {player.garbage_received}", LIGHT_GRAY),
+            (f"K.O. {player.knockouts}", GREEN),
+        ]
+        for index, (text, color) in enumerate(info_items):
+            surface = self.small_font.render(text, True, color)
+            self.screen.blit(surface, (info_x, board_y + index * 22))
+
+        if game.action_text and game.action_text_timer > 0:
+            action = self.small_font.render(game.action_text, True, YELLOW)
+            self.screen.blit(action, (board_x, board_y + board_h + 10))
+
+        if game.game_over:
+            over = self.font.render("K.O.", True, RED)
+            self.screen.blit(
+                over, over.get_rect(center=(board_x + board_w // 2, board_y + board_h // 2))
+            )
+
+    def render(self):
+        """渲染整個畫面"""
+        self.screen.fill(BLACK)
+        for index, player in enumerate(self.match.players):
+            self.draw_player(player, index * self.panel_width)
+
+        if self.match.finished:
+            if self.match.winner is None:
+                message = "DRAW"
+            else:
+                message = f"{self.match.players[self.match.winner].name} WINS!"
+            text = self.large_font.render(message, True, YELLOW)
+            self.screen.blit(
+                text,
+                text.get_rect(
+                    center=(self.screen.get_width() // 2, self.panel_height - 30)
+                ),
+            )
+            hint = self.small_font.render("Press R to rematch", True, WHITE)
+            self.screen.blit(
+                hint,
+                hint.get_rect(center=(self.screen.get_width() // 2, self.panel_height - 8)),
+            )
+
+        pygame.display.flip()
+
+    def run(self):
+        """對戰主迴圈"""
+        while True:
+            self.clock.tick(FPS)
+
+            keys_just_pressed = {}
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN:
+                    keys_just_pressed[event.key] = True
+                    if event.key == pygame.K_r and self.match.finished:
+                        self.new_match()
+
+            keys_pressed = pygame.key.get_pressed()
+            for controller in self.controllers:
+                if isinstance(controller, KeyboardController):
+                    controller.update(keys_pressed, keys_just_pressed)
+
+            if not self.match.finished:
+                inputs = [
+                    controller.next_input(player.game)
+                    for controller, player in zip(self.controllers, self.match.players)
+                ]
+                if self.match.step(inputs):
+                    winner = self.match.winner
+                    print(
+                        f"🏆 比賽結束！勝者："
+                        f"{self.match.players[winner].name if winner is not None else '無'}"
+                    )
+
+            self.render()
@@ -22,16 +22,36 @@ from config.constants import (
     GRID_HEIGHT,
     LOCK_DELAY_MAX,
 )
+from ui.text_cache import shared_text_cache
+
+
+def fit_cell_size(grid_width, grid_height, max_width, max_height):
+    """
+    計算能讓遊戲區域放入指定像素範圍的格子大小（不超過 CELL_SIZE，最小 1）
+    參數：
+    - grid_width: 遊戲區域寬度（格數）
+    - grid_height: 遊戲區域高度（格數）
+    - max_width: 可用像素寬度
+    - max_height: 可用像素高度
+    """
+    return max(1, min(CELL_SIZE, max_width // grid_width, max_height // grid_height))
 
 
 class WindowManager:
     """多視窗管理器類別"""
 
-    def __init__(self):
-        """初始化窗口管理器"""
+    def __init__(self, grid_width=GRID_WIDTH, grid_height=GRID_HEIGHT):
+        """
+        初始化窗口管理器
+        參數：
+        - grid_width: 遊戲區域寬度（格數）
+        - grid_height: 遊戲區域高度（格數）
+        """
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 20)
         self.large_font = pygame.font.Font(None, 48)
+        self.text_cache = shared_text_cache
+        self.controls_panel = None  # 預先繪製的操作說明區域（第一次繪製時建立）
 
         # 震動效果參數
         self.shake_duration = 0
@@ -43,6 +63,13 @@ class WindowManager:
         self.total_width = 1400
         self.total_height = 800
 
+        # 遊戲區域尺寸與格子大小（大型區域自動縮小格子）
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.cell_size = fit_cell_size(
+            grid_width, grid_height, self.total_width - 440, self.total_height - 60
+        )
+
         # 創建主視窗
         self.screen = pygame.display.set_mode((self.total_width, self.total_height))
         pygame.display.set_caption("Tetris - 多視窗版本")
@@ -56,8 +83,8 @@ class WindowManager:
         self.hold_area = {"x": 20, "y": 50, "width": 160, "height": 120}
 
         # 主遊戲區域 (中央)
-        game_width = GRID_WIDTH * CELL_SIZE + 40
-        game_height = GRID_HEIGHT * CELL_SIZE + 60
+        game_width = self.grid_width * self.cell_size + 40
+        game_height = self.grid_height * self.cell_size + 60
         self.game_area = {
             "x": (self.total_width - game_width) // 2,
             "y": (self.total_height - game_height) // 2,
@@ -120,6 +147,10 @@ class WindowManager:
             width,
         )
 
+    def render_text(self, font, text, color):
+        """以文字快取渲染文字（內容不變時不會重新點陣化）"""
+        return self.text_cache.render(font, text, color)
+
     def draw_main_game(self, game):
         """繪製主遊戲區域"""
         # 應用震動偏移
@@ -137,7 +168,7 @@ class WindowManager:
         pygame.draw.rect(self.screen, CYAN, game_rect, 3)
 
         # 繪製標題
-        title_text = self.font.render("TETRIS", True, WHITE)
+        title_text = self.render_text(self.font, "TETRIS", WHITE)
         title_rect = title_text.get_rect(
             center=(
                 self.game_area["x"]
@@ -149,7 +180,7 @@ class WindowManager:
         self.screen.blit(title_text, title_rect)
 
         # 繪製遊戲網格
-        game.grid.draw(self.screen, offset_x, offset_y)
+        game.grid.draw(self.screen, offset_x, offset_y, self.cell_size)
 
         # 繪製幽靈方塊
         if not game.game_over:
@@ -161,7 +192,7 @@ class WindowManager:
 
         # 遊戲結束畫面
         if game.game_over:
-            game_over_text = self.large_font.render("GAME OVER", True, RED)
+            game_over_text = self.render_text(self.large_font, "GAME OVER", RED)
             game_over_rect = game_over_text.get_rect(
                 center=(
                     self.game_area["x"] + self.game_area["width"] // 2,
@@ -170,7 +201,7 @@ class WindowManager:
             )
             self.screen.blit(game_over_text, game_over_rect)
 
-            restart_text = self.font.render("Press R to restart", True, WHITE)
+            restart_text = self.render_text(self.font, "Press R to restart", WHITE)
             restart_rect = restart_text.get_rect(
                 center=(
                     self.game_area["x"] + self.game_area["width"] // 2,
@@ -181,22 +212,24 @@ class WindowManager:
 
     def draw_current_tetromino(self, game, offset_x, offset_y):
         """繪製當前下落方塊"""
+        cell_size = self.cell_size
         blocks = game.current_tetromino.get_blocks()
         for x, y in blocks:
             if y >= 0:
-                screen_x = offset_x + x * CELL_SIZE
-                screen_y = offset_y + y * CELL_SIZE
+                screen_x = offset_x + x * cell_size
+                screen_y = offset_y + y * cell_size
                 pygame.draw.rect(
                     self.screen,
                     game.current_tetromino.color,
-                    (screen_x, screen_y, CELL_SIZE, CELL_SIZE),
+                    (screen_x, screen_y, cell_size, cell_size),
                 )
                 pygame.draw.rect(
-                    self.screen, WHITE, (screen_x, screen_y, CELL_SIZE, CELL_SIZE), 1
+                    self.screen, WHITE, (screen_x, screen_y, cell_size, cell_size), 1
                 )
 
     def draw_ghost_piece(self, game, offset_x, offset_y):
         """繪製幽靈方塊"""
+        cell_size = self.cell_size
         ghost_blocks = game.current_tetromino.get_ghost_blocks(game.grid)
 
         ghost_color = game.current_tetromino.color
@@ -204,19 +237,19 @@ class WindowManager:
 
         for x, y in ghost_blocks:
             if y >= 0:
-                screen_x = offset_x + x * CELL_SIZE
-                screen_y = offset_y + y * CELL_SIZE
+                screen_x = offset_x + x * cell_size
+                screen_y = offset_y + y * cell_size
 
                 pygame.draw.rect(
                     self.screen,
                     ghost_fill_color,
-                    (screen_x + 2, screen_y + 2, CELL_SIZE - 4, CELL_SIZE - 4),
+                    (screen_x + 2, screen_y + 2, cell_size - 4, cell_size - 4),
                 )
 
                 pygame.draw.rect(
                     self.screen,
                     ghost_color,
-                    (screen_x, screen_y, CELL_SIZE, CELL_SIZE),
+                    (screen_x, screen_y, cell_size, cell_size),
                     2,
                 )
 
@@ -231,7 +264,7 @@ class WindowManager:
         self.draw_area_border(area, YELLOW)
 
         # 繪製標題
-        title_text = self.font.render("HOLD", True, WHITE)
+        title_text = self.render_text(self.font, "HOLD", WHITE)
         title_rect = title_text.get_rect(
             center=(area["x"] + area["width"] // 2, area["y"] + 20)
         )
@@ -265,7 +298,7 @@ class WindowManager:
         self.draw_area_border(area, GREEN)
 
         # 繪製標題
-        title_text = self.font.render("NEXT", True, WHITE)
+        title_text = self.render_text(self.font, "NEXT", WHITE)
         title_rect = title_text.get_rect(
             center=(area["x"] + area["width"] // 2, area["y"] + 20)
         )
@@ -289,11 +322,11 @@ class WindowManager:
 
         # 顯示 bag 資訊
         if hasattr(game, "piece_bag"):
-            bag_text = self.small_font.render("Bag:", True, LIGHT_GRAY)
+            bag_text = self.render_text(self.small_font, "Bag:", LIGHT_GRAY)
             self.screen.blit(bag_text, (area["x"] + 10, area["y"] + 120))
 
             bag_info = f"剩餘: {len(game.piece_bag)}"
-            bag_info_text = self.small_font.render(bag_info, True, LIGHT_GRAY)
+            bag_info_text = self.render_text(self.small_font, bag_info, LIGHT_GRAY)
             self.screen.blit(bag_info_text, (area["x"] + 10, area["y"] + 140))
 
     def draw_info_area(self, game):
@@ -307,7 +340,7 @@ class WindowManager:
         self.draw_area_border(area, PURPLE)
 
         # 繪製標題
-        title_text = self.font.render("INFO", True, WHITE)
+        title_text = self.render_text(self.font, "INFO", WHITE)
         title_rect = title_text.get_rect(
             center=(area["x"] + area["width"] // 2, area["y"] + 20)
         )
@@ -323,7 +356,7 @@ class WindowManager:
         ]
 
         for item in info_items:
-            text = self.small_font.render(item, True, WHITE)
+            text = self.render_text(self.small_font, item, WHITE)
             self.screen.blit(text, (area["x"] + 10, y_offset))
             y_offset += 25
 
@@ -331,22 +364,22 @@ class WindowManager:
 
         # 特殊狀態
         if game.back_to_back_count > 0:
-            b2b_text = self.small_font.render(
-                f"Back-to-Back: {game.back_to_back_count}", True, YELLOW
+            b2b_text = self.render_text(
+                self.small_font, f"Back-to-Back: {game.back_to_back_count}", YELLOW
             )
             self.screen.blit(b2b_text, (area["x"] + 10, y_offset))
             y_offset += 25
 
         if game.combo_count > 1:
-            combo_text = self.small_font.render(
-                f"Combo: {game.combo_count}x", True, GREEN
+            combo_text = self.render_text(
+                self.small_font, f"Combo: {game.combo_count}x", GREEN
             )
             self.screen.blit(combo_text, (area["x"] + 10, y_offset))
             y_offset += 25
 
         if game.perfect_clear_count > 0:
-            pc_text = self.small_font.render(
-                f"Perfect Clear: {game.perfect_clear_count}", True, CYAN
+            pc_text = self.render_text(
+                self.small_font, f"Perfect Clear: {game.perfect_clear_count}", CYAN
             )
             self.screen.blit(pc_text, (area["x"] + 10, y_offset))
             y_offset += 25
@@ -355,15 +388,15 @@ class WindowManager:
         if game.action_text and game.action_text_timer > 0:
             if game.action_text_timer % 10 < 5:
                 action_color = RED if "T-SPIN" in game.action_text else YELLOW
-                action_text = self.small_font.render(
-                    game.action_text, True, action_color
+                action_text = self.render_text(
+                    self.small_font, game.action_text, action_color
                 )
                 self.screen.blit(action_text, (area["x"] + 10, y_offset))
                 y_offset += 25
 
         # Lock Delay 指示器
         if game.is_on_ground:
-            lock_text = self.small_font.render("Lock Delay:", True, LIGHT_GRAY)
+            lock_text = self.render_text(self.small_font, "Lock Delay:", LIGHT_GRAY)
             self.screen.blit(lock_text, (area["x"] + 10, y_offset))
             y_offset += 20
 
@@ -375,22 +408,20 @@ class WindowManager:
                 (area["x"] + 10, y_offset, int(150 * lock_progress), 8),
             )
 
-    def draw_controls_area(self):
-        """繪製操作說明區域"""
+    def build_controls_panel(self):
+        """
+        預先繪製整個操作說明區域（背景、邊框、標題與說明文字都不會變動）
+        返回：與區域同大小的 Surface
+        """
         area = self.controls_area
-
-        # 繪製背景和邊框
-        pygame.draw.rect(
-            self.screen, BLACK, (area["x"], area["y"], area["width"], area["height"])
-        )
-        self.draw_area_border(area, ORANGE)
+        panel = pygame.Surface((area["width"], area["height"]))
+        panel.fill(BLACK)
+        pygame.draw.rect(panel, ORANGE, (0, 0, area["width"], area["height"]), 2)
 
         # 繪製標題
-        title_text = self.font.render("操作說明", True, WHITE)
-        title_rect = title_text.get_rect(
-            center=(area["x"] + area["width"] // 2, area["y"] + 20)
-        )
-        self.screen.blit(title_text, title_rect)
+        title_text = self.render_text(self.font, "操作說明", WHITE)
+        title_rect = title_text.get_rect(center=(area["width"] // 2, 20))
+        panel.blit(title_text, title_rect)
 
         # 操作說明內容
         controls = [
@@ -416,21 +447,30 @@ class WindowManager:
             "• 震動反饋效果",
         ]
 
-        y_offset = area["y"] + 50
+        items = []
+        y_offset = 50
         for control in controls:
             if control == "":
                 y_offset += 10
                 continue
             elif control.startswith("•"):
-                control_text = self.small_font.render(control, True, CYAN)
+                items.append((self.small_font, control, CYAN, (10, y_offset)))
             elif control in ["基本操作:", "特色功能:"]:
-                control_text = self.font.render(control, True, WHITE)
+                items.append((self.font, control, WHITE, (10, y_offset)))
             else:
-                control_text = self.small_font.render(control, True, LIGHT_GRAY)
-
-            self.screen.blit(control_text, (area["x"] + 10, y_offset))
+                items.append((self.small_font, control, LIGHT_GRAY, (10, y_offset)))
             y_offset += 22
 
+        panel.blit(self.text_cache.render_panel(panel.get_size(), items), (0, 0))
+        return panel
+
+    def draw_controls_area(self):
+        """繪製操作說明區域（使用預先繪製的面板）"""
+        if self.controls_panel is None:
+            self.controls_panel = self.build_controls_panel()
+        area = self.controls_area
+        self.screen.blit(self.controls_panel, (area["x"], area["y"]))
+
     def render_all_windows(self, game, screen=None):
         """渲染所有視窗區域"""
         # 更新震動效果
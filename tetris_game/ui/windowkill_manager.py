@@ -34,14 +34,22 @@ from config.constants import (
     GRID_WIDTH,
     GRID_HEIGHT,
     LOCK_DELAY_MAX,
+    MAX_BOARD_PIXEL_WIDTH,
+    MAX_BOARD_PIXEL_HEIGHT,
 )
+from .window_manager import fit_cell_size
 
 
 class WindowKillManager:
     """WindowKill 風格的多視窗管理器"""
 
-    def __init__(self):
-        """初始化多視窗管理器"""
+    def __init__(self, grid_width=GRID_WIDTH, grid_height=GRID_HEIGHT):
+        """
+        初始化多視窗管理器
+        參數：
+        - grid_width: 遊戲區域寬度（格數）
+        - grid_height: 遊戲區域高度（格數）
+        """
         # Pygame 字體初始化（在主視窗中使用）
         pygame.font.init()
         self.font = pygame.font.Font(None, 36)
@@ -59,10 +67,15 @@ class WindowKillManager:
         self.root.withdraw()  # 隱藏主視窗
 
         # 主遊戲視窗（使用 Pygame）
+        # 大型遊戲區域自動縮小格子，讓視窗維持在合理大小
+        self.cell_size = fit_cell_size(
+            grid_width, grid_height, MAX_BOARD_PIXEL_WIDTH, MAX_BOARD_PIXEL_HEIGHT
+        )
+
         # 優化後的視窗大小：移除標題後減少高度，增加少量邊距
         self.main_window_size = (
-            GRID_WIDTH * CELL_SIZE + 60,  # 左右各30像素邊距
-            GRID_HEIGHT * CELL_SIZE + 60,  # 上下各約30像素邊距（原來100，現在60）
+            grid_width * self.cell_size + 60,  # 左右各30像素邊距
+            grid_height * self.cell_size + 60,  # 上下各約30像素邊距（原來100，現在60）
         )
         self.main_screen = pygame.display.set_mode(self.main_window_size)
         pygame.display.set_caption("TETRIS WINDOWS")
@@ -87,6 +100,22 @@ class WindowKillManager:
         # 遊戲數據暫存
         self.game_data = None
 
+        # Perfect Clear 提示（(落點, 解的方塊數) 或 None，由主迴圈設定）
+        self.pc_hint = None
+
+        # Finesse 分析器（FinesseAnalyzer 或 None，由主迴圈設定）
+        self.finesse = None
+
+        # 排行榜（AsyncSubmitter 或 None，由主迴圈設定）與送出成績使用的玩家名稱
+        self.leaderboard = None
+        self.player_name = "player"
+
+        # 計時模式（TimedMode 或 None，由主迴圈設定）
+        self.timed_mode = None
+
+        # 消行粒子特效（EffectsSystem 或 None，由主迴圈設定）
+        self.effects = None
+
         # 視窗動畫參數
         self.window_animations = {
             "hold_window": {
@@ -238,6 +267,7 @@ class WindowKillManager:
             "Z: 逆時針旋轉",
             "Space: 硬降",
             "C / Shift: Hold 功能",
+            "P: Perfect Clear 提示",
             "R: 重新開始",
         ]
 
@@ -351,16 +381,31 @@ class WindowKillManager:
         self.main_screen.fill(BLACK)
 
         # 繪製遊戲網格
-        game.grid.draw(self.main_screen, offset_x, offset_y)
+        game.grid.draw(self.main_screen, offset_x, offset_y, self.cell_size)
 
         # 繪製幽靈方塊
         if not game.game_over:
             self.draw_ghost_piece(game, offset_x, offset_y)
 
+        # 繪製 Perfect Clear 提示
+        if self.pc_hint and not game.game_over:
+            self.draw_pc_hint(offset_x, offset_y)
+
         # 繪製當前方塊
         if not game.game_over:
             self.draw_current_tetromino(game, offset_x, offset_y)
 
+        # 繪製消行特效（跟著遊戲區域一起震動）
+        if self.effects:
+            self.effects.draw(
+                self.main_screen,
+                offset_x,
+                offset_y,
+                self.cell_size,
+                game.grid.width,
+                game.grid.height,
+            )
+
         # 遊戲結束畫面
         if game.game_over:
             game_over_text = self.large_font.render("GAME OVER", True, RED)
@@ -380,25 +425,27 @@ class WindowKillManager:
 
     def draw_current_tetromino(self, game, offset_x, offset_y):
         """繪製當前下落方塊"""
+        cell_size = self.cell_size
         blocks = game.current_tetromino.get_blocks()
         for x, y in blocks:
             if y >= 0:
-                screen_x = offset_x + x * CELL_SIZE
-                screen_y = offset_y + y * CELL_SIZE
+                screen_x = offset_x + x * cell_size
+                screen_y = offset_y + y * cell_size
                 pygame.draw.rect(
                     self.main_screen,
                     game.current_tetromino.color,
-                    (screen_x, screen_y, CELL_SIZE, CELL_SIZE),
+                    (screen_x, screen_y, cell_size, cell_size),
                 )
                 pygame.draw.rect(
                     self.main_screen,
                     WHITE,
-                    (screen_x, screen_y, CELL_SIZE, CELL_SIZE),
+                    (screen_x, screen_y, cell_size, cell_size),
                     1,
                 )
 
     def draw_ghost_piece(self, game, offset_x, offset_y):
         """繪製幽靈方塊"""
+        cell_size = self.cell_size
         ghost_blocks = game.current_tetromino.get_ghost_blocks(game.grid)
 
         ghost_color = game.current_tetromino.color
@@ -406,22 +453,44 @@ class WindowKillManager:
 
         for x, y in ghost_blocks:
             if y >= 0:
-                screen_x = offset_x + x * CELL_SIZE
-                screen_y = offset_y + y * CELL_SIZE
+                screen_x = offset_x + x * cell_size
+                screen_y = offset_y + y * cell_size
 
                 pygame.draw.rect(
                     self.main_screen,
                     ghost_fill_color,
-                    (screen_x + 2, screen_y + 2, CELL_SIZE - 4, CELL_SIZE - 4),
+                    (screen_x + 2, screen_y + 2, cell_size - 4, cell_size - 4),
                 )
 
                 pygame.draw.rect(
                     self.main_screen,
                     ghost_color,
-                    (screen_x, screen_y, CELL_SIZE, CELL_SIZE),
+                    (screen_x, screen_y, cell_size, cell_size),
                     2,
                 )
 
+    def draw_pc_hint(self, offset_x, offset_y):
+        """繪製 Perfect Clear 提示（下一步的落點外框與剩餘方塊數）"""
+        placement, pieces = self.pc_hint
+        cell_size = self.cell_size
+        for col, row in placement.cells():
+            if row >= 0:
+                pygame.draw.rect(
+                    self.main_screen,
+                    WHITE,
+                    (
+                        offset_x + col * cell_size + 3,
+                        offset_y + row * cell_size + 3,
+                        cell_size - 6,
+                        cell_size - 6,
+                    ),
+                    1,
+                )
+
+        label = f"PC {pieces}" + (" (HOLD)" if placement.use_hold else "")
+        text = self.small_font.render(label, True, CYAN)
+        self.main_screen.blit(text, (offset_x, 3))
+
     def update_hold_window(self, game):
         """更新 Hold 視窗"""
         self.hold_canvas.delete("all")
@@ -513,6 +582,23 @@ class WindowKillManager:
             f"速度: {speed_seconds}s/格",
         ]
 
+        # 計時模式：顯示計時、目標與最近的分段時間
+        if self.timed_mode:
+            from core.modes import MODE_SPRINT, SPRINT_LINES, format_time, ticks_to_ms
+
+            timed = self.timed_mode
+            label = "時間" if timed.mode == MODE_SPRINT else "剩餘"
+            info_items = [f"{label}: {timed.display_time()}", f"分數: {game.score:,}"]
+            if timed.mode == MODE_SPRINT:
+                info_items.append(f"行數: {game.lines_cleared}/{SPRINT_LINES}")
+            else:
+                info_items.append(f"行數: {game.lines_cleared}")
+            for split_label, ticks, score in timed.splits[-2:]:
+                if timed.mode == MODE_SPRINT:
+                    info_items.append(f"{split_label}: {format_time(ticks_to_ms(ticks))}")
+                else:
+                    info_items.append(f"{split_label}: {score:,}")
+
         for item in info_items:
             self.info_canvas.create_text(
                 20, y_offset, text=item, fill="white", font=("Arial", 12), anchor="w"
@@ -555,6 +641,29 @@ class WindowKillManager:
             )
             y_offset += 20
 
+        # Finesse 統計（準確率、累計多按的鍵數與上一個方塊的結果）
+        if self.finesse and self.finesse.pieces > 0:
+            last = self.finesse.last
+            self.info_canvas.create_text(
+                20,
+                y_offset,
+                text=f"Finesse: {self.finesse.accuracy():.1f}% "
+                f"(+{self.finesse.extra_inputs})",
+                fill="white",
+                font=("Arial", 10),
+                anchor="w",
+            )
+            y_offset += 20
+            self.info_canvas.create_text(
+                20,
+                y_offset,
+                text=f"上一個: {last['actual']} 鍵 / 最佳 {last['optimal']} 鍵",
+                fill="orange" if last["extra"] else "lightgray",
+                font=("Arial", 10),
+                anchor="w",
+            )
+            y_offset += 20
+
         # 動作文字顯示
         if game.action_text and game.action_text_timer > 0:
             if game.action_text_timer % 10 < 5:
@@ -600,6 +709,10 @@ class WindowKillManager:
         # 更新震動效果
         self.update_shake(16)  # 假設 60fps，約16ms per frame
 
+        # 更新消行特效
+        if self.effects:
+            self.effects.update(16)
+
         # 更新遊戲數據
         self.game_data = game
 
@@ -690,6 +803,23 @@ class WindowKillManager:
         # 繪製 Game Over 內容
         self.draw_game_over_content(game)
 
+        # 在背景送出成績，完成後才在視窗中顯示名次
+        timed = self.timed_mode
+        if timed and not timed.completed:
+            self.draw_leaderboard_status("未完成，不列入排行榜", "lightgray")
+        elif self.leaderboard:
+            from core.leaderboard import game_entry
+
+            if timed:
+                # 計時模式先重播驗證（在背景執行緒），通過後才送出
+                timed.verify_in_background()
+                entry = lambda: timed.leaderboard_entry(self.player_name)
+            else:
+                entry = game_entry(game, self.player_name)
+            future = self.leaderboard.submit(entry)
+            self.draw_leaderboard_status("排行榜: 送出中...", "lightgray")
+            self.poll_leaderboard_result(future, self.game_over_window)
+
         # 讓視窗置於最前
         self.game_over_window.lift()
         self.game_over_window.focus_force()
@@ -700,8 +830,11 @@ class WindowKillManager:
         self.game_over_canvas.delete("all")
 
         # 標題（符合其他視窗的風格）
+        title = "GAME OVER"
+        if self.timed_mode and self.timed_mode.completed:
+            title = f"{self.timed_mode.mode.upper()} FINISH"
         self.game_over_canvas.create_text(
-            150, 25, text="GAME OVER", fill="white", font=("Arial", 18, "bold")
+            150, 25, text=title, fill="white", font=("Arial", 18, "bold")
         )
 
         y_pos = 60
@@ -712,6 +845,10 @@ class WindowKillManager:
             f"等級: {game.level}",
             f"行數: {game.lines_cleared}",
         ]
+        if self.timed_mode:
+            from core.modes import format_time
+
+            stats[1] = f"時間: {format_time(self.timed_mode.elapsed_ms())}"
 
         # 繪製統計資訊
         for stat in stats:
@@ -720,6 +857,38 @@ class WindowKillManager:
             )
             y_pos += 25
 
+    def draw_leaderboard_status(self, text, color):
+        """在 Game Over 視窗底部顯示排行榜狀態"""
+        self.game_over_canvas.delete("leaderboard")
+        self.game_over_canvas.create_text(
+            150,
+            160,
+            text=text,
+            fill=color,
+            font=("Arial", 12),
+            anchor="center",
+            tags="leaderboard",
+        )
+
+    def poll_leaderboard_result(self, future, window):
+        """
+        定期檢查成績是否送出完成（以 Tk 的 after 在主執行緒輪詢，不會阻塞畫面）
+        參數：
+        - future: AsyncSubmitter.submit 返回的 Future
+        - window: 送出時的 Game Over 視窗（視窗已關閉或被取代時停止輪詢）
+        """
+        if window is not self.game_over_window:
+            return
+        if not future.done():
+            window.after(100, self.poll_leaderboard_result, future, window)
+            return
+        try:
+            rank = future.result()["rank"]
+            self.draw_leaderboard_status(f"排行榜名次: #{rank:,}", "gold")
+        except Exception as e:
+            print(f"排行榜送出失敗: {e}")
+            self.draw_leaderboard_status("排行榜: 無法送出", "red")
+
     def on_game_over_close(self):
         """Game Over 視窗關閉事件"""
         try: